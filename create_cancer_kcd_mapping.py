@@ -12,6 +12,9 @@ from pathlib import Path
 import pandas as pd
 import re
 
+from shared.kcd_index import KCDIndex
+from shared.kcd_ranker import KCDRanker
+
 
 PROJECT_ROOT = Path(__file__).parent
 KCD_FILE = PROJECT_ROOT / "data" / "kssc" / "kcd-9th" / "normalized" / "kcd9_full.json"
@@ -20,29 +23,6 @@ OUTPUT_FILE = PROJECT_ROOT / "bridges" / "cancer_kcd_mapping.json"
 OUTPUT_CSV = PROJECT_ROOT / "bridges" / "cancer_kcd_mapping.csv"
 
 
-def is_cancer_code(code):
-    """암 코드 여부 (C00-D48)"""
-    if not code:
-        return False
-
-    # 범위 코드 제외
-    if '-' in code:
-        return False
-
-    # C로 시작
-    if code.startswith('C'):
-        return True
-
-    # D00-D48
-    if code.startswith('D'):
-        match = re.match(r'D(\d+)', code)
-        if match:
-            num = int(match.group(1))
-            return 0 <= num <= 48
-
-    return False
-
-
 def extract_cancer_keywords(cancer_name):
     """
     암종 이름에서 검색 키워드 추출
@@ -122,41 +102,25 @@ def extract_cancer_keywords(cancer_name):
     return keywords if keywords else [name]
 
 
-def search_kcd_by_keywords(kcd_data, keywords):
-    """KCD 데이터에서 키워드로 검색"""
-    codes = kcd_data['codes']
-    matches = []
-
-    for code_obj in codes:
-        if not is_cancer_code(code_obj['code']):
-            continue
-
-        # 범위 코드 제외
-        if code_obj['is_header'] or not code_obj['is_lowest']:
-            continue
-
-        name_kr = code_obj['name_kr'].lower()
-        name_en = code_obj['name_en'].lower()
-
-        # 모든 키워드가 포함되는지 확인
-        match_count = 0
-        for keyword in keywords:
-            if keyword.lower() in name_kr or keyword.lower() in name_en:
-                match_count += 1
+def search_kcd_by_keywords(ranker, keyword_lists, top_k=5):
+    """
+    KCD 코드명 BM25 검색 (여러 암종을 한 번에)
 
-        if match_count > 0:
-            matches.append({
-                'kcd_code': code_obj['code'],
-                'name_kr': code_obj['name_kr'],
-                'name_en': code_obj['name_en'],
-                'match_count': match_count,
-                'match_ratio': match_count / len(keywords)
-            })
+    암 코드 중 최하위 코드만 (표제어/범위 코드 제외)
 
-    # 매칭 비율 높은 순으로 정렬
-    matches.sort(key=lambda x: (-x['match_ratio'], -x['match_count'], x['kcd_code']))
+    Args:
+        ranker: KCDRanker
+        keyword_lists: 암종별 키워드 목록
+        top_k: 암종별 후보 수
 
-    return matches
+    Returns:
+        암종별 후보 목록 (BM25 점수 높은 순, match_ratio = 일치 키워드 비율)
+    """
+    results = ranker.rank_batch(keyword_lists, top_k=top_k, lowest_only=True, exclude_header=True)
+    for keywords, matches in zip(keyword_lists, results):
+        for match in matches:
+            match['match_ratio'] = match['match_count'] / len(keywords)
+    return results
 
 
 def main():
@@ -166,10 +130,10 @@ def main():
     print("=" * 70)
 
     # KCD 데이터 로드
-    print("\n[INFO] KCD-9 데이터 로딩...")
-    with open(KCD_FILE, 'r', encoding='utf-8') as f:
-        kcd_data = json.load(f)
-    print(f"[OK] KCD-9 {kcd_data['total_codes']}개 코드 로드")
+    print("\n[INFO] KCD-9 인덱스 로딩...")
+    kcd_index = KCDIndex.load(KCD_FILE)
+    ranker = KCDRanker(kcd_index, cancer_only=True)
+    print(f"[OK] KCD-9 {len(kcd_index)}개 코드 로드 (암 코드 {len(ranker)}개 색인)")
 
     # NCC 암종 로드
     print("\n[INFO] NCC 암종 파일 로딩...")
@@ -197,15 +161,12 @@ def main():
     mappings = []
     csv_rows = []
 
-    for cancer in cancers:
-        cancer_name = cancer['name']
-        keywords = extract_cancer_keywords(cancer_name)
-
-        # KCD 검색
-        matches = search_kcd_by_keywords(kcd_data, keywords)
+    # KCD 검색 (전체 암종 일괄, 상위 5개)
+    keyword_lists = [extract_cancer_keywords(cancer['name']) for cancer in cancers]
+    results = search_kcd_by_keywords(ranker, keyword_lists, top_k=5)
 
-        # 상위 5개만 선택
-        top_matches = matches[:5]
+    for cancer, keywords, top_matches in zip(cancers, keyword_lists, results):
+        cancer_name = cancer['name']
 
         # 매핑 저장
         kcd_codes = [m['kcd_code'] for m in top_matches]
@@ -227,6 +188,7 @@ def main():
                 'kcd_code': match['kcd_code'],
                 'kcd_name_kr': match['name_kr'],
                 'kcd_name_en': match['name_en'],
+                'score': match['score'],
                 'match_ratio': f"{match['match_ratio']:.2%}",
                 'match_count': match['match_count'],
                 'keywords': ', '.join(keywords),
@@ -242,7 +204,7 @@ def main():
             'source_kcd': str(KCD_FILE),
             'source_ncc': str(NCC_DIR),
             'total_cancers': len(cancers),
-            'method': 'keyword_search_code_based',
+            'method': 'bm25_code_based',
             'note': '이 파일은 자동 생성되었습니다. 수동 검증이 필요합니다.'
         },
         'mappings': mappings
@@ -1,6 +1,6 @@
-from playwright.sync_api import sync_playwright, Page, TimeoutError
-import time
+from playwright.sync_api import Page, TimeoutError
 from typing import List, Dict
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 from shared.utils.checkpoint import (
     load_checkpoint, save_checkpoint, is_processed,
@@ -14,6 +14,8 @@ BASE_URL = 'https://emrcert.mohw.go.kr/certifiState/productCertifiStateList.es?m
 SAVE_INTERVAL = 10  # 10개마다 저장
 MAX_RETRIES = 3
 PAGE_TIMEOUT = 30000
+LIST_READY = 'div.table2'
+VIEW_URL = 'https://emrcert.mohw.go.kr/certifiState/productCertifiStateView.es?mid=a10106010000'
 
 class ProductCertificationScraper:
     def __init__(self, headless: bool = True):
@@ -22,21 +24,23 @@ class ProductCertificationScraper:
         self.buffer_main = []  # 제품인증 메인 데이터 버퍼
         self.buffer_history = []  # 제품인증 이력 데이터 버퍼
         self.context = None  # Playwright context
+        self.factory = None  # 공통 브라우저 팩토리
+        self.detail_page = None  # 재사용하는 상세 페이지 탭
 
     def run(self):
         """크롤러 실행"""
         logger.info("제품인증 크롤러 시작")
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            self.context = browser.new_context()
+        with BrowserFactory(headless=self.headless, timeout=PAGE_TIMEOUT) as factory:
+            self.factory = factory
+            self.context = factory.new_context()
             page = self.context.new_page()
-            page.set_default_timeout(PAGE_TIMEOUT)
+            # 상세 페이지는 탭 하나를 재사용 (행마다 새 탭을 열지 않음)
+            self.detail_page = self.context.new_page()
 
             try:
                 # 첫 페이지 로드
-                page.goto(BASE_URL)
-                page.wait_for_selector('div.table2', timeout=PAGE_TIMEOUT)
+                factory.goto(page, BASE_URL, ready_selector=LIST_READY)
 
                 # 총 페이지 수 확인
                 total_pages = self._get_total_pages(page)
@@ -74,7 +78,8 @@ class ProductCertificationScraper:
                 logger.error(f"크롤러 실행 중 오류: {e}", exc_info=True)
                 self._flush_buffers()  # 오류 발생 시에도 버퍼 저장
             finally:
-                browser.close()
+                self.factory = None
+                self.detail_page = None
 
     def _get_total_pages(self, page: Page) -> int:
         """총 페이지 수 확인"""
@@ -96,9 +101,7 @@ class ProductCertificationScraper:
     def _navigate_to_page(self, page: Page, page_number: int):
         """특정 페이지로 이동"""
         url = f"{BASE_URL}&currentPage={page_number}&pageCnt=10"
-        page.goto(url)
-        page.wait_for_selector('div.table2', timeout=PAGE_TIMEOUT)
-        time.sleep(1)  # 페이지 안정화 대기
+        self.factory.goto(page, url, ready_selector=LIST_READY)
 
     def _process_list_page(self, page: Page, current_page: int):
         """목록 페이지의 각 행 처리"""
@@ -134,15 +137,13 @@ class ProductCertificationScraper:
                     # POST 방식으로 상세 페이지 이동
                     detail_url = f"{BASE_URL}&apply_no={params['apply_no']}&hptl_no={params['hptl_no']}&reg_id={params['reg_id']}"
 
-                    # 새 탭에서 상세 페이지 열기
-                    detail_page = self.context.new_page()
-                    detail_page.goto(
-                        'https://emrcert.mohw.go.kr/certifiState/productCertifiStateView.es?mid=a10106010000',
-                        timeout=PAGE_TIMEOUT
-                    )
+                    # 빈 탭이면 상세 페이지로 한 번만 이동 (이후 폼 제출은 같은 탭에서 반복)
+                    detail_page = self.detail_page
+                    if detail_page.url == 'about:blank':
+                        self.factory.goto(detail_page, VIEW_URL)
 
                     # 폼 데이터 설정 및 제출
-                    detail_page.evaluate(f"""
+                    self.factory.run_and_wait(detail_page, f"""
                         () => {{
                             const form = document.createElement('form');
                             form.method = 'POST';
@@ -166,27 +167,15 @@ class ProductCertificationScraper:
                             document.body.appendChild(form);
                             form.submit();
                         }}
-                    """)
-
-                    # 페이지 로딩 대기
-                    detail_page.wait_for_selector('div.table2', timeout=PAGE_TIMEOUT)
-                    time.sleep(0.5)
+                    """, ready_selector=LIST_READY, navigates=True)
 
                     # 상세 정보 추출
                     self._extract_detail_data(detail_page)
 
-                    # 페이지 닫기
-                    detail_page.close()
-
                     logger.info(f"  [{idx + 1}/{len(params_list)}] 처리 완료")
 
                 except Exception as e:
                     logger.error(f"  [{idx + 1}/{len(params_list)}] 행 처리 실패: {e}")
-                    try:
-                        if detail_page and not detail_page.is_closed():
-                            detail_page.close()
-                    except:
-                        pass
                     continue
 
         except Exception as e:
@@ -1,6 +1,6 @@
-from playwright.sync_api import sync_playwright, Page, TimeoutError
-import time
+from playwright.sync_api import Page, TimeoutError
 from typing import List, Dict
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 from shared.utils.checkpoint import (
     load_checkpoint, save_checkpoint, is_processed,
@@ -14,6 +14,8 @@ BASE_URL = 'https://emrcert.mohw.go.kr/certifiState/useCertifiStateList.es?mid=a
 SAVE_INTERVAL = 10
 MAX_RETRIES = 3
 PAGE_TIMEOUT = 30000
+LIST_READY = 'div.table2'
+VIEW_URL = 'https://emrcert.mohw.go.kr/certifiState/useCertifiStateView.es?mid=a10106020000'
 
 class UsageCertificationScraper:
     def __init__(self, headless: bool = True):
@@ -22,20 +24,22 @@ class UsageCertificationScraper:
         self.buffer_main = []
         self.buffer_history = []
         self.context = None
+        self.factory = None  # 공통 브라우저 팩토리
+        self.detail_page = None  # 재사용하는 상세 페이지 탭
 
     def run(self):
         """크롤러 실행"""
         logger.info("사용인증 크롤러 시작")
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            self.context = browser.new_context()
+        with BrowserFactory(headless=self.headless, timeout=PAGE_TIMEOUT) as factory:
+            self.factory = factory
+            self.context = factory.new_context()
             page = self.context.new_page()
-            page.set_default_timeout(PAGE_TIMEOUT)
+            # 상세 페이지는 탭 하나를 재사용 (행마다 새 탭을 열지 않음)
+            self.detail_page = self.context.new_page()
 
             try:
-                page.goto(BASE_URL)
-                page.wait_for_selector('div.table2', timeout=PAGE_TIMEOUT)
+                factory.goto(page, BASE_URL, ready_selector=LIST_READY)
 
                 total_pages = self._get_total_pages(page)
                 logger.info(f"총 {total_pages}페이지 발견")
@@ -65,7 +69,8 @@ class UsageCertificationScraper:
                 logger.error(f"크롤러 실행 중 오류: {e}", exc_info=True)
                 self._flush_buffers()
             finally:
-                browser.close()
+                self.factory = None
+                self.detail_page = None
 
     def _get_total_pages(self, page: Page) -> int:
         """총 페이지 수 확인"""
@@ -85,9 +90,7 @@ class UsageCertificationScraper:
     def _navigate_to_page(self, page: Page, page_number: int):
         """특정 페이지로 이동"""
         url = f"{BASE_URL}&currentPage={page_number}&pageCnt=10"
-        page.goto(url)
-        page.wait_for_selector('div.table2', timeout=PAGE_TIMEOUT)
-        time.sleep(1)
+        self.factory.goto(page, url, ready_selector=LIST_READY)
 
     def _process_list_page(self, page: Page, current_page: int):
         """목록 페이지의 각 행 처리"""
@@ -117,14 +120,13 @@ class UsageCertificationScraper:
             # 각 상세 페이지 접근
             for idx, params in enumerate(params_list):
                 try:
-                    detail_page = self.context.new_page()
-                    detail_page.goto(
-                        'https://emrcert.mohw.go.kr/certifiState/useCertifiStateView.es?mid=a10106020000',
-                        timeout=PAGE_TIMEOUT
-                    )
+                    # 빈 탭이면 상세 페이지로 한 번만 이동 (이후 폼 제출은 같은 탭에서 반복)
+                    detail_page = self.detail_page
+                    if detail_page.url == 'about:blank':
+                        self.factory.goto(detail_page, VIEW_URL)
 
                     # 폼 데이터 설정 및 제출
-                    detail_page.evaluate(f"""
+                    self.factory.run_and_wait(detail_page, f"""
                         () => {{
                             const form = document.createElement('form');
                             form.method = 'POST';
@@ -148,24 +150,14 @@ class UsageCertificationScraper:
                             document.body.appendChild(form);
                             form.submit();
                         }}
-                    """)
-
-                    detail_page.wait_for_selector('div.table2', timeout=PAGE_TIMEOUT)
-                    time.sleep(0.5)
+                    """, ready_selector=LIST_READY, navigates=True)
 
                     self._extract_detail_data(detail_page)
 
-                    detail_page.close()
-
                     logger.info(f"  [{idx + 1}/{len(params_list)}] 처리 완료")
 
                 except Exception as e:
                     logger.error(f"  [{idx + 1}/{len(params_list)}] 행 처리 실패: {e}")
-                    try:
-                        if detail_page and not detail_page.is_closed():
-                            detail_page.close()
-                    except:
-                        pass
                     continue
 
         except Exception as e:
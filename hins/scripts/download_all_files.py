@@ -6,14 +6,17 @@ KCD, EDI, 약제급여 모든 매핑 파일 자동 다운로드
 
 import asyncio
 import json
+import sys
 from pathlib import Path
-from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
-import time
 
 
 # 프로젝트 루트 및 데이터 디렉토리
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.browser import AsyncBrowserFactory
+
 DATA_DIR = PROJECT_ROOT / "data" / "hins"
 DOWNLOAD_DIR = DATA_DIR / "downloads"
 DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -30,7 +33,7 @@ class FileDownloader:
     def __init__(self, headless=False):
         self.headless = headless
         self.base_url = "https://hins.or.kr"
-        self.browser = None
+        self.factory = None
         self.page = None
         self.download_count = 0
         self.failed_downloads = []
@@ -38,44 +41,36 @@ class FileDownloader:
     async def init_browser(self):
         """브라우저 초기화"""
         print("[INFO] 브라우저 시작...")
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
+        self.factory = AsyncBrowserFactory(
             headless=self.headless,
+            timeout=60000,
             downloads_path=str(DOWNLOAD_DIR),
-            args=['--start-maximized']
+            timings_path=DOWNLOAD_DIR / "page_timings.json"
         )
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            accept_downloads=True
-        )
-        self.page = await context.new_page()
+        self.page = await self.factory.new_page()
         print("[OK] 브라우저 시작 완료")
 
     async def close_browser(self):
         """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
+        if self.factory:
+            await self.factory.close()
             print(f"[INFO] 브라우저 종료 (다운로드: {self.download_count}개)")
 
-    async def navigate_to_page(self, menu_code, page_name):
-        """특정 페이지로 이동"""
+    async def navigate_to_page(self, menu_code, page_name, ready_selector):
+        """특정 페이지로 이동 (ready_selector가 나타날 때까지 대기)"""
         print(f"\n[INFO] {page_name} 페이지 이동 중...")
 
         # 메인 페이지
-        await self.page.goto(f"{self.base_url}/main/viewMain.do",
-                           wait_until="domcontentloaded",
-                           timeout=60000)
-        await asyncio.sleep(2)
+        await self.factory.goto(self.page, f"{self.base_url}/main/viewMain.do")
 
         # 매핑 테이블 페이지
-        await self.page.evaluate("fn_go_page('3070000', '')")
-        await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
-        await asyncio.sleep(2)
+        await self.factory.run_and_wait(self.page, "fn_go_page('3070000', '')", navigates=True)
 
         # 해당 타입 페이지
-        await self.page.evaluate(f"fn_go_page('{menu_code}', '')")
-        await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
-        await asyncio.sleep(3)
+        await self.factory.run_and_wait(
+            self.page, f"fn_go_page('{menu_code}', '')",
+            ready_selector=ready_selector, navigates=True
+        )
 
         print(f"[OK] {page_name} 페이지 접근 완료")
 
@@ -120,7 +115,7 @@ class FileDownloader:
         print("KCD-SNOMED CT 파일 다운로드")
         print("=" * 60)
 
-        await self.navigate_to_page("3070100", "KCD-SNOMED CT")
+        await self.navigate_to_page("3070100", "KCD-SNOMED CT", "button.btn_go_download")
 
         downloads = []
 
@@ -151,7 +146,7 @@ class FileDownloader:
         print("EDI-SNOMED CT 파일 다운로드")
         print("=" * 60)
 
-        await self.navigate_to_page("3070200", "EDI-SNOMED CT")
+        await self.navigate_to_page("3070200", "EDI-SNOMED CT", "table")
 
         downloads = []
 
@@ -7,8 +7,8 @@ KCD-SNOMED CT, EDI-SNOMED CT, 기타-SNOMED CT 각각의
 
 import asyncio
 import json
+import sys
 from pathlib import Path
-from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
@@ -16,6 +16,10 @@ from datetime import datetime
 
 # 프로젝트 루트 및 데이터 디렉토리
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.browser import AsyncBrowserFactory
+
 DATA_DIR = PROJECT_ROOT / "data" / "hins"
 RAW_DIR = DATA_DIR / "raw"
 PARSED_DIR = DATA_DIR / "parsed"
@@ -32,27 +36,24 @@ class MappingDataScraper:
     def __init__(self, headless=False):
         self.headless = headless
         self.base_url = "https://hins.or.kr"
-        self.browser = None
+        self.factory = None
         self.page = None
 
     async def init_browser(self):
         """브라우저 초기화"""
         print("[INFO] 브라우저 시작...")
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
+        self.factory = AsyncBrowserFactory(
             headless=self.headless,
-            args=['--start-maximized']
+            timeout=60000,
+            timings_path=RAW_DIR / "page_timings.json"
         )
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080}
-        )
-        self.page = await context.new_page()
+        self.page = await self.factory.new_page()
         print("[OK] 브라우저 시작 완료")
 
     async def close_browser(self):
         """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
+        if self.factory:
+            await self.factory.close()
             print("[INFO] 브라우저 종료")
 
     async def navigate_and_click(self, menu_code, mapping_type):
@@ -60,21 +61,17 @@ class MappingDataScraper:
         print(f"\n[INFO] {mapping_type} 페이지로 이동 중...")
 
         # 메인 페이지 접속
-        await self.page.goto(f"{self.base_url}/main/viewMain.do",
-                           wait_until="domcontentloaded",
-                           timeout=60000)
-        await asyncio.sleep(3)
+        await self.factory.goto(self.page, f"{self.base_url}/main/viewMain.do")
 
         # 매핑 테이블 페이지로 이동
-        await self.page.evaluate("fn_go_page('3070000', '')")
-        await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
-        await asyncio.sleep(3)
+        await self.factory.run_and_wait(self.page, "fn_go_page('3070000', '')", navigates=True)
 
-        # 해당 매핑 타입 버튼 클릭
+        # 해당 매핑 타입 버튼 클릭 (매핑 테이블이 렌더링될 때까지 대기)
         print(f"[INFO] {mapping_type} 버튼 클릭...")
-        await self.page.evaluate(f"fn_go_page('{menu_code}', '')")
-        await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
-        await asyncio.sleep(5)
+        await self.factory.run_and_wait(
+            self.page, f"fn_go_page('{menu_code}', '')",
+            ready_selector="table", navigates=True
+        )
 
         current_url = self.page.url
         print(f"[OK] {mapping_type} 페이지 접근: {current_url}")
@@ -246,11 +243,9 @@ class MappingDataScraper:
 
             # 1. KCD-SNOMED CT
             results["kcd"] = await self.scrape_mapping_type("3070100", "KCD-SNOMED CT")
-            await asyncio.sleep(3)
 
             # 2. EDI-SNOMED CT
             results["edi"] = await self.scrape_mapping_type("3070200", "EDI-SNOMED CT")
-            await asyncio.sleep(3)
 
             # 3. 기타-SNOMED CT (메뉴 코드 확인 필요)
             # results["etc"] = await self.scrape_mapping_type("3070300", "기타-SNOMED CT")
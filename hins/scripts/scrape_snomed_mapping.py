@@ -7,9 +7,9 @@ KCD-SNOMED CT, EDI-SNOMED CT, 기타-SNOMED CT 매핑 데이터 수집
 
 import asyncio
 import json
-import time
+import sys
 from pathlib import Path
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
 from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
@@ -17,6 +17,10 @@ from datetime import datetime
 
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.browser import AsyncBrowserFactory
+
 DATA_DIR = PROJECT_ROOT / "data" / "hins"
 RAW_DIR = DATA_DIR / "raw"
 PARSED_DIR = DATA_DIR / "parsed"
@@ -34,55 +38,45 @@ class HINSScraper:
     def __init__(self, headless=False):
         self.headless = headless
         self.base_url = "https://hins.or.kr"
-        self.browser: Browser = None
+        self.factory: AsyncBrowserFactory = None
         self.page: Page = None
 
     async def init_browser(self):
         """브라우저 초기화"""
         print("[INFO] Playwright 브라우저 시작...")
-        playwright = await async_playwright().start()
-
-        # Chromium 브라우저 실행 (헤드리스 모드 선택 가능)
-        self.browser = await playwright.chromium.launch(
+        # 경량 프로파일 Chromium 실행 (헤드리스 모드 선택 가능)
+        self.factory = AsyncBrowserFactory(
             headless=self.headless,
-            args=['--start-maximized']  # 최대화 모드
+            timeout=60000,
+            timings_path=RAW_DIR / "page_timings.json"
         )
 
         # 새 페이지 생성
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        context = await self.factory.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            accept_downloads=True
         )
-        self.page = await context.new_page()
+        self.page = await self.factory.new_page(context)
 
         print("[OK] 브라우저 시작 완료")
 
     async def close_browser(self):
         """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
+        if self.factory:
+            await self.factory.close()
             print("[INFO] 브라우저 종료")
 
     async def navigate_to_mapping_table(self):
         """SNOMED CT 매핑 테이블 페이지로 이동"""
         print(f"[INFO] 메인 페이지 접속: {self.base_url}")
 
-        # 메인 페이지 접속 (타임아웃 증가, 조건 완화)
-        await self.page.goto(f"{self.base_url}/main/viewMain.do",
-                           wait_until="domcontentloaded",
-                           timeout=60000)
-        await asyncio.sleep(5)  # 페이지 로딩 대기
+        # 메인 페이지 접속
+        await self.factory.goto(self.page, f"{self.base_url}/main/viewMain.do")
 
         print("[INFO] SNOMED CT 메뉴 클릭...")
 
-        # JavaScript 함수 직접 호출 (fn_go_page('3070000',''))
-        await self.page.evaluate("""
-            fn_go_page('3070000', '');
-        """)
-
-        # 페이지 전환 대기
-        await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
-        await asyncio.sleep(5)
+        # JavaScript 함수 직접 호출 (fn_go_page('3070000','')) 후 페이지 전환 대기
+        await self.factory.run_and_wait(self.page, "fn_go_page('3070000', '')", navigates=True)
 
         current_url = self.page.url
         print(f"[OK] 매핑 테이블 페이지 접근: {current_url}")
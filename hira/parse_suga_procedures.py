@@ -5,19 +5,61 @@
 1. 전체 페이지에서 EDI 코드와 수가 정보 추출
 2. Procedure 노드 생성을 위한 데이터 준비
 3. 정규화된 JSON 형식으로 저장
+
+표 추출(pdfplumber 레이아웃 분석)은 페이지당 CPU 작업이므로
+페이지 구간을 프로세스 풀에 나눠 병렬로 처리한다.
+각 워커는 PDF를 직접 열고, 결과는 페이지 순서대로 돌려받아 합친다.
 """
 
 import pdfplumber
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 pdf_path = Path("data/hira/ebook/2025년 1월판 건강보험요양급여비용-(G000A37-2025-16).pdf")
 output_dir = Path("data/hira/parsed")
 output_dir.mkdir(parents=True, exist_ok=True)
 
+# 워커 1개가 한 번에 처리할 페이지 수 (작을수록 진행 표시가 촘촘, 클수록 PDF 재오픈 비용 감소)
+PAGES_PER_SHARD = 50
+
+
+def page_shards(pages_to_parse: int, shard_size: int = PAGES_PER_SHARD) -> List[Tuple[int, int]]:
+    """[start, end) 페이지 구간 목록"""
+    return [(start, min(start + shard_size, pages_to_parse))
+            for start in range(0, pages_to_parse, shard_size)]
+
+
+def _parse_shard(args: Tuple[str, int, int]) -> Dict[str, Any]:
+    """
+    페이지 구간 파싱 (프로세스 풀 워커)
+
+    워커마다 PDF를 따로 열고 별도 파서 인스턴스로 처리해
+    procedures / errors / 통계만 돌려준다.
+    """
+    path, start, end = args
+    parser = SUGAProcedureParser()
+
+    with pdfplumber.open(path) as pdf:
+        for page_num in range(start, end):
+            page = pdf.pages[page_num]
+            parser.procedures.extend(parser.parse_page(page_num, page))
+            # 레이아웃 캐시 해제 (구간이 길어도 워커 메모리 일정 유지)
+            page.flush_cache()
+
+    return {
+        'start': start,
+        'end': end,
+        'procedures': parser.procedures,
+        'errors': parser.errors,
+        'pages_with_tables': parser.stats['pages_with_tables'],
+        'parsing_errors': parser.stats['parsing_errors'],
+    }
+
 
 class SUGAProcedureParser:
     """건강보험요양급여비용 파서"""
@@ -197,40 +239,66 @@ class SUGAProcedureParser:
 
         return page_procedures
 
-    def parse_pdf(self, max_pages: Optional[int] = None):
-        """PDF 전체 파싱"""
+    def iter_shards(self, shards: List[Tuple[int, int]], workers: int) -> Iterator[Dict[str, Any]]:
+        """
+        페이지 구간 결과를 페이지 순서대로 반환
+
+        workers가 1이면 현재 프로세스에서 순차 처리
+        (executor.map은 제출 순서대로 결과를 내주므로 먼저 끝난 뒤 구간은 앞 구간을 기다림)
+        """
+        jobs = [(str(pdf_path), start, end) for start, end in shards]
+        if workers <= 1 or len(jobs) <= 1:
+            yield from map(_parse_shard, jobs)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_parse_shard, jobs)
+
+    def parse_pdf(self, max_pages: Optional[int] = None, workers: Optional[int] = None,
+                  shard_size: int = PAGES_PER_SHARD):
+        """
+        PDF 전체 파싱
+
+        Args:
+            max_pages: 최대 페이지 수 (테스트용)
+            workers: 프로세스 수 (기본값: CPU 코어 수, 1이면 순차 처리)
+            shard_size: 워커 1회 처리 페이지 수
+        """
+        workers = workers or os.cpu_count() or 1
+
         print(f"PDF 파싱 시작: {pdf_path}")
         print(f"출력 디렉토리: {output_dir}")
         print("="*80)
 
         with pdfplumber.open(pdf_path) as pdf:
             total_pages = len(pdf.pages)
-            self.stats['total_pages'] = total_pages
+        self.stats['total_pages'] = total_pages
 
-            # 최대 페이지 제한 (테스트용)
-            pages_to_parse = min(total_pages, max_pages) if max_pages else total_pages
+        # 최대 페이지 제한 (테스트용)
+        pages_to_parse = min(total_pages, max_pages) if max_pages else total_pages
+        shards = page_shards(pages_to_parse, shard_size)
 
-            print(f"총 페이지: {total_pages}")
-            print(f"파싱할 페이지: {pages_to_parse}")
-            print("="*80)
+        print(f"총 페이지: {total_pages}")
+        print(f"파싱할 페이지: {pages_to_parse} ({len(shards)}개 구간, 프로세스 {workers}개)")
+        print("="*80)
 
-            # 각 페이지 처리
-            for page_num in range(pages_to_parse):
-                if (page_num + 1) % 100 == 0:
-                    print(f"진행: {page_num + 1}/{pages_to_parse} 페이지 처리 중... (수집: {len(self.procedures)} procedures)")
+        # 구간 결과를 페이지 순서대로 합침 (에러도 페이지 순서 유지)
+        for shard in self.iter_shards(shards, workers):
+            self.procedures.extend(shard['procedures'])
+            self.errors.extend(shard['errors'])
+            self.stats['pages_with_tables'] += shard['pages_with_tables']
+            self.stats['parsing_errors'] += shard['parsing_errors']
 
-                page = pdf.pages[page_num]
-                page_procedures = self.parse_page(page_num, page)
-                self.procedures.extend(page_procedures)
+            print(f"진행: {shard['end']}/{pages_to_parse} 페이지 처리 완료 (수집: {len(self.procedures)} procedures)")
 
-            self.stats['total_procedures'] = len(self.procedures)
+        self.stats['total_procedures'] = len(self.procedures)
 
-            print("="*80)
-            print(f"파싱 완료!")
-            print(f"  총 페이지: {self.stats['total_pages']}")
-            print(f"  표 있는 페이지: {self.stats['pages_with_tables']}")
-            print(f"  추출된 procedures: {self.stats['total_procedures']}")
-            print(f"  파싱 에러: {self.stats['parsing_errors']}")
+        print("="*80)
+        print(f"파싱 완료!")
+        print(f"  총 페이지: {self.stats['total_pages']}")
+        print(f"  표 있는 페이지: {self.stats['pages_with_tables']}")
+        print(f"  추출된 procedures: {self.stats['total_procedures']}")
+        print(f"  파싱 에러: {self.stats['parsing_errors']}")
 
     def remove_duplicates(self):
         """중복 제거 (EDI 코드 기준)"""
@@ -308,7 +376,7 @@ def main():
     """메인 실행"""
     parser = SUGAProcedureParser()
 
-    # PDF 파싱 - 전체 페이지
+    # PDF 파싱 - 전체 페이지 (CPU 코어 수만큼 프로세스 병렬)
     parser.parse_pdf(max_pages=None)
 
     # 중복 제거
@@ -9,10 +9,24 @@
 - bbox 좌표 유사성으로 동일 표 판단
 - 헤더 일치 여부 검사
 - 연속 페이지의 행을 하나의 표로 병합
+
+표 감지 결과(find_tables)는 layout_cache에서 읽음 (최초 1회만 레이아웃 분석)
+
+스트리밍 처리:
+- 표 조각은 페이지 순서대로 생성 (iter_table_segments)
+- 병합기는 열려 있는 표 버퍼만 들고 있다가 연속이 끊기면 즉시 내보냄 (iter_merged_tables)
+- 결과는 표 단위로 JSONL에 바로 기록 (write_merged_tables_jsonl)
+→ 문서 전체의 표를 메모리에 올리지 않음
 """
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
-import pdfplumber
+import json
+import sys
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hira.table_parser.layout_cache import LayoutCache
 
 
 class TableSegment:
@@ -27,96 +41,113 @@ class TableSegment:
 
 
 class MergedTable:
-    """병합된 표"""
+    """병합된 표 (행은 세그먼트를 그대로 참조, 필요할 때만 이어 붙임)"""
     def __init__(self, segments: List[TableSegment]):
         self.segments = segments
         self.start_page = segments[0].page_num
         self.end_page = segments[-1].page_num
         self.pages = [s.page_num for s in segments]
 
-        # 데이터 병합
         self.header = segments[0].header if segments[0].has_header else None
-        self.rows = self._merge_rows()
 
-    def _merge_rows(self) -> List[List]:
-        """모든 세그먼트의 행 병합"""
-        all_rows = []
+    @property
+    def num_pages(self) -> int:
+        return len(self.pages)
 
+    def iter_rows(self) -> Iterator[List]:
+        """모든 세그먼트의 행 (첫 세그먼트는 헤더 포함, 나머지는 반복 헤더 제외)"""
         for i, segment in enumerate(self.segments):
-            if i == 0:
-                # 첫 세그먼트: 헤더 포함 전체
-                all_rows.extend(segment.data)
+            if i > 0 and segment.has_header:
+                yield from segment.data[1:]
             else:
-                # 나머지: 헤더 제외
-                if segment.has_header:
-                    all_rows.extend(segment.data[1:])
-                else:
-                    all_rows.extend(segment.data)
+                yield from segment.data
+
+    @property
+    def rows(self) -> List[List]:
+        return list(self.iter_rows())
 
-        return all_rows
+    @property
+    def row_count(self) -> int:
+        """헤더 포함 전체 행 수 (행 복사 없이 계산)"""
+        return sum(len(s.data) - (1 if i > 0 and s.has_header else 0)
+                   for i, s in enumerate(self.segments))
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리 변환"""
+        rows = self.rows
         return {
             'start_page': self.start_page,
             'end_page': self.end_page,
             'pages': self.pages,
-            'num_pages': len(self.pages),
+            'num_pages': self.num_pages,
             'header': self.header,
-            'rows': self.rows,
-            'num_rows': len(self.rows) - (1 if self.header else 0),
-            'num_cols': len(self.header) if self.header else (len(self.rows[0]) if self.rows else 0)
+            'rows': rows,
+            'num_rows': len(rows) - (1 if self.header else 0),
+            'num_cols': len(self.header) if self.header else (len(rows[0]) if rows else 0)
         }
 
 
-def extract_table_segments(pdf_path: Path, page_range: Tuple[int, int] = None) -> List[TableSegment]:
+def extract_table_segments(pdf_path: Path, page_range: Tuple[int, int] = None,
+                           cache: Optional[LayoutCache] = None) -> List[TableSegment]:
     """
-    PDF에서 표 조각 추출
+    PDF에서 표 조각 추출 (전체 목록)
 
     Args:
         pdf_path: PDF 파일 경로
         page_range: (start, end) 페이지 범위 (1-based), None이면 전체
+        cache: 레이아웃 캐시 (없으면 새로 생성)
 
     Returns:
         TableSegment 리스트
     """
-    segments = []
+    if cache is None:
+        with LayoutCache(pdf_path) as cache:
+            return list(iter_table_segments(pdf_path, page_range, cache))
+    return list(iter_table_segments(pdf_path, page_range, cache))
 
-    with pdfplumber.open(pdf_path) as pdf:
-        if page_range:
-            start, end = page_range
-            pages = pdf.pages[start-1:end]
-            page_nums = range(start, end+1)
-        else:
-            pages = pdf.pages
-            page_nums = range(1, len(pdf.pages)+1)
 
-        for page_num, page in zip(page_nums, pages):
-            tables = page.find_tables()
+def iter_table_segments(pdf_path: Path, page_range: Tuple[int, int] = None,
+                        cache: Optional[LayoutCache] = None) -> Iterator[TableSegment]:
+    """
+    PDF에서 표 조각을 페이지 순서대로 생성
+
+    Args:
+        pdf_path: PDF 파일 경로
+        page_range: (start, end) 페이지 범위 (1-based), None이면 전체
+        cache: 레이아웃 캐시 (없으면 새로 생성 후 순회가 끝나면 닫음)
+    """
+    if cache is None:
+        with LayoutCache(pdf_path) as cache:
+            yield from iter_table_segments(pdf_path, page_range, cache)
+        return
+
+    start, end = page_range if page_range else (1, None)
 
-            for table_idx, table in enumerate(tables):
-                data = table.extract()
+    for page in cache.pages(start, end):
+        page_num = page.page_num
+        tables = page.find_tables()
 
-                # 유효한 행만 필터
-                valid_data = [row for row in data if any(cell for cell in row)]
+        for table_idx, table in enumerate(tables):
+            data = table.extract()
 
-                if not valid_data:
-                    continue
+            # 유효한 행만 필터
+            valid_data = [row for row in data if any(cell for cell in row)]
 
-                # 헤더 감지 (휴리스틱)
-                has_header = detect_header(valid_data)
+            if not valid_data:
+                continue
 
-                segment = TableSegment(
-                    page_num=page_num,
-                    table_idx=table_idx,
-                    bbox=table.bbox,
-                    data=valid_data,
-                    has_header=has_header
-                )
+            # 헤더 감지 (휴리스틱)
+            has_header = detect_header(valid_data)
 
-                segments.append(segment)
+            segment = TableSegment(
+                page_num=page_num,
+                table_idx=table_idx,
+                bbox=table.bbox,
+                data=valid_data,
+                has_header=has_header
+            )
 
-    return segments
+            yield segment
 
 
 def detect_header(data: List[List]) -> bool:
@@ -190,16 +221,22 @@ def is_continuation(seg_a: TableSegment, seg_b: TableSegment, threshold: float =
     return True
 
 
-def merge_cross_page_tables(segments: List[TableSegment]) -> List[MergedTable]:
+def merge_cross_page_tables(segments: Iterable[TableSegment]) -> List[MergedTable]:
+    """페이지 간 표 병합 (전체 목록)"""
+    return list(iter_merged_tables(segments))
+
+
+def iter_merged_tables(segments: Iterable[TableSegment]) -> Iterator[MergedTable]:
     """
-    페이지 간 표 병합
+    페이지 간 표 병합 (스트리밍)
 
     알고리즘:
     - 순차적으로 스캔
     - 연속 조건 만족 시 버퍼에 누적
-    - 불일치 시 버퍼 flush 후 새 표 시작
+    - 불일치 시 버퍼 flush(즉시 yield) 후 새 표 시작
+
+    메모리에는 아직 끝나지 않은 표의 세그먼트만 남음
     """
-    merged_tables = []
     buffer = []
 
     for segment in segments:
@@ -211,53 +248,86 @@ def merge_cross_page_tables(segments: List[TableSegment]) -> List[MergedTable]:
             buffer.append(segment)
         else:
             # 불일치 → 버퍼 flush
-            if buffer:
-                merged_tables.append(MergedTable(buffer))
+            yield MergedTable(buffer)
             buffer = [segment]
 
     # 마지막 버퍼 처리
     if buffer:
-        merged_tables.append(MergedTable(buffer))
+        yield MergedTable(buffer)
+
+
+def new_merge_stats() -> Dict[str, int]:
+    return {
+        'segments': 0,
+        'merged_tables': 0,
+        'single_page_tables': 0,
+        'multi_page_tables': 0,
+        'max_pages_in_table': 0,
+        'total_rows_before': 0,
+        'total_rows_after': 0,
+    }
 
-    return merged_tables
 
+def update_merge_stats(stats: Dict[str, int], table: MergedTable) -> None:
+    """병합 표 1개를 통계에 누적"""
+    stats['segments'] += len(table.segments)
+    stats['merged_tables'] += 1
+    if table.num_pages == 1:
+        stats['single_page_tables'] += 1
+    else:
+        stats['multi_page_tables'] += 1
+    stats['max_pages_in_table'] = max(stats['max_pages_in_table'], table.num_pages)
+    stats['total_rows_before'] += sum(len(s.data) for s in table.segments)
+    stats['total_rows_after'] += table.row_count
 
-def analyze_cross_page_tables(pdf_path: Path, page_range: Tuple[int, int] = None) -> Dict[str, Any]:
+
+def write_merged_tables_jsonl(pdf_path: Path, output_path: Path, page_range: Tuple[int, int] = None,
+                              cache: Optional[LayoutCache] = None) -> Dict[str, int]:
     """
-    페이지 간 표 분석
+    병합된 표를 한 줄에 하나씩 JSONL로 기록 (표가 완성되는 즉시 기록)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        output_path: 출력 JSONL 경로
+        page_range: (start, end) 페이지 범위 (1-based), None이면 전체
+        cache: 레이아웃 캐시
 
     Returns:
-        통계 및 병합 결과
+        병합 통계
     """
-    print(f"Extracting table segments from {pdf_path.name}...")
-    segments = extract_table_segments(pdf_path, page_range)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stats = new_merge_stats()
+
+    segments = iter_table_segments(pdf_path, page_range, cache)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for table_idx, table in enumerate(iter_merged_tables(segments), 1):
+            record = {'table_id': f"m{table_idx}", **table.to_dict()}
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            update_merge_stats(stats, table)
 
-    print(f"  Found {len(segments)} table segments")
+    return stats
 
-    print("\nMerging cross-page tables...")
-    merged_tables = merge_cross_page_tables(segments)
 
-    print(f"  Result: {len(merged_tables)} merged tables")
+def analyze_cross_page_tables(pdf_path: Path, page_range: Tuple[int, int] = None) -> Dict[str, Any]:
+    """
+    페이지 간 표 분석
 
-    # 통계
-    single_page = sum(1 for t in merged_tables if t.num_pages == 1)
-    multi_page = sum(1 for t in merged_tables if t.num_pages > 1)
-    max_pages = max((t.num_pages for t in merged_tables), default=0)
+    Returns:
+        통계 및 병합 결과
+    """
+    print(f"Extracting and merging table segments from {pdf_path.name}...")
+    stats = new_merge_stats()
+    tables = []
 
-    total_rows_before = sum(len(s.data) for s in segments)
-    total_rows_after = sum(len(t.rows) for t in merged_tables)
+    for table in iter_merged_tables(iter_table_segments(pdf_path, page_range)):
+        update_merge_stats(stats, table)
+        tables.append(table.to_dict())
 
-    stats = {
-        'segments': len(segments),
-        'merged_tables': len(merged_tables),
-        'single_page_tables': single_page,
-        'multi_page_tables': multi_page,
-        'max_pages_in_table': max_pages,
-        'total_rows_before': total_rows_before,
-        'total_rows_after': total_rows_after,
-        'tables': [t.to_dict() for t in merged_tables]
-    }
+    print(f"  Found {stats['segments']} table segments")
+    print(f"  Result: {stats['merged_tables']} merged tables")
 
+    stats['tables'] = tables
     return stats
 
 
@@ -304,6 +374,11 @@ def main():
         if table['rows']:
             print(f"  첫 행: {table['rows'][1][:3] if len(table['rows']) > 1 else table['rows'][0][:3]}")
 
+    # 스트리밍 JSONL 출력 (표가 완성되는 즉시 기록)
+    output_path = base_dir / "data" / "hira" / "table_parser" / "merged_tables_sample.jsonl"
+    jsonl_stats = write_merged_tables_jsonl(pdf_path, output_path, page_range=(100, 110))
+    print(f"\nJSONL 저장: {output_path} ({jsonl_stats['merged_tables']}개 표)")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,252 @@
+"""
+PDF 페이지 레이아웃 캐시
+
+표 파서 도구들(mvp_parser, cross_page_merger, toc_extractor)이 같은 ebook을 열 때마다
+extract_text() / find_tables() 레이아웃 분석을 다시 돌리지 않도록
+페이지별 분석 결과를 한 번만 계산해 디스크에 저장한다.
+
+- 캐시 키: PDF 파일 SHA-256 + 페이지 번호 (파일이 바뀌면 자동으로 새 캐시)
+- 페이지별 gzip JSON (좌표는 소수 1자리로 반올림한 배열)
+- 캐시에 없는 페이지만 pdfplumber로 열어 분석 (PDF는 필요할 때 한 번만 오픈)
+- 페이지별 추가 결과 저장 (예: Camelot lattice 결과)
+
+저장 구조:
+    data/hira/table_parser/layout_cache/<sha256 앞 16자리>/
+        meta.json            {"source": "...", "sha256": "...", "page_count": 512, "version": 1}
+        p00001.json.gz       {"page": 1, "width": ..., "height": ..., "text": "...",
+                              "words": [[x0, top, x1, bottom, "텍스트"], ...],
+                              "lines": [[x0, top, x1, bottom], ...],
+                              "rects": [[x0, top, x1, bottom], ...],
+                              "tables": [{"bbox": [...], "rows": [[...], ...]}],
+                              "extras": {"camelot_lattice": [...]}}
+
+사용 예:
+    with LayoutCache(pdf_path) as cache:
+        for page in cache.pages(100, 110):
+            for table in page.tables:
+                rows = table.extract()
+"""
+import gzip
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "hira" / "table_parser" / "layout_cache"
+
+# 레코드 구조/표 감지 설정이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 1
+COORD_PRECISION = 1
+
+# 메모리에 유지할 최근 페이지 수 (긴 문서를 순회해도 메모리 일정)
+MEMORY_PAGES = 32
+
+
+def pdf_sha256(pdf_path: Path, chunk_size: int = 1 << 20) -> str:
+    """PDF 파일 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _box(obj: Dict[str, Any]) -> List[float]:
+    return [round(obj[k], COORD_PRECISION) for k in ('x0', 'top', 'x1', 'bottom')]
+
+
+class CachedTable:
+    """캐시된 표 (pdfplumber Table과 같은 bbox / extract() 인터페이스)"""
+
+    def __init__(self, bbox: List[float], rows: List[List[Optional[str]]]):
+        self.bbox = tuple(bbox)
+        self.rows = rows
+
+    def extract(self) -> List[List[Optional[str]]]:
+        return self.rows
+
+
+class CachedPage:
+    """캐시된 페이지 레이아웃"""
+
+    def __init__(self, record: Dict[str, Any]):
+        self.record = record
+        self.page_num = record['page']
+        self.width = record['width']
+        self.height = record['height']
+        self.text = record['text']
+        self.words = record['words']
+        self.lines = record['lines']
+        self.rects = record['rects']
+        self.tables = [CachedTable(t['bbox'], t['rows']) for t in record['tables']]
+
+    def extract_text(self) -> str:
+        return self.text
+
+    def find_tables(self) -> List[CachedTable]:
+        return self.tables
+
+    def extra(self, key: str) -> Any:
+        """페이지별 추가 결과 (없으면 None)"""
+        return self.record.get('extras', {}).get(key)
+
+
+def analyze_page(page, page_num: int) -> Dict[str, Any]:
+    """
+    pdfplumber 페이지 1개 레이아웃 분석 → 캐시 레코드
+
+    Args:
+        page: pdfplumber Page
+        page_num: 페이지 번호 (1-based)
+    """
+    tables = []
+    for table in page.find_tables():
+        tables.append({
+            'bbox': [round(v, COORD_PRECISION) for v in table.bbox],
+            'rows': table.extract(),
+        })
+
+    return {
+        'page': page_num,
+        'width': round(page.width, COORD_PRECISION),
+        'height': round(page.height, COORD_PRECISION),
+        'text': page.extract_text() or '',
+        'words': [_box(w) + [w['text']] for w in page.extract_words()],
+        'lines': [_box(line) for line in page.lines],
+        'rects': [_box(rect) for rect in page.rects],
+        'tables': tables,
+        'extras': {},
+    }
+
+
+class LayoutCache:
+    """PDF 1개에 대한 페이지별 레이아웃 캐시"""
+
+    def __init__(self, pdf_path: Path, cache_dir: Path = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            pdf_path: PDF 파일 경로
+            cache_dir: 캐시 루트 디렉토리 (PDF별 하위 디렉토리 생성)
+        """
+        self.pdf_path = Path(pdf_path)
+        self.sha256 = pdf_sha256(self.pdf_path)
+        self.dir = Path(cache_dir) / self.sha256[:16]
+        self.meta_path = self.dir / "meta.json"
+
+        self._pdf = None
+        self._memory: "OrderedDict[int, CachedPage]" = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0}
+
+        self.meta: Dict[str, Any] = {}
+        if self.meta_path.exists():
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                self.meta = json.load(f)
+        if self.meta.get('version') != CACHE_VERSION or self.meta.get('sha256') != self.sha256:
+            self.meta = {'source': self.pdf_path.name, 'sha256': self.sha256,
+                         'page_count': None, 'version': CACHE_VERSION}
+            self._clear()
+            # 새 meta를 바로 저장 (이전 meta가 남으면 열 때마다 다시 비움)
+            self._save_meta()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """열려 있는 PDF 닫기"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    @property
+    def page_count(self) -> int:
+        """전체 페이지 수 (한 번 확인하면 meta.json에 저장)"""
+        if self.meta.get('page_count') is None:
+            self.meta['page_count'] = len(self._open().pages)
+            self._save_meta()
+        return self.meta['page_count']
+
+    def page(self, page_num: int) -> CachedPage:
+        """
+        페이지 레이아웃 (캐시에 없으면 분석 후 저장)
+
+        Args:
+            page_num: 페이지 번호 (1-based)
+        """
+        if page_num in self._memory:
+            self.stats['hits'] += 1
+            self._memory.move_to_end(page_num)
+            return self._memory[page_num]
+
+        path = self._page_path(page_num)
+        if path.exists():
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                record = json.load(f)
+            self.stats['hits'] += 1
+        else:
+            pdf_page = self._open().pages[page_num - 1]
+            record = analyze_page(pdf_page, page_num)
+            # 레이아웃 객체 캐시 해제 (긴 문서에서 메모리 누적 방지)
+            pdf_page.flush_cache()
+            self._write(record)
+            self.stats['misses'] += 1
+
+        cached = CachedPage(record)
+        self._memory[page_num] = cached
+        if len(self._memory) > MEMORY_PAGES:
+            self._memory.popitem(last=False)
+        return cached
+
+    def pages(self, start: int = 1, end: Optional[int] = None) -> Iterator[CachedPage]:
+        """
+        페이지 범위 순회 (1-based, end 포함)
+
+        Args:
+            start: 시작 페이지
+            end: 마지막 페이지 (None이면 문서 끝)
+        """
+        end = min(end or self.page_count, self.page_count)
+        for page_num in range(start, end + 1):
+            yield self.page(page_num)
+
+    def set_extra(self, page_num: int, key: str, value: Any) -> None:
+        """페이지별 추가 결과 저장 (Camelot 결과 등 다른 도구의 페이지 단위 산출물)"""
+        cached = self.page(page_num)
+        cached.record.setdefault('extras', {})[key] = value
+        self._write(cached.record)
+
+    def _open(self):
+        if self._pdf is None:
+            import pdfplumber
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    def _page_path(self, page_num: int) -> Path:
+        return self.dir / f"p{page_num:05d}.json.gz"
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """페이지 레코드 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        if not self.meta_path.exists():
+            self._save_meta()
+
+        path = self._page_path(record['page'])
+        tmp_path = path.with_name(path.name + '.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def _save_meta(self) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=2)
+
+    def _clear(self) -> None:
+        """버전/파일이 다른 기존 캐시 삭제"""
+        if self.dir.exists():
+            for path in self.dir.glob("p*.json.gz"):
+                path.unlink()
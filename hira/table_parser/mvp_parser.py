@@ -7,72 +7,91 @@ Phase: Option C - Step 1 (2시간)
 - Camelot lattice로 격자형 표 파싱
 - 행 단위 JSONL 출력
 - source_anchor 포함
+
+페이지 텍스트와 Camelot 결과는 layout_cache에 저장해 두고 재실행 시 재사용
 """
 import re
 import json
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
-import pdfplumber
+from typing import List, Dict, Any, Optional
 import camelot
 
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hira.table_parser.layout_cache import LayoutCache
+
 # 상수
 TABLE_ANCHOR_PATTERN = r'표\s*\d+(-\d+)?|도표\s*\d+|그림\s*\d+'
 CODE_REF_PATTERN = r'고시\s*제?\d{4}-\d+|수가\s*[가-힣A-Z\d]+|\d{4}\.\d+\.\d+\.\s*개정|법률\s*제\d+호'
 TABLE_SCORE_TH = 0.5
+CAMELOT_CACHE_KEY = "camelot_lattice"
 
 
-def detect_table_anchors(pdf_path: Path) -> List[Dict[str, Any]]:
+def detect_table_anchors(pdf_path: Path, cache: Optional[LayoutCache] = None) -> List[Dict[str, Any]]:
     """
     PDF에서 텍스트 앵커 기반 표 후보 감지
 
     Args:
         pdf_path: PDF 파일 경로
+        cache: 레이아웃 캐시 (없으면 새로 생성)
 
     Returns:
         [{"page": 10, "anchor": "표 3-2", "bbox": [x0, y0, x1, y1], "score": 0.9}, ...]
     """
+    if cache is None:
+        with LayoutCache(pdf_path) as cache:
+            return detect_table_anchors(pdf_path, cache)
+
     candidates = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, 1):
-            text = page.extract_text()
-            if not text:
-                continue
+    for page in cache.pages():
+        page_num = page.page_num
+        text = page.extract_text()
+        if not text:
+            continue
 
-            # 텍스트 앵커 찾기
-            matches = re.finditer(TABLE_ANCHOR_PATTERN, text)
-            for match in matches:
-                anchor = match.group()
+        # 텍스트 앵커 찾기
+        matches = re.finditer(TABLE_ANCHOR_PATTERN, text)
+        for match in matches:
+            anchor = match.group()
 
-                # 앵커 근처에 표가 있을 가능성 높음
-                # 간단한 점수: 앵커가 있으면 0.8 기본 점수
-                score = 0.8
+            # 앵커 근처에 표가 있을 가능성 높음
+            # 간단한 점수: 앵커가 있으면 0.8 기본 점수
+            score = 0.8
 
-                # 페이지 내 표 구조 힌트 (선/사각형)
-                # Camelot이 자동으로 감지할 것이므로 일단 스킵
+            # 페이지 내 표 구조 힌트 (선/사각형)
+            # Camelot이 자동으로 감지할 것이므로 일단 스킵
 
-                candidates.append({
-                    "page": page_num,
-                    "anchor": anchor,
-                    "bbox": None,  # Camelot이 실제 bbox 제공
-                    "score": score,
-                    "has_anchor": True
-                })
+            candidates.append({
+                "page": page_num,
+                "anchor": anchor,
+                "bbox": None,  # Camelot이 실제 bbox 제공
+                "score": score,
+                "has_anchor": True
+            })
 
     return candidates
 
 
-def parse_with_camelot(pdf_path: Path, page_num: int) -> List[Any]:
+def parse_with_camelot(pdf_path: Path, page_num: int, cache: Optional[LayoutCache] = None) -> List[Dict[str, Any]]:
     """
-    Camelot lattice로 페이지의 표 파싱
+    Camelot lattice로 페이지의 표 파싱 (결과는 레이아웃 캐시에 저장해 재사용)
 
     Args:
         pdf_path: PDF 파일 경로
         page_num: 페이지 번호 (1-based)
+        cache: 레이아웃 캐시 (없으면 캐시 없이 파싱)
 
     Returns:
-        Camelot Table 객체 리스트
+        [{"rows": [[셀, ...], ...], "bbox": [x0, y0, x1, y1]}, ...]
     """
+    if cache is not None:
+        cached = cache.page(page_num).extra(CAMELOT_CACHE_KEY)
+        if cached is not None:
+            return cached
+
     try:
         # lattice: 격자형 표 (선이 명확한 경우)
         tables = camelot.read_pdf(
@@ -81,11 +100,22 @@ def parse_with_camelot(pdf_path: Path, page_num: int) -> List[Any]:
             flavor='lattice',
             line_scale=40  # 선 감지 임계값
         )
-        return tables
     except Exception as e:
+        # 실패는 캐시하지 않음 (다음 실행에서 재시도)
         print(f"  Camelot error on page {page_num}: {str(e)}")
         return []
 
+    results = [
+        {
+            "rows": table.df.values.tolist(),
+            "bbox": list(table._bbox) if hasattr(table, '_bbox') else None,
+        }
+        for table in tables
+    ]
+    if cache is not None:
+        cache.set_extra(page_num, CAMELOT_CACHE_KEY, results)
+    return results
+
 
 def normalize_table_row(row: List[str], headers: List[str]) -> Dict[str, Any]:
     """
@@ -166,86 +196,88 @@ def process_pdf_mvp(pdf_path: Path, doc_id: str, output_dir: Path) -> Dict[str,
     print(f"PDF: {pdf_path.name}")
     print(f"{'='*60}")
 
-    # 1. 텍스트 앵커 감지
-    print("\n[1] Detecting table anchors...")
-    candidates = detect_table_anchors(pdf_path)
-    print(f"  Found {len(candidates)} anchor candidates")
+    # 레이아웃 캐시 (페이지 텍스트 / Camelot 결과를 재실행 간 공유)
+    with LayoutCache(pdf_path) as cache:
+        # 1. 텍스트 앵커 감지
+        print("\n[1] Detecting table anchors...")
+        candidates = detect_table_anchors(pdf_path, cache)
+        print(f"  Found {len(candidates)} anchor candidates")
+
+        # 2. Camelot으로 표 파싱
+        print("\n[2] Parsing tables with Camelot lattice...")
+
+        all_records = []
+        summary = {
+            "doc_id": doc_id,
+            "total_candidates": len(candidates),
+            "total_tables": 0,
+            "total_rows": 0,
+            "pages_processed": set()
+        }
+
+        # 앵커가 있는 페이지 파싱
+        pages_with_anchors = set(c["page"] for c in candidates)
+
+        for page_num in sorted(pages_with_anchors):
+            print(f"  Processing page {page_num}...")
+            tables = parse_with_camelot(pdf_path, page_num, cache)
+
+            if not tables:
+                print(f"    No tables found")
+                continue
 
-    # 2. Camelot으로 표 파싱
-    print("\n[2] Parsing tables with Camelot lattice...")
+            print(f"    Found {len(tables)} tables")
+            summary["pages_processed"].add(page_num)
+            summary["total_tables"] += len(tables)
 
-    all_records = []
-    summary = {
-        "doc_id": doc_id,
-        "total_candidates": len(candidates),
-        "total_tables": 0,
-        "total_rows": 0,
-        "pages_processed": set()
-    }
+            for table_idx, table in enumerate(tables):
+                table_id = f"t{page_num}_{table_idx+1}"
 
-    # 앵커가 있는 페이지 파싱
-    pages_with_anchors = set(c["page"] for c in candidates)
+                rows = table["rows"]
 
-    for page_num in sorted(pages_with_anchors):
-        print(f"  Processing page {page_num}...")
-        tables = parse_with_camelot(pdf_path, page_num)
+                if not rows:
+                    continue
 
-        if not tables:
-            print(f"    No tables found")
-            continue
+                # 첫 행을 헤더로 사용
+                headers = [str(h).strip() for h in rows[0]]
 
-        print(f"    Found {len(tables)} tables")
-        summary["pages_processed"].add(page_num)
-        summary["total_tables"] += len(tables)
+                # 데이터 행 처리
+                for row_idx, row_data in enumerate(rows[1:], 1):
+                    row_id = f"{table_id}r{row_idx}"
 
-        for table_idx, table in enumerate(tables):
-            table_id = f"t{page_num}_{table_idx+1}"
+                    # 정규화
+                    table_kv = normalize_table_row(row_data, headers)
+                    text = row_to_text(table_kv)
 
-            # DataFrame으로 변환
-            df = table.df
+                    # code_refs 추출
+                    code_refs = extract_code_refs(text)
 
-            if df.empty:
-                continue
+                    # bbox (Camelot 제공)
+                    bbox = table["bbox"]
 
-            # 첫 행을 헤더로 사용
-            headers = df.iloc[0].tolist()
-            headers = [str(h).strip() for h in headers]
-
-            # 데이터 행 처리
-            for row_idx, row_data in enumerate(df.iloc[1:].values, 1):
-                row_id = f"{table_id}r{row_idx}"
-
-                # 정규화
-                table_kv = normalize_table_row(row_data.tolist(), headers)
-                text = row_to_text(table_kv)
-
-                # code_refs 추출
-                code_refs = extract_code_refs(text)
-
-                # bbox (Camelot 제공)
-                bbox = table._bbox if hasattr(table, '_bbox') else None
-
-                # 레코드 생성
-                record = {
-                    "doc_id": doc_id,
-                    "page": page_num,
-                    "table_id": table_id,
-                    "row_id": row_id,
-                    "level": 0,  # MVP에서는 중첩 테이블 미지원
-                    "parent_table_id": None,
-                    "text": text,
-                    "table_kv": table_kv,
-                    "bbox": bbox,
-                    "code_refs": code_refs,
-                    "source_anchor": {
+                    # 레코드 생성
+                    record = {
+                        "doc_id": doc_id,
                         "page": page_num,
                         "table_id": table_id,
-                        "row_id": row_id
+                        "row_id": row_id,
+                        "level": 0,  # MVP에서는 중첩 테이블 미지원
+                        "parent_table_id": None,
+                        "text": text,
+                        "table_kv": table_kv,
+                        "bbox": bbox,
+                        "code_refs": code_refs,
+                        "source_anchor": {
+                            "page": page_num,
+                            "table_id": table_id,
+                            "row_id": row_id
+                        }
                     }
-                }
 
-                all_records.append(record)
-                summary["total_rows"] += 1
+                    all_records.append(record)
+                    summary["total_rows"] += 1
+
+    print(f"  Layout cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses ({cache.dir})")
 
     # 3. JSONL 출력
     print(f"\n[3] Generating output...")
@@ -5,63 +5,74 @@
 - PDF에서 목차 페이지 감지
 - 섹션명-페이지 범위 매핑
 - 복잡도 추정 (표 밀도, 중첩 여부)
+
+페이지 텍스트/표 감지 결과는 layout_cache에서 읽음
 """
 import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
-import pdfplumber
+from typing import List, Dict, Any, Optional
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hira.table_parser.layout_cache import LayoutCache
 
 
-def extract_toc(pdf_path: Path, max_pages: int = 20) -> List[Dict[str, Any]]:
+def extract_toc(pdf_path: Path, max_pages: int = 20, cache: Optional[LayoutCache] = None) -> List[Dict[str, Any]]:
     """
     목차 추출
 
     Args:
         pdf_path: PDF 파일 경로
         max_pages: 목차 검색 범위 (기본 20페이지)
+        cache: 레이아웃 캐시 (없으면 새로 생성)
 
     Returns:
         섹션 리스트 [{"title": "...", "start_page": N, "end_page": M}]
     """
+    if cache is None:
+        with LayoutCache(pdf_path) as cache:
+            return extract_toc(pdf_path, max_pages, cache)
+
     sections = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        # 목차 페이지 찾기
-        toc_pages = find_toc_pages(pdf, max_pages)
-
-        if not toc_pages:
-            print("WARNING: No TOC found. Using heuristic section detection.")
-            return detect_sections_heuristic(pdf)
-
-        # 목차에서 섹션 추출
-        for page_num in toc_pages:
-            page = pdf.pages[page_num]
-            text = page.extract_text()
-
-            # 패턴: "제1장 .... 10" 또는 "1. 약제 급여 목록 .... 50"
-            patterns = [
-                r'제?\s*(\d+)\s*[장절편부]\s+([^\n.]{5,50})\s*\.{2,}\s*(\d+)',  # 제1장 ... 10
-                r'(\d+)\.\s+([^\n.]{5,50})\s*\.{2,}\s*(\d+)',  # 1. 제목 ... 10
-                r'([가-힣]{2,20})\s*\.{2,}\s*(\d+)',  # 한글 제목 ... 10
-            ]
-
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.MULTILINE)
-                for match in matches:
-                    if len(match.groups()) == 3:
-                        section_num, title, page_num = match.groups()
-                        sections.append({
-                            'section_num': section_num,
-                            'title': title.strip(),
-                            'start_page': int(page_num)
-                        })
-                    elif len(match.groups()) == 2:
-                        title, page_num = match.groups()
-                        sections.append({
-                            'section_num': None,
-                            'title': title.strip(),
-                            'start_page': int(page_num)
-                        })
+    # 목차 페이지 찾기
+    toc_pages = find_toc_pages(cache, max_pages)
+
+    if not toc_pages:
+        print("WARNING: No TOC found. Using heuristic section detection.")
+        return detect_sections_heuristic(cache)
+
+    # 목차에서 섹션 추출
+    for page_num in toc_pages:
+        page = cache.page(page_num + 1)
+        text = page.extract_text()
+
+        # 패턴: "제1장 .... 10" 또는 "1. 약제 급여 목록 .... 50"
+        patterns = [
+            r'제?\s*(\d+)\s*[장절편부]\s+([^\n.]{5,50})\s*\.{2,}\s*(\d+)',  # 제1장 ... 10
+            r'(\d+)\.\s+([^\n.]{5,50})\s*\.{2,}\s*(\d+)',  # 1. 제목 ... 10
+            r'([가-힣]{2,20})\s*\.{2,}\s*(\d+)',  # 한글 제목 ... 10
+        ]
+
+        for pattern in patterns:
+            matches = re.finditer(pattern, text, re.MULTILINE)
+            for match in matches:
+                if len(match.groups()) == 3:
+                    section_num, title, page_num = match.groups()
+                    sections.append({
+                        'section_num': section_num,
+                        'title': title.strip(),
+                        'start_page': int(page_num)
+                    })
+                elif len(match.groups()) == 2:
+                    title, page_num = match.groups()
+                    sections.append({
+                        'section_num': None,
+                        'title': title.strip(),
+                        'start_page': int(page_num)
+                    })
 
     # end_page 계산
     for i in range(len(sections) - 1):
@@ -69,22 +80,21 @@ def extract_toc(pdf_path: Path, max_pages: int = 20) -> List[Dict[str, Any]]:
 
     if sections:
         # 마지막 섹션은 문서 끝까지
-        with pdfplumber.open(pdf_path) as pdf:
-            sections[-1]['end_page'] = len(pdf.pages)
+        sections[-1]['end_page'] = cache.page_count
 
     return sections
 
 
-def find_toc_pages(pdf, max_pages: int) -> List[int]:
+def find_toc_pages(cache: LayoutCache, max_pages: int) -> List[int]:
     """
-    목차 페이지 번호 찾기
+    목차 페이지 번호 찾기 (0-based)
 
     패턴: "목차", "Contents", "차례" 등의 제목
     """
     toc_pages = []
 
-    for i in range(min(max_pages, len(pdf.pages))):
-        page = pdf.pages[i]
+    for i in range(min(max_pages, cache.page_count)):
+        page = cache.page(i + 1)
         text = page.extract_text()
 
         if not text:
@@ -99,7 +109,7 @@ def find_toc_pages(pdf, max_pages: int) -> List[int]:
     return toc_pages
 
 
-def detect_sections_heuristic(pdf) -> List[Dict[str, Any]]:
+def detect_sections_heuristic(cache: LayoutCache) -> List[Dict[str, Any]]:
     """
     목차가 없을 경우 휴리스틱으로 섹션 감지
 
@@ -116,7 +126,8 @@ def detect_sections_heuristic(pdf) -> List[Dict[str, Any]]:
     return sections
 
 
-def estimate_section_complexity(pdf_path: Path, section: Dict) -> Dict[str, Any]:
+def estimate_section_complexity(pdf_path: Path, section: Dict,
+                                cache: Optional[LayoutCache] = None) -> Dict[str, Any]:
     """
     섹션 복잡도 추정
 
@@ -125,54 +136,57 @@ def estimate_section_complexity(pdf_path: Path, section: Dict) -> Dict[str, Any]
     - 중첩 테이블 비율
     - 평균 표 크기 (행 × 열)
     """
-    start = section['start_page'] - 1  # 0-based
+    if cache is None:
+        with LayoutCache(pdf_path) as cache:
+            return estimate_section_complexity(pdf_path, section, cache)
+
+    start = section['start_page']
     end = section['end_page']
 
-    with pdfplumber.open(pdf_path) as pdf:
-        pages = pdf.pages[start:end]
+    pages = list(cache.pages(start, end))
 
-        total_tables = 0
-        nested_tables = 0
-        total_rows = 0
+    total_tables = 0
+    nested_tables = 0
+    total_rows = 0
 
-        for page in pages:
-            tables = page.find_tables()
-            total_tables += len(tables)
+    for page in pages:
+        tables = page.find_tables()
+        total_tables += len(tables)
 
-            # 중첩 테이블 감지 (간단한 휴리스틱)
-            for i, table_a in enumerate(tables):
-                for j, table_b in enumerate(tables):
-                    if i != j and is_nested(table_a.bbox, table_b.bbox):
-                        nested_tables += 1
-                        break
+        # 중첩 테이블 감지 (간단한 휴리스틱)
+        for i, table_a in enumerate(tables):
+            for j, table_b in enumerate(tables):
+                if i != j and is_nested(table_a.bbox, table_b.bbox):
+                    nested_tables += 1
+                    break
 
-            # 행 수 추정
-            for table in tables:
-                data = table.extract()
-                total_rows += len([row for row in data if any(cell for cell in row)])
+        # 행 수 추정
+        for table in tables:
+            data = table.extract()
+            total_rows += len([row for row in data if any(cell for cell in row)])
 
-        num_pages = len(pages)
+    num_pages = len(pages)
 
-        complexity = {
-            'section': section['title'],
-            'pages': num_pages,
-            'tables': total_tables,
-            'table_density': total_tables / num_pages if num_pages > 0 else 0,
-            'nested_ratio': nested_tables / total_tables if total_tables > 0 else 0,
-            'avg_rows_per_table': total_rows / total_tables if total_tables > 0 else 0,
-            'complexity_score': 0.0  # 계산 예정
-        }
+    complexity = {
+        'section': section['title'],
+        'pages': num_pages,
+        'tables': total_tables,
+        'table_density': total_tables / num_pages if num_pages > 0 else 0,
+        'nested_ratio': nested_tables / total_tables if total_tables > 0 else 0,
+        'avg_rows_per_table': total_rows / total_tables if total_tables > 0 else 0,
+        'complexity_score': 0.0  # 계산 예정
+    }
 
-        # 복잡도 점수 (0-100)
-        score = 0
-        score += min(complexity['table_density'] * 20, 40)  # 최대 40점
-        score += complexity['nested_ratio'] * 30  # 최대 30점
-        score += min(complexity['avg_rows_per_table'] / 10 * 30, 30)  # 최대 30점
+    # 복잡도 점수 (0-100)
+    score = 0
+    score += min(complexity['table_density'] * 20, 40)  # 최대 40점
+    score += complexity['nested_ratio'] * 30  # 최대 30점
+    score += min(complexity['avg_rows_per_table'] / 10 * 30, 30)  # 최대 30점
 
-        complexity['complexity_score'] = score
-        complexity['requires_upstage'] = score > 50  # 50점 이상이면 Upstage 권장
+    complexity['complexity_score'] = score
+    complexity['requires_upstage'] = score > 50  # 50점 이상이면 Upstage 권장
 
-        return complexity
+    return complexity
 
 
 def is_nested(bbox_a, bbox_b) -> bool:
@@ -201,7 +215,8 @@ def main():
     print("목차 추출 테스트")
     print("="*80)
 
-    sections = extract_toc(pdf_path)
+    cache = LayoutCache(pdf_path)
+    sections = extract_toc(pdf_path, cache=cache)
 
     print(f"\n발견된 섹션: {len(sections)}개")
 
@@ -216,7 +231,7 @@ def main():
         print("="*80)
 
         for section in sections[:3]:
-            complexity = estimate_section_complexity(pdf_path, section)
+            complexity = estimate_section_complexity(pdf_path, section, cache)
 
             print(f"\n{complexity['section']}")
             print(f"  페이지: {complexity['pages']}")
@@ -226,6 +241,8 @@ def main():
             print(f"  복잡도: {complexity['complexity_score']:.1f}/100")
             print(f"  Upstage 권장: {'YES' if complexity['requires_upstage'] else 'NO'}")
 
+    cache.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,298 @@
+"""
+HIRA 첨부파일 병렬 다운로드 관리자
+
+게시글 상세 페이지에서 링크를 하나씩 클릭해 expect_download를 기다리는 대신,
+첨부파일 다운로드 URL을 큐에 넣고 브라우저 컨텍스트의 요청 API(쿠키 공유)로 동시에 받는다.
+
+- 동시 다운로드 수 제한 (Semaphore) + 호스트별 요청 간격 (HostRateLimiter)
+  스크래퍼는 목록/상세 페이지와 같은 제한기를 넘겨 HIRA 호스트 전체 요청을 0.5초/1건으로 맞춤
+- 임시 파일(.part)에 청크 단위로 쓰면서 SHA-256 계산 → 완료 후 rename
+- 같은 내용의 파일은 게시글/게시판이 달라도 한 번만 저장 (SHA-256 기준)
+- 한 번 받은 다운로드 URL은 다음 실행에서 네트워크 요청 없이 재사용
+
+저장소 인덱스 (attachments/sha256_index.json):
+    {
+      "hashes": {"<sha256>": "attachments/announcement/120_서식.hwp"},
+      "urls": {"<download_url>": "<sha256>"}
+    }
+
+사용 예:
+    downloader = AttachmentDownloader(output_dir, concurrency=4)
+    downloader.bind(context)
+    downloader.enqueue(attachment, post)   # 바로 백그라운드 다운로드 시작
+    ...
+    stats = await downloader.drain()        # 남은 작업 완료 대기 + 인덱스 저장
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+from shared.utils.rate_limiter import HostRateLimiter
+from hira_cancer.post_index import file_sha256
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+DOWNLOAD_TIMEOUT = 60000  # ms
+
+# 제한기를 따로 주지 않을 때 같은 호스트 다운로드 간 최소 간격 (초, 기존 파일당 0.5초 대기와 동일)
+DOWNLOAD_INTERVAL = 0.5
+
+_FILENAME_STAR_RE = re.compile(r"filename\*\s*=\s*([^']*)''([^;]+)", re.IGNORECASE)
+_FILENAME_RE = re.compile(r'filename\s*=\s*"?([^";]+)"?', re.IGNORECASE)
+
+
+def safe_filename(name: str) -> str:
+    """파일 시스템에 쓸 수 없는 문자 치환"""
+    return re.sub(r'[<>:"/\\|?*]', '_', name)
+
+
+def filename_from_disposition(disposition: Optional[str]) -> Optional[str]:
+    """Content-Disposition 헤더에서 파일명 추출 (RFC 5987 / EUC-KR·UTF-8 URL 인코딩 모두 처리)"""
+    if not disposition:
+        return None
+
+    match = _FILENAME_STAR_RE.search(disposition)
+    if match:
+        encoding = match.group(1) or 'utf-8'
+        return unquote(match.group(2).strip(), encoding=encoding, errors='replace')
+
+    match = _FILENAME_RE.search(disposition)
+    if not match:
+        return None
+
+    name = match.group(1).strip()
+    if '%' in name:
+        # HIRA는 파일명을 URL 인코딩해서 내려보냄 (UTF-8 우선, 실패 시 EUC-KR)
+        try:
+            return unquote(name, encoding='utf-8', errors='strict')
+        except UnicodeDecodeError:
+            return unquote(name, encoding='euc-kr', errors='replace')
+    try:
+        # 헤더가 latin-1로 해석된 UTF-8/EUC-KR 바이트인 경우 복원
+        raw = name.encode('latin-1')
+    except UnicodeEncodeError:
+        return name
+    for encoding in ('utf-8', 'euc-kr'):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return name
+
+
+class AttachmentDownloader:
+    """첨부파일 다운로드 큐 + SHA-256 중복 제거 저장소"""
+
+    def __init__(self, output_dir: Path, concurrency: int = 4,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 overwrite: bool = False, timeout: int = DOWNLOAD_TIMEOUT):
+        """
+        Args:
+            output_dir: 출력 디렉토리 (첨부파일은 output_dir/attachments/<board>/에 저장)
+            concurrency: 동시 다운로드 수
+            rate_limiter: 호스트별 요청 간격 제한기 (스크래퍼의 목록 페이지 제한기를 공유,
+                          없으면 DOWNLOAD_INTERVAL초/호스트 1건)
+            overwrite: 같은 이름의 로컬 파일이 있어도 다시 받기 (증분 수집에서 교체된 첨부)
+            timeout: 다운로드 1건 타임아웃 (ms)
+        """
+        self.output_dir = Path(output_dir)
+        self.attachments_dir = self.output_dir / 'attachments'
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or HostRateLimiter(min_interval=DOWNLOAD_INTERVAL, max_concurrent=1)
+        self.overwrite = overwrite
+        self.timeout = timeout
+
+        self.registry_path = self.attachments_dir / 'sha256_index.json'
+        self.registry: Dict[str, Dict[str, str]] = {'hashes': {}, 'urls': {}}
+        if self.registry_path.exists():
+            with open(self.registry_path, 'r', encoding='utf-8') as f:
+                self.registry = json.load(f)
+
+        self.request = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: List[asyncio.Task] = []
+        self.stats = {'downloaded': 0, 'reused': 0, 'duplicates': 0, 'failed': 0}
+
+    def bind(self, context) -> None:
+        """
+        Playwright BrowserContext 연결 (context.request는 브라우저 쿠키/세션을 공유)
+
+        Args:
+            context: playwright.async_api.BrowserContext
+        """
+        self.request = context.request
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    def target_path(self, attachment: Dict[str, Any], post: Dict[str, Any],
+                    filename: Optional[str] = None) -> Path:
+        """기존 스크래퍼와 같은 저장 경로: attachments/<board>/<게시글번호>_<파일명>"""
+        board_dir = self.attachments_dir / post['board']
+        return board_dir / safe_filename(f"{post['number']}_{filename or attachment['filename']}")
+
+    def _canonical(self, sha256: str) -> Optional[Path]:
+        """해시에 해당하는 저장 파일 (파일이 사라졌으면 None)"""
+        path = self.registry['hashes'].get(sha256)
+        if path and Path(path).exists():
+            return Path(path)
+        return None
+
+    def _mark(self, attachment: Dict[str, Any], path: Path, sha256: str, duplicate: bool = False) -> None:
+        attachment['local_path'] = str(path)
+        attachment['sha256'] = sha256
+        attachment['downloaded'] = True
+        if duplicate:
+            attachment['duplicate_of'] = str(path)
+
+    def _reuse(self, attachment: Dict[str, Any], post: Dict[str, Any]) -> bool:
+        """네트워크 요청 없이 처리 가능한 경우 (이미 받은 URL / 기존 로컬 파일)"""
+        url = attachment.get('download_url')
+        sha256 = self.registry['urls'].get(url) if url else None
+        canonical = self._canonical(sha256) if sha256 else None
+        if canonical and not self.overwrite:
+            self._mark(attachment, canonical, sha256, duplicate=canonical != self.target_path(attachment, post))
+            self.stats['reused'] += 1
+            return True
+
+        local_path = self.target_path(attachment, post)
+        if local_path.exists() and not self.overwrite:
+            sha256 = self._register_existing(local_path)
+            if url:
+                self.registry['urls'][url] = sha256
+            self._mark(attachment, local_path, sha256)
+            self.stats['reused'] += 1
+            return True
+
+        return False
+
+    def _register_existing(self, path: Path) -> str:
+        sha256 = file_sha256(path)
+        self.registry['hashes'].setdefault(sha256, str(path))
+        return sha256
+
+    @staticmethod
+    def _write_temp(body: bytes, tmp_path: Path) -> str:
+        """임시 파일에 청크 단위로 쓰면서 SHA-256 계산 (스레드에서 실행)"""
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        view = memoryview(body)
+        with open(tmp_path, 'wb') as f:
+            for start in range(0, len(view), CHUNK_SIZE):
+                chunk = view[start:start + CHUNK_SIZE]
+                digest.update(chunk)
+                f.write(chunk)
+        return digest.hexdigest()
+
+    def _commit(self, tmp_path: Path, local_path: Path, sha256: str) -> tuple:
+        """
+        같은 내용이 이미 있으면 임시 파일 삭제, 없으면 최종 경로로 rename
+
+        Returns:
+            (저장 경로, 중복 여부)
+        """
+        canonical = self._canonical(sha256)
+        if canonical and canonical != local_path:
+            # 다른 게시글/게시판에서 이미 받은 동일 파일
+            tmp_path.unlink()
+            return canonical, True
+
+        os.replace(tmp_path, local_path)
+        self._forget(local_path, sha256)
+        self.registry['hashes'][sha256] = str(local_path)
+        return local_path, False
+
+    def _forget(self, path: Path, sha256: str) -> None:
+        """덮어쓴 파일의 이전 해시와 그 해시를 가리키던 URL 등록 해제 (바뀐 내용을 중복 원본으로 쓰지 않도록)"""
+        stale = {old for old, old_path in self.registry['hashes'].items()
+                 if old_path == str(path) and old != sha256}
+        if not stale:
+            return
+        for old in stale:
+            del self.registry['hashes'][old]
+        self.registry['urls'] = {url: old for url, old in self.registry['urls'].items() if old not in stale}
+
+    async def download(self, attachment: Dict[str, Any], post: Dict[str, Any]) -> bool:
+        """
+        첨부파일 1건 다운로드 (attachment 딕셔너리를 제자리에서 갱신)
+
+        Returns:
+            성공 여부
+        """
+        if self._reuse(attachment, post):
+            logger.debug(f"    재사용: {attachment['filename']}")
+            return True
+
+        url = attachment.get('download_url')
+        if not url:
+            logger.warning(f"    다운로드 URL 없음: {attachment.get('filename')}")
+            self.stats['failed'] += 1
+            return False
+
+        try:
+            async with self._semaphore:
+                async with self.rate_limiter.slot(url):
+                    response = await self.request.get(url, timeout=self.timeout)
+                    body = await response.body()
+
+            content_type = response.headers.get('content-type', '')
+            disposition = response.headers.get('content-disposition')
+            if not response.ok or (content_type.startswith('text/html') and not disposition):
+                raise RuntimeError(f"HTTP {response.status} ({content_type or 'no content-type'})")
+
+            filename = filename_from_disposition(disposition)
+            local_path = self.target_path(attachment, post, filename)
+            tmp_path = local_path.with_name(local_path.name + '.part')
+            sha256 = await asyncio.to_thread(self._write_temp, body, tmp_path)
+            # 해시 비교/등록은 이벤트 루프에서 (동시 작업 간 경쟁 없음)
+            path, duplicate = self._commit(tmp_path, local_path, sha256)
+
+            self.registry['urls'][url] = sha256
+            self._mark(attachment, path, sha256, duplicate)
+            if duplicate:
+                self.stats['duplicates'] += 1
+                logger.info(f"    중복 파일: {attachment['filename']} → {path.name}")
+            else:
+                self.stats['downloaded'] += 1
+                logger.info(f"    저장 완료: {path.name} ({len(body) / 1024:.1f} KB)")
+            return True
+
+        except Exception as e:
+            logger.error(f"    첨부파일 다운로드 실패 ({attachment.get('filename', 'Unknown')}): {e}")
+            attachment['downloaded'] = False
+            self.stats['failed'] += 1
+            return False
+
+    def enqueue(self, attachment: Dict[str, Any], post: Dict[str, Any]) -> asyncio.Task:
+        """다운로드 작업 등록 (즉시 백그라운드에서 시작, 결과는 drain()에서 수거)"""
+        task = asyncio.create_task(self.download(attachment, post))
+        self._tasks.append(task)
+        return task
+
+    async def drain(self) -> Dict[str, int]:
+        """
+        등록된 작업이 모두 끝날 때까지 대기 후 저장소 인덱스 저장
+
+        Returns:
+            직전 drain() 이후 처리 통계 (downloaded/reused/duplicates/failed)
+        """
+        tasks, self._tasks = self._tasks, []
+        if tasks:
+            await asyncio.gather(*tasks)
+        self.save_registry()
+
+        stats, self.stats = self.stats, dict.fromkeys(self.stats, 0)
+        return stats
+
+    def save_registry(self) -> None:
+        """저장소 인덱스 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.attachments_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.registry_path.with_name(self.registry_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.registry, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.registry_path)
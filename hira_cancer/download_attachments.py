@@ -1,61 +1,32 @@
 """
 이미 수집된 JSON에서 첨부파일만 다운로드
+
+AttachmentDownloader로 전체 첨부파일을 동시에 받고, 같은 내용의 파일은 SHA-256 기준으로
+한 번만 저장한 뒤 JSON의 downloaded/local_path/sha256 값을 갱신한다.
 """
 import asyncio
 import json
-import re
+import os
+import sys
 from pathlib import Path
-from playwright.async_api import async_playwright
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.browser import AsyncBrowserFactory
+from hira_cancer.attachment_downloader import AttachmentDownloader
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# 동시 다운로드 수
+DOWNLOAD_CONCURRENCY = 4
 
-async def download_attachment(page, attachment: dict, post: dict, output_dir: Path):
-    """첨부파일 다운로드"""
-    try:
-        # 저장 경로 생성
-        board_dir = output_dir / 'attachments' / post['board']
-        board_dir.mkdir(parents=True, exist_ok=True)
-
-        # 안전한 파일명 생성
-        safe_filename = f"{post['number']}_{attachment['filename']}"
-        safe_filename = re.sub(r'[<>:"/\\|?*]', '_', safe_filename)
-
-        local_path = board_dir / safe_filename
-
-        # 이미 다운로드된 경우 스킵
-        if local_path.exists():
-            logger.debug(f"  이미 존재: {safe_filename}")
-            return True
-
-        # 다운로드
-        download_url = attachment.get('download_url')
-        if not download_url:
-            logger.warning(f"  다운로드 URL 없음: {safe_filename}")
-            return False
-
-        logger.info(f"  다운로드: {safe_filename}")
 
-        async with page.expect_download(timeout=30000) as download_info:
-            await page.goto(download_url)
-
-        download = await download_info.value
-        await download.save_as(local_path)
-
-        logger.info(f"  저장 완료: {local_path.name} ({local_path.stat().st_size / 1024:.1f} KB)")
-        return True
-
-    except Exception as e:
-        logger.error(f"첨부파일 다운로드 실패 ({attachment.get('filename', 'Unknown')}): {e}")
-        return False
-
-
-async def download_all_attachments(json_file: Path, output_dir: Path):
+async def download_all_attachments(json_file: Path, output_dir: Path, concurrency: int = DOWNLOAD_CONCURRENCY):
     """JSON 파일에서 모든 첨부파일 다운로드"""
     logger.info("="*80)
     logger.info("첨부파일 다운로드 시작")
@@ -73,46 +44,42 @@ async def download_all_attachments(json_file: Path, output_dir: Path):
         for post in posts:
             total_attachments += len(post.get('attachments', []))
 
-    logger.info(f"\n총 첨부파일: {total_attachments}개")
+    logger.info(f"\n총 첨부파일: {total_attachments}개 (동시 {concurrency}건)")
 
-    downloaded = 0
-    skipped = 0
-    failed = 0
+    downloader = AttachmentDownloader(output_dir, concurrency=concurrency)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    async with AsyncBrowserFactory() as factory:
+        # 다운로드 요청은 컨텍스트 쿠키를 공유 (게시판 목록 방문으로 세션 확보)
+        page = await factory.new_page()
+        await factory.goto(page, 'https://www.hira.or.kr/bbsDummy.do?pgmid=HIRAA030023010000',
+                           ready_selector='tbody', required=False)
+        downloader.bind(page.context)
 
         for board_key, posts in boards_data.items():
             board_name = data['metadata']['boards'][board_key]['name']
-            logger.info(f"\n{'='*80}")
-            logger.info(f"[{board_name}] 첨부파일 다운로드")
-            logger.info(f"{'='*80}")
+            board_attachments = sum(len(post.get('attachments', [])) for post in posts)
+            logger.info(f"[{board_name}] 첨부파일 {board_attachments}개 등록")
 
             for post in posts:
-                attachments = post.get('attachments', [])
-                if not attachments:
-                    continue
-
-                logger.info(f"\n[{post.get('number')}] {post.get('title')[:50]}... ({len(attachments)}개)")
-
-                for attachment in attachments:
-                    result = await download_attachment(page, attachment, post, output_dir)
+                post.setdefault('board', board_key)
+                for attachment in post.get('attachments', []):
+                    downloader.enqueue(attachment, post)
 
-                    if result:
-                        downloaded += 1
-                    else:
-                        failed += 1
+        stats = await downloader.drain()
 
-                    # Rate limiting
-                    await asyncio.sleep(0.5)
+    # 다운로드 결과(local_path, sha256)를 JSON에 반영 (임시 파일에 쓴 뒤 교체)
+    tmp_file = json_file.with_name(json_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, json_file)
 
-        await browser.close()
+    downloaded = stats['downloaded'] + stats['reused'] + stats['duplicates']
+    failed = stats['failed']
 
     logger.info(f"\n{'='*80}")
     logger.info("첨부파일 다운로드 완료")
     logger.info(f"{'='*80}")
-    logger.info(f"\n성공: {downloaded}개")
+    logger.info(f"\n성공: {downloaded}개 (새로 받음 {stats['downloaded']}, 재사용 {stats['reused']}, 중복 {stats['duplicates']})")
     logger.info(f"실패: {failed}개")
     logger.info(f"전체: {total_attachments}개")
 
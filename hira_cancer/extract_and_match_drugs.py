@@ -7,7 +7,7 @@
 
 입력:
 - data/hira_cancer/parsed/{announcement,pre_announcement,faq}/*.json
-- data/hira_master/drug_dictionary.json
+- data/hira_master/drug_dictionary/ (shared.drug_dictionary)
 
 출력:
 - data/hira_cancer/drug_matching_results.json
@@ -19,10 +19,14 @@ from collections import Counter, defaultdict
 import re
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.drug_dictionary import DrugDictionary
+
 sys.stdout.reconfigure(encoding='utf-8')
 
 PARSED_DIR = Path('data/hira_cancer/parsed')
-DRUG_DICT_FILE = Path('data/hira_master/drug_dictionary.json')
+DRUG_DICT_DIR = Path('data/hira_master/drug_dictionary')
 OUTPUT_FILE = Path('data/hira_cancer/drug_matching_results.json')
 
 print('=' * 100)
@@ -33,12 +37,11 @@ print('=' * 100)
 print('\n[1] 약가 사전 로드')
 print('-' * 100)
 
-with open(DRUG_DICT_FILE, 'r', encoding='utf-8') as f:
-    drug_dict = json.load(f)
+drug_dict = DrugDictionary.open(DRUG_DICT_DIR)
 
 print(f'약가 사전 로드 완료')
 print(f'  총 검색 키: {len(drug_dict):,}개')
-print(f'  파일 크기: {DRUG_DICT_FILE.stat().st_size / (1024*1024):.2f} MB')
+print(f'  사전 크기: {drug_dict.nbytes / (1024*1024):.2f} MB')
 
 # 2. 파일 수집
 print('\n[2] 파싱 파일 수집')
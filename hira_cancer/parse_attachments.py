@@ -6,6 +6,7 @@ Markdown/HTML로 변환하고 게시글 메타데이터와 연결
 """
 import sys
 import json
+import copy
 import codecs
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -50,6 +51,9 @@ class AttachmentParser:
         self.failed_files: List[Dict[str, str]] = []
         self.total_pages = 0
         self.total_cost = 0.0
+        # 같은 내용(SHA-256)의 첨부파일은 한 번만 API로 파싱
+        self.parsed_by_hash: Dict[str, Dict[str, Any]] = {}
+        self.reused_count = 0
 
     def load_metadata(self) -> None:
         """게시글 메타데이터 로드"""
@@ -92,6 +96,7 @@ class AttachmentParser:
                             'extension': attachment.get('extension', ''),
                             'local_path': Path(attachment['local_path']),
                             'download_url': attachment.get('download_url', ''),
+                            'sha256': attachment.get('sha256'),
                         }
                         all_attachments.append(att_info)
 
@@ -117,23 +122,27 @@ class AttachmentParser:
         if not self.parser.supports(file_path.suffix):
             return None
 
+        sha256 = att_info.get('sha256')
+        if sha256 and sha256 in self.parsed_by_hash:
+            # 다른 게시글에 같은 서식이 다시 첨부된 경우: 파싱 결과 재사용
+            result = copy.deepcopy(self.parsed_by_hash[sha256])
+            result['attachment_metadata'] = self._attachment_metadata(att_info)
+            result['reused_from_sha256'] = sha256
+            self.reused_count += 1
+            return result
+
         try:
             # 파싱 실행
             result = self.parser.parse(file_path)
 
             # 메타데이터 추가
-            result['attachment_metadata'] = {
-                'board': att_info['board'],
-                'board_name': att_info['board_name'],
-                'post_number': att_info['post_number'],
-                'post_title': att_info['post_title'],
-                'attachment_index': att_info['attachment_index'],
-                'filename': att_info['filename'],
-                'download_url': att_info['download_url'],
-            }
+            result['attachment_metadata'] = self._attachment_metadata(att_info)
 
             result['parsed_at'] = datetime.now().isoformat()
 
+            if sha256:
+                self.parsed_by_hash[sha256] = result
+
             # 통계 업데이트
             self.parsed_count += 1
             self.total_pages += result.get('pages', 0)
@@ -151,6 +160,19 @@ class AttachmentParser:
             self.failed_files.append(error_info)
             return None
 
+    @staticmethod
+    def _attachment_metadata(att_info: Dict[str, Any]) -> Dict[str, Any]:
+        """파싱 결과에 붙일 첨부파일 메타데이터"""
+        return {
+            'board': att_info['board'],
+            'board_name': att_info['board_name'],
+            'post_number': att_info['post_number'],
+            'post_title': att_info['post_title'],
+            'attachment_index': att_info['attachment_index'],
+            'filename': att_info['filename'],
+            'download_url': att_info['download_url'],
+        }
+
     def save_parsed_result(self, result: Dict[str, Any], att_info: Dict[str, Any]) -> None:
         """파싱 결과 저장"""
         # 게시판별 디렉토리 생성
@@ -286,6 +308,7 @@ class AttachmentParser:
         print("📊 파싱 결과")
         print("=" * 60)
         print(f"✅ 성공: {self.parsed_count}개")
+        print(f"♻️  재사용 (동일 파일): {self.reused_count}개")
         print(f"❌ 실패: {len(self.failed_files)}개")
         print(f"📄 총 페이지: {self.total_pages}p")
 
@@ -0,0 +1,223 @@
+"""
+HIRA 게시판 증분 수집용 게시글 인덱스
+
+이전 실행에서 본 게시글의 ID, 제·개정일 서명, 첨부파일 해시를 로컬 JSON에 보관해
+다음 실행에서 새 글/개정된 글만 상세 조회하고 새 첨부파일만 내려받도록 한다.
+
+인덱스 구조 (post_index.json):
+    {
+      "updated_at": "...",
+      "boards": {
+        "announcement": {
+          "45648": {
+            "signature": "제목|제·개정일|작성일|첨부여부",
+            "title": "...",
+            "last_seen": "...",
+            "attachments": {
+              "<download_url>": {"sha256": "...", "local_path": "...", "filename": "..."}
+            }
+          }
+        }
+      }
+    }
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+# 게시글 ID로 쓸 쿼리 파라미터 (우선순위 순)
+POST_ID_PARAMS = ('brdBltNo', 'annceNo', 'seq')
+
+# 증분 수집 중단 기준: 고정 공지가 아닌 변경 없는 게시글이 연속으로 이만큼 나오면 중단
+UNCHANGED_STOP_RUN = 3
+
+# 상단 고정 공지 행 표시 (행 class 일부 / 번호 칸 문구)
+PINNED_ROW_CLASSES = ('notice', 'top', 'fix')
+PINNED_NUMBER_TEXT = '공지'
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def post_id(post: Dict[str, Any]) -> str:
+    """
+    게시글 고유 ID
+
+    목록의 '번호' 칸은 새 글이 올라오면 밀릴 수 있으므로
+    상세 URL / onclick 인자를 우선 사용한다.
+    """
+    if post.get('post_id'):
+        return post['post_id']
+
+    query = parse_qs(urlparse(post.get('detail_url') or '').query)
+    for name in POST_ID_PARAMS:
+        if query.get(name):
+            return query[name][0]
+
+    # 공고예고, 항암화학요법 등 클릭 방식: onclick 인자 (예: downLoadBbs('1','45648','6','49'))
+    onclick = post.get('onclick') or ''
+    if onclick:
+        return onclick
+
+    return f"{post.get('number', '')}|{post.get('title', '')}"
+
+
+def is_pinned_row(row_class: Optional[str], num_text: Optional[str], has_icon: bool = False) -> bool:
+    """
+    상단 고정 공지 행 여부
+
+    고정 공지는 새 글이 올라와도 1페이지 맨 위에 남아 있으므로
+    증분 수집 중단 판정에서 제외해야 한다.
+
+    Args:
+        row_class: 행(tr)의 class 속성
+        num_text: 번호 칸 문구
+        has_icon: 번호 칸에 공지 아이콘이 있는지
+    """
+    classes = (row_class or '').lower()
+    if any(marker in classes for marker in PINNED_ROW_CLASSES):
+        return True
+    return has_icon or PINNED_NUMBER_TEXT in (num_text or '')
+
+
+class UnchangedStop:
+    """
+    증분 수집 중단 판정
+
+    목록을 위에서부터 읽으며 고정 공지가 아닌 변경 없는 게시글이
+    연속으로 `run`개 나오면 중단한다. 새 글/개정된 글이 나오면 다시 센다.
+    페이지를 넘어가도 연속 개수는 이어진다.
+    """
+
+    def __init__(self, run: int = UNCHANGED_STOP_RUN):
+        self.run = run
+        self.count = 0
+        self.reached = False
+
+    def feed(self, post: Dict[str, Any]) -> bool:
+        """게시글 하나 반영 후 중단 여부 반환"""
+        if post.get('pinned'):
+            return self.reached
+        if post.get('status') == 'unchanged':
+            self.count += 1
+        else:
+            self.count = 0
+        self.reached = self.count >= self.run
+        return self.reached
+
+
+def post_signature(post: Dict[str, Any]) -> str:
+    """개정 여부 판정용 서명 (목록에서 바로 얻을 수 있는 값만 사용)"""
+    return '|'.join([
+        post.get('title', ''),
+        post.get('revision_date', ''),
+        post.get('created_date', ''),
+        '1' if post.get('has_attachment') else '0',
+    ])
+
+
+def attachment_key(attachment: Dict[str, Any]) -> str:
+    """첨부파일 식별 키 (파일이 교체되면 다운로드 URL의 첨부 순번/경로가 바뀜)"""
+    return attachment.get('download_url') or attachment.get('filename', '')
+
+
+class PostIndex:
+    """게시판별 게시글/첨부파일 인덱스"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 인덱스 JSON 경로 (없으면 빈 인덱스로 시작)
+        """
+        self.path = Path(path)
+        self.data: Dict[str, Any] = {'updated_at': None, 'boards': {}}
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+
+    def __len__(self) -> int:
+        return sum(len(posts) for posts in self.data['boards'].values())
+
+    def board(self, board_key: str) -> Dict[str, Any]:
+        """게시판별 항목 (없으면 생성)"""
+        return self.data['boards'].setdefault(board_key, {})
+
+    def get(self, board_key: str, post: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """이전에 본 게시글 항목"""
+        return self.data['boards'].get(board_key, {}).get(post_id(post))
+
+    def status(self, board_key: str, post: Dict[str, Any]) -> str:
+        """
+        게시글 상태
+
+        Returns:
+            'new' (처음 봄) / 'revised' (서명 변경) / 'unchanged'
+        """
+        entry = self.get(board_key, post)
+        if entry is None:
+            return 'new'
+        if entry.get('signature') != post_signature(post):
+            return 'revised'
+        return 'unchanged'
+
+    def known_attachment(self, board_key: str, post: Dict[str, Any],
+                         attachment: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        이미 받은 첨부파일이면 인덱스 항목 반환
+
+        같은 다운로드 키로 받은 적이 있고 로컬 파일이 남아 있으며 해시가 일치할 때만 인정
+        """
+        entry = self.get(board_key, post)
+        if not entry:
+            return None
+
+        known = entry.get('attachments', {}).get(attachment_key(attachment))
+        if not known or not known.get('local_path'):
+            return None
+
+        local_path = Path(known['local_path'])
+        if not local_path.exists() or file_sha256(local_path) != known.get('sha256'):
+            return None
+        return known
+
+    def update(self, board_key: str, post: Dict[str, Any]) -> None:
+        """상세 조회/다운로드를 마친 게시글 기록"""
+        board = self.board(board_key)
+        previous = board.get(post_id(post), {})
+        attachments = dict(previous.get('attachments', {}))
+
+        for attachment in post.get('attachments') or []:
+            if attachment.get('sha256'):
+                attachments[attachment_key(attachment)] = {
+                    'sha256': attachment['sha256'],
+                    'local_path': attachment.get('local_path'),
+                    'filename': attachment.get('filename'),
+                }
+
+        board[post_id(post)] = {
+            'signature': post_signature(post),
+            'title': post.get('title', ''),
+            'last_seen': datetime.now().isoformat(),
+            'attachments': attachments,
+        }
+
+    def save(self) -> None:
+        """인덱스 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.data['updated_at'] = datetime.now().isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
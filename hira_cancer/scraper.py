@@ -11,16 +11,30 @@ HIRA 암질환 사용약제 및 요법 스크래퍼
 - 게시글 번호, 공고번호, 제목, 제·개정일, 작성일
 - 게시글 상세 내용
 - 첨부파일 (파일명, 확장자, 다운로드)
+
+증분 모드 (incremental=True):
+- post_index.json에 게시글 ID, 제·개정일 서명, 첨부파일 해시를 보관
+- 이미 본, 바뀌지 않은 게시글을 만나면 그 게시판의 페이징 중단
+- 새 글/개정된 글만 상세 조회, 새 첨부파일만 다운로드
 """
+import argparse
 import asyncio
 import json
 import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.browser import AsyncBrowserFactory
+from shared.utils.rate_limiter import HostRateLimiter
+from hira_cancer.post_index import PostIndex, UnchangedStop, file_sha256, is_pinned_row, post_id
+from hira_cancer.attachment_downloader import AttachmentDownloader
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +48,16 @@ class HIRACancerScraper:
 
     BASE_URL = "https://www.hira.or.kr"
 
+    # 페이지 준비 셀렉터
+    LIST_READY = 'tbody'
+    DETAIL_READY = 'div.view, .view, .viewCont'
+
+    # 같은 호스트 요청 간 최소 간격 (초)
+    REQUEST_INTERVAL = 0.5
+
+    # 첨부파일 동시 다운로드 수 (요청 간격은 목록 페이지와 같은 rate_limiter가 제한)
+    DOWNLOAD_CONCURRENCY = 4
+
     # 게시판 정보
     BOARDS = {
         'announcement': {
@@ -67,30 +91,46 @@ class HIRACancerScraper:
         }
     }
 
-    def __init__(self, output_dir: Path, download_attachments: bool = True):
+    def __init__(self, output_dir: Path, download_attachments: bool = True, incremental: bool = False,
+                 index_path: Optional[Path] = None):
         """
         Args:
             output_dir: 출력 디렉토리
             download_attachments: 첨부파일 다운로드 여부
+            incremental: 증분 모드 (새 글/개정된 글만 수집)
+            index_path: 게시글 인덱스 경로 (기본값: output_dir/post_index.json)
         """
         self.output_dir = output_dir
         self.download_attachments = download_attachments
-        self.browser: Browser = None
-        self.page: Page = None
+        self.incremental = incremental
+        # 전체 수집에서도 인덱스를 갱신해 다음 증분 실행의 기준으로 사용
+        self.index = PostIndex(index_path or output_dir / 'post_index.json')
+        self.rate_limiter = HostRateLimiter(min_interval=self.REQUEST_INTERVAL, max_concurrent=1)
+        # 첨부 다운로드도 같은 HIRA 호스트이므로 목록/상세 페이지와 제한기 공유
+        # 증분 모드에서 인덱스에 없는 첨부 = 새/교체된 첨부이므로 같은 이름이어도 다시 받음
+        self.downloader = AttachmentDownloader(output_dir, concurrency=self.DOWNLOAD_CONCURRENCY,
+                                               rate_limiter=self.rate_limiter, overwrite=incremental)
+        self.factory = AsyncBrowserFactory(timings_path=output_dir / 'page_timings.json')
+        self.page: Optional[Page] = None
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=True)
-        self.page = await self.browser.new_page()
+        await self.factory.start()
+        self.page = await self.factory.new_page()
+        self.downloader.bind(self.page.context)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
+        await self.downloader.drain()
         if self.page:
             await self.page.close()
-        if self.browser:
-            await self.browser.close()
+        await self.factory.close()
+
+    async def goto(self, url: str, ready_selector: str, required: bool = False):
+        """요청 간격을 지키며 페이지 이동 후 준비 셀렉터 대기"""
+        async with self.rate_limiter.slot(url):
+            await self.factory.goto(self.page, url, ready_selector=ready_selector, required=required)
 
     async def get_total_pages(self, board_key: str) -> int:
         """
@@ -106,7 +146,21 @@ class HIRACancerScraper:
         url = self.BASE_URL + board['url']
 
         logger.info(f"[{board['name']}] 총 페이지 수 조회: {url}")
-        await self.page.goto(url, wait_until='networkidle')
+        await self.goto(url, '.total-txt, .pagination')
+
+        return await self.read_total_pages(board_key)
+
+    async def read_total_pages(self, board_key: str) -> int:
+        """
+        현재 열린 목록 페이지에서 총 페이지 수 추출
+
+        Args:
+            board_key: 게시판 키
+
+        Returns:
+            총 페이지 수
+        """
+        board = self.BOARDS[board_key]
 
         # 페이징 정보 추출
         try:
@@ -140,13 +194,16 @@ class HIRACancerScraper:
         # 기본값
         return 1
 
-    async def scrape_board_list(self, board_key: str, page_num: int = 1) -> List[Dict[str, Any]]:
+    async def scrape_board_list(self, board_key: str, page_num: int = 1,
+                                stop: Optional[UnchangedStop] = None) -> List[Dict[str, Any]]:
         """
         게시판 목록 페이지 스크래핑
 
         Args:
             board_key: 게시판 키
             page_num: 페이지 번호
+            stop: 증분 중단 판정 (None이면 전체 수집). 고정 공지가 아닌 변경 없는 게시글이
+                  연속으로 나오면 그 행에서 중단 (변경 없는 글은 status='unchanged'로 포함)
 
         Returns:
             게시글 목록
@@ -160,7 +217,7 @@ class HIRACancerScraper:
             url += f"{separator}pageIndex={page_num}"
 
         logger.info(f"[{board['name']}] 페이지 {page_num} 스크래핑: {url}")
-        await self.page.goto(url, wait_until='networkidle')
+        await self.goto(url, self.LIST_READY)
 
         posts = []
         rows = await self.page.locator(board['list_selector']).all()
@@ -179,6 +236,10 @@ class HIRACancerScraper:
                 if not num_text or not num_text.strip().isdigit():
                     continue  # 번호가 없으면 스킵
 
+                # 상단 고정 공지 (증분 중단 판정에서 제외)
+                pinned = is_pinned_row(await row.get_attribute('class'), num_text,
+                                       await cells[0].locator('img').count() > 0)
+
                 # 제목 및 링크 추출
                 if board.get('is_download_list'):
                     # 항암화학요법: 제목(컬럼1)과 링크(컬럼2)가 분리됨
@@ -252,8 +313,21 @@ class HIRACancerScraper:
                     'detail_url': detail_url,
                     'page': page_num,
                     'needs_click': needs_click,
-                    'onclick': onclick
+                    'onclick': onclick,
+                    'pinned': pinned
                 }
+                post['post_id'] = post_id(post)
+                post['status'] = self.index.status(board_key, post)
+
+                if stop is not None:
+                    stopped = stop.feed(post)
+                    if post['status'] == 'unchanged':
+                        # 바뀌지 않은 글은 상세 조회 없이 넘김 (고정 공지 아래에 새 글이 있을 수 있음)
+                        posts.append(post)
+                        if stopped:
+                            logger.info(f"  [{post['number']}] 변경 없는 기존 게시글 연속 {stop.run}건 도달: {post['title']}")
+                            break
+                        continue
 
                 # 공고예고나 항암화학요법(다운로드 전용)은 목록에서 즉시 처리
                 if needs_click and board.get('is_download_list'):
@@ -283,7 +357,8 @@ class HIRACancerScraper:
                     # 공고예고: 클릭하여 상세 조회
                     try:
                         await title_link.click()
-                        await self.page.wait_for_load_state('networkidle', timeout=10000)
+                        await self.page.wait_for_load_state('domcontentloaded', timeout=10000)
+                        await self.factory.wait_ready(self.page, self.DETAIL_READY, timeout=10000, required=False)
 
                         # 상세 내용 추출 (HTML + 텍스트)
                         content_elem = self.page.locator('div.view, .view, .viewCont')
@@ -332,10 +407,9 @@ class HIRACancerScraper:
                                         'local_path': None
                                     }
 
-                                    # 첨부파일 다운로드
+                                    # 첨부파일 다운로드 (큐에 넣고 바로 다음 링크로)
                                     if self.download_attachments:
-                                        downloaded = await self.download_attachment_on_page(link, attachment, post, i)
-                                        attachment['downloaded'] = downloaded
+                                        await self.queue_attachment(link, attachment, post, i)
 
                                     attachments.append(attachment)
 
@@ -367,10 +441,9 @@ class HIRACancerScraper:
                                         'local_path': None
                                     }
 
-                                    # 첨부파일 다운로드
+                                    # 첨부파일 다운로드 (큐에 넣고 바로 다음 링크로)
                                     if self.download_attachments:
-                                        downloaded = await self.download_attachment_on_page(link, attachment, post, i)
-                                        attachment['downloaded'] = downloaded
+                                        await self.queue_attachment(link, attachment, post, i)
 
                                     attachments.append(attachment)
 
@@ -381,8 +454,7 @@ class HIRACancerScraper:
                         logger.info(f"  [{post['number']}] {post['title']} - {len(post['content'])}자, {len(attachments)}개 첨부")
 
                         # 목록으로 돌아가기
-                        await self.page.goto(url, wait_until='networkidle')
-                        await asyncio.sleep(0.5)
+                        await self.goto(url, self.LIST_READY)
 
                     except Exception as e:
                         logger.error(f"공고예고 상세 조회 실패 ({post['title']}): {e}")
@@ -419,7 +491,7 @@ class HIRACancerScraper:
         """
         logger.info(f"[{post['board_name']}] 상세 조회: {post['title']}")
 
-        await self.page.goto(post['detail_url'], wait_until='networkidle')
+        await self.goto(post['detail_url'], self.DETAIL_READY)
 
         # 상세 내용 추출 (HTML + 텍스트)
         try:
@@ -488,10 +560,9 @@ class HIRACancerScraper:
                             'local_path': None
                         }
 
-                        # 첨부파일 다운로드 (상세 페이지에 있을 때)
+                        # 첨부파일 다운로드 (큐에 넣고 게시판 끝에서 완료 대기)
                         if self.download_attachments:
-                            downloaded = await self.download_attachment_on_page(link, attachment, post, i)
-                            attachment['downloaded'] = downloaded
+                            await self.queue_attachment(link, attachment, post, i)
 
                         attachments.append(attachment)
 
@@ -509,6 +580,34 @@ class HIRACancerScraper:
 
         return post
 
+    async def queue_attachment(self, link_element, attachment: Dict[str, Any], post: Dict[str, Any],
+                               link_index: int) -> None:
+        """
+        첨부파일 다운로드 등록
+
+        - 인덱스에 같은 키로 받은 기록이 있고 파일/해시가 그대로면 스킵
+        - 다운로드 URL이 있으면 다운로드 큐(AttachmentDownloader)에 넣고 바로 반환
+        - URL을 만들 수 없는 링크만 페이지에서 직접 클릭해 다운로드
+
+        Args:
+            link_element: 다운로드 링크 Playwright element
+            attachment: 첨부파일 정보 (다운로드 완료 시 downloaded/local_path/sha256 갱신)
+            post: 게시글 정보
+            link_index: 링크 인덱스
+        """
+        known = self.index.known_attachment(post['board'], post, attachment)
+        if known:
+            logger.debug(f"    변경 없음: {attachment['filename']}")
+            attachment['local_path'] = known['local_path']
+            attachment['sha256'] = known['sha256']
+            attachment['downloaded'] = True
+            return
+
+        if attachment.get('download_url'):
+            self.downloader.enqueue(attachment, post)
+        else:
+            attachment['downloaded'] = await self.download_attachment_on_page(link_element, attachment, post, link_index)
+
     async def download_attachment_on_page(self, link_element, attachment: Dict[str, Any], post: Dict[str, Any], link_index: int) -> bool:
         """
         상세 페이지에서 첨부파일 링크 클릭하여 다운로드
@@ -533,10 +632,12 @@ class HIRACancerScraper:
 
             local_path = board_dir / safe_filename
 
-            # 이미 다운로드된 경우 스킵
-            if local_path.exists():
+            # 전체 수집 모드: 이미 다운로드된 파일은 스킵
+            # (증분 모드에서는 인덱스에 없는 첨부 = 새/교체 첨부이므로 덮어씀)
+            if local_path.exists() and not self.incremental:
                 logger.debug(f"    이미 존재: {safe_filename}")
                 attachment['local_path'] = str(local_path)
+                attachment['sha256'] = file_sha256(local_path)
                 return True
 
             # 다운로드 (링크 클릭)
@@ -558,6 +659,7 @@ class HIRACancerScraper:
             await download.save_as(local_path)
 
             attachment['local_path'] = str(local_path)
+            attachment['sha256'] = file_sha256(local_path)
             logger.info(f"    저장 완료: {local_path.name} ({local_path.stat().st_size / 1024:.1f} KB)")
 
             return True
@@ -566,40 +668,55 @@ class HIRACancerScraper:
             logger.error(f"    첨부파일 다운로드 실패 ({attachment.get('filename', 'Unknown')}): {e}")
             return False
 
-    async def scrape_board(self, board_key: str, max_pages: int = None) -> List[Dict[str, Any]]:
+    async def scrape_board(self, board_key: str, max_pages: int = None,
+                           incremental: Optional[bool] = None) -> List[Dict[str, Any]]:
         """
         게시판 전체 스크래핑
 
         Args:
             board_key: 게시판 키
             max_pages: 최대 페이지 수 (None이면 전체)
+            incremental: 증분 모드 (None이면 생성자 설정). 바뀌지 않은 기존 게시글을 만나면 페이징 중단
 
         Returns:
-            모든 게시글 목록
+            게시글 목록 (증분 모드에서는 새 글/개정된 글만)
         """
         board = self.BOARDS[board_key]
+        incremental = self.incremental if incremental is None else incremental
+
         logger.info(f"\n{'='*80}")
-        logger.info(f"[{board['name']}] 스크래핑 시작")
+        logger.info(f"[{board['name']}] 스크래핑 시작{' (증분)' if incremental else ''}")
         logger.info(f"{'='*80}")
 
-        # 총 페이지 수 조회
-        total_pages = await self.get_total_pages(board_key)
-
-        if max_pages:
-            total_pages = min(total_pages, max_pages)
-
-        logger.info(f"[{board['name']}] 총 {total_pages}페이지 스크래핑 예정")
+        if incremental:
+            # 총 페이지 수는 첫 목록 페이지에서 읽음 (별도 요청 생략)
+            total_pages = None
+        else:
+            total_pages = await self.get_total_pages(board_key)
+            if max_pages:
+                total_pages = min(total_pages, max_pages)
+            logger.info(f"[{board['name']}] 총 {total_pages}페이지 스크래핑 예정")
 
         all_posts = []
+        stop = UnchangedStop() if incremental else None
+        page_num = 1
 
         # 각 페이지 스크래핑
-        for page_num in range(1, total_pages + 1):
+        while total_pages is None or page_num <= total_pages:
             try:
                 # 목록 조회
-                posts = await self.scrape_board_list(board_key, page_num)
+                posts = await self.scrape_board_list(board_key, page_num, stop=stop)
+
+                if total_pages is None:
+                    total_pages = await self.read_total_pages(board_key)
+                    if max_pages:
+                        total_pages = min(total_pages, max_pages)
 
                 # 상세 조회
                 for post in posts:
+                    if post.get('status') == 'unchanged' and incremental:
+                        continue
+
                     try:
                         # 이미 처리된 경우 (공고예고, 항암화학요법) 스킵
                         if not post.get('detail_fetched', False):
@@ -608,22 +725,35 @@ class HIRACancerScraper:
 
                         all_posts.append(post)
 
-                        # Rate limiting
-                        if not post.get('detail_fetched', False):
-                            await asyncio.sleep(0.5)
-
                     except Exception as e:
                         logger.error(f"게시글 처리 오류 ({post.get('title', 'Unknown')}): {e}")
                         continue
 
-                # 페이지 간 대기
-                await asyncio.sleep(1)
-
             except Exception as e:
                 logger.error(f"페이지 {page_num} 스크래핑 오류: {e}")
-                continue
+                if total_pages is None:
+                    break
+
+            if stop is not None and stop.reached:
+                logger.info(f"[{board['name']}] 페이지 {page_num}에서 기존 게시글 도달 → 페이징 중단")
+                break
 
-        logger.info(f"[{board['name']}] 완료: {len(all_posts)}개 게시글 수집")
+            page_num += 1
+
+        # 큐에 남은 첨부파일 다운로드 완료 후 인덱스 갱신 (첨부 해시 포함)
+        stats = await self.downloader.drain()
+        logger.info(f"[{board['name']}] 첨부파일: 다운로드 {stats['downloaded']}, 재사용 {stats['reused']}, "
+                    f"중복 {stats['duplicates']}, 실패 {stats['failed']}")
+
+        for post in all_posts:
+            self.index.update(board_key, post)
+
+        # 게시판 단위로 인덱스 저장 (중간 실패 시에도 진행분 유지)
+        self.index.save()
+
+        new_count = sum(1 for p in all_posts if p.get('status') == 'new')
+        revised_count = sum(1 for p in all_posts if p.get('status') == 'revised')
+        logger.info(f"[{board['name']}] 완료: {len(all_posts)}개 게시글 수집 (신규 {new_count}, 개정 {revised_count})")
         return all_posts
 
     async def scrape_all(self, max_pages_per_board: int = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -665,6 +795,7 @@ class HIRACancerScraper:
         # 통계
         stats = {
             'timestamp': timestamp,
+            'mode': 'incremental' if self.incremental else 'full',
             'boards': {}
         }
 
@@ -679,6 +810,8 @@ class HIRACancerScraper:
             stats['boards'][board_key] = {
                 'name': board_name,
                 'posts': len(posts),
+                'new': sum(1 for p in posts if p.get('status') == 'new'),
+                'revised': sum(1 for p in posts if p.get('status') == 'revised'),
                 'attachments': total_attachments,
                 'downloaded': downloaded_attachments
             }
@@ -701,6 +834,12 @@ class HIRACancerScraper:
 
 async def main():
     """메인 실행"""
+    parser = argparse.ArgumentParser(description='HIRA 암질환 사용약제 및 요법 스크래퍼')
+    parser.add_argument('--incremental', action='store_true',
+                        help='증분 모드: 새 글/개정된 글과 새 첨부파일만 수집 (post_index.json 기준)')
+    parser.add_argument('--max-pages', type=int, default=None, help='게시판당 최대 페이지 수')
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent
     output_dir = base_dir / 'data' / 'hira_cancer' / 'raw'
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -709,9 +848,9 @@ async def main():
     logger.info("HIRA 암질환 사용약제 및 요법 스크래퍼")
     logger.info("="*80)
 
-    async with HIRACancerScraper(output_dir, download_attachments=True) as scraper:
-        # 전체 스크래핑 (모든 페이지)
-        results = await scraper.scrape_all(max_pages_per_board=None)
+    async with HIRACancerScraper(output_dir, download_attachments=True, incremental=args.incremental) as scraper:
+        # 전체 스크래핑 (증분 모드면 기존 게시글에서 중단)
+        results = await scraper.scrape_all(max_pages_per_board=args.max_pages)
 
         # 결과 저장
         output_file = scraper.save_results(results)
@@ -6,22 +6,26 @@
 3. JSON 파일로 저장하여 재사용
 
 입력: data/hira_master/20221101_20251101 적용약가파일_사전제공 1부.xlsx
-출력: data/hira_master/drug_dictionary.json
+출력: data/hira_master/drug_dictionary/ (mmap 사전, shared.drug_dictionary)
+      data/hira_master/drug_dictionary.json (기존 형식, 아직 전환하지 않은 스크립트용)
 """
 
 import pandas as pd
 import json
-import re
 from pathlib import Path
-from collections import defaultdict
 import sys
 import codecs
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.drug_dictionary import DrugDictionary, DrugDictionaryBuilder, normalize_key, search_key_table
+
 # UTF-8 출력
 if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
 
 MASTER_DIR = Path('data/hira_master')
+OUTPUT_DIR = MASTER_DIR / 'drug_dictionary'
 OUTPUT_FILE = MASTER_DIR / 'drug_dictionary.json'
 
 print('=' * 100)
@@ -38,172 +42,59 @@ df = pd.read_excel(drug_file)
 print(f'총 {len(df):,}개 행 로드')
 print(f'컬럼: {list(df.columns[:10])}...')
 
-# 2. 키 추출 함수
-def extract_search_keys(product_name):
-    """
-    제품명에서 다양한 검색 키 추출
-
-    예시 입력: "옵디보주100mg(니볼루맙,유전자재조합)_(0.1g/10mL)"
-
-    출력 키:
-    1. "옵디보주100mg" - 전체 제품명 (괄호 앞)
-    2. "옵디보주" - 숫자/단위 제거
-    3. "옵디보" - 제형도 제거 (NEW!)
-    4. "니볼루맙" - 성분명 (괄호 안 첫 번째)
-
-    정규화 키 (소문자, 공백/특수문자 제거):
-    - "opdivoju100mg"
-    - "opdivoju"
-    - "opdivo"  (NEW!)
-    - "nivolumab"
-    """
-    keys = []
-
-    if pd.isna(product_name):
-        return keys
-
-    # 1. 괄호 앞부분 = 제품명 추출
-    match = re.match(r'([^(]+)', product_name)
-    if not match:
-        return keys
-
-    full_product_name = match.group(1).strip()
-    keys.append(full_product_name)  # "옵디보주100mg" 또는 "킴리아주"
-
-    # 2. 숫자 + 단위 제거
-    # 패턴: 숫자(소수점 포함) + 단위(mg, g, mL, 밀리그램, 그램 등)
-    without_dosage = re.sub(r'\d+(\.\d+)?(mg|g|mL|L|밀리그램|그램|킬로그램|밀리리터|리터|μg|mcg|IU|I\.U|KI\.U).*$', '', full_product_name, flags=re.IGNORECASE)
-    without_dosage = without_dosage.strip()
-
-    # 숫자가 제거됐으면 키 추가
-    if without_dosage and without_dosage != full_product_name:
-        keys.append(without_dosage)  # "옵디보주"
-
-    # 3. 제형 제거 (숫자 제거 여부와 무관하게 항상 시도)
-    # 제형 패턴: 주, 정, 캡슐, 시럽, 액, 연고, 크림, 겔, 패치, 좌제, 산, 과립 등
-    dosage_forms = [
-        '주', '정', '캡슐', '연질캡슐', '경질캡슐', '서방정', '서방캡슐',
-        '시럽', '액', '현탁액', '용액', '주사', '주사액',
-        '연고', '크림', '겔', '로션', '패치', '좌제', '좌약',
-        '산', '과립', '세립', '분말', '산제',
-        '점안액', '점비액', '점이액', '안연고',
-        '흡입제', '스프레이', '에어로졸',
-        '필름', '트로키', '츄정', '발포정'
-    ]
-
-    # without_dosage가 없으면 full_product_name에서 제형 제거 시도
-    base_name = without_dosage if without_dosage else full_product_name
-    without_form = base_name
-
-    for form in dosage_forms:
-        if base_name.endswith(form):
-            without_form = base_name[:-len(form)].strip()
-            break
-
-    # 제형이 제거됐고, 아직 키에 없으면 추가
-    if without_form and without_form != base_name and without_form not in keys:
-        keys.append(without_form)  # "옵디보" 또는 "킴리아"
-
-    # 4. 괄호 안 성분명
-    match = re.search(r'\(([^)]+)\)', product_name)
-    if match:
-        ingredients = match.group(1)
-        # 쉼표로 구분된 첫 번째 성분만 추출
-        first_ingredient = ingredients.split(',')[0].strip()
-        if first_ingredient:
-            keys.append(first_ingredient)  # "니볼루맙"
-
-    return keys
-
-def normalize_key(key):
-    """
-    검색 키 정규화
-    - 소문자 변환
-    - 공백, 하이픈, 언더스코어 제거
-    - 특수문자 제거
-    """
-    if not key:
-        return ''
-
-    # 소문자 변환
-    normalized = key.lower()
-
-    # 공백, 특수문자 제거
-    normalized = re.sub(r'[\s\-_·]', '', normalized)
-
-    # 한글, 영문, 숫자만 남김
-    normalized = re.sub(r'[^\w가-힣]', '', normalized)
-
-    return normalized
-
-# 3. 사전 구축
+# 2. 검색 키 추출 및 사전 구축
 print('\n[2] 검색 키 추출 및 사전 구축')
 print('-' * 100)
 
-# 사전 구조
-# {
-#   "원본키": {
-#     "records": [제품 정보들],
-#     "normalized_from": "정규화된키"
-#   },
-#   "정규화된키": {
-#     "records": [제품 정보들],
-#     "is_normalized": True
-#   }
-# }
-
-drug_dict = defaultdict(lambda: {"records": [], "normalized_from": None, "is_normalized": False})
-key_statistics = defaultdict(int)
-
-for idx, row in df.iterrows():
-    product_code = str(row['제품코드'])
-    product_name = row['제품명']
-
-    # 제품 정보
-    record = {
-        'product_code': product_code,
-        'product_name': product_name,
-        'specification': str(row['규격']) if pd.notna(row['규격']) else '',
-        'company': str(row['업체명']) if pd.notna(row['업체명']) else '',
-        'ingredient_code': str(row['주성분코드']) if pd.notna(row['주성분코드']) else '',
-        'price': float(row['상한가']) if pd.notna(row['상한가']) else 0.0,
-        'route': str(row['투여경로']) if pd.notna(row['투여경로']) else '',
-    }
-
-    # 검색 키 추출
-    search_keys = extract_search_keys(product_name)
-
-    for key in search_keys:
-        if not key:
-            continue
-
-        # 원본 키로 저장
-        drug_dict[key]["records"].append(record)
-        key_statistics['원본 키'] += 1
-
-        # 정규화 키로도 저장
-        normalized = normalize_key(key)
-        if normalized and normalized != key:
-            drug_dict[normalized]["records"].append(record)
-            drug_dict[normalized]["is_normalized"] = True
-            drug_dict[key]["normalized_from"] = normalized
-            key_statistics['정규화 키'] += 1
-
-    if (idx + 1) % 10000 == 0:
-        print(f'  처리 중: {idx + 1:,} / {len(df):,} ({(idx+1)/len(df)*100:.1f}%)')
+# 사전 구조 (shared/drug_dictionary.py)
+# - 제품 표: 제품마다 한 번만 저장 (문자열 intern)
+# - 검색 키(원본 + 정규화) → 제품 번호 목록
+
+# 검색 키: 제품명 열 전체를 pandas 문자열 연산으로 한 번에 생성 (shared.drug_dictionary.search_key_table)
+# "옵디보주100mg(니볼루맙,유전자재조합)_(0.1g/10mL)" → 옵디보주100mg / 옵디보주 / 옵디보 / 니볼루맙
+df = df.reset_index(drop=True)
+key_table = search_key_table(df['제품명'])
+
+def text_column(column):
+    """결측은 빈 문자열, 나머지는 str()"""
+    return df[column].where(df[column].notna(), '').astype(str)
+
+# 제품 정보
+records = pd.DataFrame({
+    'product_code': df['제품코드'].astype(str),
+    'product_name': df['제품명'],
+    'specification': text_column('규격'),
+    'company': text_column('업체명'),
+    'ingredient_code': text_column('주성분코드'),
+    'price': df['상한가'].astype(float).fillna(0.0),
+    'route': text_column('투여경로'),
+}).to_dict('records')
+
+builder = DrugDictionaryBuilder()
+builder.add_table(records, key_table)
+
+key_statistics = {
+    '원본 키': len(key_table),
+    '정규화 키': int(key_table['normalized'].notna().sum()),
+}
+print(f'  검색 키 종류별: {key_table["key_kind"].value_counts().to_dict()}')
+
+meta = builder.save(OUTPUT_DIR, source=drug_file)
+drug_dict = DrugDictionary.open(OUTPUT_DIR)
 
 print(f'\n완료!')
 print(f'  고유 검색 키: {len(drug_dict):,}개')
+print(f'  고유 제품: {drug_dict.num_products:,}개 (intern 문자열 {meta["strings"]:,}개)')
 print(f'  원본 키: {key_statistics["원본 키"]:,}개')
 print(f'  정규화 키: {key_statistics["정규화 키"]:,}개')
 
-# 4. 샘플 확인
+# 3. 샘플 확인
 print('\n[3] 샘플 확인')
 print('-' * 100)
 
-sample_keys = list(drug_dict.keys())[:10]
+sample_keys = [key for _, key in zip(range(10), drug_dict.keys())]
 for key in sample_keys:
-    info = drug_dict[key]
+    info = drug_dict.get(key)
     print(f'\n검색 키: "{key}"')
     print(f'  정규화 여부: {"Yes" if info["is_normalized"] else "No"}')
     print(f'  매칭 제품 수: {len(info["records"])}개')
@@ -212,7 +103,7 @@ for key in sample_keys:
         print(f'  예시 제품: {first["product_name"]}')
         print(f'           제품코드: {first["product_code"]}')
 
-# 5. 특정 약제 테스트
+# 4. 특정 약제 테스트
 print('\n[4] 검색 테스트')
 print('-' * 100)
 
@@ -245,26 +136,28 @@ for query in test_queries:
     else:
         print(f'  [매칭 없음]')
 
-# 6. JSON 저장
-print('\n[5] JSON 파일로 저장')
+# 5. 저장 결과
+print('\n[5] 사전 파일 저장')
 print('-' * 100)
 
-# defaultdict를 일반 dict로 변환
-final_dict = {k: dict(v) for k, v in drug_dict.items()}
+print(f'저장 완료: {OUTPUT_DIR}')
+print(f'사전 크기: {drug_dict.nbytes / (1024 * 1024):.2f} MB')
+
+# 기존 형식 JSON (bridges/, mfds/workflows 등 아직 전환하지 않은 스크립트용)
+final_dict = {key: drug_dict.get(key) for key in drug_dict.keys()}
 
 with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
     json.dump(final_dict, f, ensure_ascii=False, indent=2)
 
 file_size = OUTPUT_FILE.stat().st_size / (1024 * 1024)
-print(f'저장 완료: {OUTPUT_FILE}')
-print(f'파일 크기: {file_size:.2f} MB')
+print(f'기존 형식 JSON: {OUTPUT_FILE} ({file_size:.2f} MB)')
 
-# 7. 통계 요약
+# 6. 통계 요약
 print('\n[6] 통계 요약')
 print('-' * 100)
 
-total_records = sum(len(v["records"]) for v in drug_dict.values())
-avg_records_per_key = total_records / len(drug_dict) if drug_dict else 0
+total_records = meta['postings']
+avg_records_per_key = total_records / len(drug_dict) if len(drug_dict) else 0
 
 print(f'''
 총 검색 키:           {len(drug_dict):,}개
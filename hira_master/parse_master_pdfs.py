@@ -20,7 +20,7 @@ from dotenv import load_dotenv
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.parsers import UpstageParser
+from shared.parsers import TriageParser, UpstageParser
 
 # UTF-8 출력
 if sys.platform == 'win32':
@@ -39,7 +39,8 @@ class MasterPDFParser:
         if not api_key:
             raise ValueError('UPSTAGE_API_KEY not found in .env')
 
-        self.parser = UpstageParser(api_key=api_key)
+        # 텍스트 레이어가 있는 페이지는 로컬 추출, 스캔 페이지만 Upstage 전송
+        self.parser = TriageParser(UpstageParser(api_key=api_key))
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
 
@@ -64,7 +65,7 @@ class MasterPDFParser:
 
             # 통계 출력
             print(f'✅ 파싱 성공')
-            print(f'  - 페이지: {result.get("pages", 0)}p')
+            print(f'  - 페이지: {result.get("pages", 0)}p (API 전송 {result.get("usage", {}).get("pages", 0)}p)')
             print(f'  - 모델: {result.get("model")}')
             print(f'  - Markdown 길이: {len(result.get("content", ""))}자')
             print(f'  - HTML 길이: {len(result.get("html", ""))}자')
@@ -14,14 +14,17 @@ from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-def load_drug_dictionary(dict_path: Path) -> Dict:
-    """약가 사전 로드"""
-    with open(dict_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from shared.drug_dictionary import DrugDictionary
 
 
-def group_by_ingredient(drug_dict: Dict) -> Dict[str, List]:
+def load_drug_dictionary(dict_path: Path) -> DrugDictionary:
+    """약가 사전 열기 (mmap)"""
+    return DrugDictionary.open(dict_path)
+
+
+def group_by_ingredient(drug_dict: DrugDictionary) -> Dict[str, List]:
     """
     성분코드로 약제 그룹화
 
@@ -41,17 +44,17 @@ def group_by_ingredient(drug_dict: Dict) -> Dict[str, List]:
     """
     grouped = defaultdict(list)
 
-    for key, value in drug_dict.items():
-        for rec in value.get('records', []):
-            ing_code = rec.get('ingredient_code')
-            if ing_code:
-                grouped[ing_code].append({
-                    'product_name': rec.get('product_name', ''),
-                    'company': rec.get('company', ''),
-                    'price': rec.get('price', 0),
-                    'product_code': rec.get('product_code', ''),
-                    'route': rec.get('route', '')
-                })
+    # 검색 키별 중복 없이 제품 표를 한 번만 순회
+    for rec in drug_dict.products():
+        ing_code = rec.get('ingredient_code')
+        if ing_code:
+            grouped[ing_code].append({
+                'product_name': rec.get('product_name', ''),
+                'company': rec.get('company', ''),
+                'price': rec.get('price', 0),
+                'product_code': rec.get('product_code', ''),
+                'route': rec.get('route', '')
+            })
 
     # 중복 제거 (제품명 기준)
     for ing_code in grouped:
@@ -133,7 +136,7 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='성분별 약제 그룹화 및 검색')
-    parser.add_argument('--dict', default='data/hira_master/drug_dictionary.json',
+    parser.add_argument('--dict', default='data/hira_master/drug_dictionary',
                         help='약가 사전 파일')
     parser.add_argument('--search', '-s', type=str,
                         help='검색어 (성분명 일부)')
@@ -161,7 +164,7 @@ def main():
     # 약가 사전 로드
     print(f"[LOAD] {dict_path}")
     drug_dict = load_drug_dictionary(dict_path)
-    print(f"  → {len(drug_dict):,}개 검색 키 로드")
+    print(f"  → {len(drug_dict):,}개 검색 키, {drug_dict.num_products:,}개 제품")
 
     # 성분별 그룹화
     print("\n[GROUP] 성분별 그룹화 중...")
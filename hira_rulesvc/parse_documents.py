@@ -3,6 +3,7 @@ HIRA 고시 문서 파싱 스크립트
 
 Upstage Document Parse API를 사용하여
 HWP/PDF 문서를 Markdown으로 변환하고 메타데이터 연결
+(TriageParser: 텍스트 레이어가 있는 페이지는 로컬 추출, 스캔 페이지만 API 전송)
 """
 from pathlib import Path
 import json
@@ -96,7 +97,7 @@ def parse_sample(sample_count: int = 3):
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # 파서 생성
-    parser = ParserFactory.create("upstage")
+    parser = ParserFactory.create("triage")
     doc_tree = load_document_tree()
 
     # 샘플 파일 선택 (크기 작은 순)
@@ -108,7 +109,7 @@ def parse_sample(sample_count: int = 3):
     print(f"\n{len(files)}개 파일 샘플 테스트\n")
 
     total_pages = 0
-    total_cost = 0.0
+    total_api_pages = 0
 
     for i, file_path in enumerate(files, 1):
         try:
@@ -130,10 +131,12 @@ def parse_sample(sample_count: int = 3):
                 json.dump(result, f, ensure_ascii=False, indent=2)
 
             pages = result.get('pages', 0)
+            api_pages = result.get('usage', {}).get('pages', pages)
             total_pages += pages
-            cost = pages * 0.01
+            total_api_pages += api_pages
+            cost = api_pages * 0.01
 
-            print(f"→ {pages} 페이지 (${cost:.2f}) ✓")
+            print(f"→ {pages} 페이지, API {api_pages} 페이지 (${cost:.2f}) ✓")
             print(f"  저장: {output_file.name}\n")
 
         except Exception as e:
@@ -141,8 +144,8 @@ def parse_sample(sample_count: int = 3):
 
     print("-" * 80)
     print(f"완료: {len(files)}개 파일")
-    print(f"총 페이지: {total_pages}")
-    print(f"비용: ${total_pages * 0.01:.2f} (약 ₩{int(total_pages * 0.01 * 1300):,})")
+    print(f"총 페이지: {total_pages} (API 전송 {total_api_pages})")
+    print(f"비용: ${total_api_pages * 0.01:.2f} (약 ₩{int(total_api_pages * 0.01 * 1300):,})")
     print("=" * 80)
 
 
@@ -158,7 +161,7 @@ def parse_all():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # 파서 생성
-    parser = ParserFactory.create("upstage")
+    parser = ParserFactory.create("triage")
     doc_tree = load_document_tree()
 
     # 파일 목록
@@ -168,6 +171,7 @@ def parse_all():
 
     results = []
     total_pages = 0
+    total_api_pages = 0
     success_count = 0
     fail_count = 0
 
@@ -196,6 +200,7 @@ def parse_all():
 
             pages = result.get('pages', 0)
             total_pages += pages
+            total_api_pages += result.get('usage', {}).get('pages', pages)
             success_count += 1
 
             print(f"✓ ({pages:2d}p)")
@@ -212,8 +217,8 @@ def parse_all():
     print("-" * 80)
     print(f"성공: {success_count}/{len(files)} 파일")
     print(f"실패: {fail_count} 파일")
-    print(f"총 페이지: {total_pages} 페이지")
-    print(f"비용: ${total_pages * 0.01:.2f} (약 ₩{int(total_pages * 0.01 * 1300):,}원)")
+    print(f"총 페이지: {total_pages} 페이지 (API 전송 {total_api_pages} 페이지)")
+    print(f"비용: ${total_api_pages * 0.01:.2f} (약 ₩{int(total_api_pages * 0.01 * 1300):,}원)")
     print("=" * 80)
 
     # 결과 저장
@@ -224,8 +229,9 @@ def parse_all():
             "success": success_count,
             "fail": fail_count,
             "total_pages": total_pages,
-            "cost_usd": total_pages * 0.01,
-            "cost_krw": int(total_pages * 0.01 * 1300),
+            "api_pages": total_api_pages,
+            "cost_usd": total_api_pages * 0.01,
+            "cost_krw": int(total_api_pages * 0.01 * 1300),
             "parsed_at": datetime.now().isoformat()
         }, f, ensure_ascii=False, indent=2)
 
@@ -251,7 +257,7 @@ def retry_failed(use_ocr: bool = False):
     output_dir = Path("data/hira_rulesvc/parsed")
 
     # 파서 생성
-    parser = ParserFactory.create("upstage")
+    parser = ParserFactory.create("triage")
     doc_tree = load_document_tree()
 
     # 전체 파일 목록
@@ -275,6 +281,7 @@ def retry_failed(use_ocr: bool = False):
 
     results = []
     total_pages = 0
+    total_api_pages = 0
     success_count = 0
     fail_count = 0
 
@@ -306,6 +313,7 @@ def retry_failed(use_ocr: bool = False):
 
             pages = result.get('pages', 0)
             total_pages += pages
+            total_api_pages += result.get('usage', {}).get('pages', pages)
             success_count += 1
 
             print(f"✓ ({pages:2d}p)")
@@ -323,8 +331,8 @@ def retry_failed(use_ocr: bool = False):
     print("-" * 80)
     print(f"성공: {success_count}/{len(failed_files)} 파일")
     print(f"실패: {fail_count} 파일")
-    print(f"추가 페이지: {total_pages} 페이지")
-    print(f"추가 비용: ${total_pages * 0.01:.2f} (약 ₩{int(total_pages * 0.01 * 1300):,}원)")
+    print(f"추가 페이지: {total_pages} 페이지 (API 전송 {total_api_pages} 페이지)")
+    print(f"추가 비용: ${total_api_pages * 0.01:.2f} (약 ₩{int(total_api_pages * 0.01 * 1300):,}원)")
 
     # 전체 통계 업데이트
     summary_file = output_dir / "_summary.json"
@@ -332,13 +340,16 @@ def retry_failed(use_ocr: bool = False):
         with open(summary_file, 'r', encoding='utf-8') as f:
             old_summary = json.load(f)
 
+        # 이전 요약에 api_pages가 없으면 전 페이지가 API로 전송된 것
+        api_pages = old_summary.get("api_pages", old_summary["total_pages"]) + total_api_pages
         new_summary = {
             "total_files": old_summary["total_files"],
             "success": old_summary["success"] + success_count,
             "fail": old_summary["fail"] - success_count + fail_count,
             "total_pages": old_summary["total_pages"] + total_pages,
-            "cost_usd": (old_summary["total_pages"] + total_pages) * 0.01,
-            "cost_krw": int((old_summary["total_pages"] + total_pages) * 0.01 * 1300),
+            "api_pages": api_pages,
+            "cost_usd": api_pages * 0.01,
+            "cost_krw": int(api_pages * 0.01 * 1300),
             "parsed_at": datetime.now().isoformat()
         }
 
@@ -3,7 +3,7 @@ HIRA 서식 첨부파일 스크래퍼
 
 서식 정보(attach) 목록에서 다운로드 버튼을 통해 첨부파일을 수집합니다.
 """
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 import time
 import random
 from typing import List, Dict
@@ -12,6 +12,7 @@ import json
 import re
 import os
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 from shared.utils.csv_handler import save_to_csv
 from hira_rulesvc.config import get_seq_by_name, get_seq_by_partial_match
@@ -22,6 +23,8 @@ logger = setup_logger('attach_scraper', project='hira_rulesvc')
 BASE_URL = 'http://rulesvc.hira.or.kr/lmxsrv/main/main.srv'
 PAGE_TIMEOUT = 30000
 DOWNLOAD_TIMEOUT = 60000
+CONTENT_FRAME = "contentbody"
+LIST_READY = 'table'
 
 class AttachScraper:
     def __init__(self, target_seq: str = None, target_name: str = None, headless: bool = True):
@@ -32,6 +35,7 @@ class AttachScraper:
             headless: 헤드리스 모드 여부
         """
         self.headless = headless
+        self.factory = None
         self.meta_records = []
 
         # SEQ 결정
@@ -65,23 +69,19 @@ class AttachScraper:
         logger.info(f"대상 SEQ: {self.target_seq}")
         logger.info("=" * 60)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            context = browser.new_context(accept_downloads=True)
-            page = context.new_page()
-            page.set_default_timeout(PAGE_TIMEOUT)
+        timings_path = self.out_dir / 'page_timings.json'
+        with BrowserFactory(headless=self.headless, timeout=PAGE_TIMEOUT, timings_path=timings_path) as factory:
+            self.factory = factory
+            page = factory.new_page()
 
             try:
                 # 1. 메인 페이지 접속
                 logger.info(f"메인 페이지 접속: {BASE_URL}")
-                page.goto(BASE_URL)
-                page.wait_for_load_state("networkidle")
-                time.sleep(1)
+                factory.goto(page, BASE_URL, wait_until="load")
 
-                # 2. 서식정보 탭 클릭 (menu_go('2'))
+                # 2. 서식정보 탭 클릭 (menu_go('2')), 검색 폼이 붙을 때까지 대기
                 logger.info("서식정보 탭 클릭")
-                page.evaluate("menu_go('2')")
-                time.sleep(2)
+                factory.run_and_wait(page, "menu_go('2')", ready_selector='#seachForm')
 
                 # 3. 폼 제출로 목록 페이지 진입
                 content_frame = self.navigate_to_list(page)
@@ -107,28 +107,25 @@ class AttachScraper:
                     self.save_metadata()
                 raise
             finally:
-                browser.close()
+                self.factory = None
 
     def navigate_to_list(self, page: Page):
         """폼 제출로 목록 페이지 진입"""
         logger.info(f"SEQ={self.target_seq}로 목록 페이지 이동")
 
-        # 폼 값 설정 및 제출
-        page.evaluate(f"""() => {{
+        # 폼 값 설정 및 제출 후 contentbody iframe 목록 테이블 대기
+        logger.info("목록 페이지 로딩 대기...")
+        content_frame = self.factory.run_and_wait(page, f"""() => {{
             document.getElementById('SEQ').value = '{self.target_seq}';
             document.getElementById('SEQ_ATTACH_TYPE').value = '0';  // 전체
             document.getElementById('SEARCH_TYPE').value = 'all';
             document.getElementById('seachForm').action = '/lmxsrv/attach/attachList.srv';
             document.getElementById('seachForm').submit();
-        }}""")
-
-        # contentbody iframe 로딩 대기
-        logger.info("목록 페이지 로딩 대기...")
-        page.wait_for_load_state("networkidle")
+        }}""", ready_selector=LIST_READY, frame_name=CONTENT_FRAME, required=False)
+        # 요청 간격 (서버 부하 방지)
         time.sleep(random.uniform(1.0, 2.0))
 
         # contentbody iframe 참조
-        content_frame = page.frame(name="contentbody")
         if not content_frame:
             raise Exception("contentbody iframe을 찾을 수 없습니다")
 
@@ -176,8 +173,9 @@ class AttachScraper:
 
             # 다음 페이지 클릭
             logger.info(f"다음 페이지로 이동...")
-            next_btn.click()
-            frame.wait_for_load_state("networkidle")
+            frame = self.factory.click_and_wait(page, next_btn, ready_selector=LIST_READY,
+                                                frame_name=CONTENT_FRAME, required=False)
+            # 요청 간격 (서버 부하 방지)
             time.sleep(random.uniform(0.5, 1.0))
 
             page_no += 1
@@ -3,7 +3,7 @@ HIRA 고시 문서 크롤러
 
 트리에서 고시 문서(HWP, PDF 등)를 다운로드합니다.
 """
-from playwright.sync_api import sync_playwright, Page, Download
+from playwright.sync_api import Page, Download
 from pathlib import Path
 import time
 import json
@@ -14,11 +14,16 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 from hira_rulesvc.config import TREE_TO_SEQ_MAPPING
 
 BASE_URL = 'http://rulesvc.hira.or.kr/lmxsrv/main/main.srv'
 
+# 페이지 준비 판정 (고정 대기 대신 사용)
+CONTENT_FRAME = "contentbody"
+RECENT_LAW_SELECTOR = 'ul.list01 li'
+
 
 class HIRALawDocumentScraper:
     """
@@ -27,7 +32,8 @@ class HIRALawDocumentScraper:
     트리 구조에서 고시 문서 파일을 다운로드합니다.
     """
 
-    def __init__(self, output_dir: str = "data/hira_rulesvc/documents"):
+    def __init__(self, output_dir: str = "data/hira_rulesvc/documents", headless: bool = True):
+        self.headless = headless
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = setup_logger("hira_law_document_scraper", project="hira_rulesvc")
@@ -43,25 +49,21 @@ class HIRALawDocumentScraper:
         # tree.md 기반 트리 구조를 순회하면서 문서 다운로드
         total_documents = 0
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False, slow_mo=500)
-            context = browser.new_context(accept_downloads=True)
-            page = context.new_page()
+        timings_path = self.output_dir / "page_timings.json"
+        with BrowserFactory(headless=self.headless, timings_path=timings_path) as factory:
+            page = factory.new_page()
 
             try:
                 # 메인 페이지 접속
                 self.logger.info(f"메인 페이지 접속: {BASE_URL}")
-                page.goto(BASE_URL)
-                page.wait_for_load_state("networkidle")
-                time.sleep(2)
+                factory.goto(page, BASE_URL, wait_until="load")
 
-                # 서식정보 탭 클릭 (최근 고시정보 표시용)
+                # 서식정보 탭 클릭 (최근 고시정보 목록이 그려질 때까지 대기)
                 self.logger.info("서식정보 탭 클릭")
-                page.evaluate("menu_go('2')")
-                time.sleep(2)
+                content_frame = factory.run_and_wait(page, "menu_go('2')", ready_selector=RECENT_LAW_SELECTOR,
+                                                     frame_name=CONTENT_FRAME, required=False)
 
                 # contentbody iframe에서 최근 고시정보 추출
-                content_frame = page.frame(name="contentbody")
                 if not content_frame:
                     self.logger.error("contentbody iframe을 찾을 수 없습니다")
                     return
@@ -97,8 +99,6 @@ class HIRALawDocumentScraper:
                 self.logger.error(f"오류 발생: {e}")
                 import traceback
                 traceback.print_exc()
-            finally:
-                browser.close()
 
         self.logger.info("\n" + "=" * 60)
         self.logger.info(f"크롤링 완료! 총 {total_documents}개 문서 다운로드")
@@ -112,8 +112,7 @@ class HIRALawDocumentScraper:
         items = []
 
         # "최근고시정보" 섹션의 li 요소들 가져오기
-        law_list_selector = 'ul.list01 li'
-        law_elements = frame.query_selector_all(law_list_selector)
+        law_elements = frame.query_selector_all(RECENT_LAW_SELECTOR)
 
         for elem in law_elements:
             try:
@@ -179,8 +178,7 @@ class HIRALawDocumentScraper:
                 page.evaluate(f"showPopup('/lmxsrv/print/hwpView.srv?SEQ_REVISION={item['seq_revision']}', 'hwpView', 800, 680)")
 
             popup = popup_info.value
-            popup.wait_for_load_state("networkidle")
-            time.sleep(2)
+            popup.wait_for_load_state("load")
 
             # 팝업에서 다운로드 버튼 찾기
             # (실제 HTML 구조를 보고 selector 조정 필요)
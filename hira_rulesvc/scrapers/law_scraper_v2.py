@@ -3,7 +3,7 @@ HIRA 고시 문서 크롤러 v2
 
 모든 리프 노드 문서를 다운로드합니다.
 """
-from playwright.sync_api import sync_playwright, Page, Download
+from playwright.sync_api import Page, Download
 from pathlib import Path
 import time
 import json
@@ -14,12 +14,18 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 
 BASE_URL = 'http://rulesvc.hira.or.kr/lmxsrv/main/main.srv'
 LAW_DOCUMENTS_JSON = Path("hira_rulesvc/config/all_law_documents.json")
 DOCUMENT_TREE_JSON = Path("hira_rulesvc/config/document_tree.json")
 
+# 페이지 준비 판정 (고정 대기 대신 사용)
+TREE_FRAME = "tree01"
+CONTENT_FRAME = "contentbody"
+DOWNLOAD_LINK = 'a:has-text("다운로드"), td.sbt04 > a'
+
 
 class HIRALawScraperV2:
     """
@@ -28,7 +34,9 @@ class HIRALawScraperV2:
     all_law_documents.json을 기반으로 모든 리프 노드를 다운로드합니다.
     """
 
-    def __init__(self, output_dir: str = "data/hira_rulesvc/documents"):
+    def __init__(self, output_dir: str = "data/hira_rulesvc/documents", headless: bool = True):
+        self.headless = headless
+        self.factory = None
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = setup_logger("hira_law_scraper_v2", project="hira_rulesvc")
@@ -51,22 +59,19 @@ class HIRALawScraperV2:
         downloaded_count = 0
         failed_count = 0
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False, slow_mo=300)
-            context = browser.new_context(accept_downloads=True)
-            page = context.new_page()
+        timings_path = self.output_dir / "page_timings.json"
+        with BrowserFactory(headless=self.headless, timings_path=timings_path) as factory:
+            self.factory = factory
+            page = factory.new_page()
 
             try:
                 # 메인 페이지 접속
                 self.logger.info(f"메인 페이지 접속: {BASE_URL}")
-                page.goto(BASE_URL)
-                page.wait_for_load_state("networkidle")
-                time.sleep(2)
+                factory.goto(page, BASE_URL, wait_until="load")
 
-                # 고시정보 탭 클릭
+                # 고시정보 탭 클릭 (트리 프레임이 다시 그려질 때까지 대기)
                 self.logger.info("고시정보 탭 클릭")
-                page.evaluate("menu_go('1')")
-                time.sleep(2)
+                factory.run_and_wait(page, "menu_go('1')", ready_selector="a", frame_name=TREE_FRAME)
 
                 # 각 문서 다운로드 (전체)
                 for idx, doc in enumerate(self.documents, 1):
@@ -115,7 +120,7 @@ class HIRALawScraperV2:
                 import traceback
                 traceback.print_exc()
             finally:
-                browser.close()
+                self.factory = None
 
         self.logger.info("\n" + "=" * 60)
         self.logger.info(f"크롤링 완료!")
@@ -142,15 +147,18 @@ class HIRALawScraperV2:
         self.logger.info(f"  - 네비게이션 시작: {' > '.join(path)} > {name}")
 
         # tree01 iframe 가져오기
-        tree_frame = page.frame(name="tree01")
+        tree_frame = page.frame(name=TREE_FRAME)
         if not tree_frame:
             self.logger.error("  tree01 iframe을 찾을 수 없습니다")
             return False
 
         try:
             # 1. 경로상의 폴더들을 순서대로 클릭
-            for folder_name in path:
+            for depth, folder_name in enumerate(path, 1):
                 self.logger.info(f"    → 폴더 클릭: {folder_name}")
+                # 트리 확장 판정: 다음 하위 폴더(마지막이면 파일) 링크
+                next_name = path[depth] if depth < len(path) else name
+                next_link = f'a:has-text("{next_name}")'
 
                 # 폴더 링크 찾기 (정확한 텍스트 매칭)
                 folder_link = tree_frame.locator(f'a:text-is("{folder_name}")').first
@@ -172,17 +180,16 @@ class HIRALawScraperV2:
                     except:
                         pass
 
-                    # JavaScript로 강제 클릭 (display:none 무시)
-                    folder_link.evaluate('el => el.click()')
-                    time.sleep(2.5)  # 트리 확장 대기 (더 길게)
+                    # JavaScript로 강제 클릭 (display:none 무시) 후 다음 노드가 붙을 때까지 대기
+                    self.factory.click_and_wait(page, folder_link, ready_selector=next_link,
+                                                target=tree_frame, timeout=10000, required=False)
                 except Exception as e:
                     self.logger.warning(f"    폴더 클릭 실패: {e}, 더블클릭 시도")
                     try:
                         folder_link.dblclick()
-                        time.sleep(2.5)
                     except:
                         folder_link.click()
-                        time.sleep(2.5)
+                    self.factory.wait_ready(tree_frame, ready_selector=next_link, timeout=10000, required=False)
 
             # 2. 최종 파일 링크 클릭
             self.logger.info(f"    → 파일 클릭: {name}")
@@ -207,13 +214,12 @@ class HIRALawScraperV2:
                 # 링크를 화면에 보이게 스크롤
                 try:
                     file_link.scroll_into_view_if_needed(timeout=3000)
-                    time.sleep(0.5)
                 except:
                     pass
 
-                # JavaScript로 강제 클릭 (display:none 등 무시)
-                file_link.evaluate('el => el.click()')
-                time.sleep(3)
+                # JavaScript로 강제 클릭 (display:none 등 무시), 문서 프레임 로드 대기
+                self.factory.click_and_wait(page, file_link, ready_selector=DOWNLOAD_LINK,
+                                            frame_name=CONTENT_FRAME, timeout=15000, required=False)
                 self.logger.info(f"    [OK] 파일 링크 클릭 완료")
 
             except Exception as e:
@@ -239,7 +245,7 @@ class HIRALawScraperV2:
         name = doc['name']
 
         # contentbody iframe 가져오기
-        content_frame = page.frame(name="contentbody")
+        content_frame = page.frame(name=CONTENT_FRAME)
         if not content_frame:
             self.logger.error("  contentbody iframe을 찾을 수 없습니다")
             return False
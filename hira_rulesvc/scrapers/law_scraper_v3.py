@@ -3,7 +3,7 @@ HIRA 고시 문서 크롤러 v3
 
 폴더별로 네비게이션한 후, 목록의 모든 문서를 다운로드합니다.
 """
-from playwright.sync_api import sync_playwright, Page, Download
+from playwright.sync_api import Page, Download
 from pathlib import Path
 import time
 import json
@@ -14,11 +14,17 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 
 BASE_URL = 'http://rulesvc.hira.or.kr/lmxsrv/main/main.srv'
 FOLDERS_JSON = Path("hira_rulesvc/config/folders_grouped.json")
 
+# 페이지 준비 판정 (고정 대기 대신 사용)
+TREE_FRAME = "tree01"
+CONTENT_FRAME = "contentbody"
+DOWNLOAD_LINK = 'a:has-text("다운로드")'
+
 
 class HIRALawScraperV3:
     """
@@ -27,7 +33,9 @@ class HIRALawScraperV3:
     폴더 단위로 네비게이션하고, 각 폴더의 모든 문서를 다운로드합니다.
     """
 
-    def __init__(self, output_dir: str = "data/hira_rulesvc/documents"):
+    def __init__(self, output_dir: str = "data/hira_rulesvc/documents", headless: bool = True):
+        self.headless = headless
+        self.factory = None
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = setup_logger("hira_law_scraper_v3", project="hira_rulesvc")
@@ -50,22 +58,19 @@ class HIRALawScraperV3:
         downloaded_count = 0
         failed_count = 0
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False, slow_mo=300)
-            context = browser.new_context(accept_downloads=True)
-            page = context.new_page()
+        timings_path = self.output_dir / "page_timings.json"
+        with BrowserFactory(headless=self.headless, timings_path=timings_path) as factory:
+            self.factory = factory
+            page = factory.new_page()
 
             try:
                 # 메인 페이지 접속
                 self.logger.info(f"메인 페이지 접속: {BASE_URL}")
-                page.goto(BASE_URL)
-                page.wait_for_load_state("networkidle")
-                time.sleep(2)
+                factory.goto(page, BASE_URL, wait_until="load")
 
-                # 고시정보 탭 클릭
+                # 고시정보 탭 클릭 (트리 프레임이 다시 그려질 때까지 대기)
                 self.logger.info("고시정보 탭 클릭")
-                page.evaluate("menu_go('1')")
-                time.sleep(2)
+                factory.run_and_wait(page, "menu_go('1')", ready_selector="a", frame_name=TREE_FRAME)
 
                 # 각 폴더 처리
                 for idx, folder_info in enumerate(self.folders, 1):
@@ -82,21 +87,17 @@ class HIRALawScraperV3:
                         failed_count += len(expected_docs)
                         continue
 
-                    time.sleep(2)
-
                     # contentbody의 모든 다운로드 버튼 찾기
                     downloaded = self._download_all_in_folder(page, expected_docs)
                     downloaded_count += downloaded
                     failed_count += (len(expected_docs) - downloaded)
 
-                    time.sleep(1)
-
             except Exception as e:
                 self.logger.error(f"오류 발생: {e}")
                 import traceback
                 traceback.print_exc()
             finally:
-                browser.close()
+                self.factory = None
 
         self.logger.info("\n" + "=" * 60)
         self.logger.info(f"크롤링 완료!")
@@ -111,14 +112,14 @@ class HIRALawScraperV3:
 
         트리에서 폴더들을 순서대로 클릭
         """
-        tree_frame = page.frame(name="tree01")
+        tree_frame = page.frame(name=TREE_FRAME)
         if not tree_frame:
             self.logger.error("  tree01 iframe을 찾을 수 없습니다")
             return False
 
         try:
             # 각 폴더 클릭
-            for folder_name in folder_path:
+            for depth, folder_name in enumerate(folder_path, 1):
                 self.logger.info(f"    → 폴더 클릭: {folder_name}")
 
                 # 폴더 링크 찾기
@@ -137,8 +138,15 @@ class HIRALawScraperV3:
                 except:
                     pass
 
-                folder_link.evaluate('el => el.click()')
-                time.sleep(2)
+                if depth < len(folder_path):
+                    # 트리 확장: 다음 하위 폴더 링크가 붙을 때까지 대기
+                    next_link = f'a:has-text("{folder_path[depth]}")'
+                    self.factory.click_and_wait(page, folder_link, ready_selector=next_link,
+                                                target=tree_frame, timeout=10000, required=False)
+                else:
+                    # 마지막 폴더: 문서 목록 프레임이 다시 로드될 때까지 대기
+                    self.factory.click_and_wait(page, folder_link, ready_selector=DOWNLOAD_LINK,
+                                                frame_name=CONTENT_FRAME, timeout=10000, required=False)
 
             self.logger.info(f"  ✓ 폴더 네비게이션 완료")
             return True
@@ -153,7 +161,7 @@ class HIRALawScraperV3:
 
         contentbody에 표시된 모든 다운로드 버튼을 클릭
         """
-        content_frame = page.frame(name="contentbody")
+        content_frame = page.frame(name=CONTENT_FRAME)
         if not content_frame:
             self.logger.error("  contentbody iframe을 찾을 수 없습니다")
             return 0
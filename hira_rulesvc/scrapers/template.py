@@ -3,9 +3,10 @@ HIRA 규칙 서비스 스크래퍼 템플릿
 
 이 파일은 hira_rulesvc 프로젝트의 스크래퍼를 작성할 때 참고할 템플릿입니다.
 """
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import Page
 import time
 from typing import List, Dict
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 from shared.utils.checkpoint import (
     load_checkpoint, save_checkpoint, is_processed,
@@ -33,21 +34,19 @@ class HiraScraper:
         """크롤러 실행"""
         logger.info("HIRA 스크래퍼 시작")
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            self.context = browser.new_context()
+        # 공통 브라우저 팩토리 (경량 프로파일: 이미지/폰트/분석 스크립트 차단)
+        with BrowserFactory(headless=self.headless, timeout=PAGE_TIMEOUT) as factory:
+            self.context = factory.new_context()
             page = self.context.new_page()
-            page.set_default_timeout(PAGE_TIMEOUT)
 
             try:
                 # 크롤링 로직 구현
+                # 고정 sleep 대신 준비 셀렉터로 대기: factory.goto(page, BASE_URL, ready_selector='table')
                 logger.info("크롤링 완료")
 
             except Exception as e:
                 logger.error(f"크롤러 실행 중 오류: {e}", exc_info=True)
                 self._flush_buffer()
-            finally:
-                browser.close()
 
     def _flush_buffer(self):
         """버퍼의 데이터를 CSV에 저장"""
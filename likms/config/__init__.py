@@ -0,0 +1,17 @@
+"""LIKMS 법령 수집 설정 모듈"""
+
+from .law_collections import (
+    COLLECTIONS_JSON,
+    load_collections,
+    list_collections,
+    get_collection,
+    get_laws,
+)
+
+__all__ = [
+    'COLLECTIONS_JSON',
+    'load_collections',
+    'list_collections',
+    'get_collection',
+    'get_laws',
+]
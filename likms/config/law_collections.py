@@ -0,0 +1,73 @@
+"""
+대법원 포털 법령 수집 목록
+
+법령 묶음(컬렉션)은 law_collections.json에 정의한다.
+새 법령을 수집하려면 스크립트를 복사하지 말고 JSON에 항목만 추가하면 된다.
+
+항목 형식:
+    {
+      "name": "의료법 시행령",          # 저장 파일명 (공백은 _로 치환)
+      "type": "대통령령",
+      "jisCntntsSrno": "2025000011809", # 모르면 생략 → 검색으로 찾아 캐시
+      "search_keyword": "의료법"         # 생략 시 name
+    }
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+COLLECTIONS_JSON = Path(__file__).parent / "law_collections.json"
+
+
+@lru_cache(maxsize=None)
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_collections(path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    컬렉션 설정 전체 로드
+
+    Returns:
+        {컬렉션 키: {"description": ..., "laws": [...]}}
+    """
+    return _load(str(path or COLLECTIONS_JSON))['collections']
+
+
+def list_collections(path: Optional[Path] = None) -> List[str]:
+    """컬렉션 키 목록"""
+    return list(load_collections(path))
+
+
+def get_collection(key: str, path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    컬렉션 하나 조회
+
+    Raises:
+        KeyError: 정의되지 않은 컬렉션
+    """
+    collections = load_collections(path)
+    if key not in collections:
+        raise KeyError(f"알 수 없는 컬렉션: {key} (사용 가능: {', '.join(collections)})")
+    return collections[key]
+
+
+def get_laws(keys: Optional[List[str]] = None, path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    여러 컬렉션의 법령 목록 (이름 기준 중복 제거, 각 항목에 collection 키 추가)
+
+    Args:
+        keys: 컬렉션 키 목록 (None이면 전체)
+    """
+    keys = keys or list_collections(path)
+    laws: List[Dict[str, Any]] = []
+    seen = set()
+    for key in keys:
+        for law in get_collection(key, path)['laws']:
+            if law['name'] in seen:
+                continue
+            seen.add(law['name'])
+            laws.append({**law, 'collection': key})
+    return laws
@@ -0,0 +1,391 @@
+"""
+대법원 포털 법령 통합 수집기
+
+scourt_*.py 스크립트마다 복사돼 있던 "법령 목록 → 순차 접속 → 텍스트 저장" 루프를
+하나의 작업 큐로 합친 수집기. 수집할 법령은 likms/config/law_collections.json에 정의한다.
+
+- 브라우저 풀(shared.browser_pool)의 페이지 여러 개로 법령을 동시에 수집
+- 호스트별 요청 간격 제한 (고정 time.sleep(2) 대신 HostRateLimiter)
+- jisCntntsSrno를 모르는 법령은 검색 → 결과 URL을 search_cache.json에 캐시
+- 법령별 상태(collection_status.json)를 완료 즉시 저장 → 재실행 시 완료 건 건너뛰고 실패 건만 재시도
+
+저장 형식은 기존 스크립트와 동일 (data/likms/laws/<법령명>.txt, .json)
+
+사용 예:
+    python likms/scrapers/law_collector.py --collection medical nhis
+    python likms/scrapers/law_collector.py --all --workers 4
+    python likms/scrapers/law_collector.py --laws "의료법" "약사법 시행령" --force
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, quote, urlparse
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from likms.config import get_collection, get_laws, list_collections
+from shared.utils.logger import setup_logger
+
+BASE_URL = "https://portal.scourt.go.kr/pgp/main.on"
+SOURCE_NAME = "대법원 사법정보공개포털"
+DATA_DIR = Path("data/likms")
+OUTPUT_DIR = DATA_DIR / "laws"
+STATUS_PATH = DATA_DIR / "collection_status.json"
+SEARCH_CACHE_PATH = DATA_DIR / "search_cache.json"
+
+# 법령 본문 로딩 완료 판정 텍스트 (고정 대기 대신 사용)
+LAW_READY_TEXT = "제1조"
+
+# 대법원 포털 요청 간격 (기존 스크립트의 법령 간 2초 대기를 대체)
+MIN_REQUEST_INTERVAL = 1.0
+MAX_CONCURRENT_PER_HOST = 3
+DEFAULT_WORKERS = 3
+MAX_ATTEMPTS = 2
+PAGE_TIMEOUT = 30000  # ms
+
+logger = setup_logger("law_collector", project="likms")
+
+
+def safe_name(name: str) -> str:
+    """저장 파일명 (기존 스크립트와 동일하게 공백 → _)"""
+    return name.replace(" ", "_").replace("/", "_")
+
+
+def law_url(jis_cntnts_srno: str, search_keyword: str) -> str:
+    """법령 본문 직접 접근 URL"""
+    return f"{BASE_URL}?w2xPath=PGP1021M04&jisCntntsSrno={jis_cntnts_srno}&srchwd={quote(search_keyword)}&c=900"
+
+
+def search_url(search_keyword: str) -> str:
+    """법령 검색 URL"""
+    return f"{BASE_URL}?w2xPath=PGP1021M04&c=900&srchwd={quote(search_keyword)}"
+
+
+def text_stats(text: str) -> Dict[str, int]:
+    """글자/줄/단어 수"""
+    return {
+        "chars": len(text),
+        "lines": len(text.split('\n')),
+        "words": len(text.split()),
+    }
+
+
+class JsonStore:
+    """작은 JSON 상태 파일 (임시 파일에 쓴 뒤 교체)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data: Dict[str, Any] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.data.get(key)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class SearchCache(JsonStore):
+    """검색어 + 법령명 → 법령 본문 URL / jisCntntsSrno"""
+
+    @staticmethod
+    def key(law: Dict[str, Any]) -> str:
+        return f"{law.get('search_keyword') or law['name']}|{law['name']}"
+
+    def lookup(self, law: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self.get(self.key(law))
+
+    def store(self, law: Dict[str, Any], url: str) -> Dict[str, Any]:
+        query = parse_qs(urlparse(url).query)
+        entry = {
+            "url": url,
+            "jisCntntsSrno": (query.get("jisCntntsSrno") or [None])[0],
+            "cached_at": datetime.now().isoformat(),
+        }
+        self.data[self.key(law)] = entry
+        return entry
+
+
+class CollectionStatus(JsonStore):
+    """
+    법령별 수집 상태
+
+    {"의료법": {"status": "done", "attempts": 1, "collection": "medical",
+               "chars": 123456, "error": null, "updated_at": "..."}}
+    """
+
+    def is_done(self, name: str, output_dir: Path = OUTPUT_DIR) -> bool:
+        """완료 기록이 있고 저장 파일도 남아 있는지"""
+        entry = self.get(name)
+        return bool(entry) and entry.get("status") == "done" and (output_dir / f"{safe_name(name)}.json").exists()
+
+    def record(self, law: Dict[str, Any], result: Dict[str, Any]) -> None:
+        previous = self.get(law["name"]) or {}
+        self.data[law["name"]] = {
+            "status": result["status"],
+            "attempts": previous.get("attempts", 0) + result.get("attempts", 1),
+            "collection": law.get("collection"),
+            "chars": result.get("chars"),
+            "url": result.get("url"),
+            "error": result.get("error"),
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    def summary(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for entry in self.data.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
+
+
+class LawCollector:
+    """법령 목록을 브라우저 풀 작업 큐로 수집"""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, headless: bool = True, headful: bool = False,
+                 output_dir: Path = OUTPUT_DIR, status_path: Path = STATUS_PATH,
+                 search_cache_path: Path = SEARCH_CACHE_PATH, max_attempts: int = MAX_ATTEMPTS):
+        """
+        Args:
+            workers: 동시에 사용할 페이지 수
+            headless: 헤드리스 모드
+            headful: 디버그 모드 (창 표시 + slow_mo + 종료 전 대기)
+            output_dir: 법령 TXT/JSON 저장 디렉토리
+            status_path: 법령별 상태 파일
+            search_cache_path: 검색 결과 캐시 파일
+            max_attempts: 한 번 실행에서 법령별 최대 시도 횟수
+        """
+        self.workers = workers
+        self.headless = headless
+        self.headful = headful
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+
+        self.status = CollectionStatus(status_path)
+        self.search_cache = SearchCache(search_cache_path)
+        self.pool = None
+
+    def pending(self, laws: List[Dict[str, Any]], force: bool = False) -> List[Dict[str, Any]]:
+        """이번 실행에서 수집할 법령 (완료 + 파일 존재 건 제외)"""
+        if force:
+            return list(laws)
+        return [law for law in laws if not self.status.is_done(law["name"], self.output_dir)]
+
+    async def collect(self, laws: List[Dict[str, Any]], force: bool = False) -> List[Dict[str, Any]]:
+        """
+        법령 목록 수집
+
+        Returns:
+            이번 실행에서 수집한 법령 데이터 목록 (기존 스크립트의 JSON과 같은 형식)
+        """
+        # 설정/상태 클래스는 playwright 없이도 쓸 수 있도록 브라우저 모듈은 여기서 로드
+        from shared.browser_pool import BrowserPool
+        from shared.utils.rate_limiter import HostRateLimiter
+
+        todo = self.pending(laws, force)
+        skipped = len(laws) - len(todo)
+        logger.info("=" * 60)
+        logger.info(f"법령 수집 시작: {len(todo)}개 (완료 건 {skipped}개 건너뜀), 워커 {self.workers}개")
+        logger.info("=" * 60)
+        if not todo:
+            return []
+
+        collected: List[Dict[str, Any]] = []
+
+        def on_result(law: Dict[str, Any], result: Dict[str, Any]):
+            # 완료 즉시 상태/캐시 저장 (중간에 끊겨도 다음 실행에서 이어서 수집)
+            self.status.record(law, result)
+            self.status.save()
+            self.search_cache.save()
+            if result["status"] == "done":
+                collected.append(result["data"])
+
+        self.pool = BrowserPool(
+            num_contexts=1,
+            pages_per_context=self.workers,
+            headless=self.headless,
+            headful=self.headful,
+            rate_limiter=HostRateLimiter(min_interval=MIN_REQUEST_INTERVAL,
+                                         max_concurrent=MAX_CONCURRENT_PER_HOST),
+            default_timeout=PAGE_TIMEOUT,
+        )
+        self.pool.factory.timings_path = self.output_dir / "page_timings_law_collector.json"
+        async with self.pool:
+            await self.pool.run(todo, self._worker, on_result=on_result)
+        self.pool = None
+
+        self._log_summary(collected, len(todo))
+        return collected
+
+    async def _worker(self, page, law: Dict[str, Any]) -> Dict[str, Any]:
+        """법령 1건 수집 (재시도 포함, 예외 대신 상태 결과 반환)"""
+        error = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                data = await self._scrape_law(page, law)
+                return {"status": "done", "attempts": attempt, "data": data,
+                        "chars": data["stats"]["chars"], "url": data["url"]}
+            except Exception as e:
+                error = str(e)[:300]
+                logger.warning(f"  [{attempt}/{self.max_attempts}] {law['name']} 실패: {error}")
+        return {"status": "failed", "attempts": self.max_attempts, "error": error}
+
+    async def _resolve_url(self, page, law: Dict[str, Any]) -> tuple:
+        """
+        법령 본문 URL (jisCntntsSrno → 검색 캐시 → 검색 순)
+
+        Returns:
+            (URL, 페이지에 이미 본문이 열려 있는지)
+        """
+        keyword = law.get("search_keyword") or law["name"]
+        if law.get("jisCntntsSrno"):
+            return law_url(law["jisCntntsSrno"], keyword), False
+
+        cached = self.search_cache.lookup(law)
+        if cached:
+            logger.info(f"  검색 캐시 사용: {law['name']}")
+            return cached["url"], False
+
+        url = await self._search(page, law, keyword)
+        self.search_cache.store(law, url)
+        return url, True
+
+    async def _search(self, page, law: Dict[str, Any], keyword: str) -> str:
+        """검색 결과에서 법령명이 일치하는 링크를 따라가 본문 URL 반환"""
+        name = law["name"].replace("_", " ")
+        logger.info(f"  검색: {keyword} → {name}")
+        await self.pool.goto(page, search_url(keyword), ready_text=name, wait_until='domcontentloaded')
+
+        links = page.locator("a")
+        candidates = []
+        for i in range(await links.count()):
+            link = links.nth(i)
+            text = (await link.inner_text()).strip()
+            if text == name:
+                candidates.insert(0, link)
+            elif name in text:
+                candidates.append(link)
+        if not candidates:
+            raise LookupError(f"검색 결과에 법령 링크 없음: {name}")
+
+        async with self.pool.rate_limiter.slot(BASE_URL):
+            await self.pool.factory.click_and_wait(page, candidates[0], ready_text=LAW_READY_TEXT)
+        return page.url
+
+    async def _scrape_law(self, page, law: Dict[str, Any]) -> Dict[str, Any]:
+        """단일 법령 접속 → 본문 추출 → 저장"""
+        name = law["name"]
+        url, loaded = await self._resolve_url(page, law)
+
+        if not loaded:
+            await self.pool.goto(page, url, ready_text=LAW_READY_TEXT, wait_until='domcontentloaded')
+
+        body_text = await page.locator("body").inner_text()
+        if LAW_READY_TEXT not in body_text:
+            raise ValueError("법령 본문을 찾을 수 없음")
+
+        query = parse_qs(urlparse(url).query)
+        data = {
+            "title": name,
+            "type": law.get("type"),
+            "content": body_text,
+            "scraped_at": datetime.now().isoformat(),
+            "source": SOURCE_NAME,
+            "url": url,
+            "jisCntntsSrno": law.get("jisCntntsSrno") or (query.get("jisCntntsSrno") or [None])[0],
+            "stats": text_stats(body_text),
+        }
+        await asyncio.to_thread(self._save_law, data)
+
+        logger.info(f"✅ {name}: {data['stats']['chars']:,} 글자")
+        return data
+
+    def _save_law(self, data: Dict[str, Any]) -> None:
+        """TXT/JSON 저장 (기존 스크립트와 같은 파일명/형식)"""
+        base = self.output_dir / safe_name(data["title"])
+        base.with_suffix(".txt").write_text(data["content"], encoding='utf-8')
+        with open(base.with_suffix(".json"), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _log_summary(self, collected: List[Dict[str, Any]], total: int) -> None:
+        logger.info("\n" + "=" * 60)
+        logger.info(f"✅ 수집 완료: {len(collected)}/{total}개 법령")
+        for item in collected:
+            stats = item["stats"]
+            logger.info(f"  - {item['title']}: {stats['chars']:,} 글자, {stats['lines']:,} 줄, {stats['words']:,} 단어")
+
+        total_chars = sum(item["stats"]["chars"] for item in collected)
+        total_lines = sum(item["stats"]["lines"] for item in collected)
+        total_words = sum(item["stats"]["words"] for item in collected)
+        logger.info(f"총계: {total_chars:,} 글자, {total_lines:,} 줄, {total_words:,} 단어")
+        logger.info(f"전체 상태: {self.status.summary()}")
+        logger.info("=" * 60)
+
+
+def run_collections(keys: Optional[List[str]] = None, law_names: Optional[List[str]] = None,
+                    workers: int = DEFAULT_WORKERS, force: bool = False,
+                    headless: bool = True, headful: bool = False) -> List[Dict[str, Any]]:
+    """
+    컬렉션 수집 실행 (동기 진입점)
+
+    Args:
+        keys: 컬렉션 키 목록 (None이면 전체)
+        law_names: 지정 시 해당 이름의 법령만 수집 (설정에 없는 이름은 검색으로 수집)
+        workers: 동시 페이지 수
+        force: 완료된 법령도 다시 수집
+        headful: 디버그 모드 (창 표시 + slow_mo + 종료 전 대기)
+    """
+    laws = get_laws(keys)
+    if law_names:
+        by_name = {law["name"]: law for law in laws}
+        laws = [by_name.get(name) or {"name": name, "type": None} for name in law_names]
+
+    collector = LawCollector(workers=workers, headless=headless, headful=headful)
+    return asyncio.run(collector.collect(laws, force=force))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대법원 포털 법령 통합 수집")
+    parser.add_argument("--collection", nargs="+", metavar="KEY", help="수집할 컬렉션 키")
+    parser.add_argument("--all", action="store_true", help="모든 컬렉션 수집")
+    parser.add_argument("--laws", nargs="+", metavar="NAME", help="법령명 지정 수집")
+    parser.add_argument("--list", action="store_true", help="컬렉션 목록 출력")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 페이지 수")
+    parser.add_argument("--force", action="store_true", help="완료된 법령도 다시 수집")
+    parser.add_argument("--show-browser", action="store_true", help="브라우저 창 표시")
+    parser.add_argument("--headful", action="store_true", help="디버그: 창 표시 + slow_mo + 종료 전 대기")
+    args = parser.parse_args()
+
+    if args.list or not (args.collection or args.all or args.laws):
+        for key in list_collections():
+            collection = get_collection(key)
+            print(f"{key:14s} {len(collection['laws'])}개  {collection['description']}")
+        return
+
+    run_collections(
+        keys=None if args.all else args.collection,
+        law_names=args.laws,
+        workers=args.workers,
+        force=args.force,
+        headless=not args.show_browser,
+        headful=args.headful,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@
 
 특정 법령을 검색하고 텍스트를 추출하여 저장합니다.
 """
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import Page
 from pathlib import Path
 import time
 import json
@@ -15,12 +15,18 @@ import re
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 
 BASE_URL = 'https://likms.assembly.go.kr/law'
 OUTPUT_DIR = Path("data/likms/laws")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# 페이지 준비 판정 (고정 대기 대신 사용)
+SEARCH_INPUT_SELECTOR = "input[type='text']"
+RESULT_LINK_SELECTOR = "table tr a"
+LAW_READY_TEXT = "제1조"
+
 
 class LIKMSLawScraper:
     """
@@ -29,8 +35,13 @@ class LIKMSLawScraper:
     특정 법령을 검색하고 텍스트를 추출합니다.
     """
 
-    def __init__(self):
+    def __init__(self, factory: BrowserFactory = None):
+        """
+        Args:
+            factory: 공유 브라우저 팩토리 (없으면 호출마다 새로 띄움)
+        """
         self.logger = setup_logger("likms_scraper", project="likms")
+        self.factory = factory
 
     def scrape_law(self, law_name: str, exact_match: bool = True):
         """
@@ -40,69 +51,73 @@ class LIKMSLawScraper:
             law_name: 법령명 (예: "의료급여법")
             exact_match: 정확히 일치하는 법령만 선택할지 여부
         """
+        if self.factory is None:
+            with BrowserFactory(timings_path=OUTPUT_DIR / "page_timings_likms_scraper.json") as factory:
+                self.factory = factory
+                try:
+                    return self.scrape_law(law_name, exact_match)
+                finally:
+                    self.factory = None
+
         self.logger.info("=" * 60)
         self.logger.info(f"법령 수집 시작: {law_name}")
         self.logger.info("=" * 60)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False, slow_mo=500)
-            context = browser.new_context()
-            page = context.new_page()
+        page = self.factory.new_page()
 
-            try:
-                # 1. 메인 페이지 접속
-                self.logger.info(f"메인 페이지 접속: {BASE_URL}")
-                page.goto(BASE_URL, wait_until="networkidle")
-                time.sleep(2)
-
-                # 2. 법령 검색
-                self._search_law(page, law_name)
-                time.sleep(3)
-
-                # 3. 검색 결과에서 정확한 법령 찾기
-                law_info = self._find_exact_law(page, law_name, exact_match)
-                if not law_info:
-                    self.logger.error(f"법령을 찾을 수 없습니다: {law_name}")
-                    return None
-
-                # 4. 법령 상세 페이지 열기
-                self._open_law_detail(page, law_info)
-                time.sleep(3)
-
-                # 5. 법령 텍스트 추출
-                law_text = self._extract_law_text(page)
-                if not law_text:
-                    self.logger.error("법령 텍스트 추출 실패")
-                    return None
-
-                # 6. 메타데이터 수집
-                metadata = self._extract_metadata(page, law_name, law_info)
-
-                # 7. 데이터 저장
-                result = {
-                    "title": law_name,
-                    "metadata": metadata,
-                    "content": law_text,
-                    "scraped_at": datetime.now().isoformat(),
-                    "source": BASE_URL
-                }
-
-                self._save_law(result, law_name)
-
-                self.logger.info("=" * 60)
-                self.logger.info(f"법령 수집 완료: {law_name}")
-                self.logger.info(f"텍스트 길이: {len(law_text)} 글자")
-                self.logger.info("=" * 60)
-
-                return result
+        try:
+            # 1. 메인 페이지 접속
+            self.logger.info(f"메인 페이지 접속: {BASE_URL}")
+            self.factory.goto(page, BASE_URL, ready_selector=SEARCH_INPUT_SELECTOR)
 
-            except Exception as e:
-                self.logger.error(f"오류 발생: {e}")
-                import traceback
-                traceback.print_exc()
+            # 2. 법령 검색 (결과 테이블 링크가 나타날 때까지 대기)
+            self._search_law(page, law_name)
+            self.factory.wait_ready(page, ready_selector=RESULT_LINK_SELECTOR)
+
+            # 3. 검색 결과에서 정확한 법령 찾기
+            law_info = self._find_exact_law(page, law_name, exact_match)
+            if not law_info:
+                self.logger.error(f"법령을 찾을 수 없습니다: {law_name}")
                 return None
-            finally:
-                browser.close()
+
+            # 4. 법령 상세 페이지 열기 (본문 조문이 나타날 때까지 대기)
+            self._open_law_detail(page, law_info)
+            self.factory.wait_ready(page, ready_text=LAW_READY_TEXT)
+
+            # 5. 법령 텍스트 추출
+            law_text = self._extract_law_text(page)
+            if not law_text:
+                self.logger.error("법령 텍스트 추출 실패")
+                return None
+
+            # 6. 메타데이터 수집
+            metadata = self._extract_metadata(page, law_name, law_info)
+
+            # 7. 데이터 저장
+            result = {
+                "title": law_name,
+                "metadata": metadata,
+                "content": law_text,
+                "scraped_at": datetime.now().isoformat(),
+                "source": BASE_URL
+            }
+
+            self._save_law(result, law_name)
+
+            self.logger.info("=" * 60)
+            self.logger.info(f"법령 수집 완료: {law_name}")
+            self.logger.info(f"텍스트 길이: {len(law_text)} 글자")
+            self.logger.info("=" * 60)
+
+            return result
+
+        except Exception as e:
+            self.logger.error(f"오류 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+        finally:
+            page.close()
 
     def scrape_multiple(self, law_names: list):
         """
@@ -111,6 +126,15 @@ class LIKMSLawScraper:
         Args:
             law_names: 법령명 리스트
         """
+        if self.factory is None:
+            # 브라우저 프로세스 하나를 전체 법령 수집에 재사용
+            with BrowserFactory(timings_path=OUTPUT_DIR / "page_timings_likms_scraper.json") as factory:
+                self.factory = factory
+                try:
+                    return self.scrape_multiple(law_names)
+                finally:
+                    self.factory = None
+
         self.logger.info("=" * 60)
         self.logger.info(f"일괄 수집 시작: {len(law_names)}개 법령")
         self.logger.info("=" * 60)
@@ -134,7 +158,7 @@ class LIKMSLawScraper:
         self.logger.info(f"검색어: {keyword}")
 
         # 검색창 찾기
-        search_input = page.locator("input[type='text']").first
+        search_input = page.locator(SEARCH_INPUT_SELECTOR).first
         search_input.fill(keyword)
         self.logger.info("  검색어 입력 완료")
 
@@ -2,8 +2,9 @@
 대법원 포털 직접 URL 접근
 
 주어진 URL에서 시작해서 관련 법령 링크를 찾습니다.
+
+    python likms/scrapers/scourt_direct.py [--headful]
 """
-from playwright.sync_api import sync_playwright
 from pathlib import Path
 import time
 import json
@@ -13,6 +14,7 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 
 # 사용자 제공 URL
@@ -22,15 +24,14 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 logger = setup_logger("scourt_direct", project="likms")
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=300)
-    page = browser.new_page()
+with BrowserFactory(timings_path=OUTPUT_DIR / "page_timings_scourt_direct.json",
+                    headful="--headful" in sys.argv[1:]) as factory:
+    page = factory.new_page()
 
     try:
         # 의료급여법 페이지 접속
         logger.info("의료급여법 페이지 접속...")
-        page.goto(LAW_URL, wait_until="networkidle")
-        time.sleep(5)
+        factory.goto(page, LAW_URL, ready_text="제1조")
 
         # 1. 의료급여법 텍스트 저장
         logger.info("\n[1/3] 의료급여법 텍스트 추출")
@@ -143,15 +144,9 @@ with sync_playwright() as p:
         logger.info("✅ 법령 수집 완료!")
         logger.info("=" * 60)
 
-        # 10초 대기
-        logger.info("\n브라우저를 10초간 유지합니다...")
-        time.sleep(10)
-
     except Exception as e:
         logger.error(f"오류 발생: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        browser.close()
 
 logger.info("\n작업 완료!")
@@ -1,185 +1,22 @@
 """
 대법원 포털에서 보험 관련 법령 일괄 수집
 
-- 산업재해보상보험법 2종 (법률, 시행령)
-- 노인장기요양보험법 3종 (법률, 시행령, 시행규칙)
+법령 목록은 likms/config/law_collections.json의 'insurance' 컬렉션에 있으며,
+수집은 공통 수집기(law_collector.py)가 담당합니다.
+이미 수집한 법령은 건너뛰며, 다시 받으려면 --force를 사용합니다.
+
+    python likms/scrapers/scourt_insurance_laws.py [--force] [--headful]
 """
-from playwright.sync_api import sync_playwright
 from pathlib import Path
-import time
-import json
-from datetime import datetime
 import sys
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from shared.utils.logger import setup_logger
-
-BASE_URL = "https://portal.scourt.go.kr/pgp/main.on"
-OUTPUT_DIR = Path("data/likms/laws")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-logger = setup_logger("scourt_insurance_laws", project="likms")
-
-# 보험 관련 법령 5종
-LAWS = [
-    # 산업재해보상보험법 2종
-    {
-        "name": "산업재해보상보험법",
-        "type": "법률",
-        "jisCntntsSrno": "3332167",
-        "search_keyword": "%EC%82%B0%EC%97%85%EC%9E%AC%ED%95%B4%EB%B3%B4%EC%83%81%EB%B3%B4%ED%98%B8%EB%B2%95"
-    },
-    {
-        "name": "산업재해보상보험법 시행령",
-        "type": "대통령령",
-        "jisCntntsSrno": "2025000011798",
-        "search_keyword": "%EC%82%B0%EC%97%85%EC%9E%AC%ED%95%B4%EB%B3%B4%EC%83%81%EB%B3%B4%ED%98%B8%EB%B2%95"
-    },
-    # 노인장기요양보험법 3종
-    {
-        "name": "노인장기요양보험법",
-        "type": "법률",
-        "jisCntntsSrno": "3335383",
-        "search_keyword": "%EB%85%B8%EC%9D%B8%EC%9E%A5%EA%B8%B0%EC%9A%94%EC%96%91%EB%B3%B4%ED%97%98%EB%B2%95"
-    },
-    {
-        "name": "노인장기요양보험법 시행령",
-        "type": "대통령령",
-        "jisCntntsSrno": "2025000014096",
-        "search_keyword": "%EB%85%B8%EC%9D%B8%EC%9E%A5%EA%B8%B0%EC%9A%94%EC%96%91%EB%B3%B4%ED%97%98%EB%B2%95"
-    },
-    {
-        "name": "노인장기요양보험법 시행규칙",
-        "type": "보건복지부령",
-        "jisCntntsSrno": "2025000011789",
-        "search_keyword": "%EB%85%B8%EC%9D%B8%EC%9E%A5%EA%B8%B0%EC%9A%94%EC%96%91%EB%B3%B4%ED%97%98%EB%B2%95"
-    }
-]
-
-def scrape_law(page, law_info):
-    """단일 법령 수집"""
-    name = law_info["name"]
-    jisCntntsSrno = law_info["jisCntntsSrno"]
-    search_keyword = law_info["search_keyword"]
-
-    logger.info("=" * 60)
-    logger.info(f"법령 수집: {name}")
-    logger.info("=" * 60)
-
-    # URL 생성
-    url = f"{BASE_URL}?w2xPath=PGP1021M04&jisCntntsSrno={jisCntntsSrno}&srchwd={search_keyword}&c=900"
-
-    logger.info(f"접속 URL: {url}")
-    page.goto(url, wait_until="networkidle")
-    time.sleep(5)
-
-    # 텍스트 추출
-    body_text = page.locator("body").inner_text()
-
-    # 줄 수 및 단어 수 계산
-    lines = body_text.split('\n')
-    words = body_text.split()
-
-    logger.info(f"텍스트 길이: {len(body_text):,} 글자")
-    logger.info(f"줄 수: {len(lines):,} 줄")
-    logger.info(f"단어 수: {len(words):,} 단어")
-
-    # 저장
-    safe_name = name.replace(" ", "_")
-
-    # TXT 저장
-    txt_path = OUTPUT_DIR / f"{safe_name}.txt"
-    txt_path.write_text(body_text, encoding='utf-8')
-    logger.info(f"✅ TXT 저장: {txt_path}")
-
-    # JSON 저장
-    data = {
-        "title": name,
-        "type": law_info["type"],
-        "content": body_text,
-        "scraped_at": datetime.now().isoformat(),
-        "source": "대법원 사법정보공개포털",
-        "url": url,
-        "jisCntntsSrno": jisCntntsSrno,
-        "stats": {
-            "chars": len(body_text),
-            "lines": len(lines),
-            "words": len(words)
-        }
-    }
-
-    json_path = OUTPUT_DIR / f"{safe_name}.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    logger.info(f"✅ JSON 저장: {json_path}")
-
-    logger.info("=" * 60)
-
-    return data
-
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=300)
-    page = browser.new_page()
-
-    try:
-        collected = []
-
-        # 5개 법령 순차 수집
-        for idx, law_info in enumerate(LAWS, 1):
-            logger.info(f"\n[{idx}/{len(LAWS)}] {law_info['name']}")
-            result = scrape_law(page, law_info)
-            collected.append(result)
-            time.sleep(2)
-
-        # 요약
-        logger.info("\n" + "=" * 60)
-        logger.info(f"✅ 수집 완료: {len(collected)}/{len(LAWS)}개 법령")
-        logger.info("=" * 60)
-
-        # 법령 체계별 구분
-        logger.info("\n산업재해보상보험법:")
-        total_chars = 0
-        total_lines = 0
-        total_words = 0
-
-        for item in collected[:2]:
-            stats = item['stats']
-            logger.info(f"  - {item['title']}: {stats['chars']:,} 글자, {stats['lines']:,} 줄, {stats['words']:,} 단어")
-            total_chars += stats['chars']
-            total_lines += stats['lines']
-            total_words += stats['words']
-
-        logger.info(f"  소계: {total_chars:,} 글자")
-
-        logger.info("\n노인장기요양보험법:")
-        total_chars2 = 0
-        total_lines2 = 0
-        total_words2 = 0
-
-        for item in collected[2:]:
-            stats = item['stats']
-            logger.info(f"  - {item['title']}: {stats['chars']:,} 글자, {stats['lines']:,} 줄, {stats['words']:,} 단어")
-            total_chars2 += stats['chars']
-            total_lines2 += stats['lines']
-            total_words2 += stats['words']
-
-        logger.info(f"  소계: {total_chars2:,} 글자")
-
-        logger.info("\n" + "=" * 60)
-        logger.info(f"총계: {total_chars + total_chars2:,} 글자, {total_lines + total_lines2:,} 줄, {total_words + total_words2:,} 단어")
-        logger.info("=" * 60)
+from likms.scrapers.law_collector import run_collections
 
-        # 10초 대기
-        logger.info("\n브라우저를 10초간 유지합니다...")
-        time.sleep(10)
+COLLECTION = "insurance"
 
-    except Exception as e:
-        logger.error(f"오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-    finally:
-        browser.close()
 
-logger.info("\n작업 완료!")
+if __name__ == '__main__':
+    run_collections([COLLECTION], force="--force" in sys.argv[1:], headful="--headful" in sys.argv[1:])
@@ -2,10 +2,11 @@
 대법원 포털에서 법령 수집 크롤러
 
 의료급여법, 시행령, 시행규칙을 수집합니다.
+
+    python likms/scrapers/scourt_scraper.py [--headful]
 """
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import Page
 from pathlib import Path
-import time
 import json
 from datetime import datetime
 import sys
@@ -14,20 +15,31 @@ import urllib.parse
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.browser import BrowserFactory
 from shared.utils.logger import setup_logger
 
 BASE_URL = "https://portal.scourt.go.kr/pgp/main.on"
 OUTPUT_DIR = Path("data/likms/laws")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# 법령 본문 로딩 완료 판정 텍스트 (고정 대기 대신 사용)
+LAW_READY_TEXT = "제1조"
+
 
 class SCourtLawScraper:
     """
     대법원 포털 법령 크롤러
     """
 
-    def __init__(self):
+    def __init__(self, factory: BrowserFactory = None, headful: bool = False):
+        """
+        Args:
+            factory: 공유 브라우저 팩토리 (없으면 호출마다 새로 띄움)
+            headful: 디버그 모드 (창 표시 + slow_mo + 종료 전 대기)
+        """
         self.logger = setup_logger("scourt_scraper", project="likms")
+        self.factory = factory
+        self.headful = headful
 
     def scrape_law_by_search(self, law_name: str):
         """
@@ -36,84 +48,80 @@ class SCourtLawScraper:
         Args:
             law_name: 법령명 (예: "의료급여법", "의료급여법 시행령")
         """
+        if self.factory is None:
+            with BrowserFactory(timings_path=OUTPUT_DIR / "page_timings_scourt_scraper.json",
+                                headful=self.headful) as factory:
+                self.factory = factory
+                try:
+                    return self.scrape_law_by_search(law_name)
+                finally:
+                    self.factory = None
+
         self.logger.info("=" * 60)
         self.logger.info(f"법령 수집: {law_name}")
         self.logger.info("=" * 60)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False, slow_mo=300)
-            page = browser.new_page()
+        page = self.factory.new_page()
 
-            try:
-                # 1. 법령 검색
-                self.logger.info("법령 검색 중...")
-                self._search_law(page, law_name)
-                time.sleep(3)
-
-                # 2. 검색 결과에서 정확한 법령 찾아서 클릭
-                if not self._click_exact_law(page, law_name):
-                    self.logger.error(f"법령을 찾을 수 없습니다: {law_name}")
-                    return None
-
-                time.sleep(3)
-
-                # 3. 법령 텍스트 추출
-                law_text = self._extract_law_text(page)
-                if not law_text:
-                    self.logger.error("법령 텍스트 추출 실패")
-                    return None
-
-                # 4. 메타데이터 추출
-                metadata = self._extract_metadata(page, law_name)
-
-                # 5. 데이터 저장
-                result = {
-                    "title": law_name,
-                    "metadata": metadata,
-                    "content": law_text,
-                    "scraped_at": datetime.now().isoformat(),
-                    "source": "대법원 사법정보공개포털",
-                    "url": page.url
-                }
-
-                self._save_law(result, law_name)
-
-                self.logger.info("=" * 60)
-                self.logger.info(f"✅ 법령 수집 완료: {law_name}")
-                self.logger.info(f"텍스트 길이: {len(law_text):,} 글자")
-                self.logger.info("=" * 60)
-
-                return result
-
-            except Exception as e:
-                self.logger.error(f"오류 발생: {e}")
-                import traceback
-                traceback.print_exc()
+        try:
+            # 1. 법령 검색
+            self.logger.info("법령 검색 중...")
+            self._search_law(page, law_name)
+
+            # 2. 검색 결과에서 정확한 법령 찾아서 클릭
+            if not self._click_exact_law(page, law_name):
+                self.logger.error(f"법령을 찾을 수 없습니다: {law_name}")
                 return None
-            finally:
-                browser.close()
 
-    def scrape_multiple(self, law_names: list):
+            self.factory.wait_ready(page, ready_text=LAW_READY_TEXT)
+
+            # 3. 법령 텍스트 추출
+            law_text = self._extract_law_text(page)
+            if not law_text:
+                self.logger.error("법령 텍스트 추출 실패")
+                return None
+
+            # 4. 메타데이터 추출
+            metadata = self._extract_metadata(page, law_name)
+
+            # 5. 데이터 저장
+            result = {
+                "title": law_name,
+                "metadata": metadata,
+                "content": law_text,
+                "scraped_at": datetime.now().isoformat(),
+                "source": "대법원 사법정보공개포털",
+                "url": page.url
+            }
+
+            self._save_law(result, law_name)
+
+            self.logger.info("=" * 60)
+            self.logger.info(f"✅ 법령 수집 완료: {law_name}")
+            self.logger.info(f"텍스트 길이: {len(law_text):,} 글자")
+            self.logger.info("=" * 60)
+
+            return result
+
+        except Exception as e:
+            self.logger.error(f"오류 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+        finally:
+            page.close()
+
+    def scrape_multiple(self, law_names: list, workers: int = 3, force: bool = False):
         """
         여러 법령 일괄 수집
-        """
-        self.logger.info("=" * 60)
-        self.logger.info(f"일괄 수집 시작: {len(law_names)}개 법령")
-        self.logger.info("=" * 60)
-
-        results = []
-        for idx, law_name in enumerate(law_names, 1):
-            self.logger.info(f"\n[{idx}/{len(law_names)}] {law_name}")
-            result = self.scrape_law_by_search(law_name)
-            if result:
-                results.append(result)
-            time.sleep(2)
 
-        self.logger.info("\n" + "=" * 60)
-        self.logger.info(f"일괄 수집 완료: {len(results)}/{len(law_names)}개 성공")
-        self.logger.info("=" * 60)
+        공통 수집기(law_collector)의 작업 큐로 위임한다.
+        (페이지 풀 동시 수집 + 검색 결과 캐시 + 법령별 상태 저장)
+        """
+        from likms.scrapers.law_collector import run_collections
 
-        return results
+        self.logger.info(f"일괄 수집: {len(law_names)}개 법령 → law_collector")
+        return run_collections(law_names=law_names, workers=workers, force=force, headful=self.headful)
 
     def _search_law(self, page: Page, law_name: str):
         """법령 검색 페이지 열기"""
@@ -125,7 +133,8 @@ class SCourtLawScraper:
         search_url = f"{BASE_URL}?w2xPath=PGP1021M04&c=900&srchwd={search_keyword}"
 
         self.logger.info(f"검색 URL: {search_url}")
-        page.goto(search_url, wait_until="networkidle")
+        # 검색 결과에 법령명이 나타날 때까지 대기
+        self.factory.goto(page, search_url, ready_text=law_name)
 
     def _click_exact_law(self, page: Page, law_name: str) -> bool:
         """
@@ -203,7 +212,7 @@ def main():
     """
     의료급여법 3종 수집
     """
-    scraper = SCourtLawScraper()
+    scraper = SCourtLawScraper(headful="--headful" in sys.argv[1:])
 
     # 의료급여 관련 법령 3종
     laws_to_scrape = [
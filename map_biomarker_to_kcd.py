@@ -14,6 +14,9 @@ from openai import OpenAI
 import os
 from dotenv import load_dotenv
 
+from shared.kcd_index import KCDIndex
+from shared.kcd_ranker import KCDRanker
+
 
 PROJECT_ROOT = Path(__file__).parent
 BIOMARKER_FILE = PROJECT_ROOT / "bridges" / "biomarkers_extracted_v2.json"
@@ -25,87 +28,53 @@ OUTPUT_CSV = PROJECT_ROOT / "bridges" / "biomarker_cancer_kcd_mapping.csv"
 load_dotenv(PROJECT_ROOT / ".env")
 
 
-def is_cancer_code(code):
-    """암 코드 여부 (C00-D48)"""
-    if not code or '-' in code:
-        return False
-    if code.startswith('C'):
-        return True
-    if code.startswith('D') and len(code) >= 2:
-        try:
-            num = int(code[1:3])
-            return 0 <= num <= 48
-        except:
-            return False
-    return False
-
-
-def search_kcd_cancer_codes(kcd_data, cancer_name):
-    """암종 이름으로 KCD 코드 검색"""
-    codes = kcd_data['codes']
-    matches = []
-
-    # 검색 키워드 매핑
-    keyword_map = {
-        "폐암": ["폐"],
-        "유방암": ["유방"],
-        "위암": ["위"],
-        "대장암": ["대장", "결장", "직장"],
-        "간암": ["간세포", "간암"],
-        "췌장암": ["췌장"],
-        "담낭암": ["담낭"],
-        "담도암": ["담도"],
-        "신장암": ["신장", "콩팥"],
-        "방광암": ["방광"],
-        "전립선암": ["전립선"],
-        "자궁경부암": ["자궁경부", "자궁목"],
-        "자궁내막암": ["자궁내막", "자궁체부"],
-        "난소암": ["난소"],
-        "갑상선암": ["갑상선"],
-        "식도암": ["식도"],
-        "두경부암": ["두경부", "머리", "목"],
-        "흑색종": ["흑색종", "멜라닌"],
-        "백혈병": ["백혈병"],
-        "림프종": ["림프종"],
-        "골수종": ["골수종", "형질세포"],
-    }
-
-    keywords = keyword_map.get(cancer_name, [cancer_name.replace("암", "")])
-
-    for code_obj in codes:
-        if not is_cancer_code(code_obj['code']):
-            continue
-        if not code_obj['is_lowest']:  # 최하위 코드만
-            continue
+# 암종명 → 검색 키워드
+CANCER_KEYWORDS = {
+    "폐암": ["폐"],
+    "유방암": ["유방"],
+    "위암": ["위"],
+    "대장암": ["대장", "결장", "직장"],
+    "간암": ["간세포", "간암"],
+    "췌장암": ["췌장"],
+    "담낭암": ["담낭"],
+    "담도암": ["담도"],
+    "신장암": ["신장", "콩팥"],
+    "방광암": ["방광"],
+    "전립선암": ["전립선"],
+    "자궁경부암": ["자궁경부", "자궁목"],
+    "자궁내막암": ["자궁내막", "자궁체부"],
+    "난소암": ["난소"],
+    "갑상선암": ["갑상선"],
+    "식도암": ["식도"],
+    "두경부암": ["두경부", "머리", "목"],
+    "흑색종": ["흑색종", "멜라닌"],
+    "백혈병": ["백혈병"],
+    "림프종": ["림프종"],
+    "골수종": ["골수종", "형질세포"],
+}
 
-        name_kr = code_obj['name_kr'].lower()
-        name_en = code_obj['name_en'].lower()
 
-        match_count = sum(1 for kw in keywords if kw.lower() in name_kr or kw.lower() in name_en)
+def cancer_keywords(cancer_name):
+    """암종명 → KCD 검색 키워드"""
+    return CANCER_KEYWORDS.get(cancer_name, [cancer_name.replace("암", "")])
 
-        if match_count > 0:
-            # 3글자 코드만 (C50, C34 등)
-            if len(code_obj['code']) == 3 or '.' not in code_obj['code']:
-                matches.append({
-                    'kcd_code': code_obj['code'],
-                    'name_kr': code_obj['name_kr'],
-                    'name_en': code_obj['name_en'],
-                    'match_score': match_count
-                })
 
-    # 점수 높은 순, 코드 순
-    matches.sort(key=lambda x: (-x['match_score'], x['kcd_code']))
+def search_kcd_cancer_codes(ranker, cancer_names, top_k=3):
+    """
+    암종 이름으로 KCD 코드 검색 (BM25, 여러 암종을 한 번에)
 
-    # 중복 코드 제거 (예: C50, C50.0, C50.1 → C50만)
-    seen = set()
-    unique = []
-    for m in matches:
-        base_code = m['kcd_code'][:3]  # C50.0 → C50
-        if base_code not in seen:
-            seen.add(base_code)
-            unique.append(m)
+    암 코드 중 최하위 코드를 순위 매긴 뒤 3자리 분류 코드로 묶음 (예: C50.0, C50.9 → C50)
 
-    return unique[:3]  # 상위 3개
+    Returns:
+        암종별 [{kcd_code, name_kr, name_en, match_score}, ...] (상위 top_k개)
+    """
+    queries = [cancer_keywords(name) for name in cancer_names]
+    results = ranker.rank_batch(queries, top_k=top_k, lowest_only=True, collapse_category=True)
+    return [
+        [{'kcd_code': m['kcd_code'], 'name_kr': m['name_kr'], 'name_en': m['name_en'],
+          'match_score': m['score']} for m in matches]
+        for matches in results
+    ]
 
 
 def create_gpt_review_prompt(mappings):
@@ -165,8 +134,7 @@ def main():
     print("\n[INFO] 데이터 로딩...")
     with open(BIOMARKER_FILE, 'r', encoding='utf-8') as f:
         biomarker_data = json.load(f)
-    with open(KCD_FILE, 'r', encoding='utf-8') as f:
-        kcd_data = json.load(f)
+    ranker = KCDRanker(KCDIndex.load(KCD_FILE), cancer_only=True)
 
     biomarkers = biomarker_data['biomarkers']
     print(f"[OK] 바이오마커 {len(biomarkers)}개 로드")
@@ -176,13 +144,16 @@ def main():
     mappings = []
     csv_rows = []
 
+    # KCD 검색 (중복 제거한 암종명 전체를 한 번에)
+    cancer_names = sorted({name for bio in biomarkers for name in bio.get('cancer_types', [])})
+    candidates_by_cancer = dict(zip(cancer_names, search_kcd_cancer_codes(ranker, cancer_names)))
+
     for bio in biomarkers:
         biomarker_name = bio['biomarker_name_en']
         cancer_types = bio.get('cancer_types', [])
 
         for cancer_name in cancer_types:
-            # KCD 검색
-            candidates = search_kcd_cancer_codes(kcd_data, cancer_name)
+            candidates = candidates_by_cancer[cancer_name]
 
             mapping = {
                 'biomarker_id': bio['biomarker_id'],
@@ -213,7 +184,7 @@ def main():
             'source_biomarkers': str(BIOMARKER_FILE),
             'source_kcd': str(KCD_FILE),
             'total_mappings': len(mappings),
-            'method': 'keyword_search_code_based'
+            'method': 'bm25_code_based'
         },
         'mappings': mappings
     }
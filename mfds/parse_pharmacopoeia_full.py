@@ -17,6 +17,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.parsers import create_parser
+from mfds.utils.monograph_index import MonographIndex
 
 
 def parse_all_pharmacopoeia_files():
@@ -70,9 +71,9 @@ def parse_all_pharmacopoeia_files():
     print(f"\n[TOTAL] {total_size/1024/1024:.1f} MB")
 
     # 파서 생성
-    print("\n[PARSER] Creating Upstage parser...")
+    print("\n[PARSER] Creating triage parser (local text first, Upstage for scanned pages)...")
     try:
-        parser = create_parser("upstage")
+        parser = create_parser("triage")
     except Exception as e:
         print(f"[ERROR] Failed to create parser: {e}")
         return 1
@@ -199,6 +200,10 @@ def parse_all_pharmacopoeia_files():
 
     print(f"\nSummary saved: {summary_file}")
 
+    # 각조 색인 갱신 (약물명 → 각조 본문 조회용)
+    with MonographIndex.load(output_dir, output_dir / 'monograph_index', rebuild=True) as index:
+        print(f"Monograph index: {len(index)} monographs ({output_dir / 'monograph_index'})")
+
     # 에러 목록
     if error_count > 0:
         print("\n[ERRORS]")
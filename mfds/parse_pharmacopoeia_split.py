@@ -3,7 +3,7 @@
 대한민국 약전 대용량 파일 분할 파싱
 
 대용량 파일(>3MB)을 작은 청크로 분할하여 Upstage API로 파싱
-- docx: 문단 기준 분할
+- docx: document.xml 스트리밍 분할 (각조 경계 우선, mfds.utils.docx_stream)
 - hwpx: 수동 변환 필요 (향후 지원)
 """
 import sys
@@ -11,70 +11,50 @@ from pathlib import Path
 import time
 import json
 from datetime import datetime
-from docx import Document
-from docx.shared import Inches
 import tempfile
 
 # shared 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.parsers import create_parser
+from mfds.utils.docx_stream import DEFAULT_MAX_BYTES, DocxStreamSplitter
+from mfds.utils.monograph_index import MonographIndex
 
 
-def estimate_docx_size(doc):
-    """docx Document 객체의 대략적인 크기 추정 (문단 수 기준)"""
-    return len(doc.paragraphs)
-
-
-def split_docx_by_paragraphs(input_path, chunk_size=100):
+def split_docx_by_paragraphs(input_path, max_chunk_bytes=DEFAULT_MAX_BYTES):
     """
-    docx 파일을 문단 기준으로 분할
+    docx 파일을 본문 요소 단위로 스트리밍 분할 (각조 경계 우선)
+
+    문서 전체를 python-docx로 읽어 문단 텍스트만 새 문서에 옮기던 방식 대신
+    document.xml을 스트림으로 읽어 원본 문단/표 XML을 그대로 청크에 복사한다.
+    (표, 이미지, 스타일 유지 / 메모리 사용량은 청크 1개 분량)
 
     Args:
         input_path: 입력 docx 파일 경로
-        chunk_size: 청크당 문단 수 (기본값: 100)
+        max_chunk_bytes: 청크당 본문 XML 바이트 예산 (기본값: 1 MiB)
 
     Returns:
         List[Path]: 생성된 임시 docx 파일 경로들
     """
-    print(f"\n[SPLIT] Reading document: {input_path.name}")
-    doc = Document(input_path)
+    print(f"\n[SPLIT] Streaming document: {input_path.name}")
+    print(f"  Chunk budget: {max_chunk_bytes / 1024:.0f} KB of body XML")
 
-    total_paragraphs = len(doc.paragraphs)
-    print(f"  Total paragraphs: {total_paragraphs}")
-    print(f"  Chunk size: {chunk_size} paragraphs")
-
-    chunks = []
     temp_dir = Path(tempfile.gettempdir()) / "mfds_split"
-    temp_dir.mkdir(exist_ok=True)
-
-    for chunk_idx in range(0, total_paragraphs, chunk_size):
-        # 새 Document 생성
-        chunk_doc = Document()
+    splitter = DocxStreamSplitter(input_path, max_bytes=max_chunk_bytes)
+    chunks = splitter.split(temp_dir)
 
-        # 문단 복사
-        end_idx = min(chunk_idx + chunk_size, total_paragraphs)
-        for i in range(chunk_idx, end_idx):
-            para = doc.paragraphs[i]
-            # 텍스트만 복사 (간단한 방법)
-            chunk_doc.add_paragraph(para.text, style=para.style)
-
-        # 임시 파일로 저장
-        chunk_num = chunk_idx // chunk_size + 1
-        chunk_path = temp_dir / f"{input_path.stem}_chunk_{chunk_num:03d}.docx"
-        chunk_doc.save(str(chunk_path))
-
-        chunk_file_size = chunk_path.stat().st_size
-        print(f"  Chunk {chunk_num}: paragraphs {chunk_idx+1}-{end_idx} "
-              f"({chunk_file_size/1024:.1f} KB)")
-
-        chunks.append(chunk_path)
+    for chunk in chunks:
+        chunk_file_size = chunk['path'].stat().st_size
+        print(f"  Chunk {chunk['index']}: {chunk['elements']} elements, "
+              f"{chunk['bytes']/1024:.1f} KB XML ({chunk_file_size/1024:.1f} KB) "
+              f"- {chunk['first_heading'][:40]}")
 
+    print(f"  Total elements: {splitter.stats['elements']}")
     print(f"  Created {len(chunks)} chunks")
-    return chunks
+    return [chunk['path'] for chunk in chunks]
 
 
-def parse_large_file(file_info, parser, output_dir, chunk_size=100):
+def parse_large_file(file_info, parser, output_dir, max_chunk_bytes=DEFAULT_MAX_BYTES):
     """
     대용량 파일을 분할하여 파싱
 
@@ -82,7 +62,7 @@ def parse_large_file(file_info, parser, output_dir, chunk_size=100):
         file_info: 파일 정보 dict
         parser: Upstage parser 객체
         output_dir: 출력 디렉토리
-        chunk_size: docx 분할 시 청크당 문단 수
+        max_chunk_bytes: docx 분할 시 청크당 본문 XML 바이트 예산
 
     Returns:
         dict: 파싱 결과
@@ -101,7 +81,7 @@ def parse_large_file(file_info, parser, output_dir, chunk_size=100):
     # 파일 형식에 따라 분할 방법 선택
     if file_info['format'] == 'docx':
         try:
-            chunks = split_docx_by_paragraphs(file_path, chunk_size=chunk_size)
+            chunks = split_docx_by_paragraphs(file_path, max_chunk_bytes=max_chunk_bytes)
         except Exception as e:
             print(f"  [ERROR] Failed to split docx: {e}")
             return {
@@ -214,7 +194,7 @@ def parse_large_file(file_info, parser, output_dir, chunk_size=100):
             'total_chunks': len(chunks),
             'success_chunks': success_chunks,
             'error_chunks': error_chunks,
-            'chunk_size': chunk_size,
+            'max_chunk_bytes': max_chunk_bytes,
             'parse_time': elapsed
         }
     }
@@ -320,9 +300,9 @@ def main():
         return 1
 
     # 파서 생성
-    print(f"\n[PARSER] Creating Upstage parser...")
+    print(f"\n[PARSER] Creating triage parser (local text first, Upstage for scanned pages)...")
     try:
-        parser = create_parser("upstage")
+        parser = create_parser("triage")
     except Exception as e:
         print(f"[ERROR] Failed to create parser: {e}")
         return 1
@@ -344,7 +324,7 @@ def main():
             file_info,
             parser,
             output_dir,
-            chunk_size=100  # 청크당 100 문단
+            max_chunk_bytes=DEFAULT_MAX_BYTES  # 청크당 본문 XML 1 MiB (각조 경계 우선)
         )
         results.append(result)
 
@@ -409,6 +389,10 @@ def main():
 
     print(f"\nSummary saved: {summary_file}")
 
+    # 각조 색인 갱신 (약물명 → 각조 본문 조회용)
+    with MonographIndex.load(output_dir, output_dir / 'monograph_index', rebuild=True) as index:
+        print(f"Monograph index: {len(index)} monographs ({output_dir / 'monograph_index'})")
+
     return 0 if error == 0 else 1
 
 
@@ -37,7 +37,7 @@ def test_sample_files():
     ]
 
     # 파서 생성
-    parser = create_parser("upstage")
+    parser = create_parser("triage")
 
     results = []
 
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+DOCX 스트리밍 분할기 (대한민국 약전 대용량 docx용)
+
+python-docx로 문서 전체를 메모리에 올리고 문단마다 새 Document를 만들어 저장하는 대신,
+zip 안의 word/document.xml을 스트림으로 읽으면서 본문 최상위 요소(w:p, w:tbl 등)의
+원본 바이트를 그대로 잘라 청크 패키지를 만든다.
+
+- expat으로 블록 단위 파싱 (CurrentByteIndex로 요소 경계 바이트 위치 확보)
+- 청크 크기 기준: document.xml 본문 바이트 예산 (max_bytes)
+- 예산을 넘으면 청크 안의 마지막 각조(모노그래프) 시작 문단 앞에서 자름
+  (각조 시작 = 제목 스타일 문단, is_monograph_boundary 참고)
+- 청크 패키지: 원본의 다른 파트(styles, numbering, 머리글 등)는 그대로 복사,
+  이미지/임베디드 개체는 해당 청크가 참조하는 것만 포함
+- 메모리 사용량은 청크 1개 분량 + 읽기 블록 크기로 일정
+
+참고: 본문 마지막의 구역 속성(w:sectPr)은 문서 끝에 있으므로 마지막 청크에만 포함되고,
+앞 청크는 기본 페이지 설정을 사용한다 (텍스트 파싱 결과에는 영향 없음).
+
+사용 예:
+    splitter = DocxStreamSplitter(docx_path, max_bytes=1 << 20)
+    for chunk in splitter.split(temp_dir):
+        print(chunk['path'], chunk['elements'], chunk['first_heading'])
+"""
+import re
+import shutil
+import xml.parsers.expat
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+DOCUMENT_PART = 'word/document.xml'
+DOCUMENT_RELS = 'word/_rels/document.xml.rels'
+READ_BLOCK = 1 << 20          # 1 MiB
+DEFAULT_MAX_BYTES = 1 << 20   # 청크당 본문 XML 1 MiB
+
+# 각조 제목 스타일 (영문 Word: Heading1/Title, 한글 Word: 스타일 ID '1' = 제목 1)
+BOUNDARY_STYLE_RE = re.compile(r'^(heading ?1|title|1)$', re.IGNORECASE)
+
+# 본문에서 관계 ID 참조 (r:embed="rId5", r:id="rId7" 등)
+_REL_REF_RE = re.compile(rb'\b[\w.-]+:(?:embed|id|link|pict|dm|lo|qs|cs)="([^"]+)"')
+_RELATIONSHIP_RE = re.compile(rb'<Relationship\b[^>]*/>|<Relationship\b[^>]*>.*?</Relationship>', re.DOTALL)
+_ATTR_RE = re.compile(rb'\b(Id|Target|TargetMode)="([^"]*)"')
+
+# 청크가 참조할 때만 포함하는 파트
+_ON_DEMAND_DIRS = ('word/media/', 'word/embeddings/')
+
+
+def is_monograph_boundary(info: Dict[str, Any]) -> bool:
+    """본문 요소가 각조 시작(제목 스타일 문단)인지"""
+    return info['tag'].endswith(':p') and bool(info['style']) and bool(BOUNDARY_STYLE_RE.match(info['style']))
+
+
+class DocxStreamSplitter:
+    """document.xml 스트리밍 + 각조 경계/바이트 예산 기준 docx 분할"""
+
+    def __init__(self, docx_path: Path, max_bytes: int = DEFAULT_MAX_BYTES,
+                 is_boundary: Callable[[Dict[str, Any]], bool] = is_monograph_boundary):
+        """
+        Args:
+            docx_path: 원본 docx 경로
+            max_bytes: 청크당 본문 XML 바이트 예산
+            is_boundary: 본문 요소 정보({'tag', 'style', 'text'}) → 각조 시작 여부
+        """
+        self.docx_path = Path(docx_path)
+        self.max_bytes = max_bytes
+        self.is_boundary = is_boundary
+
+        self.header = b''      # <?xml ...?><w:document ...><w:body>
+        self.closing = b''     # </w:body></w:document>
+        self.stats = {'elements': 0, 'bytes': 0, 'chunks': 0}
+
+    # ------------------------------------------------------------------
+    # document.xml 스트리밍
+    # ------------------------------------------------------------------
+
+    def iter_elements(self, zin: zipfile.ZipFile) -> Iterator[Tuple[bytes, Dict[str, Any]]]:
+        """
+        본문 최상위 요소를 원본 바이트 그대로 순서대로 반환
+
+        Yields:
+            (요소 XML 바이트, {'tag': 'w:p', 'style': 'Heading1', 'text': '앞부분 텍스트'})
+        """
+        parser = xml.parsers.expat.ParserCreate()
+        buffer = bytearray()
+        base = 0                     # buffer[0]의 문서 내 바이트 위치
+        depth = 0
+        names: List[str] = []
+        ready: List[Tuple[bytes, Dict[str, Any]]] = []
+        current: Dict[str, Any] = {}
+        state = {'start': None, 'in_text': False, 'children': 0}
+
+        def tag_end(offset: int) -> int:
+            """offset에서 시작하는 태그의 끝('>' 다음) 위치"""
+            return buffer.index(b'>', offset - base) + 1 + base
+
+        def start(name, attrs):
+            nonlocal depth, base
+            depth += 1
+            names.append(name)
+            if depth == 2 and not self.header:
+                stop = tag_end(parser.CurrentByteIndex)
+                self.header = bytes(buffer[:stop - base])
+                # 닫는 태그는 여는 태그 이름으로 미리 만듦 (</w:body>를 읽기 전에 내보내는 청크도 닫히도록)
+                self.closing = f'</{name}></{names[0]}>'.encode('utf-8')
+                del buffer[:stop - base]
+                base = stop
+            elif depth == 3:
+                state['start'] = parser.CurrentByteIndex
+                state['children'] = 0
+                current.clear()
+                current.update(tag=name, style=None, text='')
+            elif depth == 5 and name.endswith(':pStyle') and names[-2].endswith(':pPr'):
+                current['style'] = next((v for k, v in attrs.items() if k.endswith(':val')), None)
+            if depth > 3:
+                state['children'] += 1
+                if name.endswith(':t'):
+                    state['in_text'] = True
+
+        def end(name):
+            nonlocal depth, base
+            if name.endswith(':t'):
+                state['in_text'] = False
+            if depth == 3:
+                stop = parser.CurrentByteIndex
+                # 자식 없는 <w:p/> 등 빈 요소 태그는 끝 핸들러 위치가 이미 '/>' 다음
+                # (그 외에는 닫는 태그 시작 위치이므로 '>'까지 포함)
+                if state['children'] or buffer[stop - base - 2:stop - base] != b'/>':
+                    stop = tag_end(stop)
+                ready.append((bytes(buffer[state['start'] - base:stop - base]), dict(current)))
+                del buffer[:stop - base]
+                base = stop
+            names.pop()
+            depth -= 1
+
+        def text(data):
+            if state['in_text'] and len(current.get('text', '')) < 80:
+                current['text'] += data
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = text
+
+        with zin.open(DOCUMENT_PART) as stream:
+            while True:
+                block = stream.read(READ_BLOCK)
+                buffer.extend(block)
+                parser.Parse(block, not block)
+                yield from ready
+                ready.clear()
+                if not block:
+                    break
+
+    # ------------------------------------------------------------------
+    # 청크 패키지 작성
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _relationships(rels: bytes) -> List[Tuple[bytes, Dict[str, str]]]:
+        result = []
+        for match in _RELATIONSHIP_RE.finditer(rels):
+            attrs = {k.decode(): v.decode('utf-8') for k, v in _ATTR_RE.findall(match.group(0))}
+            result.append((match.group(0), attrs))
+        return result
+
+    @staticmethod
+    def _part_name(target: str, base_dir: str = 'word/') -> str:
+        """관계 Target → zip 파트 이름"""
+        if target.startswith('/'):
+            return target.lstrip('/')
+        parts = (base_dir + target).split('/')
+        resolved: List[str] = []
+        for part in parts:
+            if part == '..':
+                if resolved:
+                    resolved.pop()
+            elif part and part != '.':
+                resolved.append(part)
+        return '/'.join(resolved)
+
+    def _write_chunk(self, zin: zipfile.ZipFile, path: Path, body: List[bytes],
+                     doc_rels: List[Tuple[bytes, Dict[str, str]]], rels_head: bytes,
+                     shared_parts: Set[str]) -> None:
+        """청크 패키지 1개 작성 (본문 + 참조하는 관계/파트만)"""
+        referenced = set()
+        for element in body:
+            referenced.update(m.decode('utf-8') for m in _REL_REF_RE.findall(element))
+
+        keep_rels = []
+        keep_parts = set(shared_parts)
+        for raw, attrs in doc_rels:
+            part = None if attrs.get('TargetMode') == 'External' else self._part_name(attrs.get('Target', ''))
+            on_demand = part is not None and part.startswith(_ON_DEMAND_DIRS)
+            if not on_demand or attrs.get('Id') in referenced:
+                keep_rels.append(raw)
+                if part:
+                    keep_parts.add(part)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                name = item.filename
+                if name == DOCUMENT_PART:
+                    with zout.open(DOCUMENT_PART, 'w') as f:
+                        f.write(self.header)
+                        for element in body:
+                            f.write(element)
+                        f.write(self.closing)
+                elif name == DOCUMENT_RELS:
+                    zout.writestr(DOCUMENT_RELS, rels_head + b''.join(keep_rels) + b'</Relationships>')
+                elif name.startswith(_ON_DEMAND_DIRS) and name not in keep_parts:
+                    continue
+                else:
+                    with zin.open(item) as src, zout.open(name, 'w') as dst:
+                        shutil.copyfileobj(src, dst, READ_BLOCK)
+
+    def split(self, output_dir: Path, prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        docx 분할
+
+        Args:
+            output_dir: 청크 docx 저장 디렉토리
+            prefix: 청크 파일명 접두사 (기본: 원본 파일명)
+
+        Returns:
+            [{'path', 'index', 'elements', 'bytes', 'first_heading'}, ...]
+        """
+        output_dir = Path(output_dir)
+        prefix = prefix or self.docx_path.stem
+        self.header = b''
+        self.closing = b''
+        chunks: List[Dict[str, Any]] = []
+
+        with zipfile.ZipFile(self.docx_path) as zin:
+            names = set(zin.namelist())
+            rels = zin.read(DOCUMENT_RELS) if DOCUMENT_RELS in names else b''
+            rels_head = rels[:rels.find(b'>', rels.find(b'<Relationships')) + 1] if rels else b''
+            doc_rels = self._relationships(rels)
+
+            # 머리글/바닥글 등 다른 파트가 참조하는 이미지는 항상 포함
+            shared_parts: Set[str] = set()
+            for name in names:
+                if name.endswith('.rels') and name != DOCUMENT_RELS and name.startswith('word/'):
+                    base_dir = name.replace('_rels/', '').rsplit('/', 1)[0] + '/'
+                    for _, attrs in self._relationships(zin.read(name)):
+                        if attrs.get('TargetMode') != 'External':
+                            shared_parts.add(self._part_name(attrs.get('Target', ''), base_dir))
+
+            body: List[bytes] = []
+            infos: List[Dict[str, Any]] = []
+            size = 0
+
+            def flush(count: int) -> None:
+                nonlocal size
+                index = len(chunks) + 1
+                path = output_dir / f"{prefix}_chunk_{index:03d}.docx"
+                part, part_infos = body[:count], infos[:count]
+                self._write_chunk(zin, path, part, doc_rels, rels_head, shared_parts)
+                heading = next((i['text'] for i in part_infos if self.is_boundary(i)), part_infos[0]['text'] if part_infos else '')
+                chunks.append({'path': path, 'index': index, 'elements': len(part),
+                               'bytes': sum(len(e) for e in part), 'first_heading': heading.strip()})
+                del body[:count], infos[:count]
+                size = sum(len(e) for e in body)
+
+            for element, info in self.iter_elements(zin):
+                self.stats['elements'] += 1
+                self.stats['bytes'] += len(element)
+
+                if body and size + len(element) > self.max_bytes:
+                    # 예산 초과: 청크 안의 마지막 각조 시작 앞에서 자름 (없으면 여기서)
+                    cut = next((i for i in range(len(infos) - 1, 0, -1) if self.is_boundary(infos[i])), len(body))
+                    if self.is_boundary(info):
+                        cut = len(body)
+                    flush(cut)
+
+                body.append(element)
+                infos.append(info)
+                size += len(element)
+
+            # 마지막 청크 (본문 끝 구역 속성 sectPr 포함)
+            if body:
+                flush(len(body))
+
+        self.stats['chunks'] = len(chunks)
+        return chunks
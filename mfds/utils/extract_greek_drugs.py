@@ -6,6 +6,7 @@
 """
 import json
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Set
 
@@ -93,6 +94,24 @@ class GreekDrugExtractor:
 
         return results
 
+    def extract_from_index(self, index) -> List[Dict]:
+        """
+        각조 색인(mfds.utils.monograph_index.MonographIndex)의 제목에서 추출
+        (JSON 전체를 읽지 않고 각조 제목만 확인)
+        """
+        results = []
+        for monograph_id, title in enumerate(index.titles):
+            if self.has_greek_letters(title):
+                entry = index.entry(monograph_id, with_text=False)
+                results.append({
+                    'name': title,
+                    'source_file': entry['volume'],
+                    'greek_chars': self._extract_greek_chars(title),
+                    'type': 'monograph',
+                    'monograph_id': monograph_id
+                })
+        return results
+
     def scan_directory(self, parsed_dir: Path, use_elements: bool = True) -> List[Dict]:
         """
         파싱된 약전 디렉토리 전체 스캔
@@ -176,6 +195,8 @@ def main():
                         help='Output JSON path')
     parser.add_argument('--use-content', action='store_true',
                         help='Use content field instead of elements (less accurate)')
+    parser.add_argument('--use-index', action='store_true',
+                        help='Use monograph index titles (built by parse_pharmacopoeia_*.py)')
 
     args = parser.parse_args()
 
@@ -190,7 +211,14 @@ def main():
 
     # 추출 실행
     extractor = GreekDrugExtractor()
-    drugs = extractor.scan_directory(input_dir, use_elements=not args.use_content)
+    if args.use_index:
+        sys.path.insert(0, str(base_dir))
+        from mfds.utils.monograph_index import MonographIndex
+
+        with MonographIndex.load(input_dir, input_dir / 'monograph_index') as index:
+            drugs = extractor.extract_from_index(index)
+    else:
+        drugs = extractor.scan_directory(input_dir, use_elements=not args.use_content)
 
     if not drugs:
         print("\n[INFO] No drugs with Greek letters found")
@@ -209,5 +237,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
@@ -7,15 +7,25 @@ KP12 통칙 기반:
 - ASCII 변환 동의어 생성 (alpha, beta 등)
 - 한글 변환 동의어 생성 (알파, 베타 등)
 - 단위 기호 제외 (μg, μL 등)
+
+단위 μ를 한 번 가린 뒤 str.translate 표로 변환 (여러 그리스 문자가 있는 이름도 모두 변환)
 """
 import re
 import json
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Set
 
 
 class GreekLetterNormalizer:
-    """그리스 문자 정규화 및 동의어 생성"""
+    """
+    그리스 문자 정규화 및 동의어 생성
+
+    단위 기호(μg 등)의 μ를 먼저 한 번에 가린 뒤 str.translate 표로 ASCII/한글 표기를
+    한 번에 만든다 (글자별 반복 치환 없음, 여러 그리스 문자가 있어도 모두 변환).
+    """
+
+    # 단위 기호 μ를 임시로 가리는 문자 (사용자 정의 영역, 약물명에 나오지 않음)
+    UNIT_MASK = '\ue000'
 
     def __init__(self, rules_path: str = None):
         """
@@ -34,22 +44,41 @@ class GreekLetterNormalizer:
         self.greek_to_ko = self.greek_rules['mappings_ko']
         self.excluded_units = set(self.greek_rules['excluded_contexts'])
 
-    def _is_unit_context(self, text: str, match_pos: int) -> bool:
-        """μ가 단위 기호인지 확인 (μg, μL 등)"""
-        # match_pos 이후 문자 확인
-        if match_pos + 1 < len(text):
-            next_char = text[match_pos + 1]
-            # μ 다음에 g, L, m, S, M, Pa 등이 오면 단위로 판단
-            if next_char in 'gLmSMP':
-                # 전체 단위 추출
-                unit_match = re.match(r'μ[a-zA-Z]+', text[match_pos:])
-                if unit_match and unit_match.group() in self.excluded_units:
-                    return True
-        return False
+        # 변환 표 (한 글자 키만, 가린 단위 μ는 표에 없으므로 그대로 남음)
+        self._ascii_table = str.maketrans({k: v for k, v in self.greek_to_ascii.items() if len(k) == 1})
+        self._ko_table = str.maketrans({k: v for k, v in self.greek_to_ko.items() if len(k) == 1})
+        letters = ''.join(k for k in self.greek_to_ascii if len(k) == 1)
+        self._greek_re = re.compile(f'[{re.escape(letters)}]' if letters else r'(?!)')
+        # μ 다음에 g, L, m, S, M, P가 오고 이어지는 영문자까지가 제외 단위 목록에 있으면 단위
+        self._unit_re = re.compile(r'μ(?=[gLmSMP])[a-zA-Z]+')
+        self._cache: Dict[tuple, Dict] = {}
+
+    def mask_units(self, text: str) -> str:
+        """단위 기호의 μ를 UNIT_MASK로 가림 (한 번의 정규식 탐색)"""
+        if 'μ' not in text:
+            return text
+        return self._unit_re.sub(
+            lambda m: self.UNIT_MASK + m.group()[1:] if m.group() in self.excluded_units else m.group(),
+            text)
+
+    def _unmask(self, text: str) -> str:
+        return text.replace(self.UNIT_MASK, 'μ')
+
+    def greek_chars(self, text: str) -> Set[str]:
+        """단위 기호를 제외한 그리스 문자 집합"""
+        return set(self._greek_re.findall(self.mask_units(text)))
+
+    def to_ascii(self, text: str) -> str:
+        """그리스 문자 → ASCII 표기 (α-Tocopherol → alpha-Tocopherol, 단위 μ는 유지)"""
+        return self._unmask(self.mask_units(text).translate(self._ascii_table))
+
+    def to_korean(self, text: str) -> str:
+        """그리스 문자 → 한글 표기 (α-Tocopherol → 알파-Tocopherol, 단위 μ는 유지)"""
+        return self._unmask(self.mask_units(text).translate(self._ko_table))
 
     def generate_synonyms(self, name: str, is_english: bool = True) -> Dict[str, any]:
         """
-        약물명에서 그리스 문자를 찾아 동의어 생성
+        약물명에서 그리스 문자를 찾아 동의어 생성 (같은 이름은 캐시)
 
         Args:
             name: 약물명 (예: "α-Tocopherol")
@@ -63,6 +92,16 @@ class GreekLetterNormalizer:
                 'has_greek': 그리스 문자 포함 여부
             }
         """
+        cache_key = (name, is_english)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = self._synonyms(name, is_english)
+        cached = self._cache[cache_key]
+        # 호출자가 목록을 수정해도 캐시는 그대로 유지
+        return dict(cached, synonyms_ascii=list(cached['synonyms_ascii']),
+                    synonyms_ko=list(cached['synonyms_ko']))
+
+    def _synonyms(self, name: str, is_english: bool) -> Dict[str, any]:
+        """동의어 계산 (단위 가림 1회 + 변환 표 1회씩)"""
         result = {
             'preferred': name,
             'synonyms_ascii': [],
@@ -70,43 +109,24 @@ class GreekLetterNormalizer:
             'has_greek': False
         }
 
-        # 그리스 문자 감지
-        greek_chars = set()
-        for i, char in enumerate(name):
-            if char in self.greek_to_ascii:
-                # 단위 기호는 제외
-                if char == 'μ' and self._is_unit_context(name, i):
-                    continue
-                greek_chars.add(char)
-
-        if not greek_chars:
+        masked = self.mask_units(name)
+        if not self._greek_re.search(masked):
             return result
 
         result['has_greek'] = True
 
-        # ASCII 변환
-        ascii_name = name
-        for greek, ascii_val in self.greek_to_ascii.items():
-            if greek in greek_chars:
-                # 단위가 아닌 위치만 치환
-                ascii_name = self._safe_replace(name, greek, ascii_val)
-
+        # ASCII 변환 (모든 그리스 문자 한 번에)
+        ascii_name = self._unmask(masked.translate(self._ascii_table))
         if ascii_name != name:
             result['synonyms_ascii'].append(ascii_name)
 
             # 하이픈 변형 생성 (alpha-tocopherol vs alphatocopherol)
             if '-' in ascii_name:
-                no_hyphen = ascii_name.replace('-', '')
-                if no_hyphen != ascii_name:
-                    result['synonyms_ascii'].append(no_hyphen)
+                result['synonyms_ascii'].append(ascii_name.replace('-', ''))
 
         # 한글 변환 (영문명인 경우만)
         if is_english:
-            ko_name = name
-            for greek, ko_val in self.greek_to_ko.items():
-                if greek in greek_chars:
-                    ko_name = self._safe_replace(name, greek, ko_val)
-
+            ko_name = self._unmask(masked.translate(self._ko_table))
             if ko_name != name:
                 result['synonyms_ko'].append(ko_name)
 
@@ -114,27 +134,20 @@ class GreekLetterNormalizer:
                 if '-' in ko_name:
                     result['synonyms_ko'].append(ko_name.replace('-', ''))
 
-        # 중복 제거
-        result['synonyms_ascii'] = list(set(result['synonyms_ascii']))
-        result['synonyms_ko'] = list(set(result['synonyms_ko']))
+        # 중복 제거 (순서 유지)
+        result['synonyms_ascii'] = list(dict.fromkeys(result['synonyms_ascii']))
+        result['synonyms_ko'] = list(dict.fromkeys(result['synonyms_ko']))
 
         return result
 
-    def _safe_replace(self, text: str, greek: str, replacement: str) -> str:
-        """단위 기호를 제외하고 그리스 문자만 치환"""
-        result = []
-        i = 0
-        while i < len(text):
-            if text[i] == greek:
-                # μ인 경우 단위 체크
-                if greek == 'μ' and self._is_unit_context(text, i):
-                    result.append(greek)  # 단위는 그대로
-                else:
-                    result.append(replacement)
-            else:
-                result.append(text[i])
-            i += 1
-        return ''.join(result)
+    def generate_synonyms_batch(self, names: Iterable[str], is_english: bool = True) -> List[Dict[str, any]]:
+        """
+        여러 약물명 동의어 일괄 생성 (같은 이름은 한 번만 계산)
+
+        Returns:
+            names와 같은 순서의 generate_synonyms() 결과 목록
+        """
+        return [self.generate_synonyms(name, is_english) for name in names]
 
     def normalize_drug_name(self, name_en: str, name_ko: str = None) -> Dict:
         """
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+약전 각조(모노그래프) 색인
+
+parse_pharmacopoeia_full.py / parse_pharmacopoeia_split.py 결과는 권(volume)마다
+content 하나짜리 큰 JSON이라, 약물 하나를 찾으려면 JSON 전체를 읽고 정규식으로 훑어야 했다.
+파싱이 끝난 뒤 한 번 색인해 두고 각조 단위로 바로 꺼내 쓴다.
+
+- 각조 분할: 마크다운 제목(# / ##) 기준, 제목이 없는 권은 분자식 줄(C9H8O4 : 180.16)
+  바로 앞의 짧은 줄 묶음을 각조 시작으로 봄
+- content가 HTML이면(Upstage html 출력 등) <h1>/<h2>는 마크다운 제목으로, 블록 태그는 줄바꿈으로 바꾼 뒤 분할
+- 이름 키: 제목 + 각조 첫머리의 한글명, NFKC/소문자/공백·하이픈 제거
+  그리스 문자는 ASCII(alpha)·한글(알파) 표기 키를 함께 등록 (α-Tocopherol = alpha-tocopherol = 알파토코페롤)
+- 본문은 권별 UTF-8 텍스트로 떼어 두고 mmap으로 열어 각조 바이트 범위만 디코딩
+- 원본 JSON의 크기/수정 시각이 바뀌면 자동 재빌드
+
+저장 구조:
+    data/mfds/parsed/monograph_index/
+        meta.json         {"version": 2, "volumes": [{"name", "source", "source_size", "source_mtime_ns"}], "count": ...}
+        volume_000.txt    권별 본문 (UTF-8)
+        monographs.bin    uint64 × 3 × count (권 번호, 시작 바이트, 끝 바이트)
+        titles.json       ["Aspirin", ...]   (각조 순서)
+        names.json        {"<이름 키>": [각조 번호, ...], ...}
+
+사용 예:
+    index = MonographIndex.load()
+    for hit in index.lookup('α-Tocopherol'):
+        print(hit['volume'], hit['title'], hit['text'][:200])
+"""
+import html
+import json
+import mmap
+import os
+import re
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PARSED_DIR = PROJECT_ROOT / "data" / "mfds" / "parsed"
+INDEX_DIR = PARSED_DIR / "monograph_index"
+
+# 파일 구조/분할 방식이 바뀌면 올려서 기존 색인 무효화
+INDEX_VERSION = 2
+
+# 색인에서 제외할 파싱 산출물
+SKIP_FILES = {'parse_summary.json', 'split_parse_summary.json'}
+
+GREEK_ASCII = {
+    'α': 'alpha', 'β': 'beta', 'γ': 'gamma', 'δ': 'delta', 'ε': 'epsilon', 'ζ': 'zeta',
+    'η': 'eta', 'θ': 'theta', 'ι': 'iota', 'κ': 'kappa', 'λ': 'lambda', 'μ': 'mu',
+    'ν': 'nu', 'ξ': 'xi', 'ο': 'omicron', 'π': 'pi', 'ρ': 'rho', 'σ': 'sigma',
+    'τ': 'tau', 'υ': 'upsilon', 'φ': 'phi', 'χ': 'chi', 'ψ': 'psi', 'ω': 'omega',
+}
+GREEK_KO = {
+    'α': '알파', 'β': '베타', 'γ': '감마', 'δ': '델타', 'ε': '엡실론', 'ζ': '제타',
+    'η': '에타', 'θ': '세타', 'ι': '이오타', 'κ': '카파', 'λ': '람다', 'μ': '뮤',
+    'ν': '뉴', 'ξ': '크시', 'ο': '오미크론', 'π': '파이', 'ρ': '로', 'σ': '시그마',
+    'τ': '타우', 'υ': '입실론', 'φ': '파이', 'χ': '카이', 'ψ': '프사이', 'ω': '오메가',
+}
+_TO_ASCII = str.maketrans(GREEK_ASCII)
+_TO_KO = str.maketrans(GREEK_KO)
+_KEY_STRIP_RE = re.compile(r'[\s\-‐‑–—_,.·:;()\[\]{}\'"`*]+')
+
+_HEADING_RE = re.compile(r'^#{1,2}\s+(.+?)\s*#*\s*$', re.MULTILINE)
+_FORMULA_RE = re.compile(r'^\(?C\d+H\d+[A-Za-z0-9·.()\s]*\)?\s*[:：]\s*\d+\.\d+', re.MULTILINE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_HTML_DETECT_RE = re.compile(r'<(?:h[1-6]|p|br|div|table|tr|td|section|span)\b[^>]*>', re.IGNORECASE)
+_HTML_HEADING_RE = re.compile(r'<h([12])\b[^>]*>(.*?)</h\1\s*>', re.IGNORECASE | re.DOTALL)
+_HTML_BLOCK_RE = re.compile(r'<br\s*/?>|</?(?:p|div|h[3-6]|table|tr|li|ul|ol|section|header|footer|figure|caption)\b[^>]*>',
+                            re.IGNORECASE)
+_HTML_CELL_RE = re.compile(r'</t[dh]\s*>', re.IGNORECASE)
+_KO_NAME_RE = re.compile(r'^[가-힣0-9αβγδεζηθικλμνξοπρστυφχψω\s\-,·()]+$')
+_MAX_TITLE_LEN = 80
+
+
+def name_key(name: str) -> str:
+    """이름 비교 키 (NFKC, 소문자, 공백·하이픈·구두점 제거, 그리스 문자는 그대로)"""
+    text = unicodedata.normalize('NFKC', name).casefold()
+    return _KEY_STRIP_RE.sub('', text)
+
+
+def name_keys(name: str) -> List[str]:
+    """이름 1개의 색인 키 (원문 + 그리스 문자 ASCII/한글 표기)"""
+    key = name_key(name)
+    if not key:
+        return []
+    keys = [key]
+    for table in (_TO_ASCII, _TO_KO):
+        variant = key.translate(table)
+        if variant not in keys:
+            keys.append(variant)
+    return keys
+
+
+def _clean_title(text: str) -> str:
+    text = _HTML_TAG_RE.sub('', text)
+    return text.strip().strip('*_').strip()
+
+
+def segment_monographs(text: str) -> List[Tuple[int, int, str]]:
+    """
+    권 본문 → 각조 구간
+
+    Returns:
+        [(시작 문자 위치, 끝 문자 위치, 제목), ...] (첫 각조 앞 서문은 제외)
+    """
+    starts = [(m.start(), _clean_title(m.group(1))) for m in _HEADING_RE.finditer(text)]
+
+    if not starts:
+        # 제목 표시가 없는 권: 분자식 줄 바로 앞의 짧은 줄 묶음(제목/한글명/이명)이 각조 시작
+        for m in _FORMULA_RE.finditer(text):
+            block_start = m.start()
+            title_start = None
+            for _ in range(4):
+                prev_end = block_start - 1
+                if prev_end <= 0:
+                    break
+                prev_start = text.rfind('\n', 0, prev_end) + 1
+                line = text[prev_start:prev_end].strip()
+                if not line:
+                    if title_start is not None:
+                        break
+                elif len(line) > _MAX_TITLE_LEN or _FORMULA_RE.match(line):
+                    break
+                else:
+                    title_start = prev_start
+                block_start = prev_start
+            if title_start is not None:
+                title = text[title_start:text.find('\n', title_start)].strip()
+                if not starts or starts[-1][0] < title_start:
+                    starts.append((title_start, _clean_title(title)))
+
+    segments = []
+    for i, (start, title) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+        if title:
+            segments.append((start, end, title))
+    return segments
+
+
+def monograph_names(title: str, body: str, max_lines: int = 4) -> List[str]:
+    """각조 이름 (제목 + 제목 바로 아래 한글명)"""
+    names = [title]
+    for line in body.splitlines()[1:max_lines + 1]:
+        line = _clean_title(line.lstrip('#'))
+        if not line:
+            continue
+        if len(line) <= _MAX_TITLE_LEN and _KO_NAME_RE.match(line) and re.search('[가-힣]', line):
+            names.append(line)
+    return names
+
+
+def html_to_text(content: str) -> str:
+    """HTML → 색인용 텍스트 (<h1>/<h2>는 마크다운 제목 줄, 블록 태그는 줄바꿈, 나머지 태그 제거)"""
+    def heading(m: re.Match) -> str:
+        title = ' '.join(_HTML_TAG_RE.sub(' ', m.group(2)).split())
+        return f"\n{'#' * int(m.group(1))} {title}\n"
+
+    text = _HTML_HEADING_RE.sub(heading, content)
+    text = _HTML_CELL_RE.sub(' ', text)
+    text = _HTML_BLOCK_RE.sub('\n', text)
+    return html.unescape(_HTML_TAG_RE.sub('', text))
+
+
+def volume_text(data: Dict[str, Any]) -> str:
+    """파싱 결과 JSON → 색인할 본문 (마크다운 content, 없으면 html / HTML이면 html_to_text로 변환)"""
+    content = data.get('content', '')
+    if isinstance(content, dict):
+        content = content.get('markdown') or content.get('text') or content.get('html') or ''
+    if not content:
+        content = data.get('html', '')
+    if _HTML_DETECT_RE.search(content):
+        return html_to_text(content)
+    return content
+
+
+class MonographIndex:
+    """약전 각조 색인 (권별 본문 mmap + 이름 키 → 각조 번호)"""
+
+    def __init__(self, index_dir: Path, volumes: List[str], monographs, titles: List[str],
+                 names: Dict[str, List[int]]):
+        """
+        Args:
+            index_dir: 색인 디렉토리 (권별 본문 파일 위치)
+            volumes: 권 이름 목록
+            monographs: (권 번호, 시작 바이트, 끝 바이트) 평탄 배열 (array('Q') 또는 memoryview)
+            titles: 각조 제목
+            names: 이름 키 → 각조 번호 목록
+        """
+        self.index_dir = Path(index_dir)
+        self.volumes = volumes
+        self.monographs = monographs
+        self.titles = titles
+        self.names = names
+        self._texts: Dict[int, mmap.mmap] = {}
+        self._files = []
+        self._mmaps: List[mmap.mmap] = []
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    # ------------------------------------------------------------------
+    # 빌드 / 저장 / 열기
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, sources: Iterable[Path], index_dir: Path = INDEX_DIR) -> "MonographIndex":
+        """
+        파싱 결과 JSON들로 색인 빌드 후 저장 (각 파일을 임시 파일에 쓴 뒤 교체, meta.json은 마지막)
+
+        Args:
+            sources: 권별 파싱 결과 JSON 경로
+            index_dir: 색인 디렉토리
+        """
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+
+        def replace(name: str, data: bytes) -> None:
+            path = index_dir / name
+            tmp_path = path.with_name(name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        volumes_meta = []
+        monographs = array('Q')
+        titles: List[str] = []
+        names: Dict[str, List[int]] = {}
+
+        for volume_id, source in enumerate(sorted(Path(s) for s in sources)):
+            with open(source, 'r', encoding='utf-8') as f:
+                text = volume_text(json.load(f))
+
+            stat = source.stat()
+            volumes_meta.append({'name': source.stem, 'source': str(source),
+                                 'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns})
+            replace(f'volume_{volume_id:03d}.txt', text.encode('utf-8'))
+
+            # 문자 위치 → 바이트 위치 (구간 경계만 인코딩 길이로 누적)
+            byte_pos = 0
+            char_pos = 0
+            for start, end, title in segment_monographs(text):
+                byte_pos += len(text[char_pos:start].encode('utf-8'))
+                byte_start = byte_pos
+                byte_pos += len(text[start:end].encode('utf-8'))
+                char_pos = end
+
+                monograph_id = len(titles)
+                monographs.extend((volume_id, byte_start, byte_pos))
+                titles.append(title)
+                for name in monograph_names(title, text[start:end]):
+                    for key in name_keys(name):
+                        ids = names.setdefault(key, [])
+                        if not ids or ids[-1] != monograph_id:
+                            ids.append(monograph_id)
+
+        replace('monographs.bin', monographs.tobytes())
+        replace('titles.json', json.dumps(titles, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        replace('names.json', json.dumps(names, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        meta = {'version': INDEX_VERSION, 'volumes': volumes_meta, 'count': len(titles)}
+        replace('meta.json', json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'))
+
+        return cls.open(index_dir)
+
+    @classmethod
+    def open(cls, index_dir: Path = INDEX_DIR) -> "MonographIndex":
+        """저장된 색인 열기 (monographs.bin과 권별 본문은 mmap)"""
+        index_dir = Path(index_dir)
+        with open(index_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(index_dir / 'titles.json', 'r', encoding='utf-8') as f:
+            titles = json.load(f)
+        with open(index_dir / 'names.json', 'r', encoding='utf-8') as f:
+            names = json.load(f)
+
+        mapped = None
+        monographs = array('Q')
+        path = index_dir / 'monographs.bin'
+        if path.stat().st_size:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            monographs = memoryview(mapped).cast('Q')
+
+        index = cls(index_dir, [v['name'] for v in meta['volumes']], monographs, titles, names)
+        if mapped is not None:
+            index._mmaps.append(mapped)
+        return index
+
+    @classmethod
+    def load(cls, parsed_dir: Path = PARSED_DIR, index_dir: Path = INDEX_DIR,
+             rebuild: bool = False) -> "MonographIndex":
+        """
+        색인 열기 (없거나 원본 JSON 목록/크기/수정 시각이 다르면 빌드)
+
+        Args:
+            parsed_dir: 파싱 결과 JSON 디렉토리
+            index_dir: 색인 디렉토리
+            rebuild: 강제 재빌드
+        """
+        sources = sorted(p for p in Path(parsed_dir).glob('*.json') if p.name not in SKIP_FILES)
+
+        meta = {}
+        meta_path = Path(index_dir) / 'meta.json'
+        if meta_path.exists() and not rebuild:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+
+        current = [(str(p), p.stat().st_size, p.stat().st_mtime_ns) for p in sources]
+        stored = [(v['source'], v['source_size'], v['source_mtime_ns']) for v in meta.get('volumes', [])]
+        if meta.get('version') == INDEX_VERSION and current == stored:
+            return cls.open(index_dir)
+
+        print(f"[INDEX] Building monograph index from {len(sources)} volumes...")
+        index = cls.build(sources, index_dir)
+        print(f"  → {len(index)} monographs, {len(index.names)} name keys")
+        return index
+
+    def close(self) -> None:
+        """mmap 해제"""
+        if isinstance(self.monographs, memoryview):
+            self.monographs.release()
+            self.monographs = array('Q')
+        for m in list(self._texts.values()) + self._mmaps:
+            m.close()
+        for f in self._files:
+            f.close()
+        self._texts = {}
+        self._mmaps = []
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _volume(self, volume_id: int) -> mmap.mmap:
+        if volume_id not in self._texts:
+            f = open(self.index_dir / f'volume_{volume_id:03d}.txt', 'rb')
+            self._files.append(f)
+            self._texts[volume_id] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._texts[volume_id]
+
+    def text(self, monograph_id: int) -> str:
+        """각조 본문 (해당 바이트 범위만 디코딩)"""
+        volume_id, start, end = self.monographs[monograph_id * 3:monograph_id * 3 + 3]
+        return self._volume(volume_id)[start:end].decode('utf-8')
+
+    def entry(self, monograph_id: int, with_text: bool = True) -> Dict[str, Any]:
+        volume_id = self.monographs[monograph_id * 3]
+        result = {'id': monograph_id, 'title': self.titles[monograph_id], 'volume': self.volumes[volume_id]}
+        if with_text:
+            result['text'] = self.text(monograph_id)
+        return result
+
+    def find(self, name: str) -> List[int]:
+        """이름 → 각조 번호 목록 (그리스 문자/ASCII/한글 표기 모두 같은 키로 조회)"""
+        for key in name_keys(name):
+            ids = self.names.get(key)
+            if ids:
+                return list(ids)
+        return []
+
+    def lookup(self, name: str, with_text: bool = True) -> List[Dict[str, Any]]:
+        """
+        이름으로 각조 조회
+
+        Returns:
+            [{'id', 'title', 'volume', 'text'}, ...]
+        """
+        return [self.entry(i, with_text) for i in self.find(name)]
+
+
+def main():
+    """파싱 결과 디렉토리 색인 (재빌드)"""
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='약전 각조 색인 빌드')
+    arg_parser.add_argument('--parsed-dir', type=Path, default=PARSED_DIR)
+    arg_parser.add_argument('--index-dir', type=Path, default=INDEX_DIR)
+    arg_parser.add_argument('--lookup', nargs='*', default=[], help='빌드 후 조회할 약물명')
+    args = arg_parser.parse_args()
+
+    with MonographIndex.load(args.parsed_dir, args.index_dir, rebuild=True) as index:
+        for name in args.lookup:
+            hits = index.lookup(name, with_text=False)
+            print(f"  {name}: {[(h['volume'], h['title']) for h in hits] or 'not found'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,7 @@
 - data/hira_master/drug_dictionary_normalized.json (정규화 적용된 마스터)
 """
 import json
+import re
 import sys
 from pathlib import Path
 from typing import Dict, List
@@ -57,57 +58,55 @@ def apply_normalization_to_master(
     # 정규화된 이름으로 접근할 수 있도록 새로운 엔트리 추가
     new_entries = {}
 
+    # 성분명 추출 후 고유 성분명만 한 번에 동의어 생성
+    ingredient_pattern = re.compile(r'\((.*?)\)')
+    targets = []
     for product_name, product_data in master.items():
-        # 그리스 문자 약물인지 확인
-        if product_name in greek_product_names:
-            # 정규화 적용
-            records = product_data.get('records', [])
-            if records:
-                # product_name_full에서 성분명 추출
-                sample_record = records[0]
-                full_name = sample_record.get('product_name', '')
-
-                # 성분명 추출 (괄호 안)
-                import re
-                match = re.search(r'\((.*?)\)', full_name)
-                if match:
-                    ingredient_name = match.group(1)
-
-                    # 정규화 동의어 생성
-                    normalized_result = normalizer.normalize_drug_name(ingredient_name, None)
-
-                    # 기존 데이터에 정규화 정보 추가
-                    product_data['greek_normalization'] = {
-                        'has_greek': True,
-                        'original_ingredient': ingredient_name,
-                        'synonyms_en': normalized_result['name']['synonyms_en'],
-                        'synonyms_ko': normalized_result['name'].get('synonyms_ko', [])
-                    }
-                    updated_count += 1
-
-                    # 정규화된 이름으로도 검색 가능하도록 새 엔트리 생성
-                    for synonym in normalized_result['name']['synonyms_en']:
-                        # 제품명에서 성분명 부분을 정규화된 이름으로 교체
-                        normalized_product_name = product_name
-
-                        # 간단한 매핑: α→alpha, β→beta로 제품명 변환
-                        for greek, ascii_val in normalizer.greek_to_ascii.items():
-                            normalized_product_name = normalized_product_name.replace(greek, ascii_val)
-
-                        # 새 엔트리 추가 (중복 방지)
-                        if normalized_product_name != product_name and normalized_product_name not in master:
-                            new_entries[normalized_product_name] = {
-                                'records': records.copy(),
-                                'normalized_from': product_name,
-                                'is_normalized': True,
-                                'greek_normalization': product_data['greek_normalization']
-                            }
-                            new_entries_count += 1
-        else:
+        if product_name not in greek_product_names:
             # 그리스 문자 없는 약물
             product_data['greek_normalization'] = {
                 'has_greek': False
             }
+            continue
+
+        records = product_data.get('records', [])
+        if not records:
+            continue
+
+        # product_name_full에서 성분명 추출 (괄호 안)
+        full_name = records[0].get('product_name', '')
+        match = ingredient_pattern.search(full_name)
+        if match:
+            targets.append((product_name, product_data, match.group(1)))
+
+    synonyms = normalizer.generate_synonyms_batch(ingredient for _, _, ingredient in targets)
+
+    for (product_name, product_data, ingredient_name), en_result in zip(targets, synonyms):
+        # 기존 데이터에 정규화 정보 추가
+        product_data['greek_normalization'] = {
+            'has_greek': True,
+            'original_ingredient': ingredient_name,
+            'synonyms_en': en_result['synonyms_ascii'],
+            'synonyms_ko': []
+        }
+        updated_count += 1
+
+        # 정규화된 이름으로도 검색 가능하도록 새 엔트리 생성
+        # (제품명의 그리스 문자 전체를 ASCII로, 단위 μ는 유지)
+        if not en_result['synonyms_ascii']:
+            continue
+        normalized_product_name = normalizer.to_ascii(product_name)
+
+        # 새 엔트리 추가 (중복 방지)
+        if (normalized_product_name != product_name and normalized_product_name not in master
+                and normalized_product_name not in new_entries):
+            new_entries[normalized_product_name] = {
+                'records': product_data['records'].copy(),
+                'normalized_from': product_name,
+                'is_normalized': True,
+                'greek_normalization': product_data['greek_normalization']
+            }
+            new_entries_count += 1
 
     # 5. 새 엔트리 병합
     print(f"\n[MERGE] Adding normalized entries...")
@@ -2,6 +2,8 @@
 NCC 암정보 사전 스크래퍼
 
 총 3,543건의 암 정보 사전 데이터 수집
+- 브라우저 풀 기반 동시 수집 (shared.browser_pool)
+- 배치가 완성되는 즉시 저장
 """
 import asyncio
 import json
@@ -9,7 +11,7 @@ import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
 import logging
 import sys
 
@@ -22,8 +24,11 @@ from ncc.cancer_dictionary.config import (
     SCRAPING_CONFIG,
     OUTPUT_DIRS
 )
+from shared.browser_pool import BrowserPool
+from shared.utils.rate_limiter import HostRateLimiter
 
 # 로깅 설정
+Path(OUTPUT_DIRS["logs"]).mkdir(parents=True, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -39,8 +44,7 @@ class CancerDictionaryScraper:
     """암정보 사전 스크래퍼"""
 
     def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.pool: Optional[BrowserPool] = None
         self.scraped_count = 0
         self.failed_count = 0
         self.total_items = 0
@@ -51,33 +55,35 @@ class CancerDictionaryScraper:
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=SCRAPING_CONFIG["headless"]
+        self.pool = BrowserPool(
+            num_contexts=SCRAPING_CONFIG["num_contexts"],
+            pages_per_context=SCRAPING_CONFIG["pages_per_context"],
+            headless=SCRAPING_CONFIG["headless"],
+            user_agent=SCRAPING_CONFIG["user_agent"],
+            rate_limiter=HostRateLimiter(
+                min_interval=SCRAPING_CONFIG["min_request_interval"],
+                max_concurrent=SCRAPING_CONFIG["max_concurrent_per_host"]
+            ),
+            default_timeout=SCRAPING_CONFIG["timeout"]
         )
-        self.page = await self.browser.new_page()
-        await self.page.set_extra_http_headers({
-            'User-Agent': SCRAPING_CONFIG["user_agent"]
-        })
+        await self.pool.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
-        if self.page:
-            await self.page.close()
-        if self.browser:
-            await self.browser.close()
+        if self.pool:
+            await self.pool.__aexit__(exc_type, exc_val, exc_tb)
 
     async def get_total_pages(self) -> int:
         """전체 페이지 수 가져오기"""
         try:
             # 첫 페이지 로드
             url = f"{DICTIONARY_LIST_URL}?rows={SCRAPING_CONFIG['rows_per_page']}&cpage=1"
-            await self.page.goto(url, timeout=SCRAPING_CONFIG["timeout"])
-            await self.page.wait_for_load_state("networkidle")
+            async with self.pool.acquire() as page:
+                await self.pool.goto(page, url)
 
-            # 전체 항목 수 추출 (예: "총 3,543건")
-            total_text = await self.page.locator('.total_num, .result_count, strong').first.inner_text()
+                # 전체 항목 수 추출 (예: "총 3,543건")
+                total_text = await page.locator('.total_num, .result_count, strong').first.inner_text()
             match = re.search(r'(\d{1,3}(?:,\d{3})*)', total_text)
 
             if match:
@@ -94,19 +100,22 @@ class CancerDictionaryScraper:
             logger.error(f"페이지 수 확인 중 오류: {str(e)}")
             return 119  # 기본값
 
-    async def scrape_page(self, page_num: int) -> List[Dict[str, Any]]:
-        """단일 페이지 스크래핑"""
+    async def scrape_page(self, page_num: int, page: Optional[Page] = None) -> List[Dict[str, Any]]:
+        """단일 페이지 스크래핑 (page가 없으면 풀에서 하나 빌려 사용)"""
+        if page is None:
+            async with self.pool.acquire() as pooled_page:
+                return await self.scrape_page(page_num, pooled_page)
+
         items = []
 
         try:
             url = f"{DICTIONARY_LIST_URL}?rows={SCRAPING_CONFIG['rows_per_page']}&cpage={page_num}"
             logger.info(f"페이지 {page_num} 스크래핑 시작: {url}")
 
-            await self.page.goto(url, timeout=SCRAPING_CONFIG["timeout"])
-            await self.page.wait_for_load_state("networkidle")
+            await self.pool.goto(page, url)
 
             # 목록 항목 추출 (.word-box 내 button.word)
-            list_items = await self.page.query_selector_all('.word-box button.word')
+            list_items = await page.query_selector_all('.word-box button.word')
 
             if not list_items:
                 logger.warning(f"페이지 {page_num}에서 항목을 찾을 수 없음")
@@ -114,6 +123,8 @@ class CancerDictionaryScraper:
 
             logger.info(f"페이지 {page_num}에서 {len(list_items)}개 항목 발견")
 
+            # 1) 목록에서 제목/키워드 먼저 추출
+            entries = []
             for item in list_items:
                 try:
                     # 제목 추출
@@ -133,36 +144,43 @@ class CancerDictionaryScraper:
                         if match:
                             keyword = match.group(1)
 
-                    # 상세 내용 가져오기 (Ajax 요청)
-                    content = ""
-                    if keyword:
-                        content = await self.fetch_detail_content(keyword)
-
-                    item_data = {
-                        "title": title,
-                        "keyword": keyword,
-                        "content": content,
-                        "page_num": page_num,
-                        "scraped_at": datetime.now().isoformat()
-                    }
-
-                    items.append(item_data)
-                    self.scraped_count += 1
-
-                    if self.scraped_count % 50 == 0:
-                        logger.info(f"진행 중: {self.scraped_count}개 수집 완료")
+                    entries.append((title, keyword))
 
                 except Exception as e:
                     logger.error(f"항목 추출 중 오류: {str(e)}")
                     self.failed_count += 1
                     continue
 
+            # 2) 상세 내용 동시 요청 (Ajax, 호스트별 간격 제한 적용)
+            contents = await asyncio.gather(*(
+                self.fetch_detail_content(keyword, page) if keyword else self._empty_content()
+                for _, keyword in entries
+            ))
+
+            for (title, keyword), content in zip(entries, contents):
+                items.append({
+                    "title": title,
+                    "keyword": keyword,
+                    "content": content,
+                    "page_num": page_num,
+                    "scraped_at": datetime.now().isoformat()
+                })
+                self.scraped_count += 1
+
+                if self.scraped_count % 50 == 0:
+                    logger.info(f"진행 중: {self.scraped_count}개 수집 완료")
+
         except Exception as e:
             logger.error(f"페이지 {page_num} 스크래핑 실패: {str(e)}")
 
         return items
 
-    async def fetch_detail_content(self, keyword: str) -> str:
+    @staticmethod
+    async def _empty_content() -> str:
+        """키워드가 없는 항목의 상세 내용"""
+        return ""
+
+    async def fetch_detail_content(self, keyword: str, page: Page) -> str:
         """Ajax로 상세 내용 가져오기"""
         try:
             # JavaScript를 사용하지 않고 직접 JSON 응답 받기
@@ -170,19 +188,20 @@ class CancerDictionaryScraper:
             import urllib.parse
             encoded_keyword = urllib.parse.quote(keyword)
 
-            result = await self.page.evaluate(f'''
-                async () => {{
-                    const response = await fetch('/inc/searchWorks/search.do', {{
-                        method: 'POST',
-                        headers: {{
-                            'Content-Type': 'application/x-www-form-urlencoded',
-                        }},
-                        body: 'work={encoded_keyword}'
-                    }});
-                    const data = await response.json();
-                    return data;
-                }}
-            ''')
+            async with self.pool.rate_limiter.slot(DICTIONARY_DETAIL_URL):
+                result = await page.evaluate('''
+                    async (body) => {
+                        const response = await fetch('/inc/searchWorks/search.do', {
+                            method: 'POST',
+                            headers: {
+                                'Content-Type': 'application/x-www-form-urlencoded',
+                            },
+                            body: body
+                        });
+                        const data = await response.json();
+                        return data;
+                    }
+                ''', f'work={encoded_keyword}')
 
             # JSON 응답에서 설명 추출
             if result and 'sense' in result:
@@ -207,6 +226,10 @@ class CancerDictionaryScraper:
         except Exception as e:
             logger.error(f"배치 {batch_num} 저장 실패: {str(e)}")
 
+    async def _scrape_page_worker(self, page: Page, page_num: int) -> List[Dict[str, Any]]:
+        """브라우저 풀 작업 함수"""
+        return await self.scrape_page(page_num, page)
+
     async def scrape_all(self, start_page: int = 1, end_page: Optional[int] = None, batch_size: int = 10):
         """전체 사전 스크래핑"""
         logger.info("=" * 100)
@@ -223,29 +246,41 @@ class CancerDictionaryScraper:
 
         logger.info(f"수집 범위: 페이지 {start_page} ~ {end_page}")
 
-        all_items = []
-        batch_num = 1
+        page_nums = list(range(start_page, end_page + 1))
+
+        # 배치 번호별 페이지 결과 버퍼 (배치에 속한 페이지가 모두 끝나면 즉시 저장)
+        batch_pages: Dict[int, Dict[int, List[Dict[str, Any]]]] = {}
+        batch_sizes: Dict[int, int] = {}
+        for page_num in page_nums:
+            batch_num = (page_num - start_page) // batch_size + 1
+            batch_sizes[batch_num] = batch_sizes.get(batch_num, 0) + 1
 
-        for page_num in range(start_page, end_page + 1):
-            items = await self.scrape_page(page_num)
-            all_items.extend(items)
+        completed_pages = 0
 
-            # 배치 단위로 저장
-            if len(all_items) >= batch_size * SCRAPING_CONFIG['rows_per_page']:
-                await self.save_items(all_items, batch_num)
-                all_items = []
-                batch_num += 1
+        async def on_page_done(page_num: int, items: List[Dict[str, Any]]):
+            nonlocal completed_pages
+            completed_pages += 1
 
-            # 요청 간격 대기
-            await asyncio.sleep(SCRAPING_CONFIG["delay_between_requests"])
+            batch_num = (page_num - start_page) // batch_size + 1
+            pages = batch_pages.setdefault(batch_num, {})
+            pages[page_num] = items
+
+            if len(pages) == batch_sizes[batch_num]:
+                batch_items = [item for num in sorted(pages) for item in pages[num]]
+                await self.save_items(batch_items, batch_num)
+                del batch_pages[batch_num]
 
             # 진행 상황 로그
-            progress = (page_num - start_page + 1) / (end_page - start_page + 1) * 100
-            logger.info(f"진행률: {progress:.1f}% ({page_num}/{end_page} 페이지)")
+            progress = completed_pages / len(page_nums) * 100
+            logger.info(f"진행률: {progress:.1f}% ({completed_pages}/{len(page_nums)} 페이지)")
+
+        # 목록 페이지를 풀에서 동시 처리 (요청 간격은 호스트별 rate limiter가 관리)
+        await self.pool.run(page_nums, self._scrape_page_worker, on_result=on_page_done)
 
-        # 남은 항목 저장
-        if all_items:
-            await self.save_items(all_items, batch_num)
+        # 실패한 페이지가 있는 배치도 남은 결과는 저장
+        for batch_num, pages in sorted(batch_pages.items()):
+            batch_items = [item for num in sorted(pages) for item in pages[num]]
+            await self.save_items(batch_items, batch_num)
 
         # 최종 요약
         logger.info("=" * 100)
@@ -161,7 +161,12 @@ SCRAPING_CONFIG = {
     "delay_between_requests": 2.0,
     "timeout": 60000,
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 (Research/Education)",
-    "headless": True
+    "headless": True,
+    # 브라우저 풀 (동시 페이지 수 = num_contexts × pages_per_context)
+    "num_contexts": 2,
+    "pages_per_context": 3,
+    "max_concurrent_per_host": 3,  # 같은 호스트 동시 요청 상한
+    "min_request_interval": 0.5,  # 같은 호스트 요청 시작 간 최소 간격 (초)
 }
 
 # 출력 디렉토리
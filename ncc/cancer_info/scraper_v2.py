@@ -4,6 +4,7 @@ NCC (국립암센터) 암정보 스크래퍼 v2
 전체 100개 암종 수집 (태그 시스템 적용)
 - 주요암, 성인, 소아청소년 태그
 - 개선된 노이즈 필터링
+- 브라우저 풀 기반 동시 수집 (shared.browser_pool)
 """
 import asyncio
 import json
@@ -11,21 +12,24 @@ import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
 import logging
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from ncc.config import (
+from ncc.cancer_info.config_v2 import (
     BASE_URL,
     CHEMOTHERAPY_PAGES,
     CANCER_TYPES_ALL,
     SCRAPING_CONFIG,
     OUTPUT_DIRS
 )
+from shared.browser_pool import BrowserPool
+from shared.utils.rate_limiter import HostRateLimiter
 
 # 로깅 설정
+Path(OUTPUT_DIRS["logs"]).mkdir(parents=True, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -41,8 +45,7 @@ class NCCScraper:
     """국립암센터 암정보 스크래퍼 v2"""
 
     def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.pool: Optional[BrowserPool] = None
         self.scraped_count = 0
         self.failed_count = 0
 
@@ -52,44 +55,50 @@ class NCCScraper:
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=SCRAPING_CONFIG["headless"]
+        self.pool = BrowserPool(
+            num_contexts=SCRAPING_CONFIG["num_contexts"],
+            pages_per_context=SCRAPING_CONFIG["pages_per_context"],
+            headless=SCRAPING_CONFIG["headless"],
+            user_agent=SCRAPING_CONFIG["user_agent"],
+            rate_limiter=HostRateLimiter(
+                min_interval=SCRAPING_CONFIG["min_request_interval"],
+                max_concurrent=SCRAPING_CONFIG["max_concurrent_per_host"]
+            ),
+            default_timeout=SCRAPING_CONFIG["timeout"]
         )
-        self.page = await self.browser.new_page()
-        await self.page.set_extra_http_headers({
-            'User-Agent': SCRAPING_CONFIG["user_agent"]
-        })
+        await self.pool.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
-        if self.page:
-            await self.page.close()
-        if self.browser:
-            await self.browser.close()
+        if self.pool:
+            await self.pool.__aexit__(exc_type, exc_val, exc_tb)
 
-    async def scrape_cancer(self, cancer_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def scrape_cancer(self, cancer_info: Dict[str, Any], page: Optional[Page] = None) -> Optional[Dict[str, Any]]:
         """
         단일 암종 스크래핑 (cancer_seq 기반)
 
         Args:
             cancer_info: 암종 정보 {"name": "갑상선암", "cancer_seq": "3341", "tags": [...]}
+            page: 사용할 페이지 (없으면 풀에서 하나 빌려 사용)
 
         Returns:
             파싱된 데이터 또는 None
         """
+        if page is None:
+            async with self.pool.acquire() as pooled_page:
+                return await self.scrape_cancer(cancer_info, pooled_page)
+
         # URL 생성 (전체암 보기 페이지의 view.do)
         url = f"{BASE_URL}/lay1/program/S1T211C223/cancer/view.do?cancer_seq={cancer_info['cancer_seq']}"
         logger.info(f"스크래핑 시작: {cancer_info['name']} (seq: {cancer_info['cancer_seq']})")
 
         try:
             # 페이지 로드
-            await self.page.goto(url, timeout=SCRAPING_CONFIG["timeout"])
-            await self.page.wait_for_load_state("networkidle")
+            await self.pool.goto(page, url)
 
             # 콘텐츠 영역 추출
-            content_data = await self.extract_content()
+            content_data = await self.extract_content(page)
 
             if not content_data:
                 logger.warning(f"콘텐츠 추출 실패: {cancer_info['name']}")
@@ -123,13 +132,13 @@ class NCCScraper:
             self.failed_count += 1
             return None
 
-    async def extract_content(self) -> Optional[Dict[str, Any]]:
+    async def extract_content(self, page: Page) -> Optional[Dict[str, Any]]:
         """
         페이지 콘텐츠 추출 (노이즈 제거 버전)
         """
         try:
             # 먼저 노이즈 요소 제거
-            await self.remove_noise_elements()
+            await self.remove_noise_elements(page)
 
             # 메인 콘텐츠 영역 찾기
             content_selectors = [
@@ -143,14 +152,14 @@ class NCCScraper:
 
             content_element = None
             for selector in content_selectors:
-                element = await self.page.query_selector(selector)
+                element = await page.query_selector(selector)
                 if element:
                     content_element = element
                     break
 
             if not content_element:
                 logger.warning("콘텐츠 영역을 찾을 수 없음")
-                content_element = await self.page.query_selector('body')
+                content_element = await page.query_selector('body')
 
             # 섹션 추출 (제목 + 본문) - h4#go 이후부터만
             sections = await self.extract_sections_filtered(content_element)
@@ -175,7 +184,7 @@ class NCCScraper:
             logger.error(f"콘텐츠 추출 중 오류: {str(e)}")
             return None
 
-    async def remove_noise_elements(self):
+    async def remove_noise_elements(self, page: Page):
         """페이지에서 노이즈 요소 제거"""
         noise_selectors = [
             'header', 'footer',
@@ -190,7 +199,7 @@ class NCCScraper:
 
         for selector in noise_selectors:
             try:
-                await self.page.evaluate(f'''
+                await page.evaluate(f'''
                     document.querySelectorAll("{selector}").forEach(el => el.remove());
                 ''')
             except:
@@ -337,6 +346,10 @@ class NCCScraper:
         except Exception as e:
             logger.error(f"데이터 저장 실패: {str(e)}")
 
+    async def _scrape_worker(self, page: Page, cancer_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """브라우저 풀 작업 함수"""
+        return await self.scrape_cancer(cancer_info, page)
+
     async def run_phase2_all(self):
         """Phase 2: 전체 100개 암종 스크래핑"""
         logger.info("=" * 100)
@@ -344,15 +357,9 @@ class NCCScraper:
         logger.info(f"총 암종 수: {len(CANCER_TYPES_ALL)}개")
         logger.info("=" * 100)
 
-        results = []
-
-        for cancer_info in CANCER_TYPES_ALL:
-            result = await self.scrape_cancer(cancer_info)
-            if result:
-                results.append(result)
-
-            # 요청 간격 대기
-            await asyncio.sleep(SCRAPING_CONFIG["delay_between_requests"])
+        # 페이지 풀에서 동시 수집 (요청 간격은 호스트별 rate limiter가 관리, 저장은 scrape_cancer에서 완료 즉시)
+        results = await self.pool.run(CANCER_TYPES_ALL, self._scrape_worker)
+        results = [result for result in results if result]
 
         # 최종 요약
         logger.info("=" * 100)
@@ -8,6 +8,7 @@ NCC 제거, KCD 코드만 사용
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 from neo4j import GraphDatabase
@@ -16,6 +17,10 @@ from dotenv import load_dotenv
 
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.kcd_index import KCDIndex
+
 DATA_DIR_KCD = PROJECT_ROOT / "data" / "kssc" / "kcd-9th" / "normalized"
 DATA_DIR_KDRG = PROJECT_ROOT / "data" / "hira_master" / "kdrg_parsed" / "codes"
 BRIDGES_DIR = PROJECT_ROOT / "bridges"
@@ -101,9 +106,10 @@ class CodeBasedIntegrator:
             d.name_en = COALESCE(d.name_en, disease.name_en)
         """
 
-        # 암 코드 태깅
+        # 암 코드 태깅 (KCD 인덱스의 is_cancer 비트맵)
+        kcd_index = KCDIndex.load(INPUT_KCD)
         for code in codes:
-            code['is_cancer'] = self.is_cancer_code(code['code'])
+            code['is_cancer'] = kcd_index.is_cancer(code['code'])
 
         with self.driver.session() as session:
             for i in range(0, len(codes), batch_size):
@@ -312,20 +318,6 @@ class CodeBasedIntegrator:
         self.stats['targets_rels'] = len(relationships)
         print(f"[OK] {self.stats['targets_rels']}개 TARGETS 관계 생성")
 
-    def is_cancer_code(self, code):
-        """암 코드 여부"""
-        if not code or '-' in code:
-            return False
-        if code.startswith('C'):
-            return True
-        if code.startswith('D'):
-            try:
-                num = int(code[1:3])
-                return 0 <= num <= 48
-            except:
-                return False
-        return False
-
     def verify_import(self):
         """검증"""
         print("\n[INFO] 데이터 검증 중...")
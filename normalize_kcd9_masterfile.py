@@ -2,25 +2,185 @@
 KCD-9 Master file 정규화 및 JSON 변환
 - 54,126개 질병코드를 구조화된 JSON으로 변환
 - 검색 가능한 형태로 정리
+- 정제된 표를 Parquet(kcd9_full.parquet)로도 저장 → shared.kcd_index가 인덱스 재빌드 때 load_kcd9_frame()으로 필요한 컬럼만 로드
+- xlsx 해시가 바뀐 경우에만 pd.read_excel 실행 (그 외에는 Parquet 캐시 사용)
 """
 import sys
 import codecs
+import hashlib
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 import pandas as pd
 import json
 from datetime import datetime
 
-# UTF-8 출력
-if sys.platform == 'win32':
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+SOURCE_FILE = Path('data/kssc/kcd-9th/제9차 한국표준질병ㆍ사인분류 2차 정오 DB masterfile_251031_20251103085142.xlsx')
+SHEET_NAME = 'KCD-8 DB Masterfile'
+OUTPUT_DIR = Path('data/kssc/kcd-9th/normalized')
+PARQUET_FILE = OUTPUT_DIR / 'kcd9_full.parquet'
+SOURCE_META_FILE = OUTPUT_DIR / 'kcd9_source.json'
+
+COLUMNS = [
+    'is_header',        # 표제어 (1이면 주 코드)
+    'classification',   # 분류기준 (대/중/소/세)
+    'code',            # 질병분류코드
+    'symbol',          # 검별 (+/*)
+    'note',            # 주석 (포함/제외/주)
+    'name_kr',         # 한글명칭
+    'name_en',         # 영문명칭
+    'is_lowest',       # 최하위코드 (1이면 실제 사용 가능)
+    'is_domestic',     # 국내세분화코드
+    'is_oriental',     # 한의병명
+    'is_additional',   # 국내추가진단명
+    'revision_no',     # 정오차수
+    'revision_note',   # 정오내용
+    'unused'           # 사용하지 않는 컬럼
+]
+TEXT_COLUMNS = ['code', 'name_kr', 'name_en', 'classification', 'symbol', 'note', 'revision_no', 'revision_note']
+FLAG_COLUMNS = ['is_header', 'is_lowest', 'is_domestic', 'is_oriental', 'is_additional']
+
+# 출력 JSON 필드 순서 (기존 파일과 동일)
+FULL_FIELDS = ['code', 'name_kr', 'name_en', 'is_header', 'classification', 'symbol', 'note',
+               'is_lowest', 'is_domestic', 'is_oriental', 'is_additional']
+USABLE_FIELDS = ['code', 'name_kr', 'name_en', 'classification', 'symbol', 'is_domestic', 'is_oriental']
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def clean_masterfile(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    컬럼 단위 정제 (행 반복 없음)
+
+    - 텍스트 컬럼: 결측치 → '', 문자열 변환 후 strip
+    - 플래그 컬럼: 결측치 → 0, bool 변환
+    """
+    df = df.copy()
+    df.columns = COLUMNS
+    df = df.drop(columns=['unused'])
+
+    for column in TEXT_COLUMNS:
+        values = df[column]
+        df[column] = values.astype(str).str.strip().where(values.notna(), '')
+
+    for column in FLAG_COLUMNS:
+        df[column] = df[column].fillna(0).astype(int).astype(bool)
+
+    return df
+
+
+def load_masterfile(file_path: Path = SOURCE_FILE, output_dir: Path = OUTPUT_DIR,
+                    force: bool = False) -> pd.DataFrame:
+    """
+    정제된 Master file 표 로드
+
+    xlsx의 SHA-256이 마지막 변환 때와 같으면 Parquet 캐시를 읽고,
+    다르면(또는 force) xlsx를 다시 읽어 정제 후 캐시를 갱신한다.
+    """
+    parquet_file = output_dir / PARQUET_FILE.name
+    meta_file = output_dir / SOURCE_META_FILE.name
+    source_hash = file_sha256(file_path)
+
+    if not force and parquet_file.exists() and meta_file.exists():
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('sha256') == source_hash:
+            print(f'[캐시] xlsx 변경 없음 → {parquet_file.name} 사용')
+            return pd.read_parquet(parquet_file)
 
+    # Master file 읽기 (2행이 헤더)
+    print(f'[xlsx] {file_path.name} 읽는 중...')
+    df = clean_masterfile(pd.read_excel(file_path, sheet_name=SHEET_NAME, header=2))
+
+    output_dir.mkdir(exist_ok=True, parents=True)
+    df.to_parquet(parquet_file, index=False)
+    with open(meta_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'source': file_path.name,
+            'sha256': source_hash,
+            'rows': len(df),
+            'converted_at': datetime.now().isoformat(),
+        }, f, ensure_ascii=False, indent=2)
+
+    print(f'  ✅ Parquet 캐시 저장: {parquet_file.name}')
+    return df
+
+
+def load_kcd9_frame(columns: Optional[List[str]] = None, output_dir: Path = OUTPUT_DIR) -> pd.DataFrame:
+    """
+    다른 스크립트용 KCD-9 표 로드 (정규화 결과 Parquet)
+
+    Args:
+        columns: 읽을 컬럼 (None이면 전체)
+    """
+    return pd.read_parquet(output_dir / PARQUET_FILE.name, columns=columns)
+
+
+def build_views(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    전체 레코드 / 최하위 코드 / 코드 맵 / 대분류 통계를 한 번에 생성
+
+    Returns:
+        {'records': [...], 'usable': [...], 'code_map': {...}, 'chapters': [...]}
+    """
+    full_rows = df[FULL_FIELDS].to_dict('records')
+    usable_rows = df[USABLE_FIELDS].to_dict('records')
+    lowest = df['is_lowest'].tolist()
+    revision_no = df['revision_no'].tolist()
+    revision_note = df['revision_note'].tolist()
+
+    records = []
+    usable = []
+    code_map = {}
+    for record, usable_record, is_lowest, rev_no, rev_note in zip(
+            full_rows, usable_rows, lowest, revision_no, revision_note):
+        # 정오 정보 (있는 경우만)
+        if rev_no:
+            record['revision'] = {'no': rev_no, 'note': rev_note}
+        records.append(record)
+
+        # 최하위 코드만 (실제 사용 가능한 코드)
+        if is_lowest:
+            usable.append(usable_record)
+
+        # 코드 → 명칭 매핑 (빠른 검색용)
+        code_map[record['code']] = {
+            'name_kr': record['name_kr'],
+            'name_en': record['name_en'],
+            'is_lowest': record['is_lowest'],
+            'is_header': record['is_header'],
+        }
+
+    # 대분류별 코드 수: 예) A00-B99 → A로 시작하는 코드 수
+    first_letter_counts = df['code'].str[:1].value_counts()
+    chapters = []
+    for code_range, name_kr in df.loc[df['classification'] == '대', ['code', 'name_kr']].itertuples(index=False):
+        start_code = code_range.split('-')[0][:1]
+        chapters.append({
+            'code_range': code_range,
+            'name_kr': name_kr,
+            'total_codes': int(first_letter_counts.get(start_code, 0)) if start_code else 0
+        })
+
+    return {'records': records, 'usable': usable, 'code_map': code_map, 'chapters': chapters}
+
+
+def write_json(path: Path, data: Dict[str, Any]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
 
-def normalize_masterfile():
+
+def normalize_masterfile(force: bool = False):
     """Master file 정규화"""
 
-    file_path = Path('data/kssc/kcd-9th/제9차 한국표준질병ㆍ사인분류 2차 정오 DB masterfile_251031_20251103085142.xlsx')
-    output_dir = Path('data/kssc/kcd-9th/normalized')
+    file_path = SOURCE_FILE
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(exist_ok=True, parents=True)
 
     print('='*80)
@@ -29,53 +189,10 @@ def normalize_masterfile():
     print(f'\n입력: {file_path.name}')
     print(f'출력: {output_dir}\n')
 
-    # Master file 읽기 (2행이 헤더)
-    df = pd.read_excel(file_path, sheet_name='KCD-8 DB Masterfile', header=2)
+    df = load_masterfile(file_path, output_dir, force=force)
 
     print(f'총 데이터: {len(df):,}개 행\n')
 
-    # 컬럼명 정리
-    df.columns = [
-        'is_header',        # 표제어 (1이면 주 코드)
-        'classification',   # 분류기준 (대/중/소/세)
-        'code',            # 질병분류코드
-        'symbol',          # 검별 (+/*)
-        'note',            # 주석 (포함/제외/주)
-        'name_kr',         # 한글명칭
-        'name_en',         # 영문명칭
-        'is_lowest',       # 최하위코드 (1이면 실제 사용 가능)
-        'is_domestic',     # 국내세분화코드
-        'is_oriental',     # 한의병명
-        'is_additional',   # 국내추가진단명
-        'revision_no',     # 정오차수
-        'revision_note',   # 정오내용
-        'unused'           # 사용하지 않는 컬럼
-    ]
-
-    # 결측치 처리
-    df = df.fillna({
-        'is_header': 0,
-        'classification': '',
-        'symbol': '',
-        'note': '',
-        'is_lowest': 0,
-        'is_domestic': 0,
-        'is_oriental': 0,
-        'is_additional': 0,
-    })
-
-    # 데이터 타입 변환
-    df['is_header'] = df['is_header'].astype(int)
-    df['is_lowest'] = df['is_lowest'].astype(int)
-    df['is_domestic'] = df['is_domestic'].astype(int)
-    df['is_oriental'] = df['is_oriental'].astype(int)
-    df['is_additional'] = df['is_additional'].astype(int)
-
-    print('[데이터 정제 완료]')
-    print(f'  - 컬럼명 정리')
-    print(f'  - 결측치 처리')
-    print(f'  - 데이터 타입 변환\n')
-
     # 통계
     print('[데이터 통계]')
     print(f'  총 코드 수: {len(df):,}개')
@@ -97,155 +214,66 @@ def normalize_masterfile():
     for symbol, count in symbol_counts.items():
         print(f'  {symbol}: {count:,}개')
 
-    # 1. 전체 데이터를 JSON으로 저장
-    print(f'\n[1] 전체 데이터 JSON 변환...')
-
-    records = []
-    for _, row in df.iterrows():
-        record = {
-            'code': str(row['code']).strip(),
-            'name_kr': str(row['name_kr']).strip() if pd.notna(row['name_kr']) else '',
-            'name_en': str(row['name_en']).strip() if pd.notna(row['name_en']) else '',
-            'is_header': bool(row['is_header']),
-            'classification': str(row['classification']).strip(),
-            'symbol': str(row['symbol']).strip(),
-            'note': str(row['note']).strip() if pd.notna(row['note']) else '',
-            'is_lowest': bool(row['is_lowest']),
-            'is_domestic': bool(row['is_domestic']),
-            'is_oriental': bool(row['is_oriental']),
-            'is_additional': bool(row['is_additional']),
-        }
+    print(f'\n[출력 뷰 생성] 전체 / 최하위 코드 / 코드 맵 / 대분류 통계...')
+    views = build_views(df)
+    generated_at = datetime.now().isoformat()
 
-        # 정오 정보 (있는 경우만)
-        if pd.notna(row['revision_no']):
-            record['revision'] = {
-                'no': str(row['revision_no']).strip(),
-                'note': str(row['revision_note']).strip() if pd.notna(row['revision_note']) else ''
-            }
-
-        records.append(record)
-
-    # 전체 데이터 저장
-    full_output = {
+    # 1. 전체 데이터 저장
+    full_file = output_dir / 'kcd9_full.json'
+    write_json(full_file, {
         'version': 'KCD-9',
         'release_date': '2025-10-31',
         'revision': '2차 정오',
-        'total_codes': len(records),
-        'generated_at': datetime.now().isoformat(),
-        'codes': records
-    }
-
-    full_file = output_dir / 'kcd9_full.json'
-    with open(full_file, 'w', encoding='utf-8') as f:
-        json.dump(full_output, f, ensure_ascii=False, indent=2)
-
-    print(f'  ✅ 저장: {full_file.name} ({len(records):,}개 코드)')
-
-    # 2. 최하위 코드만 추출 (실제 사용 가능한 코드)
-    print(f'\n[2] 최하위 코드만 추출...')
-
-    lowest_df = df[df['is_lowest'] == 1].copy()
-    lowest_records = []
-
-    for _, row in lowest_df.iterrows():
-        record = {
-            'code': str(row['code']).strip(),
-            'name_kr': str(row['name_kr']).strip() if pd.notna(row['name_kr']) else '',
-            'name_en': str(row['name_en']).strip() if pd.notna(row['name_en']) else '',
-            'classification': str(row['classification']).strip(),
-            'symbol': str(row['symbol']).strip(),
-            'is_domestic': bool(row['is_domestic']),
-            'is_oriental': bool(row['is_oriental']),
-        }
-        lowest_records.append(record)
+        'total_codes': len(views['records']),
+        'generated_at': generated_at,
+        'codes': views['records']
+    })
+    print(f'  ✅ 저장: {full_file.name} ({len(views["records"]):,}개 코드)')
 
-    lowest_output = {
+    # 2. 최하위 코드만 (실제 사용 가능한 코드)
+    lowest_file = output_dir / 'kcd9_usable_codes.json'
+    write_json(lowest_file, {
         'version': 'KCD-9',
         'release_date': '2025-10-31',
         'revision': '2차 정오',
         'description': '최하위 코드만 포함 (실제 진단 시 사용 가능한 코드)',
-        'total_codes': len(lowest_records),
-        'generated_at': datetime.now().isoformat(),
-        'codes': lowest_records
-    }
-
-    lowest_file = output_dir / 'kcd9_usable_codes.json'
-    with open(lowest_file, 'w', encoding='utf-8') as f:
-        json.dump(lowest_output, f, ensure_ascii=False, indent=2)
-
-    print(f'  ✅ 저장: {lowest_file.name} ({len(lowest_records):,}개 코드)')
+        'total_codes': len(views['usable']),
+        'generated_at': generated_at,
+        'codes': views['usable']
+    })
+    print(f'  ✅ 저장: {lowest_file.name} ({len(views["usable"]):,}개 코드)')
 
     # 3. 코드 → 명칭 매핑 딕셔너리 (빠른 검색용)
-    print(f'\n[3] 검색용 매핑 딕셔너리 생성...')
-
-    code_map = {}
-    for _, row in df.iterrows():
-        code = str(row['code']).strip()
-        code_map[code] = {
-            'name_kr': str(row['name_kr']).strip() if pd.notna(row['name_kr']) else '',
-            'name_en': str(row['name_en']).strip() if pd.notna(row['name_en']) else '',
-            'is_lowest': bool(row['is_lowest']),
-            'is_header': bool(row['is_header']),
-        }
-
-    map_output = {
+    map_file = output_dir / 'kcd9_code_map.json'
+    write_json(map_file, {
         'version': 'KCD-9',
         'description': '코드 → 명칭 빠른 검색용 매핑',
-        'total_codes': len(code_map),
-        'generated_at': datetime.now().isoformat(),
-        'map': code_map
-    }
-
-    map_file = output_dir / 'kcd9_code_map.json'
-    with open(map_file, 'w', encoding='utf-8') as f:
-        json.dump(map_output, f, ensure_ascii=False, indent=2)
-
-    print(f'  ✅ 저장: {map_file.name} ({len(code_map):,}개 코드)')
+        'total_codes': len(views['code_map']),
+        'generated_at': generated_at,
+        'map': views['code_map']
+    })
+    print(f'  ✅ 저장: {map_file.name} ({len(views["code_map"]):,}개 코드)')
 
     # 4. 대분류별 통계
-    print(f'\n[4] 대분류별 통계 생성...')
-
-    major_df = df[df['classification'] == '대'].copy()
-    major_stats = []
-
-    for _, row in major_df.iterrows():
-        code_range = str(row['code']).strip()
-        name_kr = str(row['name_kr']).strip() if pd.notna(row['name_kr']) else ''
-
-        # 해당 대분류에 속하는 코드 수 계산
-        # 예: A00-B99 → A, B로 시작하는 코드들
-        start_code = code_range.split('-')[0][0] if '-' in code_range else code_range[0]
-
-        count = len(df[df['code'].astype(str).str.startswith(start_code)])
-
-        major_stats.append({
-            'code_range': code_range,
-            'name_kr': name_kr,
-            'total_codes': count
-        })
-
-    stats_output = {
+    stats_file = output_dir / 'kcd9_statistics.json'
+    write_json(stats_file, {
         'version': 'KCD-9',
         'description': '대분류(Chapter)별 통계',
-        'generated_at': datetime.now().isoformat(),
-        'chapters': major_stats
-    }
-
-    stats_file = output_dir / 'kcd9_statistics.json'
-    with open(stats_file, 'w', encoding='utf-8') as f:
-        json.dump(stats_output, f, ensure_ascii=False, indent=2)
-
-    print(f'  ✅ 저장: {stats_file.name} ({len(major_stats)}개 대분류)')
+        'generated_at': generated_at,
+        'chapters': views['chapters']
+    })
+    print(f'  ✅ 저장: {stats_file.name} ({len(views["chapters"])}개 대분류)')
 
     # 요약
     print(f'\n\n{"="*80}')
     print('📊 정규화 완료 요약')
     print('='*80)
     print(f'\n생성된 파일:')
-    print(f'  1. kcd9_full.json - 전체 데이터 ({len(records):,}개)')
-    print(f'  2. kcd9_usable_codes.json - 사용 가능한 코드 ({len(lowest_records):,}개)')
-    print(f'  3. kcd9_code_map.json - 빠른 검색용 ({len(code_map):,}개)')
-    print(f'  4. kcd9_statistics.json - 대분류 통계 ({len(major_stats)}개)')
+    print(f'  1. kcd9_full.json - 전체 데이터 ({len(views["records"]):,}개)')
+    print(f'  2. kcd9_usable_codes.json - 사용 가능한 코드 ({len(views["usable"]):,}개)')
+    print(f'  3. kcd9_code_map.json - 빠른 검색용 ({len(views["code_map"]):,}개)')
+    print(f'  4. kcd9_statistics.json - 대분류 통계 ({len(views["chapters"])}개)')
+    print(f'  5. {PARQUET_FILE.name} - 컬럼형 캐시 (xlsx 변환 캐시, KCD 인덱스 빌드 원본)')
 
     print(f'\n💾 저장 위치: {output_dir}')
 
@@ -253,12 +281,18 @@ def normalize_masterfile():
         'full': full_file,
         'usable': lowest_file,
         'map': map_file,
-        'stats': stats_file
+        'stats': stats_file,
+        'parquet': output_dir / PARQUET_FILE.name
     }
 
 
 def main():
-    files = normalize_masterfile()
+    # UTF-8 출력 (import 시에는 표준 출력을 건드리지 않음)
+    if sys.platform == 'win32':
+        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
+    files = normalize_masterfile(force='--force' in sys.argv[1:])
 
     print('\n\n' + '='*80)
     print('✅ 완료')
@@ -8,12 +8,13 @@ import codecs
 from pathlib import Path
 import json
 import os
-from datetime import datetime
 from dotenv import load_dotenv
 from pypdf import PdfReader, PdfWriter
 import requests
 import time
 
+from shared.chunk_orchestrator import ChunkOrchestrator, ChunkResultCache
+
 # UTF-8 출력
 if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -25,19 +26,28 @@ load_dotenv()
 class SmartKDRGParser:
     """MDC 구조 기반 지능형 KDRG 파서"""
 
-    def __init__(self, output_dir: str = 'data/hira_master/kdrg_parsed'):
+    def __init__(self, output_dir: str = 'data/hira_master/kdrg_parsed', workers: int = 3):
+        """
+        Args:
+            output_dir: 출력 디렉토리
+            workers: 동시 API 요청 수
+        """
         self.api_key = os.getenv('UPSTAGE_API_KEY')
         if not self.api_key:
             raise ValueError('UPSTAGE_API_KEY not found in .env')
 
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
+        self.workers = workers
         self.base_url = "https://api.upstage.ai/v1/document-ai/document-parse"
 
         # 임시 분할 파일 저장 위치
         self.temp_dir = self.output_dir / 'temp_chunks'
         self.temp_dir.mkdir(exist_ok=True)
 
+        # 청크 결과 캐시 (원본 해시 + 페이지 범위)
+        self.cache_dir = self.output_dir / 'chunk_cache'
+
     def load_structure(self, structure_file: Path) -> dict:
         """저장된 구조 파일 로드"""
         with open(structure_file, 'r', encoding='utf-8') as f:
@@ -56,6 +66,7 @@ class SmartKDRGParser:
         split_files = []
 
         for i, chunk in enumerate(chunks, 1):
+            i = chunk.get('index', i)  # 계획 순번 (캐시된 청크를 건너뛰어도 파일명 유지)
             start_page = chunk['start'] - 1  # 0-indexed
             end_page = chunk['end']
 
@@ -139,79 +150,48 @@ class SmartKDRGParser:
                 print(f'  ❌ 에러: {e}')
                 return {'error': str(e), 'chunk': chunk_info}
 
-    def parse_chunks(self, chunks: list) -> list:
-        """분할된 PDF 파일들 파싱"""
-        print(f'\n🔄 청크 파싱: {len(chunks)}개')
+    def parse_chunks(self, pdf_path: Path, plan: list, output_format: str = 'html') -> ChunkOrchestrator:
+        """청크 파싱
 
-        results = []
-        total = len(chunks)
+        - (원본 해시, 페이지 범위) 캐시에 있는 청크는 재사용, 나머지만 분할 후 전송
+        - 큰 청크부터 workers개 동시 요청 (요청 시작 간격 1초)
+        - 도착하는 대로 페이지 순서에 맞춰 점진 병합 (orchestrator.merger)
+        """
+        print(f'\n🔄 청크 파싱: {len(plan)}개 (동시 {self.workers}개)')
 
-        for chunk in chunks:
-            result = self.parse_chunk(chunk, total)
-            results.append(result)
+        cache = ChunkResultCache(self.cache_dir, pdf_path, output_format)
+        orchestrator = ChunkOrchestrator(
+            lambda chunk: self.parse_chunk(chunk, len(plan), output_format),
+            cache, workers=self.workers, output_format=output_format
+        )
 
-            # Rate limit 방지
-            time.sleep(1)
+        def report(position, result):
+            item = plan[position]
+            status = '❌ 실패' if 'error' in result else '✅ 완료'
+            print(f'  {status} p.{item["start"]}-{item["end"]} '
+                  f'(순서대로 병합: {orchestrator.merger.next_position}/{len(plan)})')
 
-        return results
+        orchestrator.run(plan, prepare=lambda pending: self.split_pdf(pdf_path, pending), on_result=report)
 
-    def merge_results(self, results: list, source_file: str, output_format: str = 'html') -> dict:
-        """파싱 결과 병합"""
-        print(f'\n🔗 결과 병합')
+        stats = orchestrator.stats
+        print(f'\n  캐시 재사용: {stats["cached"]}개, 파싱: {stats["parsed"]}개, 실패: {stats["failed"]}개')
+        return orchestrator
 
-        # 에러가 없는 결과만 필터링
-        valid_results = [r for r in results if 'error' not in r]
+    def merge_results(self, orchestrator: ChunkOrchestrator, source_file: str) -> dict:
+        """파싱 결과 병합 (청크가 도착할 때마다 이미 순서대로 이어 붙인 결과 정리)"""
+        print(f'\n🔗 결과 병합')
 
-        if not valid_results:
+        merged = orchestrator.merger.merged(source_file, 'mdc_structure_based_split')
+        if not merged:
             print('  ❌ 모든 청크 파싱 실패')
             return None
 
-        # Content 병합
-        merged_content = []
-        for r in valid_results:
-            content_dict = r.get('content', {})
-            if isinstance(content_dict, dict):
-                content_text = content_dict.get(output_format, '')
-            else:
-                content_text = str(content_dict)
-            merged_content.append(content_text)
-
-        merged_content_str = '\n\n<hr>\n\n'.join(merged_content)
-
-        # Elements 병합
-        merged_elements = []
-        for r in valid_results:
-            if 'elements' in r:
-                merged_elements.extend(r['elements'])
-
-        # 총 페이지 수
-        total_pages = sum(r.get('chunk_metadata', {}).get('api_pages', 0) for r in valid_results)
-
-        # 청크 메타데이터
-        chunks_metadata = []
-        for r in valid_results:
-            if 'chunk_metadata' in r:
-                chunks_metadata.append(r['chunk_metadata'])
-
-        merged = {
-            'source_file': source_file,
-            'total_pages': total_pages,
-            'chunks_parsed': len(valid_results),
-            'chunks_failed': len(results) - len(valid_results),
-            'content': merged_content_str,
-            'elements': merged_elements,
-            'output_format': output_format,
-            'parsing_method': 'mdc_structure_based_split',
-            'parsed_at': datetime.now().isoformat(),
-            'chunks_metadata': chunks_metadata
-        }
-
-        print(f'  ✅ 병합 완료: {total_pages}p, {len(merged_content_str):,}자')
-        print(f'  ✅ Elements: {len(merged_elements)}개')
+        print(f'  ✅ 병합 완료: {merged["total_pages"]}p, {len(merged["content"]):,}자')
+        print(f'  ✅ Elements: {len(merged["elements"])}개')
 
         # 청크별 요약
         print(f'\n  📋 청크별 분할:')
-        for meta in chunks_metadata:
+        for meta in merged['chunks_metadata']:
             chunk_info = meta['chunk_info']
             print(f'     {chunk_info["name"]:70s} p.{chunk_info["start"]:4d}-{chunk_info["end"]:4d} ({chunk_info["pages"]:3d}p)')
 
@@ -240,19 +220,15 @@ class SmartKDRGParser:
         print(f'  MDC 섹션: {structure["mdc_count"]}개')
         print(f'  분할 청크: {len(chunks)}개')
 
-        # 2. PDF 분할
-        print('\n[단계 2] PDF 분할')
-        split_files = self.split_pdf(pdf_path, chunks)
-
-        # 3. 각 청크 파싱
-        print('\n[단계 3] 청크 파싱')
-        results = self.parse_chunks(split_files)
+        # 2. 캐시에 없는 청크만 PDF 분할 후 병렬 파싱
+        print('\n[단계 2] PDF 분할 + 청크 파싱')
+        orchestrator = self.parse_chunks(pdf_path, chunks, output_format)
 
-        # 4. 결과 병합
-        print('\n[단계 4] 결과 병합')
-        merged = self.merge_results(results, pdf_path.name, output_format)
+        # 3. 결과 병합
+        print('\n[단계 3] 결과 병합')
+        merged = self.merge_results(orchestrator, pdf_path.name)
 
-        # 5. 저장
+        # 4. 저장
         if merged:
             # JSON 저장
             output_file = self.output_dir / 'kdrg_smart.json'
@@ -274,7 +250,7 @@ class SmartKDRGParser:
             print(merged['content'][:500])
             print('-' * 80)
 
-        # 6. 임시 파일 정리
+        # 5. 임시 파일 정리
         self.cleanup_temp_files()
 
         return merged
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+약제/용어 매칭 핫패스 벤치마크 + 성능 회귀 게이트
+
+측정 대상:
+  - refine.process_all          DrugAnchorRefiner 전체 (순차, --workers > 1이면 병렬도 따로)
+  - refine.gate.<게이트>         게이트 함수별 (브랜드 해소, 금칙어, 라우팅, 접미사, 음차, 충돌)
+  - drug_candidates.extract     extract_and_match_drugs_v2.extract_drug_candidates
+  - term_matcher.extract        TermMatcher.extract_terms_from_text
+  - brand_index.build           build_brand_index_phase4.build_brand_index
+  - brand_resolver.build        build_brand_index_phase4.build_brand_resolver (스냅샷 저장 포함)
+  - kcd.search                  KCDIndex.search (n-gram 역색인 키워드 검색)
+
+코퍼스:
+  - 기본은 시드 고정 합성 코퍼스 (--scale로 크기 조절, 같은 시드면 커밋 간 입력이 같음)
+  - --corpus: 파싱 JSON 디렉토리 (content 필드) → 본문 추출 벤치마크에 실제 문서 사용
+  - --refine-input: drug_matching_results_v2.json 또는 후보 CSV → 정제기 벤치마크에 실제 항목 사용
+
+측정 방식:
+  - 시간: --repeat번 실행 중 최솟값 (time.perf_counter), 준비(setup)는 측정에서 제외
+  - 메모리: 별도 1회 실행을 tracemalloc으로 추적한 최대 증가량 (병렬 실행의 작업자 프로세스는 제외)
+  - 처리량 = 항목 수 / 최소 시간
+
+결과 JSON:
+    {"meta": {"commit": ..., "python": ..., "scale": ..., "seed": ..., ...},
+     "benchmarks": {"<이름>": {"items": N, "unit": "entries", "seconds": ..., "throughput": ...,
+                               "peak_kb": ..., "runs": [...]}}}
+
+회귀 게이트:
+    --baseline 이전 결과 JSON과 비교해 처리량이 --threshold 비율보다 떨어지거나
+    최대 메모리가 --memory-threshold 비율보다 늘면 실패 (종료 코드 1)
+
+사용 예:
+    python scripts/benchmark_matching.py --output data/benchmarks/base.json
+    python scripts/benchmark_matching.py --baseline data/benchmarks/base.json --threshold 0.15
+    python scripts/benchmark_matching.py --only refine --workers 8 --corpus data/hira_cancer/parsed
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from hira_cancer.extract_and_match_drugs_v2 import extract_drug_candidates
+from ncc.cancer_dictionary.term_matcher import TermMatcher
+from scripts.build_brand_index_phase4 import build_brand_index, build_brand_resolver
+from scripts.refine_drug_anchors import DrugAnchorRefiner, DrugEntry
+from shared.kcd_index import KCDIndex
+
+OUTPUT_DIR = PROJECT_ROOT / "data" / "benchmarks"
+FILTERS_FILE = PROJECT_ROOT / "rules" / "filters.yaml"
+
+# 결과 JSON 구조가 바뀌면 올림 (다른 버전끼리는 비교하지 않음)
+RESULT_VERSION = 1
+
+# 값이 다르면 같은 작업으로 볼 수 없어 비교를 거부하는 meta 항목
+COMPARABLE_META = ('scale', 'seed', 'corpus', 'refine_input', 'workers')
+
+# scale 1.0 기준 합성 코퍼스 크기 (실데이터 규모: 정제 입력 수천 건, 파싱 문서 800여 개, 암 용어 3,543개)
+BASE_SIZES = {
+    'refine_entries': 5000,
+    'documents': 800,
+    'terms': 3500,
+    'brand_entries': 2000,
+    'kcd_records': 20000,
+    'kcd_keywords': 300,
+}
+
+# 음차 쌍 (영문 성분명, 한글 성분명)
+DRUG_PAIRS = [
+    ('paclitaxel', '파클리탁셀'), ('docetaxel', '도세탁셀'), ('trastuzumab', '트라스투주맙'),
+    ('pembrolizumab', '펨브롤리주맙'), ('nivolumab', '니볼루맙'), ('rituximab', '리툭시맙'),
+    ('bevacizumab', '베바시주맙'), ('imatinib', '이매티닙'), ('gefitinib', '게피티닙'),
+    ('osimertinib', '오시머티닙'), ('carboplatin', '카보플라틴'), ('cisplatin', '시스플라틴'),
+    ('oxaliplatin', '옥살리플라틴'), ('gemcitabine', '젬시타빈'), ('cyclophosphamide', '사이클로포스파마이드'),
+    ('fluorouracil', '플루오로우라실'), ('abemaciclib', '아베마시클립'), ('palbociclib', '팔보시클립'),
+]
+# 게이트에서 걸러지는 항목 (금칙어, 레짐, 바이오마커, 질환, 음차 불일치)
+NOISE_PAIRS = [
+    ('vial', '바이알'), ('ampoule', '앰플'), ('FOLFOX', '폴폭스'), ('FOLFIRI', '폴피리'), ('HER2', 'HER2'),
+    ('EGFR', 'EGFR'), ('NSCLC', '비소세포폐암'), ('prednisolone', '아비라테론'), ('mg', 'mg'),
+]
+# 합성 성분명 (영문 접미사, 한글 접미사)
+NAME_SUFFIXES = [('mab', '맙'), ('tinib', '티닙'), ('ciclib', '시클립'), ('taxel', '탁셀'), ('platin', '플라틴')]
+EN_SYLLABLES = ['ba', 'ce', 'di', 'fo', 'ga', 'li', 'mo', 'ne', 'pa', 'ri', 'so', 'tu', 'va', 'xi', 'zo']
+KO_SYLLABLES = ['바', '세', '디', '포', '가', '리', '모', '네', '파', '리', '소', '투', '바', '시', '조']
+FORMS = ['주', '정', '캡슐', '시럽', '주사액']
+KO_WORDS = ['환자', '투여', '용량', '급여', '기준', '인정', '병용', '요법', '진행성', '전이성', '재발',
+            '유방암', '폐암', '위암', '대장암', '림프종', '백혈병', '수술', '보조', '1차', '2차', '치료']
+CONTEXTS = ['mg/m² 정맥 투여', '1일 1회 경구 투여', '3주 간격 6사이클', '임상시험 유효성 확인', '허가 적응증 이외 사용']
+
+
+@dataclass
+class Benchmark:
+    """측정 항목 하나"""
+    name: str
+    items: int
+    unit: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = field(default=lambda: None)
+
+
+# =============================================================================
+# 합성 코퍼스
+# =============================================================================
+
+def synthetic_name(rng: random.Random) -> tuple:
+    """합성 성분명 (영문, 한글) - 접미사/음절이 짝을 이룸"""
+    picks = [rng.randrange(len(EN_SYLLABLES)) for _ in range(rng.randint(2, 3))]
+    en_suffix, ko_suffix = rng.choice(NAME_SUFFIXES)
+    return (''.join(EN_SYLLABLES[i] for i in picks) + en_suffix,
+            ''.join(KO_SYLLABLES[i] for i in picks) + ko_suffix)
+
+
+def synthetic_entries(rng: random.Random, count: int) -> List[DrugEntry]:
+    """정제기 입력 (실제 쌍 + 합성 쌍 + 노이즈, 같은 ko에 다른 en이 섞여 충돌도 생김)"""
+    names = DRUG_PAIRS + [synthetic_name(rng) for _ in range(max(count // 4, 1))]
+    entries = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.15:
+            en, ko = rng.choice(NOISE_PAIRS)
+        elif roll < 0.2:
+            en, ko = rng.choice(names)[0], rng.choice(names)[1]
+        else:
+            en, ko = rng.choice(names)
+        context = f"{ko}({en}) {rng.choice(CONTEXTS)}" if rng.random() < 0.3 else ""
+        entries.append(DrugEntry(en=en.lower(), ko=ko, count=rng.randint(1, 60), source='synthetic',
+                                 context_span=context))
+    return entries
+
+
+def synthetic_terms(rng: random.Random, count: int) -> List[Dict[str, str]]:
+    """NCC 암정보 사전 배치 파일 형식 용어"""
+    terms = [{'title': word, 'keyword': word, 'content': f'{word}에 대한 설명'} for word in KO_WORDS[10:]]
+    seen = {term['title'] for term in terms}
+    while len(terms) < count:
+        title = ''.join(rng.choice(KO_SYLLABLES) for _ in range(rng.randint(2, 5))) + rng.choice(['암', '종', '증', '술', '제'])
+        if title in seen:
+            continue
+        seen.add(title)
+        terms.append({'title': title, 'keyword': title, 'content': f'{title}에 대한 설명'})
+    return terms
+
+
+def synthetic_documents(rng: random.Random, count: int, terms: List[Dict[str, str]]) -> List[str]:
+    """HIRA 공고/FAQ 본문과 비슷한 문서 (약제명+제형, 괄호 성분명, 사전 용어, 일반 단어)"""
+    documents = []
+    for _ in range(count):
+        sentences = []
+        for _ in range(rng.randint(15, 40)):
+            en, ko = rng.choice(DRUG_PAIRS)
+            words = rng.sample(KO_WORDS, 4) + [rng.choice(terms)['title']]
+            sentences.append(f"{ko}{rng.choice(FORMS)} ({en}) {' '.join(words)} {rng.choice(CONTEXTS)}.")
+        documents.append(' '.join(sentences))
+    return documents
+
+
+def synthetic_brand_entries(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    """anticancer_master_classified.json 형식 항목"""
+    entries = []
+    for i in range(count):
+        en, ko = synthetic_name(rng) if i >= len(DRUG_PAIRS) else DRUG_PAIRS[i]
+        brand = ''.join(rng.choice(KO_SYLLABLES) for _ in range(3))
+        entries.append({
+            'atc_code': f'L01{chr(65 + i % 8)}{chr(65 + i // 8 % 26)}{i % 100:02d}',
+            'brand_name_primary': brand,
+            'brand_names_clean': [brand, brand + rng.choice(FORMS)],
+            'brand_names_raw': [f'{brand}{rng.choice(FORMS)}{rng.randint(1, 500)}밀리그램'],
+            'ingredient_ko': ko, 'atc_name_en': en, 'ingredient_base_ko': ko, 'ingredient_base_en': en,
+            'salt_form': None, 'manufacturers': ['합성제약'],
+            'atc_level1': 'L', 'atc_level1_name': '항암제 및 면역조절제',
+            'atc_level2': 'L01', 'atc_level2_name': '항종양제',
+        })
+    return entries
+
+
+def synthetic_kcd_records(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    """kcd9_full.json codes 레코드 형식"""
+    records = []
+    for i in range(count):
+        letter = chr(65 + i * 26 // count)
+        code = f'{letter}{i % 100:02d}.{i // 100 % 10}' if i % 10 else f'{letter}{i % 100:02d}'
+        name_kr = ' '.join(rng.sample(KO_WORDS, 3)) + '의 ' + rng.choice(['악성 신생물', '양성 신생물', '질환'])
+        name_en = ' '.join(rng.sample(EN_SYLLABLES, 3)) + ' neoplasm'
+        records.append({'code': code, 'name_kr': name_kr, 'name_en': name_en,
+                        'is_header': not i % 10, 'is_lowest': bool(i % 10)})
+    return records
+
+
+def load_corpus_documents(corpus_dir: Path) -> List[str]:
+    """파싱 JSON 디렉토리 → 본문 목록 (content 필드, 없으면 건너뜀)"""
+    documents = []
+    for path in sorted(corpus_dir.glob('**/*.json')):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict) and data.get('content'):
+            documents.append(data['content'])
+    return documents
+
+
+# =============================================================================
+# 벤치마크 구성
+# =============================================================================
+
+def copy_entries(entries: List[DrugEntry]) -> List[DrugEntry]:
+    """게이트가 항목을 고치므로 반복마다 새 사본 사용"""
+    return [DrugEntry(en=e.en, ko=e.ko, count=e.count, source=e.source, context_span=e.context_span)
+            for e in entries]
+
+
+def refine_benchmarks(entries: List[DrugEntry], filters_path: Path, workers: int) -> List[Benchmark]:
+    """정제기 전체 + 게이트별"""
+    logging.getLogger('scripts.refine_drug_anchors').setLevel(logging.ERROR)
+
+    def fresh():
+        refiner = DrugAnchorRefiner(str(filters_path))
+        refiner._build_curated_pairs_set()
+        return refiner, copy_entries(entries)
+
+    benchmarks = [Benchmark('refine.process_all', len(entries), 'entries', setup=fresh,
+                            run=lambda state: state[0].process_all(state[1], workers=1))]
+    if workers > 1:
+        benchmarks.append(Benchmark('refine.process_all.parallel', len(entries), 'entries', setup=fresh,
+                                    run=lambda state: state[0].process_all(state[1], workers=workers)))
+
+    def gate(method: str):
+        def run(state):
+            refiner, batch = state
+            check = getattr(refiner, method)
+            for entry in batch:
+                check(entry)
+        return run
+
+    for name, method in [('brand', 'resolve_brand_name'), ('forbidden', 'check_forbidden_forms'),
+                         ('routing', 'check_routing'), ('suffix', 'check_suffix_consistency'),
+                         ('phonetic', 'check_phonetic_similarity'), ('conflict', 'check_conflicts')]:
+        benchmarks.append(Benchmark(f'refine.gate.{name}', len(entries), 'entries', setup=fresh, run=gate(method)))
+    return benchmarks
+
+
+def text_benchmarks(documents: List[str], terms_dir: Path) -> List[Benchmark]:
+    """본문 추출 (약제 후보, 암 용어)"""
+    matcher = TermMatcher(str(terms_dir))
+
+    def extract_candidates(_):
+        for text in documents:
+            extract_drug_candidates(text)
+
+    def extract_terms(_):
+        for text in documents:
+            matcher.extract_terms_from_text(text)
+
+    return [Benchmark('drug_candidates.extract', len(documents), 'documents', run=extract_candidates),
+            Benchmark('term_matcher.extract', len(documents), 'documents', run=extract_terms)]
+
+
+def index_benchmarks(brand_entries: List[Dict[str, Any]], kcd_records: List[Dict[str, Any]],
+                     keywords: List[str], work_dir: Path) -> List[Benchmark]:
+    """브랜드 색인 빌드, KCD 키워드 검색"""
+    kcd_index = KCDIndex.from_records(kcd_records)
+
+    def search(_):
+        for keyword in keywords:
+            kcd_index.search(keyword)
+
+    return [
+        Benchmark('brand_index.build', len(brand_entries), 'entries', run=lambda _: build_brand_index(brand_entries)),
+        Benchmark('brand_resolver.build', len(brand_entries), 'entries',
+                  run=lambda _: build_brand_resolver(brand_entries, work_dir / 'brand_resolver')),
+        Benchmark('kcd.search', len(keywords), 'queries', run=search),
+    ]
+
+
+# =============================================================================
+# 측정 / 비교
+# =============================================================================
+
+def measure(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    """최소 시간 + tracemalloc 최대 증가량"""
+    runs = []
+    for _ in range(repeat):
+        state = benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run(state)
+        runs.append(time.perf_counter() - start)
+
+    state = benchmark.setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        benchmark.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = min(runs)
+    return {
+        'items': benchmark.items,
+        'unit': benchmark.unit,
+        'seconds': round(seconds, 6),
+        'throughput': round(benchmark.items / seconds, 2) if seconds > 0 else None,
+        'peak_kb': round((peak - base) / 1024, 1),
+        'runs': [round(run, 6) for run in runs],
+    }
+
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 (git이 없으면 None)"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_suite(scale: float = 1.0, repeat: int = 3, seed: int = 0, only: Optional[List[str]] = None,
+              workers: int = 1, corpus_dir: Optional[Path] = None, refine_input: Optional[Path] = None,
+              filters_path: Path = FILTERS_FILE) -> Dict[str, Any]:
+    """
+    전체 벤치마크 실행
+
+    Args:
+        scale: 합성 코퍼스 크기 배율 (BASE_SIZES 기준)
+        repeat: 시간 측정 반복 횟수 (최솟값 사용)
+        seed: 합성 코퍼스 시드
+        only: 이름 접두사 목록 (지정 시 해당 벤치마크만)
+        workers: refine.process_all.parallel 프로세스 수 (1이면 생략)
+        corpus_dir: 실제 파싱 JSON 디렉토리 (본문 추출 벤치마크)
+        refine_input: 실제 정제기 입력 (JSON/CSV)
+        filters_path: 정제기 필터 규칙
+
+    Returns:
+        결과 dict (meta, benchmarks)
+    """
+    rng = random.Random(seed)
+    sizes = {key: max(int(value * scale), 1) for key, value in BASE_SIZES.items()}
+
+    def selected(name: str) -> bool:
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    def group_selected(group: str) -> bool:
+        # 접두사가 그룹보다 길 수도 있음 (kcd.search → kcd, refine.gate → refine)
+        return not only or any(prefix.startswith(group) or group.startswith(prefix) for prefix in only)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+
+        if refine_input:
+            entries = DrugAnchorRefiner(str(filters_path)).load_input(str(refine_input))
+        else:
+            entries = synthetic_entries(rng, sizes['refine_entries'])
+
+        terms = synthetic_terms(rng, sizes['terms'])
+        terms_dir = work_dir / 'terms'
+        terms_dir.mkdir()
+        with open(terms_dir / 'batch_000.json', 'w', encoding='utf-8') as f:
+            json.dump(terms, f, ensure_ascii=False)
+        documents = load_corpus_documents(corpus_dir) if corpus_dir else synthetic_documents(rng, sizes['documents'], terms)
+
+        kcd_records = synthetic_kcd_records(rng, sizes['kcd_records'])
+        keywords = [rng.choice(KO_WORDS) if i % 2 else rng.choice(EN_SYLLABLES) for i in range(sizes['kcd_keywords'])]
+
+        benchmarks = []
+        if group_selected('refine'):
+            benchmarks += refine_benchmarks(entries, filters_path, workers)
+        if group_selected('drug_candidates') or group_selected('term_matcher'):
+            benchmarks += text_benchmarks(documents, terms_dir)
+        if group_selected('brand') or group_selected('kcd'):
+            benchmarks += index_benchmarks(synthetic_brand_entries(rng, sizes['brand_entries']), kcd_records,
+                                           keywords, work_dir)
+
+        benchmarks = [benchmark for benchmark in benchmarks if selected(benchmark.name)]
+        if not benchmarks:
+            raise ValueError(f"No benchmarks match --only {only}")
+
+        results = {}
+        for benchmark in benchmarks:
+            results[benchmark.name] = measure(benchmark, repeat)
+            result = results[benchmark.name]
+            print(f"  {benchmark.name:32s} {result['seconds'] * 1000:10.1f} ms  "
+                  f"{result['throughput'] or 0:12,.0f} {benchmark.unit}/s  {result['peak_kb']:10,.0f} KB")
+
+    return {
+        'meta': {
+            'version': RESULT_VERSION,
+            'commit': git_commit(),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'scale': scale,
+            'repeat': repeat,
+            'seed': seed,
+            'workers': workers,
+            'only': only or [],
+            'corpus': str(corpus_dir) if corpus_dir else 'synthetic',
+            'refine_input': str(refine_input) if refine_input else 'synthetic',
+        },
+        'benchmarks': results,
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10,
+                    memory_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    기준 결과 대비 회귀 목록
+
+    Args:
+        baseline: 기준 결과 (run_suite 출력)
+        current: 현재 결과
+        threshold: 처리량 감소 허용 비율 (0.10 → 10% 넘게 느려지면 회귀)
+        memory_threshold: 최대 메모리 증가 허용 비율 (None이면 threshold와 같음)
+
+    결과 형식 버전이나 입력 조건(COMPARABLE_META: 배율, 시드, 코퍼스, 프로세스 수 등)이 다르면
+    같은 항목 수라도 같은 작업이 아니므로 ValueError.
+    기준에 있는 벤치마크가 현재 결과에 없거나(metric 'missing') 입력 크기가 다르면(metric 'items')
+    비교할 수 없으므로 그 자체를 회귀로 보고한다. 현재 결과가 --only로 일부만 실행했으면
+    선택된 벤치마크만 확인한다. 기준에 없는 새 벤치마크는 무시.
+
+    Returns:
+        [{'name', 'metric', 'baseline', 'current', 'change'}, ...] (change는 비율, 나쁜 방향이 양수,
+        missing/items는 None)
+    """
+    base_meta, current_meta = baseline.get('meta', {}), current.get('meta', {})
+    if base_meta.get('version') != current_meta.get('version'):
+        raise ValueError("Benchmark result versions differ; rerun the baseline")
+    differing = [key for key in COMPARABLE_META if base_meta.get(key) != current_meta.get(key)]
+    if differing:
+        details = ', '.join(f"{key} {base_meta.get(key)!r} → {current_meta.get(key)!r}" for key in differing)
+        raise ValueError(f"Benchmark inputs differ from the baseline ({details})")
+    memory_threshold = threshold if memory_threshold is None else memory_threshold
+    only = current.get('meta', {}).get('only') or []
+
+    regressions = []
+    for name, base in baseline['benchmarks'].items():
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        result = current['benchmarks'].get(name)
+        if result is None:
+            regressions.append({'name': name, 'metric': 'missing', 'baseline': base.get('items'),
+                                'current': None, 'change': None})
+            continue
+        if base.get('items') != result.get('items'):
+            regressions.append({'name': name, 'metric': 'items', 'baseline': base.get('items'),
+                                'current': result.get('items'), 'change': None})
+            continue
+        if base.get('throughput') and result.get('throughput'):
+            change = 1 - result['throughput'] / base['throughput']
+            if change > threshold:
+                regressions.append({'name': name, 'metric': 'throughput', 'baseline': base['throughput'],
+                                    'current': result['throughput'], 'change': round(change, 4)})
+        if base.get('peak_kb') and result.get('peak_kb') is not None:
+            change = result['peak_kb'] / base['peak_kb'] - 1
+            if change > memory_threshold:
+                regressions.append({'name': name, 'metric': 'peak_kb', 'baseline': base['peak_kb'],
+                                    'current': result['peak_kb'], 'change': round(change, 4)})
+    return regressions
+
+
+def save_result(result: Dict[str, Any], output_path: Path) -> None:
+    """결과 JSON 저장 (.tmp에 쓴 뒤 교체)"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='약제/용어 매칭 벤치마크 + 회귀 게이트')
+    parser.add_argument('--scale', type=float, default=1.0, help='합성 코퍼스 크기 배율 (기본값: 1.0)')
+    parser.add_argument('--repeat', type=int, default=3, help='시간 측정 반복 횟수 (기본값: 3, 최솟값 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 코퍼스 시드')
+    parser.add_argument('--only', action='append', default=None,
+                        help='이름 접두사 (예: refine, kcd; 여러 번 지정 가능)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='refine.process_all.parallel 프로세스 수 (기본값: 1 = 생략)')
+    parser.add_argument('--corpus', type=Path, default=None, help='실제 파싱 JSON 디렉토리 (본문 추출 벤치마크)')
+    parser.add_argument('--refine-input', type=Path, default=None, help='실제 정제기 입력 JSON/CSV')
+    parser.add_argument('--filters', type=Path, default=FILTERS_FILE, help='filters.yaml 파일')
+    parser.add_argument('--output', type=Path, default=None,
+                        help='결과 JSON (기본값: data/benchmarks/matching_<commit>.json)')
+    parser.add_argument('--baseline', type=Path, default=None, help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.10, help='처리량 감소 허용 비율 (기본값: 0.10)')
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help='최대 메모리 증가 허용 비율 (기본값: --threshold와 같음)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    print("=" * 80)
+    print(f"매칭 벤치마크 (scale {args.scale}, repeat {args.repeat})")
+    print("=" * 80)
+
+    try:
+        result = run_suite(args.scale, args.repeat, args.seed, args.only, args.workers,
+                           args.corpus, args.refine_input, args.filters)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    output_path = args.output or OUTPUT_DIR / f"matching_{result['meta']['commit'] or 'local'}.json"
+    save_result(result, output_path)
+    print(f"\n[OK] Saved: {output_path}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    try:
+        regressions = compare_results(baseline, result, args.threshold, args.memory_threshold)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    print(f"\n[Compare] baseline {baseline['meta'].get('commit')} → current {result['meta']['commit']}")
+    for name, current in result['benchmarks'].items():
+        base = baseline['benchmarks'].get(name)
+        if base and base.get('throughput') and current.get('throughput'):
+            print(f"  {name:32s} {current['throughput'] / base['throughput']:6.2f}x throughput")
+    if regressions:
+        print(f"\n[FAIL] {len(regressions)} regression(s):")
+        for item in regressions:
+            if item['metric'] == 'missing':
+                print(f"  - {item['name']}: missing from current run")
+            elif item['metric'] == 'items':
+                print(f"  - {item['name']} items: {item['baseline']} → {item['current']} (not comparable)")
+            else:
+                print(f"  - {item['name']} {item['metric']}: {item['baseline']} → {item['current']} "
+                      f"({item['change'] * 100:+.1f}%)")
+        return 1
+
+    print("\n[PASS] No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
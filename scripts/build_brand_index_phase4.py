@@ -2,13 +2,19 @@
 Phase 4: Brand Name Index Construction
 - Build brand name → ATC code mapping index
 - Support exact matching for HIRA document processing
+- Save a brand resolver snapshot (shared.brand_resolver) for exact + fuzzy lookup
 """
 
 import json
 import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.brand_resolver import BrandResolverBuilder
+
 
 def normalize_brand_name(name: str) -> str:
     """
@@ -171,11 +177,26 @@ def build_brand_index(classified_data: list) -> dict:
     }
 
 
+def build_brand_resolver(classified_data: list, resolver_dir: Path, source: Path = None) -> dict:
+    """
+    Save brand resolver snapshot (one interned record per ingredient)
+
+    Returns:
+        Snapshot meta (records, keys, postings, ...)
+    """
+    builder = BrandResolverBuilder()
+    for entry in classified_data:
+        variants = generate_brand_variants(entry.get('brand_name_primary', ''), entry.get('brand_names_raw', []))
+        builder.add(entry, [v for v in variants if v])
+    return builder.save(resolver_dir, source=source)
+
+
 def main():
     # File paths
     input_file = Path('C:/Jimin/scrape-hub/bridges/anticancer_master_classified.json')
     output_file = Path('C:/Jimin/scrape-hub/bridges/brand_index.json')
     output_stats = Path('C:/Jimin/scrape-hub/bridges/brand_index_stats.json')
+    output_resolver = output_file.parent / 'brand_resolver'
 
     print("=" * 60)
     print("Phase 4: Brand Name Index Construction")
@@ -239,6 +260,11 @@ def main():
 
     print(f"   [OK] Saved statistics: {output_stats.name}")
 
+    # Resolver snapshot (exact + fuzzy lookup for matching scripts)
+    resolver_meta = build_brand_resolver(data, output_resolver, source=input_file)
+    print(f"   [OK] Saved resolver snapshot: {output_resolver.name}/ "
+          f"({resolver_meta['records']} records, {resolver_meta['keys']} keys)")
+
     # Summary
     print("\n" + "=" * 60)
     print("[SUCCESS] Phase 4 COMPLETE")
@@ -250,6 +276,7 @@ def main():
     print(f"  * Brand variants: {total_variants}")
     print(f"\nOutput: {output_file}")
     print(f"Statistics: {output_stats}")
+    print(f"Resolver: {output_resolver}")
     print(f"\n[READY] Anticancer dictionary complete (Phases 1-4)")
     print(f"Next: Import to Neo4j")
 
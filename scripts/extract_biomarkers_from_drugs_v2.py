@@ -5,10 +5,12 @@ v1.0과의 차이점:
 - v1.0: 항암제 데이터만 사용 (17개 바이오마커)
 - v2.0: 항암제 + HINS 검사 데이터 통합 (24개 바이오마커)
 - HINS에서 발견된 KRAS, FLT3, IDH1/2, BRCA1/2, NTRK1 추가
+
+키워드 검색은 shared.biomarker_extractor (트라이 정규식 1회 탐색, 일치 위치 반환)
 """
 
 import json
-import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
@@ -16,6 +18,10 @@ from datetime import datetime
 
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.biomarker_extractor import BiomarkerKeywordExtractor, snippet
+
 BRIDGES_DIR = PROJECT_ROOT / "bridges"
 DATA_DIR = PROJECT_ROOT / "data" / "hins" / "parsed"
 
@@ -245,11 +251,22 @@ BIOMARKER_PATTERNS = {
 # 비타민 등 제외 키워드
 EXCLUDE_KEYWORDS = ['비타민', 'VITAMIN', 'GALK1', 'PROS1']
 
+# 바이오마커를 찾을 항암제 필드
+DRUG_TEXT_FIELDS = ('mechanism_of_action', 'atc_level3_name')
+
 
 class BiomarkerExtractorV2:
     """바이오마커 추출기 v2.0 (HINS 통합)"""
 
-    def __init__(self):
+    def __init__(self, workers=None):
+        """
+        Args:
+            workers: 키워드 추출 프로세스 수 (기본값: CPU 코어 수, 1이면 순차 처리)
+        """
+        self.workers = workers
+        self.extractor = BiomarkerKeywordExtractor(
+            {name: info['keywords'] for name, info in BIOMARKER_PATTERNS.items()}
+        )
         self.drugs = []
         self.hins_tests = []
         self.biomarkers = {}
@@ -299,47 +316,39 @@ class BiomarkerExtractorV2:
 
     def extract_biomarkers_from_text(self, text):
         """텍스트에서 바이오마커 추출"""
-        if not text:
-            return []
-
-        text_upper = text.upper()
-        found_biomarkers = []
-
-        for biomarker_name, info in BIOMARKER_PATTERNS.items():
-            for keyword in info['keywords']:
-                if keyword.upper() in text_upper:
-                    found_biomarkers.append(biomarker_name)
-                    break
-
-        return found_biomarkers
+        return self.extractor.biomarkers(text)
 
     def process_drugs(self):
         """항암제에서 바이오마커 추출"""
         print("\n[INFO] 항암제 데이터에서 바이오마커 추출 중...")
 
-        for drug in self.drugs:
-            drug_biomarkers = set()
-
-            # mechanism_of_action에서 추출
-            moa = drug.get('mechanism_of_action', '')
-            if moa:
-                found = self.extract_biomarkers_from_text(moa)
-                drug_biomarkers.update(found)
-
-            # ATC Level 3에서 추출
-            atc_level3_name = drug.get('atc_level3_name', '')
-            if atc_level3_name:
-                found = self.extract_biomarkers_from_text(atc_level3_name)
-                drug_biomarkers.update(found)
+        # mechanism_of_action, ATC Level 3 텍스트 전체를 한 번에 추출 (항암제 순서 × 필드 순서)
+        texts = [drug.get(field) or '' for drug in self.drugs for field in DRUG_TEXT_FIELDS]
+        spans_per_text = self.extractor.extract_batch(texts, workers=self.workers)
+
+        for drug_index, drug in enumerate(self.drugs):
+            # 바이오마커 → 근거 (필드, 일치 키워드, 주변 문장)
+            evidence = defaultdict(list)
+            for field_index, field in enumerate(DRUG_TEXT_FIELDS):
+                position = drug_index * len(DRUG_TEXT_FIELDS) + field_index
+                text = texts[position]
+                for biomarker_name, start, end in spans_per_text[position]:
+                    evidence[biomarker_name].append({
+                        'field': field,
+                        'keyword': text[start:end],
+                        'span': [start, end],
+                        'snippet': snippet(text, start, end)
+                    })
 
             # 바이오마커 발견 시 매핑 저장
-            for biomarker_name in drug_biomarkers:
+            for biomarker_name, drug_evidence in evidence.items():
                 self.drug_biomarker_map[biomarker_name].append({
                     'atc_code': drug['atc_code'],
                     'ingredient_ko': drug['ingredient_ko'],
                     'ingredient_en': drug.get('ingredient_base_en', ''),
                     'mechanism_of_action': drug.get('mechanism_of_action', ''),
-                    'therapeutic_category': drug.get('therapeutic_category', '')
+                    'therapeutic_category': drug.get('therapeutic_category', ''),
+                    'evidence': drug_evidence
                 })
 
         print(f"[OK] {len(self.drug_biomarker_map)}개 바이오마커 발견 (항암제)")
@@ -517,5 +526,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -8,154 +8,268 @@
   2. 엑셀 659개 승인 요법
   3. (향후) 공고/FAQ 게시글
 
-출력: CSV with columns: surface, src, page, span_start, span_end, context
+처리 방식:
+  - 영문/한글 접미사 패턴 22개를 정규식 하나(CandidateScanner)로 합쳐 본문을 한 번만 훑음
+    (괄호쌍 패턴은 단어 경계를 넘는 구조라 별도 1회)
+  - JSON 파일은 프로세스 풀에서 파일 단위로 처리, 결과는 파일 순서대로 받아 합침
+  - 괄호쌍(en-ko) 집계는 후보를 만들 때 문맥에서 바로 뽑아 두고 합칠 때 Counter로 더함
+    (save_json에서 문맥 전체를 다시 훑지 않음)
+  - 후보/순서/집계 결과는 패턴별로 따로 훑던 기존 방식과 같음
+
+출력: out/candidates/drug_candidates.json (en-ko 쌍)
 """
+import argparse
 import json
-import csv
+import os
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
-from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
 import pandas as pd
 
 
+# 약제 접미사 (영문: 단어 끝, 대소문자 무시)
+EN_SUFFIXES = [
+    'mab',        # 단클론항체
+    'nib',        # 키나제 억제제
+    'tinib',      # 키나제 억제제 (특정)
+    'platin',     # 백금계
+    'taxel',      # 탁산계
+    'rubicin',    # 안트라사이클린
+    'mustine',    # 알킬화제
+    'parib',      # PARP 억제제
+    'ciclib',     # CDK4/6 억제제
+    'tecan',      # 토포이소머라제 억제제
+    'navir',      # 프로테아제 억제제
+    'tidine',     # 뉴클레오시드 유사체
+]
+
+# 약제 접미사 (한글: 한글 연속 구간 안)
+KO_SUFFIXES = ['맙', '니브', '티닙', '플라틴', '탁셀', '루비신', '머스틴', '파립', '시클립', '테칸']
+
+# 괄호쌍 패턴: 한글명 (영문명) or 영문명 (한글명)
+PAIR_PATTERN = re.compile(
+    r'([가-힣][가-힣\s]+)\s*\(([A-Za-z][A-Za-z\s\-]+)\)|([A-Za-z][A-Za-z\s\-]+)\s*\(([가-힣][가-힣\s]+)\)'
+)
+
+# 한글 금칙어 (약제명이 아닌 것들)
+FORBIDDEN_KO = {
+    '비급여', '급여', '기타', '병용', '단독', '승인', '허가', '인정', '불인정',
+    '제외', '포함', '이상', '이하', '미만', '초과', '경과', '조치', '공고',
+    '항목', '대상', '요법', '방법', '치료', '투여', '용량', '용법', '시행',
+    '적응증', '금기', '주의', '경고', '부작용', '이상반응', '효능', '효과'
+}
+
+# JSON 후보 문맥 폭 (±글자)
+CONTEXT_WIDTH = 40
+
+# 프로세스 풀 워커에 한 번에 넘기는 파일 수
+FILES_PER_TASK = 8
+
+_HANGUL_RUN = re.compile(r'[가-힣]+')
+
+# (단계, 정렬 키1, 정렬 키2, 시작, 끝, surface, lang)
+# 단계 0=영문 패턴, 1=한글 패턴, 2=괄호쌍 / 정렬 키는 기존 패턴별 루프의 방문 순서
+Hit = Tuple[int, int, int, int, int, str, str]
+
+
+class CandidateScanner:
+    """
+    접미사 패턴 전체를 합친 스캐너
+
+    기존 패턴별 finditer와 같은 일치를 한 번의 탐색으로 얻는다.
+    - 영문 r'\\w+{접미사}\\b': 일치는 항상 \\w 연속 구간 전체 → 구간이 접미사로 끝나면 일치
+      (패턴 번호는 구간 끝에 맞는 접미사 중 가장 앞 번호 = 기존 루프에서 처음 나오는 패턴)
+    - 한글 r'[가-힣]+{접미사}': 한글 구간마다 최대 1개, 구간 시작 ~ 마지막 접미사 끝
+      (rfind 위치가 1 이상일 때) → 접미사를 포함한 한글 구간만 찾은 뒤 접미사별로 잘라냄
+    - 두 패턴 모두 구간 시작에서만 시도 (뒷보기로 구간 중간 위치는 바로 건너뜀)
+    """
+
+    def __init__(self, en_suffixes: List[str] = EN_SUFFIXES, ko_suffixes: List[str] = KO_SUFFIXES):
+        self.en_suffixes = en_suffixes
+        self.ko_suffixes = ko_suffixes
+        en = '|'.join(map(re.escape, sorted(en_suffixes, key=len, reverse=True)))
+        ko = '|'.join(map(re.escape, sorted(ko_suffixes, key=len, reverse=True)))
+        self.pattern = re.compile(
+            rf'(?<!\w)\w+(?P<en>{en})\b|(?<![가-힣])(?P<ko>[가-힣]*?(?:{ko})[가-힣]*)', re.IGNORECASE
+        )
+        # 일치한 접미사(단어 끝에 맞는 가장 짧은 것) → 그 접미사로 끝나는 (패턴 번호, 접미사)
+        self._en_longer = {suffix: [(i, other) for i, other in enumerate(en_suffixes) if other.endswith(suffix)]
+                           for suffix in en_suffixes}
+        self._ko_cache: Dict[str, List[Tuple[int, int]]] = {}
+
+    def _ko_hits(self, run: str, offset: int, hits: List[Hit]) -> None:
+        """한글 구간 1개 → 접미사별 일치 (같은 구간은 캐시)"""
+        cuts = self._ko_cache.get(run)
+        if cuts is None:
+            cuts = []
+            for idx, suffix in enumerate(self.ko_suffixes):
+                j = run.rfind(suffix)
+                if j >= 1:
+                    cuts.append((idx, j + len(suffix)))
+            self._ko_cache[run] = cuts
+        for idx, end in cuts:
+            hits.append((1, idx, offset, offset, offset + end, run[:end], 'ko'))
+
+    def scan(self, text: str) -> List[Hit]:
+        """텍스트 → 영문/한글 패턴 일치 + 괄호쌍 (정렬 안 함, 앞 세 값이 기존 방문 순서)"""
+        hits: List[Hit] = []
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            surface = match.group()
+            if match.lastgroup == 'en':
+                lower = surface.lower()
+                idx = min(i for i, suffix in self._en_longer[match.group('en').lower()]
+                          if lower.endswith(suffix) and len(surface) > len(suffix))
+                hits.append((0, idx, start, start, match.end(), surface, 'en'))
+                # 영문 일치가 삼킨 \w 구간 안의 한글 구간
+                if not surface.isascii():
+                    for run in _HANGUL_RUN.finditer(surface):
+                        self._ko_hits(run.group(), start + run.start(), hits)
+            else:
+                self._ko_hits(surface, start, hits)
+
+        for match in PAIR_PATTERN.finditer(text):
+            # 그룹1,2: 한글(영문) / 그룹3,4: 영문(한글)
+            if match.group(1) and match.group(2):
+                ko_name, en_name = match.group(1).strip(), match.group(2).strip()
+            elif match.group(3) and match.group(4):
+                en_name, ko_name = match.group(3).strip(), match.group(4).strip()
+            else:
+                continue
+            hits.append((2, match.start(), 0, match.start(), match.end(), en_name, 'en'))
+            hits.append((2, match.start(), 1, match.start(), match.end(), ko_name, 'ko'))
+        return hits
+
+
+def context_pairs(context: str) -> List[Tuple[str, str]]:
+    """문맥 → (영문 소문자, 한글) 괄호쌍 (금칙어/짧은 영문 제외)"""
+    pairs = []
+    for match in PAIR_PATTERN.finditer(context):
+        if match.group(1) and match.group(2):
+            ko, en = match.group(1).strip(), match.group(2).strip().lower()
+        elif match.group(3) and match.group(4):
+            en, ko = match.group(3).strip().lower(), match.group(4).strip()
+        else:
+            continue
+        # 한글 금칙어 필터, 영문이 너무 짧으면 제외 (약어 제외)
+        if ko in FORBIDDEN_KO or len(en) < 4:
+            continue
+        pairs.append((en, ko))
+    return pairs
+
+
+def harvest_text(scanner: CandidateScanner, text: str, src: str,
+                 fixed_context: Optional[str] = None) -> List[Tuple[Dict[str, Any], List[Tuple[str, str]]]]:
+    """
+    텍스트 1개 → 텍스트 안에서 처음 나온 후보 (surface 소문자 기준) + 문맥 괄호쌍
+
+    Args:
+        src: 출처 (괄호쌍 후보는 ':pair' 추가)
+        fixed_context: 모든 후보에 쓸 문맥 (없으면 일치 위치 ±CONTEXT_WIDTH)
+    """
+    # surface별 기존 방문 순서상 첫 일치만 남긴 뒤 그 순서로 정렬
+    first: Dict[str, Hit] = {}
+    for hit in scanner.scan(text):
+        key = hit[5].lower()
+        best = first.get(key)
+        if best is None or hit[:3] < best[:3]:
+            first[key] = hit
+
+    results = []
+    for phase, _, _, start, end, surface, lang in sorted(first.values(), key=lambda hit: hit[:3]):
+        if fixed_context is None:
+            context = text[max(0, start - CONTEXT_WIDTH):min(len(text), end + CONTEXT_WIDTH)]
+            context = context.replace('\n', ' ').strip()
+        else:
+            context = fixed_context
+        candidate = {
+            'surface': surface,
+            'lang': lang,
+            'src': f'{src}:pair' if phase == 2 else src,
+            'page': None,
+            'span_start': start,
+            'span_end': end,
+            'context': context
+        }
+        results.append((candidate, context_pairs(context) if context else []))
+    return results
+
+
+_SCANNER = CandidateScanner()
+
+
+def _harvest_json(json_path: str) -> List[Tuple[Dict[str, Any], List[Tuple[str, str]]]]:
+    """공고책자 JSON 1개 채굴 (프로세스 풀 워커)"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    content = data.get('content', '')
+    metadata = data.get('metadata', {})
+    source_file = Path(metadata.get('source_file', 'unknown')).stem
+    return harvest_text(_SCANNER, content, f'json:{source_file}')
+
+
 class DrugCandidateHarvester:
     """약제 후보 채굴기"""
 
     def __init__(self):
-        # 약제 접미사 패턴
-        self.en_patterns = [
-            r'\w+mab\b',        # 단클론항체
-            r'\w+nib\b',        # 키나제 억제제
-            r'\w+tinib\b',      # 키나제 억제제 (특정)
-            r'\w+platin\b',     # 백금계
-            r'\w+taxel\b',      # 탁산계
-            r'\w+rubicin\b',    # 안트라사이클린
-            r'\w+mustine\b',    # 알킬화제
-            r'\w+parib\b',      # PARP 억제제
-            r'\w+ciclib\b',     # CDK4/6 억제제
-            r'\w+tecan\b',      # 토포이소머라제 억제제
-            r'\w+navir\b',      # 프로테아제 억제제
-            r'\w+tidine\b',     # 뉴클레오시드 유사체
-        ]
-
-        self.ko_patterns = [
-            r'[가-힣]+맙',
-            r'[가-힣]+니브',
-            r'[가-힣]+티닙',
-            r'[가-힣]+플라틴',
-            r'[가-힣]+탁셀',
-            r'[가-힣]+루비신',
-            r'[가-힣]+머스틴',
-            r'[가-힣]+파립',
-            r'[가-힣]+시클립',
-            r'[가-힣]+테칸',
-        ]
-
-        # 괄호쌍 패턴: 한글명 (영문명) or 영문명 (한글명)
-        self.pair_pattern = r'([가-힣][가-힣\s]+)\s*\(([A-Za-z][A-Za-z\s\-]+)\)|([A-Za-z][A-Za-z\s\-]+)\s*\(([가-힣][가-힣\s]+)\)'
+        self.scanner = _SCANNER
 
         self.candidates = []  # List[Dict]
         self.seen = set()  # 중복 제거용
+        self.pair_counts = Counter()  # (en, ko) -> 후보 문맥 등장 수
+
+    def _merge(self, results: Iterable[Tuple[Dict[str, Any], List[Tuple[str, str]]]]) -> None:
+        """파일/행 결과 합치기 (전체에서 처음 나온 surface만 후보로, 그 문맥의 괄호쌍 집계)"""
+        for candidate, pairs in results:
+            key = candidate['surface'].lower()
+            if key not in self.seen:
+                self.seen.add(key)
+                self.candidates.append(candidate)
+                self.pair_counts.update(pairs)
 
     def extract_from_json(self, json_path: Path, verbose: bool = False):
         """공고책자 JSON에서 추출"""
         if verbose:
             print(f"Processing JSON: {json_path.name}")
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        content = data.get('content', '')
-        metadata = data.get('metadata', {})
-        source_file = Path(metadata.get('source_file', 'unknown')).stem
-
-        # 영문 패턴 추출
-        for pattern in self.en_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                surface = match.group(0)
-                start = match.start()
-                end = match.end()
-
-                # 컨텍스트 추출 (±40자)
-                ctx_start = max(0, start - 40)
-                ctx_end = min(len(content), end + 40)
-                context = content[ctx_start:ctx_end]
-
-                # 중복 제거 (surface 기준)
-                key = surface.lower()
-                if key not in self.seen:
-                    self.seen.add(key)
-                    self.candidates.append({
-                        'surface': surface,
-                        'lang': 'en',
-                        'src': f'json:{source_file}',
-                        'page': None,
-                        'span_start': start,
-                        'span_end': end,
-                        'context': context.replace('\n', ' ').strip()
-                    })
-
-        # 한글 패턴 추출
-        for pattern in self.ko_patterns:
-            for match in re.finditer(pattern, content):
-                surface = match.group(0)
-                start = match.start()
-                end = match.end()
-
-                ctx_start = max(0, start - 40)
-                ctx_end = min(len(content), end + 40)
-                context = content[ctx_start:ctx_end]
-
-                key = surface.lower()
-                if key not in self.seen:
-                    self.seen.add(key)
-                    self.candidates.append({
-                        'surface': surface,
-                        'lang': 'ko',
-                        'src': f'json:{source_file}',
-                        'page': None,
-                        'span_start': start,
-                        'span_end': end,
-                        'context': context.replace('\n', ' ').strip()
-                    })
-
-        # 괄호쌍 패턴 추출
-        for match in re.finditer(self.pair_pattern, content):
-            # 그룹1,2: 한글(영문) / 그룹3,4: 영문(한글)
-            if match.group(1) and match.group(2):
-                ko_name = match.group(1).strip()
-                en_name = match.group(2).strip()
-            elif match.group(3) and match.group(4):
-                en_name = match.group(3).strip()
-                ko_name = match.group(4).strip()
-            else:
-                continue
-
-            start = match.start()
-            end = match.end()
-            ctx_start = max(0, start - 40)
-            ctx_end = min(len(content), end + 40)
-            context = content[ctx_start:ctx_end]
-
-            # 한글, 영문 각각 추가
-            for surface, lang in [(en_name, 'en'), (ko_name, 'ko')]:
-                key = surface.lower()
-                if key not in self.seen:
-                    self.seen.add(key)
-                    self.candidates.append({
-                        'surface': surface,
-                        'lang': lang,
-                        'src': f'json:{source_file}:pair',
-                        'page': None,
-                        'span_start': start,
-                        'span_end': end,
-                        'context': context.replace('\n', ' ').strip()
-                    })
+        self._merge(_harvest_json(str(json_path)))
 
         if verbose:
             print(f"  Extracted: {len(self.candidates)} candidates so far")
 
+    def iter_json_results(self, json_paths: List[Path], workers: int) -> Iterator[list]:
+        """
+        JSON 파일별 결과를 파일 순서대로 반환
+
+        workers가 1이면 현재 프로세스에서 순차 처리
+        """
+        jobs = [str(path) for path in json_paths]
+        if workers <= 1 or len(jobs) <= 1:
+            yield from map(_harvest_json, jobs)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_harvest_json, jobs, chunksize=FILES_PER_TASK)
+
+    def extract_from_jsons(self, json_paths: List[Path], workers: Optional[int] = None,
+                           progress_every: int = 100):
+        """
+        JSON 파일 여러 개 병렬 추출 (결과는 파일 순서대로 합쳐 순차 처리와 같음)
+
+        Args:
+            workers: 프로세스 수 (기본값: CPU 코어 수, 1이면 순차 처리)
+        """
+        workers = workers or os.cpu_count() or 1
+        for idx, results in enumerate(self.iter_json_results(json_paths, workers), 1):
+            self._merge(results)
+            if progress_every and idx % progress_every == 0:
+                print(f"  Progress: {idx}/{len(json_paths)} files, {len(self.candidates)} candidates so far")
+
     def extract_from_excel(self, excel_path: Path):
         """엑셀 659개 요법에서 추출"""
         print(f"\n[2/3] Processing Excel: {excel_path.name}")
@@ -185,64 +299,8 @@ class DrugCandidateHarvester:
             if not text or text == 'nan':
                 continue
 
-            # 영문 패턴
-            for pattern in self.en_patterns:
-                for match in re.finditer(pattern, text, re.IGNORECASE):
-                    surface = match.group(0)
-                    key = surface.lower()
-                    if key not in self.seen:
-                        self.seen.add(key)
-                        self.candidates.append({
-                            'surface': surface,
-                            'lang': 'en',
-                            'src': f'excel:row{idx}',
-                            'page': None,
-                            'span_start': match.start(),
-                            'span_end': match.end(),
-                            'context': text[:100]  # 텍스트 전체가 짧으므로 100자만
-                        })
-
-            # 한글 패턴
-            for pattern in self.ko_patterns:
-                for match in re.finditer(pattern, text):
-                    surface = match.group(0)
-                    key = surface.lower()
-                    if key not in self.seen:
-                        self.seen.add(key)
-                        self.candidates.append({
-                            'surface': surface,
-                            'lang': 'ko',
-                            'src': f'excel:row{idx}',
-                            'page': None,
-                            'span_start': match.start(),
-                            'span_end': match.end(),
-                            'context': text[:100]
-                        })
-
-            # 괄호쌍
-            for match in re.finditer(self.pair_pattern, text):
-                if match.group(1) and match.group(2):
-                    ko_name = match.group(1).strip()
-                    en_name = match.group(2).strip()
-                elif match.group(3) and match.group(4):
-                    en_name = match.group(3).strip()
-                    ko_name = match.group(4).strip()
-                else:
-                    continue
-
-                for surface, lang in [(en_name, 'en'), (ko_name, 'ko')]:
-                    key = surface.lower()
-                    if key not in self.seen:
-                        self.seen.add(key)
-                        self.candidates.append({
-                            'surface': surface,
-                            'lang': lang,
-                            'src': f'excel:row{idx}:pair',
-                            'page': None,
-                            'span_start': match.start(),
-                            'span_end': match.end(),
-                            'context': text[:100]
-                        })
+            # 텍스트 전체가 짧으므로 문맥은 100자만
+            self._merge(harvest_text(self.scanner, text, f'excel:row{idx}', fixed_context=text[:100]))
 
         print(f"  Total candidates now: {len(self.candidates)}")
 
@@ -250,43 +308,8 @@ class DrugCandidateHarvester:
         """JSON으로 저장 (en-ko 쌍)"""
         print(f"\n[3/4] Building en-ko pairs from context")
 
-        # 한글 금칙어 (약제명이 아닌 것들)
-        FORBIDDEN_KO = {
-            '비급여', '급여', '기타', '병용', '단독', '승인', '허가', '인정', '불인정',
-            '제외', '포함', '이상', '이하', '미만', '초과', '경과', '조치', '공고',
-            '항목', '대상', '요법', '방법', '치료', '투여', '용량', '용법', '시행',
-            '적응증', '금기', '주의', '경고', '부작용', '이상반응', '효능', '효과'
-        }
-
-        # Context에서 괄호쌍 추출
-        pairs = {}  # (en, ko) -> count
-
-        for candidate in self.candidates:
-            context = candidate.get('context', '')
-            if not context:
-                continue
-
-            # 괄호쌍 추출
-            for match in re.finditer(self.pair_pattern, context):
-                if match.group(1) and match.group(2):
-                    ko = match.group(1).strip()
-                    en = match.group(2).strip().lower()
-                elif match.group(3) and match.group(4):
-                    en = match.group(3).strip().lower()
-                    ko = match.group(4).strip()
-                else:
-                    continue
-
-                # 한글 금칙어 필터
-                if ko in FORBIDDEN_KO:
-                    continue
-
-                # 영문이 너무 짧으면 제외 (약어 제외)
-                if len(en) < 4:
-                    continue
-
-                key = (en, ko)
-                pairs[key] = pairs.get(key, 0) + 1
+        # 후보를 합칠 때 문맥에서 뽑아 둔 괄호쌍 집계
+        pairs = self.pair_counts
 
         print(f"  Extracted {len(pairs)} en-ko pairs")
 
@@ -320,6 +343,12 @@ class DrugCandidateHarvester:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='약제 후보 대량 채굴')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본값: CPU 코어 수, 1이면 순차 처리)')
+    parser.add_argument('--parsed-dir', action='append', default=None,
+                        help='추가로 채굴할 파싱 JSON 디렉토리 (content/metadata 형식, 여러 번 지정 가능)')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("약제 후보 대량 채굴 (Drug Candidate Harvester) - FULL MODE")
     print("=" * 80)
@@ -332,25 +361,23 @@ def main():
         "data/hira_cancer/parsed/faq",
         "data/hira_cancer/parsed/pre_announcement",
         "data/hira_cancer/parsed/chemotherapy"
-    ]
+    ] + (args.parsed_dir or [])
 
-    total_files = 0
+    json_files = []
     for dir_path in parsed_dirs:
         dir_obj = Path(dir_path)
         if not dir_obj.exists():
             print(f"[WARNING] Directory not found: {dir_path}")
             continue
 
-        json_files = list(dir_obj.glob("**/*.json"))
-        print(f"\n[Processing] {dir_path}: {len(json_files)} files")
+        dir_files = list(dir_obj.glob("**/*.json"))
+        print(f"\n[Processing] {dir_path}: {len(dir_files)} files")
+        json_files.extend(dir_files)
 
-        for idx, json_path in enumerate(json_files, 1):
-            if idx % 100 == 0:
-                print(f"  Progress: {idx}/{len(json_files)} files, {len(harvester.candidates)} candidates so far")
-            harvester.extract_from_json(json_path, verbose=False)
-            total_files += 1
+    # 디렉토리 구분 없이 한 풀에서 처리 (결과는 디렉토리/파일 순서대로 합침)
+    harvester.extract_from_jsons(json_files, workers=args.workers)
 
-    print(f"\n[Summary] Processed {total_files} JSON files")
+    print(f"\n[Summary] Processed {len(json_files)} JSON files")
 
     # 2. 엑셀
     excel_path = Path("data/hira_cancer/raw/attachments/chemotherapy/사전신청요법(용법용량 포함)및 불승인요법_250915.xlsx")
@@ -372,5 +399,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
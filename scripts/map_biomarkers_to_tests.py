@@ -6,6 +6,7 @@ Phase 1에서 추출한 바이오마커와 Phase 2에서 파싱한 HINS 검사
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
@@ -13,6 +14,9 @@ from collections import defaultdict
 
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.biomarker_matcher import BiomarkerTestIndex, normalize_biomarker_name
 BRIDGES_DIR = PROJECT_ROOT / "bridges"
 DATA_DIR = PROJECT_ROOT / "data" / "hins" / "parsed"
 
@@ -48,60 +52,17 @@ class BiomarkerTestMapper:
         print(f"[OK] 검사: {len(self.tests)}개")
 
     def normalize_biomarker_name(self, name):
-        """바이오마커명 정규화"""
-        if not name:
-            return None
-
-        # 대문자 변환
-        name = name.upper()
-
-        # 공통 변형 처리
-        normalization_map = {
-            'HER-2': 'HER2',
-            'K-RAS': 'KRAS',
-            'B-RAF': 'BRAF',
-            'ROS-1': 'ROS1',
-            'PD-1': 'PD1',
-            'PD-L1': 'PDL1',
-            'CTLA-4': 'CTLA4',
-            'C-MET': 'MET',
-        }
-
-        for old, new in normalization_map.items():
-            if old in name:
-                name = name.replace(old, new)
-
-        return name.strip()
+        """바이오마커명 정규화 (shared.biomarker_matcher)"""
+        return normalize_biomarker_name(name)
 
     def match_biomarker_to_test(self, biomarker, test):
-        """바이오마커와 검사 매칭"""
-        biomarker_name_en = self.normalize_biomarker_name(biomarker['biomarker_name_en'])
-        test_biomarker_name = self.normalize_biomarker_name(test['biomarker_name'])
-
-        # 직접 매칭
-        if biomarker_name_en == test_biomarker_name:
+        """바이오마커와 검사 1쌍 매칭 (단건 확인용, 전체 매핑은 create_mappings의 색인 사용)"""
+        index = BiomarkerTestIndex([test['biomarker_name']])
+        for _, match_type, confidence in index.match(biomarker['biomarker_name_en']):
             return {
-                'match_type': 'exact_match',
-                'confidence': 0.95
+                'match_type': match_type,
+                'confidence': confidence
             }
-
-        # 부분 매칭 (BCR-ABL 같은 경우)
-        if biomarker_name_en and test_biomarker_name:
-            if biomarker_name_en in test_biomarker_name or test_biomarker_name in biomarker_name_en:
-                return {
-                    'match_type': 'partial_match',
-                    'confidence': 0.85
-                }
-
-        # CDK4/6 같은 복합 바이오마커
-        if '/' in biomarker_name_en:
-            parts = biomarker_name_en.split('/')
-            if any(part in test_biomarker_name for part in parts):
-                return {
-                    'match_type': 'composite_match',
-                    'confidence': 0.80
-                }
-
         return None
 
     def create_mappings(self):
@@ -110,26 +71,27 @@ class BiomarkerTestMapper:
 
         mapping_id = 1
 
+        # 검사 바이오마커명은 한 번만 정규화/색인
+        index = BiomarkerTestIndex(test['biomarker_name'] for test in self.tests)
+
         for biomarker in self.biomarkers:
             biomarker_id = biomarker['biomarker_id']
             biomarker_name = biomarker['biomarker_name_en']
 
             matched_tests = []
 
-            for test in self.tests:
-                match_result = self.match_biomarker_to_test(biomarker, test)
-
-                if match_result:
-                    matched_tests.append({
-                        'test_id': test['test_id'],
-                        'edi_code': test['edi_code'],
-                        'test_name_ko': test['test_name_ko'],
-                        'test_category': test['test_category'],
-                        'match_type': match_result['match_type'],
-                        'confidence': match_result['confidence']
-                    })
+            for position, match_type, confidence in index.match(biomarker_name):
+                test = self.tests[position]
+                matched_tests.append({
+                    'test_id': test['test_id'],
+                    'edi_code': test['edi_code'],
+                    'test_name_ko': test['test_name_ko'],
+                    'test_category': test['test_category'],
+                    'match_type': match_type,
+                    'confidence': confidence
+                })
 
-                    self.stats[match_result['match_type']] += 1
+                self.stats[match_type] += 1
 
             if matched_tests:
                 mapping_entry = {
@@ -247,5 +209,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -14,11 +14,22 @@ import re
 import argparse
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field, asdict
+import os
+import sys
 import unicodedata
 from difflib import SequenceMatcher
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.brand_resolver import BrandResolver
+from shared.hangul_phonetic import PhoneticIndex, romanize
+
+# 병렬 처리 시 작업 하나에 넣는 항목 수
+ENTRIES_PER_TASK = 500
 
 # =============================================================================
 # 데이터 클래스
@@ -57,7 +68,8 @@ class GateChainStats:
 class DrugAnchorRefiner:
     """약제 앵커 정제기"""
 
-    def __init__(self, filters_path: str, brand_alias_path: Optional[str] = None, curated_pairs_path: Optional[str] = None):
+    def __init__(self, filters_path: str, brand_alias_path: Optional[str] = None, curated_pairs_path: Optional[str] = None,
+                 brand_resolver_dir: Optional[str] = None):
         """
         초기화
 
@@ -65,6 +77,7 @@ class DrugAnchorRefiner:
             filters_path: filters.yaml 파일 경로
             brand_alias_path: brand_alias.yaml 파일 경로 (선택)
             curated_pairs_path: curated pairs JSON 파일 경로 (선택)
+            brand_resolver_dir: 브랜드 해소기 스냅샷 디렉토리 (선택, build_brand_index_phase4.py 출력)
         """
         self.logger = logging.getLogger(__name__)
 
@@ -82,6 +95,12 @@ class DrugAnchorRefiner:
                 self.ingredient_to_brands = brand_data.get('ingredient_to_brands', {})
             self.logger.info(f"Loaded {len(self.brand_to_ingredient)} brand mappings")
 
+        # 브랜드 해소기 (brand_alias.yaml에 없는 브랜드명, 오타 포함)
+        self.brand_resolver = None
+        if brand_resolver_dir and (Path(brand_resolver_dir) / 'meta.json').exists():
+            self.brand_resolver = BrandResolver.open(brand_resolver_dir)
+            self.logger.info(f"Loaded brand resolver ({len(self.brand_resolver)} keys)")
+
         # 큐레이션 화이트리스트 로드 (나중에 normalize_text 사용 필요)
         self.curated_pairs_raw = []  # 원본 데이터 임시 저장
         if curated_pairs_path and Path(curated_pairs_path).exists():
@@ -129,6 +148,9 @@ class DrugAnchorRefiner:
         # 충돌 추적
         self.ko_to_en_map: Dict[str, List[str]] = defaultdict(list)
 
+        # 음성 키 색인 (suggest_english에서 처음 쓸 때 구축)
+        self.phonetic_index: Optional[PhoneticIndex] = None
+
     # =========================================================================
     # 1. 정규화
     # =========================================================================
@@ -225,6 +247,19 @@ class DrugAnchorRefiner:
                 entry.en = ingredient
             entry.reason_codes.append("BRAND_RESOLVED_KO")
 
+        # 별칭 사전에 없으면 해소기로 조회 (브랜드 키만, 오타는 FUZZY 코드로 구분)
+        if self.brand_resolver and not any(code.startswith("BRAND_RESOLVED") for code in entry.reason_codes):
+            for name, lang in ((entry.en, 'EN'), (entry.ko, 'KO')):
+                resolved = self.brand_resolver.lookup(name) if name else None
+                if not resolved or resolved['match_type'] != 'brand' or not resolved['ingredient_base_en']:
+                    continue
+                ingredient = resolved['ingredient_base_en'].lower()
+                self.logger.info(f"Resolved brand: {name} → {ingredient} (distance {resolved['distance']})")
+                if lang == 'EN' or not entry.en or entry.en == entry.ko:
+                    entry.en = ingredient
+                entry.reason_codes.append(f"BRAND_{'FUZZY' if resolved['distance'] else 'RESOLVED'}_{lang}")
+                break
+
         return entry
 
     def has_context_signal(self, entry: DrugEntry) -> bool:
@@ -393,43 +428,44 @@ class DrugAnchorRefiner:
         """
         한글 → 로마자 변환 (간단한 음차)
 
+        음절 11,172개의 로마자를 미리 만든 표로 한 번에 변환 (shared.hangul_phonetic)
+
         Args:
             text: 한글 텍스트
 
         Returns:
             로마자 텍스트
         """
-        # 간단한 자모 분해 및 로마자 변환
-        # 실제로는 jamo, romanize 라이브러리 사용 권장
-        # 여기서는 단순화된 버전
-
-        # 초성, 중성, 종성 유니코드 오프셋
-        CHOSUNG_BASE = 0x1100
-        JUNGSUNG_BASE = 0x1161
-        JONGSUNG_BASE = 0x11A8
-        HANGUL_BASE = 0xAC00
-
-        CHOSUNG_LIST = ['g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj', 'ch', 'k', 't', 'p', 'h']
-        JUNGSUNG_LIST = ['a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo', 'u', 'weo', 'we', 'wi', 'yu', 'eu', 'ui', 'i']
-        JONGSUNG_LIST = ['', 'g', 'kk', 'gs', 'n', 'nj', 'nh', 'd', 'l', 'lg', 'lm', 'lb', 'ls', 'lt', 'lp', 'lh', 'm', 'b', 'bs', 's', 'ss', 'ng', 'j', 'ch', 'k', 't', 'p', 'h']
-
-        result = []
-        for char in text:
-            code = ord(char)
-            if 0xAC00 <= code <= 0xD7A3:  # 한글 음절
-                code -= HANGUL_BASE
-                cho = code // (21 * 28)
-                jung = (code % (21 * 28)) // 28
-                jong = code % 28
-
-                result.append(CHOSUNG_LIST[cho])
-                result.append(JUNGSUNG_LIST[jung])
-                if jong != 0:
-                    result.append(JONGSUNG_LIST[jong])
-            else:
-                result.append(char)
+        return romanize(text)
+
+    def build_phonetic_index(self) -> PhoneticIndex:
+        """
+        영문 성분명 음성 키 색인 구축 (큐레이션 쌍, 브랜드 별칭 성분명, 활성 항목)
+
+        Returns:
+            PhoneticIndex
+        """
+        names = [pair['en'].lower() for pair in self.curated_pairs_raw if pair.get('en')]
+        names.extend(str(ingredient).lower() for ingredient in self.brand_to_ingredient.values() if ingredient)
+        names.extend(entry.en for entry in self.active_drugs if entry.en)
+        self.phonetic_index = PhoneticIndex(names)
+        self.logger.info(f"Built phonetic index ({len(self.phonetic_index)} English names)")
+        return self.phonetic_index
+
+    def suggest_english(self, ko: str, limit: int = 3) -> List[Tuple[str, float]]:
+        """
+        한글 약제명 → 음차가 맞는 영문 성분명 후보 (사전 전체 비교 없이 음성 키 색인 조회)
 
-        return ''.join(result)
+        Args:
+            ko: 한글 약제명
+            limit: 최대 후보 수
+
+        Returns:
+            [(영문 성분명, 유사도), ...]
+        """
+        if self.phonetic_index is None:
+            self.build_phonetic_index()
+        return self.phonetic_index.candidates(ko, limit)
 
     def is_curated_pair(self, entry: DrugEntry) -> bool:
         """
@@ -547,6 +583,24 @@ class DrugAnchorRefiner:
         Returns:
             처리된 약제 항목
         """
+        entry, all_reasons = self.apply_local_gates(entry)
+        if all_reasons is None:
+            return entry
+        return self.apply_conflict_gate(entry, all_reasons)
+
+    def apply_local_gates(self, entry: DrugEntry) -> Tuple[DrugEntry, Optional[List[str]]]:
+        """
+        항목 하나만 보는 게이트 적용 (큐레이션, 브랜드 해소, 게이트 1~5)
+
+        ko_to_en_map을 건드리지 않으므로 항목별로 병렬 처리할 수 있다.
+
+        Args:
+            entry: 약제 항목
+
+        Returns:
+            (처리된 약제 항목, 누적 reason_codes)
+            결정이 끝났으면 reason_codes 자리는 None, 아니면 충돌 해소(apply_conflict_gate)로 넘긴다
+        """
         all_reasons = []
 
         # 최우선: 큐레이션 화이트리스트 체크 (모든 게이트 우회)
@@ -554,7 +608,7 @@ class DrugAnchorRefiner:
             self.logger.info(f"Curated pair - bypassing all gates: {entry.en} → {entry.ko}")
             entry.decision = "active"
             entry.reason_codes = ["PASS_ALL", "CURATED_WHITELIST"]
-            return entry
+            return entry, None
 
         # 전처리: 브랜드명 해소
         entry = self.resolve_brand_name(entry)
@@ -565,7 +619,7 @@ class DrugAnchorRefiner:
         if not pass_gate1:
             entry.decision = "drop"
             entry.reason_codes = all_reasons
-            return entry
+            return entry, None
 
         # 게이트 2: 라우팅 (레짐/바이오마커/질환은 조기 분류)
         is_routed, reasons2, route_target = self.check_routing(entry)
@@ -573,7 +627,7 @@ class DrugAnchorRefiner:
         if is_routed:
             entry.decision = f"route_{route_target}"
             entry.reason_codes = all_reasons
-            return entry
+            return entry, None
 
         # 게이트 3: 접미사 정합성
         pass_gate3, reasons3, strict_suffix_matched = self.check_suffix_consistency(entry)
@@ -581,7 +635,7 @@ class DrugAnchorRefiner:
         if not pass_gate3:
             entry.decision = "pending"
             entry.reason_codes = all_reasons
-            return entry
+            return entry, None
 
         # 게이트 4: 음차/철자 유사도
         # strict suffix가 매칭된 경우, 음차 검사 스킵
@@ -600,7 +654,7 @@ class DrugAnchorRefiner:
                 else:
                     entry.decision = "pending"
                     entry.reason_codes = all_reasons
-                    return entry
+                    return entry, None
 
         # 게이트 5: ATC 교차검증 (스킵)
         pass_gate5, reasons5 = self.check_atc_consistency(entry)
@@ -608,8 +662,23 @@ class DrugAnchorRefiner:
         if not pass_gate5:
             entry.decision = "pending"
             entry.reason_codes = all_reasons
-            return entry
+            return entry, None
+
+        return entry, all_reasons
+
+    def apply_conflict_gate(self, entry: DrugEntry, all_reasons: List[str]) -> DrugEntry:
+        """
+        게이트 6 (충돌 해소) 적용 후 최종 결정
+
+        ko_to_en_map에 먼저 등록된 쌍이 이기므로 입력 순서대로 호출해야 한다.
+
+        Args:
+            entry: apply_local_gates를 통과한 약제 항목
+            all_reasons: apply_local_gates의 누적 reason_codes
 
+        Returns:
+            처리된 약제 항목
+        """
         # 게이트 6: 충돌 해소
         pass_gate6, reasons6 = self.check_conflicts(entry)
         all_reasons.extend(reasons6)
@@ -721,21 +790,42 @@ class DrugAnchorRefiner:
             self.curated_pairs.add((en_norm, ko_norm))
         self.logger.info(f"Built {len(self.curated_pairs)} normalized curated pairs")
 
-    def process_all(self, entries: List[DrugEntry]) -> None:
+    def iter_local_gates(self, entries: List[DrugEntry],
+                         workers: int) -> Iterator[Tuple[DrugEntry, Optional[List[str]]]]:
+        """
+        apply_local_gates 결과를 입력 순서대로 생성 (ENTRIES_PER_TASK개씩 프로세스 풀에 분배)
+
+        workers가 1이거나 작업이 하나뿐이면 현재 프로세스에서 순차 처리
+        """
+        jobs = [entries[i:i + ENTRIES_PER_TASK] for i in range(0, len(entries), ENTRIES_PER_TASK)]
+        if workers <= 1 or len(jobs) <= 1:
+            for entry in entries:
+                yield self.apply_local_gates(entry)
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            for results in executor.map(_local_gates_chunk, jobs):
+                yield from results
+
+    def process_all(self, entries: List[DrugEntry], workers: Optional[int] = None) -> None:
         """
         모든 항목 처리
 
+        맵 단계: 항목별 게이트(금칙어, 라우팅, 접미사, 음차)를 프로세스 풀에서 병렬 적용
+        리듀스 단계: 입력 순서대로 충돌 해소 → 순차 처리와 같은 결과/통계
+
         Args:
             entries: 약제 항목 리스트
+            workers: 프로세스 수 (기본값: CPU 코어 수, 1이면 순차 처리)
         """
         # 큐레이션 화이트리스트 세트 구축 (정규화 적용)
         self._build_curated_pairs_set()
 
         progress_interval = self.filters['execution']['progress_interval']
+        workers = workers or os.cpu_count() or 1
 
-        for idx, entry in enumerate(entries, 1):
-            # 게이트 체인 적용
-            processed = self.apply_gate_chain(entry)
+        for idx, (entry, all_reasons) in enumerate(self.iter_local_gates(entries, workers), 1):
+            # 게이트 6 (충돌 해소)은 ko_to_en_map 순서가 결과를 정하므로 여기서 순차 적용
+            processed = entry if all_reasons is None else self.apply_conflict_gate(entry, all_reasons)
 
             # 결과 분류
             if processed.decision == "active":
@@ -878,6 +968,17 @@ class DrugAnchorRefiner:
             lines.append(f"- `{entry.en} → {entry.ko}` (count: {entry.count})\n")
         lines.append("\n")
 
+        # 음차 불일치 보류 항목 → 음성 키가 맞는 영문 성분명 후보
+        phonetic_fails = [entry for entry in self.pending_drugs if "PHONETIC_FAIL" in entry.reason_codes]
+        if phonetic_fails:
+            self.build_phonetic_index()
+            lines.append("### 음차 후보 제안 (PHONETIC_FAIL)\n")
+            for entry in phonetic_fails[:10]:
+                suggestions = [f"{en} ({score:.2f})" for en, score in self.suggest_english(entry.ko)
+                               if en != entry.en]
+                lines.append(f"- `{entry.en} → {entry.ko}`: {', '.join(suggestions) or '후보 없음'}\n")
+            lines.append("\n")
+
         # 수락 기준 검증
         lines.append("## ✅ 수락 기준 검증\n")
 
@@ -933,16 +1034,36 @@ class DrugAnchorRefiner:
 # 메인 함수
 # =============================================================================
 
+# =============================================================================
+# 병렬 처리 작업자
+# =============================================================================
+
+_worker_refiner: Optional[DrugAnchorRefiner] = None
+
+
+def _init_worker(refiner: DrugAnchorRefiner) -> None:
+    """작업자 프로세스마다 정제기 사본을 한 번만 받음"""
+    global _worker_refiner
+    _worker_refiner = refiner
+
+
+def _local_gates_chunk(entries: List[DrugEntry]) -> List[Tuple[DrugEntry, Optional[List[str]]]]:
+    """ProcessPoolExecutor 작업 단위: 항목 묶음에 apply_local_gates 적용"""
+    return [_worker_refiner.apply_local_gates(entry) for entry in entries]
+
+
 def main():
     parser = argparse.ArgumentParser(description='게이트 체인 기반 약제 매칭 정제')
     parser.add_argument('--input', required=True, help='입력 JSON 파일')
     parser.add_argument('--filters', required=True, help='filters.yaml 파일')
     parser.add_argument('--brand-alias', help='brand_alias.yaml 파일 (선택)')
     parser.add_argument('--curated-pairs', help='큐레이션 화이트리스트 JSON 파일 (선택)')
+    parser.add_argument('--brand-resolver', help='브랜드 해소기 스냅샷 디렉토리 (선택)')
     parser.add_argument('--out-drug', required=True, help='출력 drug.yaml 파일')
     parser.add_argument('--log', required=True, help='로그 JSONL 파일')
     parser.add_argument('--report', required=True, help='리포트 MD 파일')
     parser.add_argument('--dry-run', action='store_true', help='드라이런 모드 (200건만 처리)')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본값: CPU 코어 수, 1이면 순차 처리)')
 
     args = parser.parse_args()
 
@@ -953,14 +1074,14 @@ def main():
     )
 
     # 정제기 초기화
-    refiner = DrugAnchorRefiner(args.filters, args.brand_alias, args.curated_pairs)
+    refiner = DrugAnchorRefiner(args.filters, args.brand_alias, args.curated_pairs, args.brand_resolver)
 
     # 입력 로드
     dry_run_limit = 200 if args.dry_run else None
     entries = refiner.load_input(args.input, dry_run_limit)
 
     # 처리
-    refiner.process_all(entries)
+    refiner.process_all(entries, workers=args.workers)
 
     # 출력
     # drug.yaml (active + pending)
@@ -0,0 +1,151 @@
+"""
+텍스트 → 바이오마커 키워드 추출 (공용)
+
+extract_biomarkers_from_drugs_v2.py가 텍스트마다 바이오마커 × 키워드 전부를 `in`으로
+확인하던 것을, 키워드 전체를 트라이 정규식 하나로 컴파일해 텍스트를 한 번만 훑도록 바꾼다.
+비용은 (키워드 수 × 텍스트 길이)가 아니라 텍스트 길이에 비례한다.
+
+- 트라이 정규식: 각 위치에서 가장 긴 키워드 1개 (대소문자 무시, 원문 위치 그대로)
+- 같은 위치에서 시작하는 짧은 키워드(VEGF ⊂ VEGFR 등)는 접두어 표로 함께 반환
+- 다른 위치에서 시작하는 키워드(VEGFR 안의 EGFR 등)도 기존 `in` 검사처럼 모두 반환
+- 3글자 이하 영숫자 키워드(ALK, MET, MEK 등)는 앞이 영문자/숫자가 아니고 뒤가 영문자가 아닐 때만 일치
+  (GALK1 → ALK, METHOTREXATE → MET 같은 오탐 방지, MEK1/2 · ALK1 같은 숫자 접미는 허용)
+
+결과는 (바이오마커, 시작, 끝) 위치라 근거 문장(snippet)을 바로 잘라낼 수 있다.
+말뭉치 전체는 extract_batch()로 프로세스 풀에 나눠 처리한다.
+
+사용 예:
+    extractor = BiomarkerKeywordExtractor({'HER2': ['HER2', 'ERBB2'], 'ALK': ['ALK']})
+    for biomarker, start, end in extractor.extract(text):
+        print(biomarker, snippet(text, start, end))
+    spans_per_text = extractor.extract_batch(texts, workers=4)
+"""
+import os
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 경계 규칙을 적용할 짧은 키워드 최대 길이
+SHORT_TOKEN_MAX_LEN = 3
+
+# 프로세스 풀 워커 1개가 한 번에 처리할 텍스트 수
+CHUNK_SIZE = 2000
+
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits)
+_LETTERS = frozenset(string.ascii_letters)
+
+Span = Tuple[str, int, int]
+
+
+def needs_boundary(keyword: str) -> bool:
+    """짧은 영숫자 키워드(ALK, MET 등)는 단어 경계 필요"""
+    return len(keyword) <= SHORT_TOKEN_MAX_LEN and keyword.isascii() and keyword.isalnum()
+
+
+def _trie_regex(node: Dict[str, dict]) -> str:
+    """트라이 → 정규식 (탐욕적 선택이라 가장 긴 키워드가 먼저 일치)"""
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return '(?:' + body + ')?' if '' in node else body
+
+
+def snippet(text: str, start: int, end: int, width: int = 30) -> str:
+    """일치 위치 앞뒤 width 글자 (근거 문장)"""
+    return text[max(0, start - width):end + width].strip()
+
+
+class BiomarkerKeywordExtractor:
+    """바이오마커 키워드 다중 패턴 추출기 (트라이 정규식 + 접두어 표)"""
+
+    def __init__(self, keywords: Dict[str, Iterable[str]]):
+        """
+        Args:
+            keywords: 바이오마커 → 키워드 목록 (dict 순서 = 결과 순서)
+        """
+        self.biomarkers_order: List[str] = list(keywords)
+        owners: Dict[str, List[str]] = {}
+        for biomarker, words in keywords.items():
+            for word in words:
+                key = word.upper()
+                if key and biomarker not in owners.setdefault(key, []):
+                    owners[key].append(biomarker)
+
+        trie: Dict[str, dict] = {}
+        for key in owners:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        # 키워드 → 같은 위치에서 함께 일치하는 (길이, 바이오마커, 경계 필요) 목록 (자기 자신 포함)
+        self.prefixes: Dict[str, List[Tuple[int, str, bool]]] = {}
+        for key in owners:
+            entries = []
+            for length in range(len(key), 0, -1):
+                prefix = key[:length]
+                for biomarker in owners.get(prefix, []):
+                    entries.append((length, biomarker, needs_boundary(prefix)))
+            self.prefixes[key] = entries
+
+        # 전방 탐색으로 모든 위치에서 시도 (겹치는 일치도 놓치지 않음)
+        self.pattern = re.compile('(?=(' + _trie_regex(trie) + '))', re.IGNORECASE) if owners else None
+
+    def extract(self, text: Optional[str]) -> List[Span]:
+        """
+        텍스트 1개 → 일치 목록
+
+        Returns:
+            [(바이오마커, 시작, 끝), ...] (시작 위치 순, 같은 위치에서는 바이오마커마다 가장 긴 키워드 1개)
+        """
+        if not text or self.pattern is None:
+            return []
+
+        spans = []
+        size = len(text)
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            left_bounded = start == 0 or text[start - 1] not in _WORD_CHARS
+            seen = set()
+            for length, biomarker, boundary in self.prefixes[match.group(1).upper()]:
+                end = start + length
+                if biomarker in seen:
+                    continue
+                if boundary and not (left_bounded and (end == size or text[end] not in _LETTERS)):
+                    continue
+                seen.add(biomarker)
+                spans.append((biomarker, start, end))
+        return spans
+
+    def biomarkers(self, text: Optional[str]) -> List[str]:
+        """텍스트에 나오는 바이오마커 (키워드 사전 순서, 중복 없음)"""
+        found = {biomarker for biomarker, _, _ in self.extract(text)}
+        return [biomarker for biomarker in self.biomarkers_order if biomarker in found]
+
+    def extract_batch(self, texts: List[Optional[str]], workers: Optional[int] = None,
+                      chunk_size: int = CHUNK_SIZE) -> List[List[Span]]:
+        """
+        텍스트 목록 → 텍스트별 일치 목록 (입력 순서 유지)
+
+        workers가 1이거나 텍스트가 한 구간 이하이면 현재 프로세스에서 순차 처리
+
+        Args:
+            workers: 프로세스 수 (기본값: CPU 코어 수)
+            chunk_size: 워커 1회 처리 텍스트 수
+        """
+        workers = workers or os.cpu_count() or 1
+        jobs = [(self, texts[start:start + chunk_size]) for start in range(0, len(texts), chunk_size)]
+        if workers <= 1 or len(jobs) <= 1:
+            chunks = map(_extract_chunk, jobs)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = list(executor.map(_extract_chunk, jobs))
+        return [spans for chunk in chunks for spans in chunk]
+
+
+def _extract_chunk(args: Tuple[BiomarkerKeywordExtractor, List[Optional[str]]]) -> List[List[Span]]:
+    """텍스트 구간 추출 (프로세스 풀 워커)"""
+    extractor, texts = args
+    return [extractor.extract(text) for text in texts]
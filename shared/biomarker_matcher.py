@@ -0,0 +1,154 @@
+"""
+바이오마커 ↔ 검사 이름 매칭 색인 (공용)
+
+map_biomarkers_to_tests.py가 바이오마커 × 검사 모든 쌍마다 양쪽 이름을 다시 정규화하고
+부분 문자열 포함 여부를 확인하던 것을, 검사 쪽을 한 번 색인해 두고 후보만 확인하도록 바꾼다.
+
+- 정규화: 이름마다 한 번 (대문자 + HER-2 → HER2 등 표기 통일)
+- 정확 일치: 정규화 이름 → 검사 번호 해시
+- 바이오마커 ⊂ 검사명: 검사명 2-gram(1글자 질의는 1-gram) 역색인 교집합 → 포함 여부 확인
+- 검사명 ⊂ 바이오마커: 바이오마커 이름의 모든 부분 문자열을 정확 일치 해시에서 조회
+- 복합 바이오마커(CDK4/6): 토큰 확장(CDK4, CDK6) 후 각 토큰으로 포함 여부 조회
+
+일치 종류/신뢰도는 기존과 동일 (MATCH_CONFIDENCE, 검사마다 가장 높은 종류 하나).
+
+사용 예:
+    index = BiomarkerTestIndex([test['biomarker_name'] for test in tests])
+    for position, match_type, confidence in index.match('HER-2'):
+        print(tests[position]['edi_code'], match_type, confidence)
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 일치 종류 → 신뢰도 (우선순위 순)
+MATCH_CONFIDENCE = {
+    'exact_match': 0.95,
+    'partial_match': 0.85,
+    'composite_match': 0.80,
+}
+
+NORMALIZATION_MAP = {
+    'HER-2': 'HER2',
+    'K-RAS': 'KRAS',
+    'B-RAF': 'BRAF',
+    'ROS-1': 'ROS1',
+    'PD-1': 'PD1',
+    'PD-L1': 'PDL1',
+    'CTLA-4': 'CTLA4',
+    'C-MET': 'MET',
+}
+
+_COMPOSITE_HEAD_RE = re.compile(r'^(.*?)(\d+)$')
+
+
+def normalize_biomarker_name(name: Optional[str]) -> Optional[str]:
+    """바이오마커명 정규화 (대문자 + 표기 통일)"""
+    if not name:
+        return None
+
+    name = name.upper()
+    for old, new in NORMALIZATION_MAP.items():
+        if old in name:
+            name = name.replace(old, new)
+    return name.strip()
+
+
+def expand_composite(name: str) -> List[str]:
+    """
+    복합 바이오마커 토큰 확장
+
+    'CDK4/6'  → ['CDK4', 'CDK6']   (숫자만 있는 토큰은 앞 토큰의 문자 부분을 붙임)
+    'BCR/ABL' → ['BCR', 'ABL']
+    """
+    tokens = []
+    stem = ''
+    for part in name.split('/'):
+        part = part.strip()
+        if not part:
+            continue
+        if part.isdigit() and stem:
+            part = stem + part
+        else:
+            match = _COMPOSITE_HEAD_RE.match(part)
+            stem = match.group(1) if match else part
+        if part not in tokens:
+            tokens.append(part)
+    return tokens
+
+
+class BiomarkerTestIndex:
+    """검사 바이오마커명 색인 (정확 일치 해시 + n-gram 역색인)"""
+
+    def __init__(self, test_names: Iterable[Optional[str]]):
+        """
+        Args:
+            test_names: 검사별 바이오마커명 (순서 = 검사 번호)
+        """
+        self.names: List[Optional[str]] = []
+        self.exact: Dict[str, List[int]] = {}
+        self.grams: Dict[str, Set[int]] = {}
+
+        normalized_cache: Dict[Optional[str], Optional[str]] = {}
+        for position, raw in enumerate(test_names):
+            if raw not in normalized_cache:
+                normalized_cache[raw] = normalize_biomarker_name(raw)
+            name = normalized_cache[raw]
+            self.names.append(name)
+            if not name:
+                continue
+            self.exact.setdefault(name, []).append(position)
+            for gram in set(name) | {name[i:i + 2] for i in range(len(name) - 1)}:
+                self.grams.setdefault(gram, set()).add(position)
+
+        self.max_len = max((len(name) for name in self.exact), default=0)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def containing(self, text: str) -> Set[int]:
+        """정규화 이름에 text(비어 있지 않음)가 포함된 검사 번호"""
+        grams = [text] if len(text) == 1 else [text[i:i + 2] for i in range(len(text) - 1)]
+        postings = sorted((self.grams.get(gram, set()) for gram in set(grams)), key=len)
+        if not postings[0]:
+            return set()
+        candidates = set.intersection(*postings)
+        return {i for i in candidates if text in self.names[i]}
+
+    def contained_in(self, text: str) -> Set[int]:
+        """정규화 이름이 text의 부분 문자열인 검사 번호"""
+        result: Set[int] = set()
+        length = len(text)
+        for start in range(length):
+            for end in range(start + 1, min(length, start + self.max_len) + 1):
+                ids = self.exact.get(text[start:end])
+                if ids:
+                    result.update(ids)
+        return result
+
+    def match(self, biomarker_name: Optional[str]) -> List[Tuple[int, str, float]]:
+        """
+        바이오마커 1개 → 일치 검사
+
+        Returns:
+            [(검사 번호, 일치 종류, 신뢰도), ...] (검사 번호 순)
+        """
+        name = normalize_biomarker_name(biomarker_name)
+        found: Dict[int, str] = {}
+
+        def add(positions: Iterable[int], match_type: str) -> None:
+            for position in positions:
+                found.setdefault(position, match_type)
+
+        if name is None:
+            # 이름이 없으면 이름이 없는 검사와만 정확 일치
+            add((i for i, test_name in enumerate(self.names) if test_name is None), 'exact_match')
+        else:
+            add(self.exact.get(name, []), 'exact_match')
+            if name:
+                add(self.containing(name) | self.contained_in(name), 'partial_match')
+            if '/' in name:
+                for token in expand_composite(name):
+                    add(self.containing(token), 'composite_match')
+
+        return [(position, match_type, MATCH_CONFIDENCE[match_type])
+                for position, match_type in sorted(found.items())]
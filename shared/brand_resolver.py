@@ -0,0 +1,374 @@
+"""
+브랜드명/성분명 → ATC 레코드 해소기 (공용, mmap 스냅샷)
+
+build_brand_index_phase4.py의 brand_index.json은 키마다 entry_info.copy()를 통째로 저장해
+같은 성분의 ATC 계층 필드가 브랜드 수만큼 중복되고, 쓰는 쪽은 JSON/YAML 전체를 읽어
+정확히 같은 키만 dict로 조회했다. 여기서는 성분(ATC 레코드)을 한 번만 저장하고
+정규화 키 → 레코드 번호 목록과 BK-tree를 스냅샷으로 저장해 mmap으로 연다.
+
+- 레코드: 성분별 1개, ATC 단계 이름은 코드 → 이름 표에 한 번만 저장 (records.json)
+- 키: shared.drug_dictionary.normalize_key (소문자, 공백/하이픈/특수문자 제거), UTF-8 바이트 순 정렬
+- 키 → (레코드 번호, 일치 종류) posting, 성분명 키가 브랜드 키보다 먼저
+  (기존 combined_index에서 ingredient_index가 brand_index를 덮어쓰던 우선순위)
+- 오타 조회: 키 전체 BK-tree (편집 거리), 자식 목록을 평탄화한 배열로 저장해 열 때 재구성 없음
+
+저장 구조:
+    bridges/brand_resolver/
+        meta.json            {"version": 1, "source": "...", "records": ..., "keys": ..., "match_types": [...]}
+        records.json         {"atc_names": {코드: 이름}, "records": [...]}
+        keys.bin             정렬된 정규화 키 UTF-8 연결
+        key_offsets.bin      uint32 × (키 수 + 1)
+        key_postings.bin     uint32 × (키 수 + 1)  → postings.bin 내 시작 위치 (쌍 단위)
+        postings.bin         uint32 × 2 × posting 수 (레코드 번호, 일치 종류 번호)
+        bk_offsets.bin       uint32 × (키 수 + 1)  → BK-tree 자식 시작 위치 (루트 = 키 0)
+        bk_children.bin      uint32 × 자식 수 (키 번호)
+        bk_distances.bin     uint8 × 자식 수 (부모와의 편집 거리)
+
+사용 예:
+    with BrandResolver.open() as resolver:
+        resolver.lookup('버제니오')           # {'atc_code': 'L01EF03', 'match_type': 'brand', ...}
+        resolver.lookup('버재니오')           # 오타 → 편집 거리 1 키로 해소 ('distance': 1)
+        resolver.fuzzy('keytruda', 2)        # [('keytruda', 0), ...]
+"""
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from shared.drug_dictionary import normalize_key
+from shared.utils.mmap_table import MmapFiles, PackedStrings, SnapshotWriter, pack_strings
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RESOLVER_DIR = PROJECT_ROOT / "bridges" / "brand_resolver"
+
+# 파일 구조가 바뀌면 올려서 기존 스냅샷 무효화
+RESOLVER_VERSION = 1
+
+# 일치 종류 (posting 정렬 우선순위 순)
+MATCH_TYPES = ('ingredient_ko', 'ingredient_base_ko', 'ingredient_en', 'brand')
+
+# 레코드 필드 (ATC 단계 이름은 atc_names 표에서 채움)
+RECORD_FIELDS = ('brand_display', 'atc_code', 'ingredient_ko', 'ingredient_en', 'ingredient_base_ko',
+                 'ingredient_base_en', 'salt_form', 'manufacturers', 'mechanism_of_action',
+                 'therapeutic_category', 'brand_variants')
+ATC_LEVELS = ('atc_level1', 'atc_level2', 'atc_level3')
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Levenshtein 편집 거리 (글자 단위, 한글은 음절 단위)
+
+    Myers/Hyyrö 비트 병렬 알고리즘: 짧은 쪽 문자열의 글자 위치를 정수 비트로 두고
+    긴 쪽 글자마다 비트 연산 몇 번으로 DP 열 전체를 갱신 (O(len(a)) 번의 정수 연산)
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    full = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+
+    pv, mv, score = full, 0, len(b)
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    return score
+
+
+def default_max_distance(key: str) -> int:
+    """오타 허용 거리 (4글자 이하 1, 그 이상 2)"""
+    return 1 if len(key) <= 4 else 2
+
+
+class BrandResolverBuilder:
+    """anticancer_master_classified 항목 → 해소기 스냅샷"""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        self.atc_names: Dict[str, str] = {}
+        self.keys: Dict[str, List[Tuple[int, int]]] = {}
+
+    def _add_key(self, name: Optional[str], record_id: int, match_type: str) -> None:
+        key = normalize_key(name or '')
+        if not key:
+            return
+        posting = (record_id, MATCH_TYPES.index(match_type))
+        postings = self.keys.setdefault(key, [])
+        if posting not in postings:
+            postings.append(posting)
+
+    def add(self, entry: Dict[str, Any], brand_variants: Iterable[str] = ()) -> int:
+        """
+        성분 1개 등록 (build_brand_index와 같은 키: 정제 브랜드명, 성분명 한/영, 기본 성분명)
+
+        Args:
+            entry: anticancer_master_classified.json 항목
+            brand_variants: 브랜드명 변형 (generate_brand_variants 결과)
+
+        Returns:
+            레코드 번호
+        """
+        record_id = len(self.records)
+        record = {
+            'brand_display': entry.get('brand_name_primary', ''),
+            'atc_code': entry.get('atc_code', ''),
+            'ingredient_ko': entry.get('ingredient_ko', ''),
+            'ingredient_en': entry.get('atc_name_en', ''),
+            'ingredient_base_ko': entry.get('ingredient_base_ko', ''),
+            'ingredient_base_en': entry.get('ingredient_base_en', ''),
+            'salt_form': entry.get('salt_form'),
+            'manufacturers': entry.get('manufacturers', []),
+            'mechanism_of_action': entry.get('mechanism_of_action', ''),
+            'therapeutic_category': entry.get('therapeutic_category', ''),
+            'brand_variants': sorted(set(brand_variants)),
+        }
+        for level in ATC_LEVELS:
+            code = entry.get(level, '')
+            record[level] = code
+            if code and entry.get(level + '_name'):
+                self.atc_names.setdefault(code, entry[level + '_name'])
+        self.records.append(record)
+
+        for brand in entry.get('brand_names_clean', []):
+            self._add_key(brand, record_id, 'brand')
+        self._add_key(record['ingredient_ko'], record_id, 'ingredient_ko')
+        if record['ingredient_base_ko'] != record['ingredient_ko']:
+            self._add_key(record['ingredient_base_ko'], record_id, 'ingredient_base_ko')
+        self._add_key(record['ingredient_en'], record_id, 'ingredient_en')
+        return record_id
+
+    def save(self, resolver_dir: Path = RESOLVER_DIR, source: Optional[Path] = None) -> Dict[str, Any]:
+        """스냅샷 저장 (각 파일을 임시 파일에 쓴 뒤 교체, meta.json은 마지막)"""
+        writer = SnapshotWriter(resolver_dir)
+        records = {'atc_names': self.atc_names, 'records': self.records}
+        writer.write_json('records.json', records, indent=None)
+
+        # str 정렬 = UTF-8 바이트 정렬 → 열었을 때 이분 탐색 가능
+        keys = sorted(self.keys)
+        data = {}
+        data['keys.bin'], data['key_offsets.bin'] = pack_strings(keys)
+
+        # 성분명 키가 브랜드 키보다 먼저, 같은 종류는 등록 순서
+        postings = array('I')
+        posting_offsets = array('I', [0])
+        for key in keys:
+            for record_id, match_type in sorted(self.keys[key], key=lambda p: p[1]):
+                postings.extend((record_id, match_type))
+            posting_offsets.append(len(postings) // 2)
+        data['key_postings.bin'] = posting_offsets
+        data['postings.bin'] = postings
+
+        # BK-tree: 노드별 {거리: 자식}을 만든 뒤 자식 목록을 거리 순으로 평탄화
+        children: List[Dict[int, int]] = [{} for _ in keys]
+        for key_id in range(1, len(keys)):
+            node = 0
+            while True:
+                distance = min(edit_distance(keys[key_id], keys[node]), 255)
+                child = children[node].get(distance)
+                if child is None:
+                    children[node][distance] = key_id
+                    break
+                node = child
+
+        bk_offsets = array('I', [0])
+        bk_children = array('I')
+        bk_distances = bytearray()
+        for node_children in children:
+            for distance in sorted(node_children):
+                bk_children.append(node_children[distance])
+                bk_distances.append(distance)
+            bk_offsets.append(len(bk_children))
+        data['bk_offsets.bin'] = bk_offsets
+        data['bk_children.bin'] = bk_children
+        data['bk_distances.bin'] = bytes(bk_distances)
+        writer.write_files(BrandResolver._FILES, data)
+
+        meta = {'version': RESOLVER_VERSION, 'source': str(source) if source else None,
+                'records': len(self.records), 'keys': len(keys), 'postings': len(postings) // 2,
+                'atc_names': len(self.atc_names), 'match_types': list(MATCH_TYPES)}
+        writer.write_json('meta.json', meta)
+        return meta
+
+
+class BrandResolver:
+    """브랜드명/성분명 해소기 (mmap)"""
+
+    # 파일명 → array 형식 (None은 바이트 그대로)
+    _FILES = {
+        'keys.bin': None, 'key_offsets.bin': 'I', 'key_postings.bin': 'I', 'postings.bin': 'I',
+        'bk_offsets.bin': 'I', 'bk_children.bin': 'I', 'bk_distances.bin': None,
+    }
+
+    def __init__(self, resolver_dir: Path = RESOLVER_DIR):
+        self.resolver_dir = Path(resolver_dir)
+        with open(self.resolver_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != RESOLVER_VERSION:
+            raise ValueError(f"Unsupported brand resolver version: {self.meta.get('version')} "
+                             f"(expected {RESOLVER_VERSION}, rebuild with build_brand_index_phase4.py)")
+
+        with open(self.resolver_dir / 'records.json', 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        self.atc_names: Dict[str, str] = records['atc_names']
+        self.records: List[Dict[str, Any]] = records['records']
+
+        self._files = MmapFiles(self.resolver_dir, self._FILES)
+        data = self._files.data
+        self._keys = PackedStrings(data['keys.bin'], data['key_offsets.bin'])
+        self._key_postings = data['key_postings.bin']
+        self._postings = data['postings.bin']
+        self._bk_offsets = data['bk_offsets.bin']
+        self._bk_children = data['bk_children.bin']
+        self._bk_distances = data['bk_distances.bin']
+
+    @classmethod
+    def open(cls, resolver_dir: Path = RESOLVER_DIR) -> "BrandResolver":
+        return cls(resolver_dir)
+
+    def __reduce__(self):
+        # mmap은 pickle할 수 없으므로 프로세스 간에는 디렉토리만 넘겨 다시 연다
+        return self.__class__.open, (self.resolver_dir,)
+
+    def close(self) -> None:
+        """mmap 해제"""
+        self._files.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 레코드
+    # ------------------------------------------------------------------
+
+    def record(self, record_id: int, match_type: str = 'brand') -> Dict[str, Any]:
+        """
+        레코드 → 기존 brand_index.json 항목 형태
+
+        brand_display는 일치 종류에 따라 대표 브랜드명 또는 성분명 (기존과 같음)
+        """
+        record = self.records[record_id]
+        entry = {field: record[field] for field in RECORD_FIELDS}
+        for level in ATC_LEVELS:
+            entry[level] = record[level]
+            entry[level + '_name'] = self.atc_names.get(record[level], '')
+        entry['manufacturers'] = list(record['manufacturers'])
+        entry['brand_variants'] = list(record['brand_variants'])
+        if match_type != 'brand':
+            entry['brand_display'] = record[match_type]
+        entry['match_type'] = match_type
+        return entry
+
+    # ------------------------------------------------------------------
+    # 정확 일치
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, key_id: int) -> str:
+        return self._keys[key_id]
+
+    def _position(self, key: str) -> Optional[int]:
+        return self._keys.position(key)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._position(normalize_key(name)) is not None
+
+    def keys(self) -> Iterator[str]:
+        """정규화 키 (UTF-8 바이트 순)"""
+        for i in range(len(self._keys)):
+            yield self._key(i)
+
+    def postings(self, key: str) -> List[Tuple[int, str]]:
+        """정규화 키 → [(레코드 번호, 일치 종류), ...] (성분명 우선)"""
+        i = self._position(key)
+        if i is None:
+            return []
+        return [(self._postings[2 * p], MATCH_TYPES[self._postings[2 * p + 1]])
+                for p in range(self._key_postings[i], self._key_postings[i + 1])]
+
+    def resolve(self, name: str) -> List[Dict[str, Any]]:
+        """이름 → 정확 일치 항목 전체 (정규화 키 기준)"""
+        return [self.record(record_id, match_type) for record_id, match_type in self.postings(normalize_key(name))]
+
+    # ------------------------------------------------------------------
+    # 오타 허용 조회
+    # ------------------------------------------------------------------
+
+    def fuzzy(self, name: str, max_distance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        BK-tree 조회: 편집 거리 max_distance 이하 키
+
+        Args:
+            max_distance: 허용 거리 (기본값: default_max_distance)
+
+        Returns:
+            [(정규화 키, 거리), ...] (거리 → 키 순)
+        """
+        query = normalize_key(name)
+        if not query or not len(self._keys):
+            return []
+        if max_distance is None:
+            max_distance = default_max_distance(query)
+
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            key = self._key(node)
+            distance = edit_distance(query, key)
+            if distance <= max_distance:
+                found.append((key, distance))
+            # 삼각 부등식: |d - k| ≤ 자식 거리 ≤ d + k 인 자식만 방문
+            low, high = distance - max_distance, distance + max_distance
+            for c in range(self._bk_offsets[node], self._bk_offsets[node + 1]):
+                if low <= self._bk_distances[c] <= high:
+                    stack.append(self._bk_children[c])
+        return sorted(found, key=lambda item: (item[1], item[0]))
+
+    def lookup(self, name: str, fuzzy: bool = True, max_distance: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        이름 1개 해소: 정확 일치 → (fuzzy=True면) 가장 가까운 키
+        (가장 가까운 키가 여러 성분으로 갈리면 None)
+
+        Returns:
+            기존 brand_index.json 항목 + 'matched_key', 'distance' (없으면 None)
+        """
+        key = normalize_key(name or '')
+        if not key:
+            return None
+        postings = self.postings(key)
+        distance = 0
+        if not postings and fuzzy:
+            candidates = self.fuzzy(key, max_distance)
+            if candidates:
+                # 가장 가까운 키들이 서로 다른 성분을 가리키면 해소하지 않음
+                best = [k for k, d in candidates if d == candidates[0][1]]
+                if len({self.postings(k)[0][0] for k in best}) == 1:
+                    key, distance = candidates[0]
+                    postings = self.postings(key)
+        if not postings:
+            return None
+        record_id, match_type = postings[0]
+        entry = self.record(record_id, match_type)
+        entry['matched_key'] = key
+        entry['distance'] = distance
+        return entry
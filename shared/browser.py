@@ -0,0 +1,501 @@
+"""
+공통 Playwright 브라우저 팩토리
+
+모든 스크래퍼가 같은 방식으로 브라우저를 띄우고 페이지를 여는 공통 모듈
+- 경량 프로파일: 이미지/미디어/폰트/분석 스크립트 요청 차단, 불필요한 Chromium 기능 비활성화
+- 고정 sleep 대신 셀렉터/텍스트 기반 준비 대기 (wait_ready)
+- 브라우저 프로세스 1개를 여러 작업에서 재사용 (팩토리 인스턴스 단위)
+- 페이지 로드 시간 기록 (PageTimings)
+- headful=True: 디버그용 창 표시 + slow_mo + 종료 전 대기 (기존 scourt_* 스크립트의 화면 확인 동작)
+
+사용 예 (sync):
+    with BrowserFactory() as factory:
+        page = factory.new_page()
+        factory.goto(page, url, ready_selector='tbody tr')
+
+사용 예 (async):
+    async with AsyncBrowserFactory() as factory:
+        page = await factory.new_page()
+        await factory.goto(page, url, ready_text='제1조')
+"""
+import asyncio
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+# 분석/추적 스크립트 URL 키워드 (호스트 또는 경로에 포함되면 차단)
+ANALYTICS_URL_KEYWORDS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'connect.facebook',
+    'wcs.naver.net',
+    'hotjar.com',
+    'beusable.net',
+    'clarity.ms',
+    'scorecardresearch.com',
+)
+
+# 브라우저 프로파일
+# - lightweight: 텍스트/DOM 수집용 (기본값)
+# - full: 차단 없음 (화면 확인, 렌더링 의존 디버깅용)
+PROFILES: Dict[str, Dict[str, Any]] = {
+    'lightweight': {
+        'blocked_resource_types': frozenset({'image', 'media', 'font'}),
+        'blocked_url_keywords': ANALYTICS_URL_KEYWORDS,
+        'launch_args': [
+            '--disable-gpu',
+            '--disable-dev-shm-usage',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-default-apps',
+            '--disable-sync',
+            '--mute-audio',
+            '--no-first-run',
+        ],
+        'viewport': {'width': 1280, 'height': 900},
+    },
+    'full': {
+        'blocked_resource_types': frozenset(),
+        'blocked_url_keywords': (),
+        'launch_args': [],
+        'viewport': None,
+    },
+}
+
+DEFAULT_TIMEOUT = 30000  # ms
+
+# headful 디버그 모드: 동작 사이 지연(ms), 종료 전 창 유지 시간(초)
+DEBUG_SLOW_MO = 300
+DEBUG_HOLD_SECONDS = 10
+
+# 본문에 특정 텍스트가 나타날 때까지 대기하는 JS 조건
+_READY_TEXT_JS = "text => !!document.body && document.body.innerText.includes(text)"
+
+
+def should_block(url: str, resource_type: str,
+                 blocked_resource_types: Iterable[str],
+                 blocked_url_keywords: Iterable[str]) -> bool:
+    """요청 차단 여부 판정"""
+    if resource_type in blocked_resource_types:
+        return True
+    url = url.lower()
+    return any(keyword in url for keyword in blocked_url_keywords)
+
+
+class PageTimings:
+    """페이지 로드 시간 기록"""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    def record(self, url: str, elapsed: float, ready: Optional[str] = None, ok: bool = True):
+        """로드 1건 기록 (elapsed: 초)"""
+        self.records.append({
+            'url': url,
+            'elapsed_ms': round(elapsed * 1000, 1),
+            'ready': ready,
+            'ok': ok,
+        })
+
+    @contextmanager
+    def measure(self, url: str, ready: Optional[str] = None):
+        """with 블록 실행 시간을 로드 시간으로 기록"""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(url, time.perf_counter() - start, ready, ok)
+
+    def summary(self) -> Dict[str, Any]:
+        """로드 시간 요약 통계"""
+        elapsed = sorted(r['elapsed_ms'] for r in self.records)
+        if not elapsed:
+            return {'count': 0}
+
+        return {
+            'count': len(elapsed),
+            'failed': sum(1 for r in self.records if not r['ok']),
+            'total_ms': round(sum(elapsed), 1),
+            'avg_ms': round(sum(elapsed) / len(elapsed), 1),
+            'p50_ms': elapsed[len(elapsed) // 2],
+            'p95_ms': elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))],
+            'max_ms': elapsed[-1],
+        }
+
+    def save(self, path: Path):
+        """기록 전체를 JSON으로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': self.summary(), 'records': self.records}, f, ensure_ascii=False, indent=2)
+
+
+class _FactoryBase:
+    """sync/async 팩토리 공통 설정"""
+
+    def __init__(
+        self,
+        profile: str = 'lightweight',
+        headless: bool = True,
+        timeout: int = DEFAULT_TIMEOUT,
+        blocked_resource_types: Optional[Iterable[str]] = None,
+        timings_path: Optional[Path] = None,
+        headful: bool = False,
+        **launch_kwargs,
+    ):
+        """
+        Args:
+            profile: 'lightweight' (기본) 또는 'full'
+            headless: 헤드리스 모드
+            headful: 디버그 모드 (창 표시, slow_mo DEBUG_SLOW_MO, 종료 전 DEBUG_HOLD_SECONDS초 대기)
+            timeout: 페이지 기본 타임아웃 (ms)
+            blocked_resource_types: 프로파일의 차단 리소스 타입 재정의
+            timings_path: 종료 시 페이지 로드 시간을 저장할 JSON 경로
+            launch_kwargs: chromium.launch 추가 인자 (downloads_path 등)
+        """
+        self.profile = dict(PROFILES[profile])
+        if blocked_resource_types is not None:
+            self.profile['blocked_resource_types'] = frozenset(blocked_resource_types)
+
+        self.headless = headless and not headful
+        self.timeout = timeout
+        self.timings_path = timings_path
+        self.launch_kwargs = launch_kwargs
+        self.hold_seconds = 0
+        if headful:
+            self.launch_kwargs.setdefault('slow_mo', DEBUG_SLOW_MO)
+            self.hold_seconds = DEBUG_HOLD_SECONDS
+        self.timings = PageTimings()
+
+    def _launch_options(self) -> Dict[str, Any]:
+        options = dict(self.launch_kwargs)
+        options['headless'] = self.headless
+        options['args'] = list(self.profile['launch_args']) + list(options.get('args', []))
+        return options
+
+    def _context_options(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        options = dict(kwargs)
+        if self.profile['viewport'] and 'viewport' not in options:
+            options['viewport'] = self.profile['viewport']
+        return options
+
+    def _blocks(self, request) -> bool:
+        return should_block(
+            request.url,
+            request.resource_type,
+            self.profile['blocked_resource_types'],
+            self.profile['blocked_url_keywords'],
+        )
+
+    @property
+    def _has_blocking(self) -> bool:
+        return bool(self.profile['blocked_resource_types'] or self.profile['blocked_url_keywords'])
+
+    def _report_timings(self):
+        summary = self.timings.summary()
+        if summary['count']:
+            logger.info(
+                f"페이지 로드 {summary['count']}건: 평균 {summary['avg_ms']}ms, "
+                f"p95 {summary['p95_ms']}ms, 최대 {summary['max_ms']}ms"
+            )
+        if self.timings_path:
+            self.timings.save(self.timings_path)
+
+
+class BrowserFactory(_FactoryBase):
+    """동기(sync_playwright) 브라우저 팩토리"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._playwright = None
+        self.browser = None
+        self._default_context = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self):
+        """브라우저 실행 (이미 실행 중이면 재사용)"""
+        if self.browser is None:
+            self._playwright = sync_playwright().start()
+            self.browser = self._playwright.chromium.launch(**self._launch_options())
+        return self.browser
+
+    def close(self):
+        """브라우저 종료 및 로드 시간 요약 (headful이면 창을 잠시 유지한 뒤 종료)"""
+        self._report_timings()
+        if self.browser:
+            if self.hold_seconds:
+                time.sleep(self.hold_seconds)
+            self.browser.close()
+            self.browser = None
+            self._default_context = None
+        if self._playwright:
+            self._playwright.stop()
+            self._playwright = None
+
+    def _route(self, route):
+        if self._blocks(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    def new_context(self, **kwargs):
+        """프로파일이 적용된 새 컨텍스트"""
+        context = self.start().new_context(**self._context_options(kwargs))
+        context.set_default_timeout(self.timeout)
+        if self._has_blocking:
+            context.route('**/*', self._route)
+        return context
+
+    def new_page(self, context=None):
+        """새 페이지 (context가 없으면 팩토리 기본 컨텍스트 사용)"""
+        if context is None:
+            if self._default_context is None:
+                self._default_context = self.new_context(accept_downloads=True)
+            context = self._default_context
+        return context.new_page()
+
+    def wait_ready(self, page, ready_selector: Optional[str] = None, ready_text: Optional[str] = None,
+                   timeout: Optional[int] = None, required: bool = True):
+        """
+        셀렉터가 붙거나 본문에 텍스트가 나타날 때까지 대기 (page 또는 frame)
+
+        Args:
+            required: False면 시간 초과 시 경고만 남기고 진행
+        """
+        timeout = timeout or self.timeout
+        try:
+            if ready_selector:
+                page.wait_for_selector(ready_selector, state='attached', timeout=timeout)
+            if ready_text:
+                page.wait_for_function(_READY_TEXT_JS, arg=ready_text, timeout=timeout)
+        except PlaywrightTimeoutError:
+            if required:
+                raise
+            logger.warning(f"준비 대기 시간 초과: {ready_selector or ready_text}")
+
+    def goto(self, page, url: str, ready_selector: Optional[str] = None, ready_text: Optional[str] = None,
+             wait_until: str = 'domcontentloaded', timeout: Optional[int] = None,
+             required: bool = True):
+        """페이지 이동 + 준비 대기, 로드 시간 기록"""
+        with self.timings.measure(url, ready_selector or ready_text):
+            response = page.goto(url, wait_until=wait_until, timeout=timeout or self.timeout)
+            self.wait_ready(page, ready_selector, ready_text, timeout, required)
+        return response
+
+    def run_and_wait(self, page, script: str, ready_selector: Optional[str] = None,
+                     ready_text: Optional[str] = None, timeout: Optional[int] = None,
+                     navigates: bool = False, target=None, frame_name: Optional[str] = None,
+                     required: bool = True):
+        """
+        JS 네비게이션 함수 실행 후 준비 대기 (fn_go_page, menu_go 등)
+
+        Args:
+            navigates: 스크립트가 페이지 이동을 일으키는지 (이동 완료까지 먼저 대기)
+            target: 준비 대기 대상 page/frame (기본값: page)
+            frame_name: 스크립트가 이 이름의 iframe을 다시 불러오는 경우 (해당 프레임 이동 후 그 프레임에서 대기)
+
+        Returns:
+            준비 대기를 마친 page/frame
+        """
+        return self._act_and_wait(page, lambda: page.evaluate(script), script, ready_selector, ready_text,
+                                  timeout, navigates, target, frame_name, required)
+
+    def click_and_wait(self, page, locator, ready_selector: Optional[str] = None,
+                       ready_text: Optional[str] = None, timeout: Optional[int] = None,
+                       navigates: bool = False, target=None, frame_name: Optional[str] = None,
+                       required: bool = True):
+        """
+        요소를 JS로 클릭(숨김 요소 포함)한 뒤 준비 대기 (트리 메뉴, 페이지 번호 링크 등)
+
+        인자는 run_and_wait와 동일
+        """
+        return self._act_and_wait(page, lambda: locator.evaluate('el => el.click()'), 'click', ready_selector,
+                                  ready_text, timeout, navigates, target, frame_name, required)
+
+    def _act_and_wait(self, page, action, label, ready_selector, ready_text, timeout,
+                      navigates, target, frame_name, required):
+        timeout = timeout or self.timeout
+        with self.timings.measure(label, ready_selector or ready_text):
+            if frame_name:
+                try:
+                    with page.expect_event('framenavigated', predicate=lambda f: f.name == frame_name,
+                                           timeout=timeout) as event:
+                        action()
+                    target = event.value
+                    target.wait_for_load_state('domcontentloaded', timeout=timeout)
+                except PlaywrightTimeoutError:
+                    if required:
+                        raise
+                    logger.warning(f"프레임 이동 대기 시간 초과: {frame_name}")
+                    target = page.frame(name=frame_name)
+            elif navigates:
+                with page.expect_navigation(wait_until='domcontentloaded', timeout=timeout):
+                    action()
+            else:
+                action()
+            target = target or page
+            self.wait_ready(target, ready_selector, ready_text, timeout, required)
+        return target
+
+
+class AsyncBrowserFactory(_FactoryBase):
+    """비동기(async_playwright) 브라우저 팩토리"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._playwright = None
+        self.browser = None
+        self._default_context = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        """브라우저 실행 (이미 실행 중이면 재사용)"""
+        if self.browser is None:
+            self._playwright = await async_playwright().start()
+            self.browser = await self._playwright.chromium.launch(**self._launch_options())
+        return self.browser
+
+    async def close(self):
+        """브라우저 종료 및 로드 시간 요약 (headful이면 창을 잠시 유지한 뒤 종료)"""
+        self._report_timings()
+        if self.browser:
+            if self.hold_seconds:
+                await asyncio.sleep(self.hold_seconds)
+            await self.browser.close()
+            self.browser = None
+            self._default_context = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _route(self, route):
+        if self._blocks(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def new_context(self, **kwargs):
+        """프로파일이 적용된 새 컨텍스트"""
+        browser = await self.start()
+        context = await browser.new_context(**self._context_options(kwargs))
+        context.set_default_timeout(self.timeout)
+        if self._has_blocking:
+            await context.route('**/*', self._route)
+        return context
+
+    async def new_page(self, context=None):
+        """새 페이지 (context가 없으면 팩토리 기본 컨텍스트 사용)"""
+        if context is None:
+            if self._default_context is None:
+                self._default_context = await self.new_context(accept_downloads=True)
+            context = self._default_context
+        return await context.new_page()
+
+    async def wait_ready(self, page, ready_selector: Optional[str] = None, ready_text: Optional[str] = None,
+                         timeout: Optional[int] = None, required: bool = True):
+        """
+        셀렉터가 붙거나 본문에 텍스트가 나타날 때까지 대기 (page 또는 frame)
+
+        Args:
+            required: False면 시간 초과 시 경고만 남기고 진행
+        """
+        timeout = timeout or self.timeout
+        try:
+            if ready_selector:
+                await page.wait_for_selector(ready_selector, state='attached', timeout=timeout)
+            if ready_text:
+                await page.wait_for_function(_READY_TEXT_JS, arg=ready_text, timeout=timeout)
+        except PlaywrightTimeoutError:
+            if required:
+                raise
+            logger.warning(f"준비 대기 시간 초과: {ready_selector or ready_text}")
+
+    async def goto(self, page, url: str, ready_selector: Optional[str] = None, ready_text: Optional[str] = None,
+                   wait_until: str = 'domcontentloaded', timeout: Optional[int] = None,
+                   required: bool = True):
+        """페이지 이동 + 준비 대기, 로드 시간 기록"""
+        with self.timings.measure(url, ready_selector or ready_text):
+            response = await page.goto(url, wait_until=wait_until, timeout=timeout or self.timeout)
+            await self.wait_ready(page, ready_selector, ready_text, timeout, required)
+        return response
+
+    async def run_and_wait(self, page, script: str, ready_selector: Optional[str] = None,
+                           ready_text: Optional[str] = None, timeout: Optional[int] = None,
+                           navigates: bool = False, target=None, frame_name: Optional[str] = None,
+                           required: bool = True):
+        """
+        JS 네비게이션 함수 실행 후 준비 대기 (fn_go_page, menu_go 등)
+
+        Args:
+            navigates: 스크립트가 페이지 이동을 일으키는지 (이동 완료까지 먼저 대기)
+            target: 준비 대기 대상 page/frame (기본값: page)
+            frame_name: 스크립트가 이 이름의 iframe을 다시 불러오는 경우 (해당 프레임 이동 후 그 프레임에서 대기)
+
+        Returns:
+            준비 대기를 마친 page/frame
+        """
+        return await self._act_and_wait(page, lambda: page.evaluate(script), script, ready_selector, ready_text,
+                                        timeout, navigates, target, frame_name, required)
+
+    async def click_and_wait(self, page, locator, ready_selector: Optional[str] = None,
+                             ready_text: Optional[str] = None, timeout: Optional[int] = None,
+                             navigates: bool = False, target=None, frame_name: Optional[str] = None,
+                             required: bool = True):
+        """
+        요소를 JS로 클릭(숨김 요소 포함)한 뒤 준비 대기 (트리 메뉴, 페이지 번호 링크 등)
+
+        인자는 run_and_wait와 동일
+        """
+        return await self._act_and_wait(page, lambda: locator.evaluate('el => el.click()'), 'click',
+                                        ready_selector, ready_text, timeout, navigates, target, frame_name,
+                                        required)
+
+    async def _act_and_wait(self, page, action, label, ready_selector, ready_text, timeout,
+                            navigates, target, frame_name, required):
+        timeout = timeout or self.timeout
+        with self.timings.measure(label, ready_selector or ready_text):
+            if frame_name:
+                try:
+                    async with page.expect_event('framenavigated', predicate=lambda f: f.name == frame_name,
+                                                 timeout=timeout) as event:
+                        await action()
+                    target = await event.value
+                    await target.wait_for_load_state('domcontentloaded', timeout=timeout)
+                except PlaywrightTimeoutError:
+                    if required:
+                        raise
+                    logger.warning(f"프레임 이동 대기 시간 초과: {frame_name}")
+                    target = page.frame(name=frame_name)
+            elif navigates:
+                async with page.expect_navigation(wait_until='domcontentloaded', timeout=timeout):
+                    await action()
+            else:
+                await action()
+            target = target or page
+            await self.wait_ready(target, ready_selector, ready_text, timeout, required)
+        return target
@@ -0,0 +1,158 @@
+"""
+공통 Playwright 브라우저 풀
+
+하나의 Chromium 프로세스에 컨텍스트 여러 개, 컨텍스트마다 페이지 여러 개를
+미리 열어 두고 작업을 동시에 처리하는 비동기 스크래핑 런타임
+
+- 컨텍스트 N개 × 컨텍스트당 페이지 M개 (동시 작업 수 = N × M)
+- 호스트별 요청 간격 제한 (HostRateLimiter)
+- 이미지/폰트/CSS/미디어/분석 스크립트 요청 차단 (shared.browser 경량 프로파일 + CSS)
+- 페이지 로드 시간 기록 (pool.factory.timings)
+- 작업이 끝나는 순서대로 결과 콜백 호출 (완료 즉시 저장 가능)
+
+사용 예:
+    async with BrowserPool(num_contexts=2, pages_per_context=3) as pool:
+        async def worker(page, item):
+            await pool.goto(page, item['url'])
+            return await page.inner_text('body')
+
+        results = await pool.run(items, worker, on_result=save)
+"""
+import asyncio
+import inspect
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+from shared.browser import AsyncBrowserFactory, PROFILES
+from shared.utils.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 본문 추출에 필요 없는 리소스 타입
+DEFAULT_BLOCKED_RESOURCE_TYPES = PROFILES['lightweight']['blocked_resource_types'] | {'stylesheet'}
+
+
+class BrowserPool:
+    """컨텍스트/페이지 풀 기반 비동기 스크래핑 런타임"""
+
+    def __init__(
+        self,
+        num_contexts: int = 2,
+        pages_per_context: int = 3,
+        headless: bool = True,
+        user_agent: Optional[str] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        default_timeout: Optional[int] = None,
+        ready_selector: Optional[str] = None,
+        headful: bool = False,
+    ):
+        """
+        Args:
+            num_contexts: 브라우저 컨텍스트 수 (쿠키/세션 분리 단위)
+            pages_per_context: 컨텍스트당 페이지 수
+            headless: 헤드리스 모드
+            user_agent: User-Agent 문자열
+            rate_limiter: 호스트별 요청 간격 제한기 (없으면 기본값 1초/호스트 2건)
+            blocked_resource_types: 차단할 Playwright resource_type 목록
+            default_timeout: 페이지 기본 타임아웃 (ms)
+            ready_selector: goto 후 기본으로 기다릴 셀렉터
+            headful: 디버그 모드 (AsyncBrowserFactory headful 참고)
+        """
+        self.num_contexts = num_contexts
+        self.pages_per_context = pages_per_context
+        self.user_agent = user_agent
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.ready_selector = ready_selector
+
+        factory_kwargs = {'headless': headless, 'blocked_resource_types': blocked_resource_types,
+                          'headful': headful}
+        if default_timeout:
+            factory_kwargs['timeout'] = default_timeout
+        self.factory = AsyncBrowserFactory(**factory_kwargs)
+
+        self.contexts: List[BrowserContext] = []
+        self._idle_pages: Optional[asyncio.Queue] = None
+
+    @property
+    def size(self) -> int:
+        """동시에 사용할 수 있는 페이지 수"""
+        return self.num_contexts * self.pages_per_context
+
+    async def __aenter__(self):
+        """브라우저 실행 및 페이지 풀 생성"""
+        await self.factory.start()
+        self._idle_pages = asyncio.Queue()
+
+        for _ in range(self.num_contexts):
+            context = await self.factory.new_context(user_agent=self.user_agent)
+            self.contexts.append(context)
+
+            for _ in range(self.pages_per_context):
+                page = await context.new_page()
+                self._idle_pages.put_nowait(page)
+
+        logger.info(f"브라우저 풀 준비: 컨텍스트 {self.num_contexts}개 × 페이지 {self.pages_per_context}개")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 및 브라우저 종료"""
+        for context in self.contexts:
+            await context.close()
+        self.contexts = []
+        await self.factory.close()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """풀에서 유휴 페이지 하나를 빌려 사용 후 반납"""
+        page = await self._idle_pages.get()
+        try:
+            yield page
+        finally:
+            self._idle_pages.put_nowait(page)
+
+    async def goto(self, page: Page, url: str, ready_selector: Optional[str] = None,
+                   wait_until: str = 'load', **kwargs):
+        """호스트별 간격 제한을 지키며 페이지 이동 (+ 준비 셀렉터 대기)"""
+        async with self.rate_limiter.slot(url):
+            return await self.factory.goto(page, url, ready_selector=ready_selector or self.ready_selector,
+                                           wait_until=wait_until, **kwargs)
+
+    async def run(
+        self,
+        items: Iterable[Any],
+        worker: Callable[[Page, Any], Awaitable[Any]],
+        on_result: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> List[Any]:
+        """
+        작업 목록을 페이지 풀에서 동시에 처리
+
+        Args:
+            items: 작업 항목 목록
+            worker: async (page, item) -> result
+            on_result: (item, result) 콜백. 작업이 끝나는 순서대로 호출 (async 함수도 가능)
+
+        Returns:
+            입력 순서대로 정렬된 결과 목록 (실패한 항목은 None)
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+
+        async def _run_one(index: int, item: Any):
+            async with self.acquire() as page:
+                try:
+                    result = await worker(page, item)
+                except Exception as e:
+                    logger.error(f"작업 실패 ({item!r}): {e}")
+                    return
+            results[index] = result
+            if on_result is not None:
+                ret = on_result(item, result)
+                if inspect.isawaitable(ret):
+                    await ret
+
+        await asyncio.gather(*(_run_one(i, item) for i, item in enumerate(items)))
+        return results
@@ -0,0 +1,251 @@
+"""
+PDF 청크 파싱 오케스트레이터 (Upstage 등 외부 파서 공용)
+
+목차/구조 기반으로 나눈 청크를 순서대로 하나씩 API에 보내고 전부 끝난 뒤 병합하던 것을
+다음과 같이 바꾼다.
+
+- 청크 결과 캐시: (원본 PDF SHA-256, 시작~끝 페이지, 출력 형식) 단위 JSON
+  → 목차를 조금 고쳐 다시 돌리면 범위가 바뀐 청크만 다시 전송
+- 큰 청크부터 동시 워커에 배정 (긴 청크가 마지막에 남아 전체 시간이 늘어나는 것 방지)
+- 요청 시작 간 최소 간격 유지 (기존 청크 사이 time.sleep(1) 대체)
+- 도착하는 대로 점진 병합 (앞쪽 청크가 모두 도착한 구간까지 페이지 순서대로 이어 붙임)
+
+캐시 구조:
+    <cache_dir>/<sha256 앞 16자리>/p0001-0042.html.json
+
+사용 예:
+    cache = ChunkResultCache(output_dir / 'chunk_cache', pdf_path, 'html')
+    orchestrator = ChunkOrchestrator(parser.parse_chunk, cache, workers=3)
+    results = orchestrator.run(splits, prepare=lambda pending: parser.split_pdf(pdf_path, pending))
+    merged = orchestrator.merger.merged(pdf_path.name, 'smart_section_based_split')
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+CACHE_VERSION = 1
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def result_content(result: Dict[str, Any], output_format: str) -> str:
+    """API 응답에서 지정 형식 content 추출"""
+    content = result.get('content', {})
+    if isinstance(content, dict):
+        return content.get(output_format, '')
+    return str(content)
+
+
+class ChunkResultCache:
+    """청크 파싱 결과 캐시 (원본 해시 + 페이지 범위 + 출력 형식)"""
+
+    def __init__(self, cache_dir: Path, pdf_path: Path, output_format: str = 'html'):
+        """
+        Args:
+            cache_dir: 캐시 루트 디렉토리 (원본별 하위 디렉토리 생성)
+            pdf_path: 원본 PDF 경로 (내용 해시로 캐시 구분)
+            output_format: 출력 형식 (html / markdown / text)
+        """
+        self.sha256 = file_sha256(Path(pdf_path))
+        self.dir = Path(cache_dir) / self.sha256[:16]
+        self.output_format = output_format
+
+    def path(self, start: int, end: int) -> Path:
+        return self.dir / f"p{start:04d}-{end:04d}.{self.output_format}.json"
+
+    def get(self, start: int, end: int) -> Optional[Dict[str, Any]]:
+        """캐시된 결과 (없거나 버전/해시가 다르면 None)"""
+        path = self.path(start, end)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get('version') != CACHE_VERSION or entry.get('sha256') != self.sha256:
+            return None
+        return entry['result']
+
+    def put(self, start: int, end: int, result: Dict[str, Any]) -> None:
+        """결과 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(start, end)
+        tmp_path = path.with_name(path.name + '.tmp')
+        entry = {'version': CACHE_VERSION, 'sha256': self.sha256, 'start': start, 'end': end,
+                 'cached_at': datetime.now().isoformat(), 'result': result}
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class ProgressiveMerger:
+    """
+    청크 결과 점진 병합
+
+    결과는 도착 순서와 상관없이 계획 순서(position)로 등록하고,
+    앞쪽 청크가 모두 도착한 구간까지 content/elements를 이어 붙인다.
+    """
+
+    def __init__(self, total: int, output_format: str = 'html'):
+        self.total = total
+        self.output_format = output_format
+        self.slots: List[Optional[Dict[str, Any]]] = [None] * total
+        self.next_position = 0
+
+        self.contents: List[str] = []
+        self.elements: List[Any] = []
+        self.chunks_metadata: List[Dict[str, Any]] = []
+        self.total_pages = 0
+        self.failed = 0
+
+    def add(self, position: int, result: Dict[str, Any]) -> int:
+        """
+        결과 등록
+
+        Returns:
+            지금까지 순서대로 병합된 청크 수
+        """
+        self.slots[position] = result
+        while self.next_position < self.total and self.slots[self.next_position] is not None:
+            self._append(self.slots[self.next_position])
+            self.next_position += 1
+        return self.next_position
+
+    def _append(self, result: Dict[str, Any]) -> None:
+        if 'error' in result:
+            self.failed += 1
+            return
+        self.contents.append(result_content(result, self.output_format))
+        self.elements.extend(result.get('elements', []))
+        if 'chunk_metadata' in result:
+            self.chunks_metadata.append(result['chunk_metadata'])
+        self.total_pages += result.get('chunk_metadata', {}).get('api_pages', 0)
+
+    @property
+    def done(self) -> bool:
+        return self.next_position == self.total
+
+    def merged(self, source_file: str, parsing_method: str) -> Optional[Dict[str, Any]]:
+        """병합 결과 (성공한 청크가 없으면 None)"""
+        if not self.contents:
+            return None
+        return {
+            'source_file': source_file,
+            'total_pages': self.total_pages,
+            'chunks_parsed': len(self.contents),
+            'chunks_failed': self.failed,
+            'content': '\n\n<hr>\n\n'.join(self.contents),
+            'elements': self.elements,
+            'output_format': self.output_format,
+            'parsing_method': parsing_method,
+            'parsed_at': datetime.now().isoformat(),
+            'chunks_metadata': self.chunks_metadata
+        }
+
+
+class ChunkOrchestrator:
+    """청크 캐시 확인 → 남은 청크만 분할/병렬 파싱 → 점진 병합"""
+
+    def __init__(self, parse_chunk: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 cache: Optional[ChunkResultCache] = None, workers: int = 3,
+                 min_interval: float = 1.0, output_format: str = 'html'):
+        """
+        Args:
+            parse_chunk: 분할된 청크 1개 파싱 (실패 시 {'error': ...} 반환)
+            cache: 청크 결과 캐시 (None이면 캐시 없이 전부 파싱)
+            workers: 동시 요청 수
+            min_interval: 요청 시작 간 최소 간격 (초)
+            output_format: 병합할 content 형식
+        """
+        self.parse_chunk = parse_chunk
+        self.cache = cache
+        self.workers = workers
+        self.min_interval = min_interval
+        self.output_format = output_format
+
+        self.merger: Optional[ProgressiveMerger] = None
+        self.stats = {'cached': 0, 'parsed': 0, 'failed': 0}
+        self._lock = threading.Lock()
+        self._last_start = 0.0
+
+    def _throttle(self) -> None:
+        """요청 시작 간격 확보 (워커 스레드 간 공유)"""
+        with self._lock:
+            remaining = self._last_start + self.min_interval - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            self._last_start = time.monotonic()
+
+    def _run_one(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        self._throttle()
+        return self.parse_chunk(chunk)
+
+    def run(self, plan: List[Dict[str, Any]],
+            prepare: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+            on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        계획된 청크 전체 처리
+
+        Args:
+            plan: 청크 계획 ({'start', 'end', ...} 페이지 1-based, end 포함)
+            prepare: 캐시에 없는 계획 항목 → 파싱할 청크 (PDF 분할 등, 같은 순서로 반환)
+                     각 항목에는 계획 순번 'index'(1-based)가 붙어 전달됨
+            on_result: 결과 도착 콜백 (계획 순번 0-based, 결과)
+
+        Returns:
+            계획 순서의 결과 목록
+        """
+        self.merger = ProgressiveMerger(len(plan), self.output_format)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(plan)
+
+        def land(position: int, result: Dict[str, Any]) -> None:
+            results[position] = result
+            self.merger.add(position, result)
+            if on_result:
+                on_result(position, result)
+
+        pending = []
+        for position, item in enumerate(plan):
+            cached = self.cache.get(item['start'], item['end']) if self.cache else None
+            if cached is not None:
+                self.stats['cached'] += 1
+                land(position, cached)
+            else:
+                pending.append((position, dict(item, index=position + 1)))
+
+        if pending:
+            chunks = prepare([item for _, item in pending])
+            # 큰 청크부터 배정
+            jobs = sorted(zip((position for position, _ in pending), (item for _, item in pending), chunks),
+                          key=lambda job: (-(job[1]['end'] - job[1]['start']), job[0]))
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(self._run_one, chunk): (position, item)
+                           for position, item, chunk in jobs}
+                for future in as_completed(futures):
+                    position, item = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'error': str(e), 'chunk': item}
+
+                    if 'error' in result:
+                        self.stats['failed'] += 1
+                    else:
+                        self.stats['parsed'] += 1
+                        if self.cache:
+                            self.cache.put(item['start'], item['end'], result)
+                    land(position, result)
+
+        return results
@@ -0,0 +1,369 @@
+"""
+약가 검색 사전 (공용, mmap)
+
+build_drug_dictionary.py가 만들던 drug_dictionary.json은 검색 키마다 제품 records 목록을
+통째로 복사해 같은 제품이 키 최대 8개에 중복 저장되고, 사용하는 스크립트마다 JSON 전체를 읽었다.
+여기서는 제품 표와 키 → 제품 번호 목록을 분리해 디스크에 저장하고 mmap으로 연다.
+
+- 제품 표: 문자열은 한 번만 저장(intern)하고 제품마다 문자열 번호 6개 + 상한가 (열 단위 배열)
+- 검색 키: UTF-8 바이트 순으로 정렬 → 이분 탐색 O(log n)
+- 키 → 제품 번호 posting (중복 없음)
+- 열 때는 meta.json만 읽고 나머지는 mmap (시작 비용 거의 없음)
+
+저장 구조:
+    data/hira_master/drug_dictionary/
+        meta.json            {"version": 1, "source": "...", "products": ..., "keys": ..., "strings": ...}
+        strings.bin          intern 문자열 UTF-8 연결
+        string_offsets.bin   uint32 × (문자열 수 + 1)
+        products.bin         uint32 × 6 × 제품 수 (PRODUCT_FIELDS 순서의 문자열 번호)
+        prices.bin           float64 × 제품 수
+        keys.bin             정렬된 검색 키 UTF-8 연결
+        key_offsets.bin      uint32 × (키 수 + 1)
+        key_flags.bin        uint8 × 키 수 (KEY_ORIGINAL / KEY_NORMALIZED)
+        key_postings.bin     uint32 × (키 수 + 1)  → postings.bin 내 시작 위치
+        postings.bin         uint32 × 전체 posting 수 (제품 번호)
+
+사용 예:
+    with DrugDictionary.open() as drug_dict:
+        '옵디보' in drug_dict
+        drug_dict.records('니볼루맙')          # [{'product_code': ..., 'price': ...}, ...]
+        drug_dict.lookup('Opdivo-주')         # 원본 키 → 정규화 키 순서로 조회
+"""
+import json
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from shared.utils.mmap_table import MmapFiles, PackedStrings, SnapshotWriter, pack_strings
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DICT_DIR = PROJECT_ROOT / "data" / "hira_master" / "drug_dictionary"
+
+# 파일 구조가 바뀌면 올려서 기존 사전 무효화
+DICT_VERSION = 1
+
+PRODUCT_FIELDS = ('product_code', 'product_name', 'specification', 'company', 'ingredient_code', 'route')
+
+KEY_ORIGINAL = 1
+KEY_NORMALIZED = 2
+
+# 제품명 → 검색 키 (search_key_table)
+# 제형: 목록 앞쪽 제형을 먼저 확인하던 기존 순서를 유지하기 위해,
+# 앞쪽 제형으로 끝나는 뒤쪽 제형(서방정 → 정, 주사액 → 액 등)은 정규식에서 뺀다.
+# 남은 제형끼리는 서로 접미사 관계가 아니므로 한 제품명에 최대 하나만 일치한다.
+DOSAGE_FORMS = [
+    '주', '정', '캡슐', '연질캡슐', '경질캡슐', '서방정', '서방캡슐',
+    '시럽', '액', '현탁액', '용액', '주사', '주사액',
+    '연고', '크림', '겔', '로션', '패치', '좌제', '좌약',
+    '산', '과립', '세립', '분말', '산제',
+    '점안액', '점비액', '점이액', '안연고',
+    '흡입제', '스프레이', '에어로졸',
+    '필름', '트로키', '츄정', '발포정'
+]
+_EFFECTIVE_FORMS = [form for i, form in enumerate(DOSAGE_FORMS)
+                    if not any(form.endswith(prev) for prev in DOSAGE_FORMS[:i])]
+FORM_SUFFIX_RE = re.compile(r'^(.*)(?:' + '|'.join(map(re.escape, _EFFECTIVE_FORMS)) + r')$', re.DOTALL)
+DOSAGE_RE = re.compile(r'\d+(\.\d+)?(mg|g|mL|L|밀리그램|그램|킬로그램|밀리리터|리터|μg|mcg|IU|I\.U|KI\.U).*$',
+                       re.IGNORECASE)
+
+# 검색 키 종류 (search_key_table의 key_kind, 제품별 키 순서)
+KEY_KINDS = ('product', 'without_dosage', 'without_form', 'ingredient')
+
+
+def normalize_key(key: str) -> str:
+    """
+    검색 키 정규화
+    - 소문자 변환
+    - 공백, 하이픈, 언더스코어 제거
+    - 특수문자 제거
+    """
+    if not key:
+        return ''
+
+    # 소문자 변환
+    normalized = key.lower()
+
+    # 공백, 특수문자 제거
+    normalized = re.sub(r'[\s\-_·]', '', normalized)
+
+    # 한글, 영문, 숫자만 남김
+    normalized = re.sub(r'[^\w가-힣]', '', normalized)
+
+    return normalized
+
+
+def normalize_keys(keys):
+    """normalize_key의 pandas 열 단위 버전 (Series → Series)"""
+    return (keys.str.lower()
+            .str.replace(r'[\s\-_·]', '', regex=True)
+            .str.replace(r'[^\w가-힣]', '', regex=True))
+
+
+def search_key_table(product_names):
+    """
+    제품명 열 → 검색 키 긴 형식 표 (pandas 문자열 연산, 행 반복 없음)
+
+    예시 입력: "옵디보주100mg(니볼루맙,유전자재조합)_(0.1g/10mL)"
+
+    키 종류 (KEY_KINDS):
+    1. product        "옵디보주100mg" - 전체 제품명 (괄호 앞)
+    2. without_dosage "옵디보주" - 숫자/단위 제거
+    3. without_form   "옵디보" - 제형도 제거
+    4. ingredient     "니볼루맙" - 성분명 (괄호 안 첫 번째)
+
+    Args:
+        product_names: 제품명 Series (index = 행 번호)
+
+    Returns:
+        DataFrame [row, key, key_kind, normalized]
+        (row, KEY_KINDS 순서로 정렬, 빈 키 제외, normalized는 원본과 다를 때만 값)
+    """
+    import pandas as pd
+
+    names = product_names[product_names.notna()].astype(str)
+
+    full = names.str.extract(r'^([^(]+)', expand=False).str.strip()
+    without_dosage = full.str.replace(DOSAGE_RE, '', regex=True).str.strip()
+    base = without_dosage.where(without_dosage != '', full)
+    stem = base.str.extract(FORM_SUFFIX_RE, expand=False).str.strip()
+    ingredient = names.str.extract(r'\(([^)]+)\)', expand=False).str.split(',').str[0].str.strip()
+
+    # 괄호 앞 제품명이 없으면(괄호로 시작) 키 없음
+    has_name = full.notna()
+    columns = {
+        'product': full,
+        'without_dosage': without_dosage.where(without_dosage != full),
+        'without_form': stem.where((stem != base) & (stem != full) & (stem != without_dosage)),
+        'ingredient': ingredient.where(has_name),
+    }
+
+    frames = []
+    for order, kind in enumerate(KEY_KINDS):
+        keys = columns[kind]
+        keys = keys[keys.notna() & (keys != '')]
+        frames.append(pd.DataFrame({'row': keys.index, 'key': keys.values, 'key_kind': kind, 'order': order}))
+    table = pd.concat(frames, ignore_index=True).sort_values(['row', 'order'], kind='stable')
+
+    normalized = normalize_keys(table['key'])
+    table['normalized'] = normalized.where((normalized != '') & (normalized != table['key']))
+    return table.drop(columns='order').reset_index(drop=True)
+
+
+class DrugDictionaryBuilder:
+    """제품 레코드 + 검색 키 → 사전 파일"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.products = array('I')
+        self.prices = array('d')
+        self.keys: Dict[str, List[int]] = {}
+        self.key_flags: Dict[str, int] = {}
+
+    def _intern(self, value: Any) -> int:
+        value = '' if value is None else str(value)
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def _add_key(self, key: str, product_id: int, flag: int) -> None:
+        ids = self.keys.setdefault(key, [])
+        if not ids or ids[-1] != product_id:
+            ids.append(product_id)
+        self.key_flags[key] = self.key_flags.get(key, 0) | flag
+
+    def add(self, record: Dict[str, Any], search_keys: Iterable[str]) -> int:
+        """
+        제품 1개 등록
+
+        Args:
+            record: PRODUCT_FIELDS + 'price'
+            search_keys: 원본 검색 키 (정규화 키는 자동 추가)
+
+        Returns:
+            제품 번호
+        """
+        product_id = len(self.prices)
+        self.products.extend(self._intern(record.get(field)) for field in PRODUCT_FIELDS)
+        self.prices.append(float(record.get('price') or 0.0))
+
+        for key in search_keys:
+            if not key:
+                continue
+            self._add_key(key, product_id, KEY_ORIGINAL)
+            normalized = normalize_key(key)
+            if normalized and normalized != key:
+                self._add_key(normalized, product_id, KEY_NORMALIZED)
+        return product_id
+
+    def add_table(self, records: List[Dict[str, Any]], key_table) -> None:
+        """
+        제품 전체 + search_key_table() 결과 일괄 등록
+
+        Args:
+            records: 제품 레코드 (key_table의 row = 이 목록의 순번)
+            key_table: DataFrame [row, key, normalized]
+        """
+        offset = len(self.prices)
+        for record in records:
+            self.products.extend(self._intern(record.get(field)) for field in PRODUCT_FIELDS)
+            self.prices.append(float(record.get('price') or 0.0))
+
+        for row, key, normalized in key_table[['row', 'key', 'normalized']].itertuples(index=False):
+            self._add_key(key, offset + row, KEY_ORIGINAL)
+            if isinstance(normalized, str):
+                self._add_key(normalized, offset + row, KEY_NORMALIZED)
+
+    def save(self, dict_dir: Path = DICT_DIR, source: Optional[Path] = None) -> Dict[str, Any]:
+        """사전 파일 저장 (각 파일을 임시 파일에 쓴 뒤 교체, meta.json은 마지막)"""
+        # str 정렬 = UTF-8 바이트 정렬 → 열었을 때 이분 탐색 가능
+        keys = sorted(self.keys)
+        postings = array('I')
+        posting_offsets = array('I', [0])
+        for key in keys:
+            postings.extend(self.keys[key])
+            posting_offsets.append(len(postings))
+
+        data = {'products.bin': self.products, 'prices.bin': self.prices,
+                'key_flags.bin': bytes(self.key_flags[key] for key in keys),
+                'key_postings.bin': posting_offsets, 'postings.bin': postings}
+        data['strings.bin'], data['string_offsets.bin'] = pack_strings(self.strings)
+        data['keys.bin'], data['key_offsets.bin'] = pack_strings(keys)
+
+        writer = SnapshotWriter(dict_dir)
+        writer.write_files(DrugDictionary._FILES, data)
+
+        meta = {'version': DICT_VERSION, 'source': str(source) if source else None,
+                'products': len(self.prices), 'keys': len(keys), 'strings': len(self.strings),
+                'postings': len(postings)}
+        writer.write_json('meta.json', meta)
+        return meta
+
+
+class DrugDictionary:
+    """약가 검색 사전 (mmap)"""
+
+    # 파일명 → array 형식 (None은 바이트 그대로)
+    _FILES = {
+        'strings.bin': None, 'string_offsets.bin': 'I', 'products.bin': 'I', 'prices.bin': 'd',
+        'keys.bin': None, 'key_offsets.bin': 'I', 'key_flags.bin': None,
+        'key_postings.bin': 'I', 'postings.bin': 'I',
+    }
+
+    def __init__(self, dict_dir: Path = DICT_DIR):
+        self.dict_dir = Path(dict_dir)
+        with open(self.dict_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != DICT_VERSION:
+            raise ValueError(f"Unsupported drug dictionary version: {self.meta.get('version')} "
+                             f"(expected {DICT_VERSION}, rebuild with build_drug_dictionary.py)")
+
+        self._files = MmapFiles(self.dict_dir, self._FILES)
+        data = self._files.data
+        self._strings = PackedStrings(data['strings.bin'], data['string_offsets.bin'])
+        self._keys = PackedStrings(data['keys.bin'], data['key_offsets.bin'])
+        self._products = data['products.bin']
+        self._prices = data['prices.bin']
+        self._key_flags = data['key_flags.bin']
+        self._key_postings = data['key_postings.bin']
+        self._postings = data['postings.bin']
+
+    @classmethod
+    def open(cls, dict_dir: Path = DICT_DIR) -> "DrugDictionary":
+        return cls(dict_dir)
+
+    def close(self) -> None:
+        """mmap 해제"""
+        self._files.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """디스크 크기 (바이트)"""
+        return self._files.nbytes + (self.dict_dir / 'meta.json').stat().st_size
+
+    # ------------------------------------------------------------------
+    # 제품
+    # ------------------------------------------------------------------
+
+    @property
+    def num_products(self) -> int:
+        return len(self._prices)
+
+    def _string(self, string_id: int) -> str:
+        return self._strings[string_id]
+
+    def product(self, product_id: int) -> Dict[str, Any]:
+        """제품 레코드 (기존 drug_dictionary.json의 records 항목과 같은 형태)"""
+        base = product_id * len(PRODUCT_FIELDS)
+        record = {field: self._string(self._products[base + i]) for i, field in enumerate(PRODUCT_FIELDS)}
+        record['price'] = self._prices[product_id]
+        return record
+
+    def products(self) -> Iterator[Dict[str, Any]]:
+        """전체 제품 (약가파일 행 순서)"""
+        for product_id in range(self.num_products):
+            yield self.product(product_id)
+
+    # ------------------------------------------------------------------
+    # 검색 키
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _position(self, key: str) -> Optional[int]:
+        return self._keys.position(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._position(key) is not None
+
+    def keys(self) -> Iterator[str]:
+        """검색 키 (UTF-8 바이트 순)"""
+        return iter(self._keys)
+
+    def product_ids(self, key: str) -> List[int]:
+        """키 → 제품 번호 목록 (없으면 빈 목록)"""
+        i = self._position(key)
+        if i is None:
+            return []
+        return list(self._postings[self._key_postings[i]:self._key_postings[i + 1]])
+
+    def records(self, key: str) -> List[Dict[str, Any]]:
+        """키 → 제품 레코드 목록"""
+        return [self.product(product_id) for product_id in self.product_ids(key)]
+
+    def get(self, key: str, default=None) -> Optional[Dict[str, Any]]:
+        """
+        기존 drug_dictionary.json 항목 형태로 조회
+
+        Returns:
+            {'records': [...], 'normalized_from': '정규화 키' | None, 'is_normalized': bool}
+        """
+        i = self._position(key)
+        if i is None:
+            return default
+        flag = self._key_flags[i]
+        normalized = normalize_key(key) if flag & KEY_ORIGINAL else ''
+        return {
+            'records': [self.product(p) for p in self._postings[self._key_postings[i]:self._key_postings[i + 1]]],
+            'normalized_from': normalized if normalized and normalized != key else None,
+            'is_normalized': bool(flag & KEY_NORMALIZED),
+        }
+
+    def lookup(self, query: str) -> List[Dict[str, Any]]:
+        """원본 키로 찾고, 없으면 정규화 키로 조회"""
+        records = self.records(query)
+        if not records:
+            normalized = normalize_key(query)
+            if normalized and normalized != query:
+                records = self.records(normalized)
+        return records
@@ -0,0 +1,163 @@
+"""
+한글 음차 로마자 변환 + 자음 골격 음성 키 (공용)
+
+refine_drug_anchors.DrugAnchorRefiner._romanize_korean은 항목마다 음절을 하나씩 자모 분해했고,
+한글 약제명에 맞는 영문 성분명을 찾으려면 사전 전체와 SequenceMatcher를 돌려야 했다.
+여기서는 한글 음절 11,172개 전부의 로마자/음성 키를 미리 표로 만들어 str.translate 한 번으로 변환하고,
+음성 키 → 영문 성분명 색인으로 후보만 조회한다.
+
+- romanize: 기존 _romanize_korean과 같은 출력 (초성/중성/종성 로마자 연결, 한글 외 문자는 그대로)
+- 음성 키 (자음 골격): 모음/묵음(ㅇ 초성, ㅎ, h, w, y)을 빼고 자음을 음차 대응 부류로 묶은 뒤 연속 중복 제거
+    K: ㄱㄲㅋ / g k c q (c는 e/i/y 앞에서 S)     T: ㄷㄸㅌ / d t th
+    P: ㅂㅃㅍ / b p f v ph                       S: ㅅㅆㅈㅉㅊ / s z j sh (x → KS, 어두 x → S)
+    L: ㄹ / l r (r은 모음 앞에서만, carboplatin → 카보)   M: ㅁ / m   N: ㄴ ㅇ(종성) / n
+  예: paclitaxel → PKLTKSL ← 파클리탁셀, gemcitabine → SMSTPN ← 젬시타빈
+- 영문 g는 e/i/y 앞에서 게(gefitinib)/젬(gemcitabine) 둘 다 가능해 키 후보를 모두 만든다.
+
+사용 예:
+    romanize('파클리탁셀')                     # 'pakeulritagsel'
+    korean_key('파클리탁셀'), english_keys('paclitaxel')   # 'PKLTKSL', ['PKLTKSL']
+    index = PhoneticIndex(['paclitaxel', 'docetaxel', 'imatinib'])
+    index.candidates('이매티닙')               # [('imatinib', 0.6...)]
+"""
+import re
+from difflib import SequenceMatcher
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172  # 19 × 21 × 28
+
+CHOSUNG_ROMAN = ['g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj', 'ch', 'k', 't', 'p', 'h']
+JUNGSUNG_ROMAN = ['a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo', 'u', 'weo', 'we',
+                  'wi', 'yu', 'eu', 'ui', 'i']
+JONGSUNG_ROMAN = ['', 'g', 'kk', 'gs', 'n', 'nj', 'nh', 'd', 'l', 'lg', 'lm', 'lb', 'ls', 'lt', 'lp', 'lh', 'm', 'b',
+                  'bs', 's', 'ss', 'ng', 'j', 'ch', 'k', 't', 'p', 'h']
+
+# 자모 → 음성 부류 (JONGSUNG은 외래어 받침 발음 기준: ㅅ → T, ㅇ → N)
+CHOSUNG_KEY = ['K', 'K', 'N', 'T', 'T', 'L', 'M', 'P', 'P', 'S', 'S', '', 'S', 'S', 'S', 'K', 'T', 'P', '']
+JONGSUNG_KEY = ['', 'K', 'K', 'KS', 'N', 'NS', 'N', 'T', 'L', 'LK', 'LM', 'LP', 'LS', 'LT', 'LP', 'L', 'M', 'P',
+                'PS', 'T', 'T', 'N', 'T', 'T', 'K', 'T', 'P', '']
+
+# 음절 표 (순번 = 코드 - 0xAC00)
+ROMANIZATION: Tuple[str, ...] = tuple(
+    CHOSUNG_ROMAN[cho] + JUNGSUNG_ROMAN[jung] + JONGSUNG_ROMAN[jong]
+    for cho in range(19) for jung in range(21) for jong in range(28)
+)
+SYLLABLE_KEYS: Tuple[str, ...] = tuple(
+    CHOSUNG_KEY[cho] + JONGSUNG_KEY[jong]
+    for cho in range(19) for jung in range(21) for jong in range(28)
+)
+
+_ROMAN_TABLE = {HANGUL_BASE + i: roman for i, roman in enumerate(ROMANIZATION)}
+_KEY_TABLE = {HANGUL_BASE + i: key for i, key in enumerate(SYLLABLE_KEYS)}
+
+_NON_HANGUL = re.compile(r'[^가-힣]+')
+_REPEAT = re.compile(r'(.)\1+')
+
+# 영문 철자 → 음성 부류 (순서대로 적용, 소문자 a-z만 남긴 뒤)
+_EN_RULES = [(re.compile(pattern), repl) for pattern, repl in [
+    (r'ph', 'f'), (r'th', 't'), (r'sh', 's'), (r'ch', 'k'), (r'ck', 'k'), (r'qu', 'k'), (r'q', 'k'),
+    (r'^x', 's'), (r'x', 'ks'),
+    (r'c(?=[eiy])', 's'), (r'c', 'k'),
+    (r'g(?=[eiy])', 'G'),            # 게/제 모호 → 아래에서 K, S로 펼침
+    (r'r(?![aeiouy])', ''), (r'r', 'l'),
+    (r'[zj]', 's'), (r'[fvb]', 'p'), (r'd', 't'), (r'g', 'k'),
+    (r'[aeiouywh]', ''),
+]]
+
+# 모호한 g가 많을 때 키 후보 상한 (2^3)
+MAX_AMBIGUOUS = 3
+
+
+def romanize(text: str) -> str:
+    """한글 → 로마자 (음절 표 + str.translate, 한글 외 문자는 그대로)"""
+    return text.translate(_ROMAN_TABLE) if text else ''
+
+
+def korean_key(text: str) -> str:
+    """한글 이름 → 음성 키 (한글 음절만 사용)"""
+    if not text:
+        return ''
+    return _REPEAT.sub(r'\1', _NON_HANGUL.sub('', text).translate(_KEY_TABLE))
+
+
+def english_keys(name: str) -> List[str]:
+    """영문 이름 → 음성 키 후보 (e/i/y 앞 g는 K, S 둘 다)"""
+    skeleton = re.sub(r'[^a-z]', '', (name or '').lower())
+    for pattern, repl in _EN_RULES:
+        skeleton = pattern.sub(repl, skeleton)
+    skeleton = skeleton.upper()
+
+    parts = skeleton.split('G')
+    if len(parts) - 1 > MAX_AMBIGUOUS:
+        parts = ['K'.join(parts[:-MAX_AMBIGUOUS])] + parts[-MAX_AMBIGUOUS:]
+    keys = []
+    for choice in product('KS', repeat=len(parts) - 1):
+        joined = parts[0] + ''.join(c + part for c, part in zip(choice, parts[1:]))
+        key = _REPEAT.sub(r'\1', joined)
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _deletions(key: str) -> Set[str]:
+    """키에서 자음 1개를 뺀 변형 (받침 유무 등 1자 차이 허용)"""
+    return {key[:i] + key[i + 1:] for i in range(len(key))}
+
+
+class PhoneticIndex:
+    """음성 키 → 영문 이름 색인"""
+
+    def __init__(self, names: Iterable[str], fuzzy: bool = True):
+        """
+        Args:
+            names: 영문 성분명 (중복은 한 번만)
+            fuzzy: 자음 1개 차이(삭제 변형)도 색인
+        """
+        self.names: List[str] = []
+        self.exact: Dict[str, Set[int]] = {}
+        self.deletes: Dict[str, Set[int]] = {}
+        self.fuzzy = fuzzy
+
+        seen = set()
+        for name in names:
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            position = len(self.names)
+            self.names.append(name)
+            for key in english_keys(name):
+                if not key:
+                    continue
+                self.exact.setdefault(key, set()).add(position)
+                if fuzzy:
+                    for variant in _deletions(key) | {key}:
+                        self.deletes.setdefault(variant, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, korean: str) -> Set[int]:
+        """한글 이름 → 후보 이름 번호 (키 일치, 없으면 자음 1개 차이)"""
+        key = korean_key(korean)
+        if not key:
+            return set()
+        found = set(self.exact.get(key, ()))
+        if not found and self.fuzzy:
+            for variant in _deletions(key) | {key}:
+                found |= self.deletes.get(variant, set())
+        return found
+
+    def candidates(self, korean: str, limit: Optional[int] = 5) -> List[Tuple[str, float]]:
+        """
+        한글 이름 → 영문 이름 후보 (로마자 SequenceMatcher 유사도 내림차순)
+
+        Returns:
+            [(영문 이름, 유사도), ...]
+        """
+        romanized = romanize(korean)
+        scored = [(self.names[i], SequenceMatcher(None, self.names[i].lower(), romanized).ratio())
+                  for i in self.lookup(korean)]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit] if limit else scored
@@ -0,0 +1,378 @@
+"""
+KCD-9 코드 인덱스 (공용)
+
+암종/바이오마커 → KCD 매핑 스크립트와 neo4j 임포터가 각자 kcd9_full.json 전체를 읽고
+코드마다 name_kr/name_en을 소문자로 바꿔 가며 선형 탐색하던 것을 한 곳에 모은다.
+
+- 코드 트라이: 코드를 정렬한 배열 + 이분 탐색 (접두사 'C50', 범위 'C00'~'D48' 조회)
+- 플래그 비트맵: 코드별 1바이트 (암 코드 / 최하위 코드 / 표제어)
+- n-gram 역색인: 소문자 한글명·영문명의 1-gram/2-gram → 정렬된 코드 번호 목록
+- 한 번 빌드해 디스크에 저장하고, 이후에는 meta.json만 읽고 나머지 파일은 전부 mmap으로 연다
+  (코드/이름/n-gram 키는 UTF-8 연결 바이트 + 오프셋 배열, 조회는 이분 탐색 - 열 때 dict/list를 만들지 않음)
+  (kcd9_full.json의 크기/수정 시각이 바뀌면 자동 재빌드)
+- 재빌드 원본 레코드는 normalize_kcd9_masterfile.py가 같은 표로 함께 저장하는 kcd9_full.parquet에서
+  필요한 컬럼만 읽음 (load_kcd9_frame, pandas/pyarrow가 없거나 Parquet이 없으면 kcd9_full.json)
+
+저장 구조:
+    data/kssc/kcd-9th/normalized/kcd9_index/
+        meta.json           {"version": 2, "source": "...", "source_size": ..., "source_mtime_ns": ..., "count": 54126}
+        codes.bin           정렬된 코드 UTF-8 연결          code_offsets.bin      uint32 × (코드 수 + 1)
+        names_kr.bin        한글명 (코드 순서)              names_kr_offsets.bin  uint32 × (코드 수 + 1)
+        names_en.bin        영문명 (코드 순서)              names_en_offsets.bin  uint32 × (코드 수 + 1)
+        haystack.bin        검증용 "소문자 한글명\n소문자 영문명"   haystack_offsets.bin  uint32 × (코드 수 + 1)
+        flags.bin           uint8 × 코드 수
+        grams.bin           정렬된 n-gram UTF-8 연결        gram_offsets.bin      uint32 × (n-gram 수 + 1)
+        gram_postings.bin   uint32 × (n-gram 수 + 1)  → postings.bin 내 시작 위치
+        postings.bin        uint32 × 전체 posting 수 (코드 번호)
+
+사용 예:
+    index = KCDIndex.load()
+    index.prefix('C50')                         # ['C50', 'C50.0', ...]
+    index.range('C00', 'D48')                   # 신생물 코드 전체
+    counts = index.match_counts(['유방'], cancer_only=True, lowest_only=True)
+"""
+import json
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from shared.utils.mmap_table import MmapFiles, PackedStrings, SnapshotWriter, empty_files, pack_strings
+
+PROJECT_ROOT = Path(__file__).parent.parent
+KCD_FILE = PROJECT_ROOT / "data" / "kssc" / "kcd-9th" / "normalized" / "kcd9_full.json"
+INDEX_DIR = KCD_FILE.parent / "kcd9_index"
+
+# 인덱스 빌드에 쓰는 레코드 필드
+RECORD_FIELDS = ['code', 'name_kr', 'name_en', 'is_header', 'is_lowest']
+
+# 파일 구조/색인 방식이 바뀌면 올려서 기존 인덱스 무효화
+INDEX_VERSION = 2
+
+FLAG_CANCER = 1
+FLAG_LOWEST = 2
+FLAG_HEADER = 4
+
+_D_CATEGORY_RE = re.compile(r'D(\d+)')
+
+
+def is_cancer_code(code: Optional[str]) -> bool:
+    """암 코드 여부 (C00-D48, 범위 코드 제외)"""
+    if not code or '-' in code:
+        return False
+    if code.startswith('C'):
+        return True
+    if code.startswith('D'):
+        match = _D_CATEGORY_RE.match(code)
+        if match:
+            return 0 <= int(match.group(1)) <= 48
+    return False
+
+
+def name_grams(text: str) -> set:
+    """색인용 n-gram (1-gram + 2-gram, 공백 포함 그대로)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(text: str) -> List[str]:
+    """검색어 → 교집합을 구할 n-gram (2글자 이상이면 2-gram, 1글자면 그 글자)"""
+    if len(text) < 2:
+        return [text]
+    return sorted({text[i:i + 2] for i in range(len(text) - 1)})
+
+
+def load_records(source: Path = KCD_FILE) -> List[Dict[str, Any]]:
+    """
+    인덱스 빌드용 KCD 레코드 (RECORD_FIELDS만)
+
+    kcd9_full.json은 normalize_kcd9_masterfile.py가 kcd9_full.parquet와 같은 표에서 만들므로,
+    옆에 Parquet이 있으면 필요한 컬럼만 컬럼형으로 읽고 JSON 전체 파싱은 생략한다.
+    """
+    source = Path(source)
+    try:
+        from normalize_kcd9_masterfile import PARQUET_FILE, load_kcd9_frame
+    except ImportError:  # pandas 미설치
+        PARQUET_FILE = None
+    if PARQUET_FILE is not None and source.name == KCD_FILE.name and (source.parent / PARQUET_FILE.name).exists():
+        try:
+            return load_kcd9_frame(RECORD_FIELDS, source.parent).to_dict('records')
+        except ImportError:  # pyarrow 미설치
+            pass
+    with open(source, 'r', encoding='utf-8') as f:
+        return json.load(f)['codes']
+
+
+class KCDIndex:
+    """KCD 코드 인덱스 (코드 정렬 배열 + 플래그 비트맵 + n-gram 역색인)"""
+
+    # 파일명 → array 형식 (None은 바이트 그대로)
+    _FILES = {
+        'codes.bin': None, 'code_offsets.bin': 'I',
+        'names_kr.bin': None, 'names_kr_offsets.bin': 'I',
+        'names_en.bin': None, 'names_en_offsets.bin': 'I',
+        'haystack.bin': None, 'haystack_offsets.bin': 'I',
+        'flags.bin': None,
+        'grams.bin': None, 'gram_offsets.bin': 'I', 'gram_postings.bin': 'I', 'postings.bin': 'I',
+    }
+
+    def __init__(self, data: Dict[str, Any], files: Optional[MmapFiles] = None):
+        """
+        Args:
+            data: _FILES 이름 → 바이트/배열 (from_records는 메모리 배열, open은 mmap을 cast한 memoryview)
+            files: open으로 연 mmap 파일 (close에서 해제)
+        """
+        self._bind(data)
+        self._files = files
+
+    def _bind(self, data: Dict[str, Any]) -> None:
+        self.codes = PackedStrings(data['codes.bin'], data['code_offsets.bin'])
+        self.names_kr = PackedStrings(data['names_kr.bin'], data['names_kr_offsets.bin'])
+        self.names_en = PackedStrings(data['names_en.bin'], data['names_en_offsets.bin'])
+        # 검증용 소문자 이름 (한글명/영문명 경계를 넘는 매칭 방지용 구분자)
+        self._haystack = PackedStrings(data['haystack.bin'], data['haystack_offsets.bin'])
+        self.flags = data['flags.bin']
+        self.grams = PackedStrings(data['grams.bin'], data['gram_offsets.bin'])
+        self.gram_postings = data['gram_postings.bin']
+        self.postings = data['postings.bin']
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: str) -> bool:
+        return self.position(code) is not None
+
+    # ------------------------------------------------------------------
+    # 빌드 / 저장 / 로드
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "KCDIndex":
+        """kcd9_full.json의 codes 레코드로 메모리 인덱스 생성"""
+        rows = sorted(records, key=lambda r: r['code'])
+        codes = [r['code'] for r in rows]
+        names_kr = [r.get('name_kr') or '' for r in rows]
+        names_en = [r.get('name_en') or '' for r in rows]
+
+        flags = bytearray(len(rows))
+        inverted: Dict[str, List[int]] = {}
+        for i, row in enumerate(rows):
+            flag = 0
+            if is_cancer_code(row['code']):
+                flag |= FLAG_CANCER
+            if row.get('is_lowest'):
+                flag |= FLAG_LOWEST
+            if row.get('is_header'):
+                flag |= FLAG_HEADER
+            flags[i] = flag
+
+            for gram in name_grams(names_kr[i].lower()) | name_grams(names_en[i].lower()):
+                inverted.setdefault(gram, []).append(i)
+
+        # str 정렬 = UTF-8 바이트 정렬 (코드 포인트 순서 보존) → 저장 후에도 이분 탐색 가능
+        grams = sorted(inverted)
+        gram_postings = array('I', [0])
+        postings = array('I')
+        for gram in grams:
+            postings.extend(inverted[gram])
+            gram_postings.append(len(postings))
+
+        haystack = [f"{kr.lower()}\n{en.lower()}" for kr, en in zip(names_kr, names_en)]
+        data = {'flags.bin': bytes(flags), 'gram_postings.bin': gram_postings, 'postings.bin': postings}
+        data['codes.bin'], data['code_offsets.bin'] = pack_strings(codes)
+        data['names_kr.bin'], data['names_kr_offsets.bin'] = pack_strings(names_kr)
+        data['names_en.bin'], data['names_en_offsets.bin'] = pack_strings(names_en)
+        data['haystack.bin'], data['haystack_offsets.bin'] = pack_strings(haystack)
+        data['grams.bin'], data['gram_offsets.bin'] = pack_strings(grams)
+        return cls(data)
+
+    def save(self, index_dir: Path, source_stat: Optional[os.stat_result] = None,
+             source: Optional[Path] = None) -> None:
+        """인덱스 파일 저장 (각 파일을 임시 파일에 쓴 뒤 교체, meta.json은 마지막)"""
+        writer = SnapshotWriter(index_dir)
+        writer.write_files(self._FILES, self._data)
+
+        meta = {'version': INDEX_VERSION, 'count': len(self.codes),
+                'source': str(source) if source else None,
+                'source_size': source_stat.st_size if source_stat else None,
+                'source_mtime_ns': source_stat.st_mtime_ns if source_stat else None}
+        writer.write_json('meta.json', meta)
+
+    @classmethod
+    def open(cls, index_dir: Path) -> "KCDIndex":
+        """저장된 인덱스 열기 (meta.json 외 모든 파일 mmap)"""
+        index_dir = Path(index_dir)
+        with open(index_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported KCD index version: {meta.get('version')} "
+                             f"(expected {INDEX_VERSION}, rebuild with KCDIndex.load(rebuild=True))")
+
+        files = MmapFiles(index_dir, cls._FILES)
+        return cls(files.data, files)
+
+    @classmethod
+    def load(cls, source: Path = KCD_FILE, index_dir: Path = INDEX_DIR,
+             rebuild: bool = False) -> "KCDIndex":
+        """
+        인덱스 로드 (없거나 원본이 바뀌었으면 kcd9_full.json에서 빌드 후 저장)
+
+        Args:
+            source: kcd9_full.json 경로
+            index_dir: 인덱스 디렉토리
+            rebuild: 원본이 그대로여도 다시 빌드
+        """
+        source = Path(source)
+        index_dir = Path(index_dir)
+        stat = source.stat()
+
+        meta = {}
+        meta_path = index_dir / 'meta.json'
+        if meta_path.exists() and not rebuild:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+
+        if (meta.get('version') == INDEX_VERSION and meta.get('source_size') == stat.st_size
+                and meta.get('source_mtime_ns') == stat.st_mtime_ns):
+            return cls.open(index_dir)
+
+        cls.from_records(load_records(source)).save(index_dir, stat, source)
+        return cls.open(index_dir)
+
+    def close(self) -> None:
+        """mmap 해제"""
+        if self._files is None:
+            return
+        self._bind(empty_files(self._FILES))
+        self._files.close()
+        self._files = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 코드 조회
+    # ------------------------------------------------------------------
+
+    def position(self, code: str) -> Optional[int]:
+        """코드 번호 (없으면 None, 정렬된 코드 이분 탐색)"""
+        return self.codes.position(code)
+
+    def entry(self, i: int) -> Dict[str, Any]:
+        """코드 번호 → 레코드"""
+        flag = self.flags[i]
+        return {
+            'code': self.codes[i],
+            'name_kr': self.names_kr[i],
+            'name_en': self.names_en[i],
+            'is_cancer': bool(flag & FLAG_CANCER),
+            'is_lowest': bool(flag & FLAG_LOWEST),
+            'is_header': bool(flag & FLAG_HEADER),
+        }
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        """코드 → 레코드 (없으면 None)"""
+        i = self.position(code)
+        return None if i is None else self.entry(i)
+
+    def is_cancer(self, code: str) -> bool:
+        """암 코드 여부 (인덱스에 없는 코드는 규칙으로 판정)"""
+        i = self.position(code)
+        if i is None:
+            return is_cancer_code(code)
+        return bool(self.flags[i] & FLAG_CANCER)
+
+    def prefix(self, prefix: str) -> List[str]:
+        """접두사로 시작하는 코드 (정렬 순서)"""
+        start = bisect_left(self.codes, prefix)
+        end = bisect_left(self.codes, prefix + '\uffff', lo=start)
+        return self.codes[start:end]
+
+    def range(self, start: str, end: str) -> List[str]:
+        """
+        코드 범위 조회 (범위 코드 'A00-B99' 제외)
+
+        end는 접두사로 취급한다: range('C00', 'D48')은 D48.9까지 포함
+        """
+        lo = bisect_left(self.codes, start)
+        hi = bisect_right(self.codes, end + '\uffff', lo=lo)
+        return [code for code in self.codes[lo:hi] if '-' not in code]
+
+    def cancer_codes(self, lowest_only: bool = False) -> List[str]:
+        """암 코드 목록 (비트맵 기준)"""
+        mask = FLAG_CANCER | (FLAG_LOWEST if lowest_only else 0)
+        return [self.codes[i] for i in range(len(self.codes)) if self.flags[i] & mask == mask]
+
+    # ------------------------------------------------------------------
+    # 이름 검색
+    # ------------------------------------------------------------------
+
+    def _posting(self, gram: str) -> Optional[memoryview]:
+        i = bisect_left(self.grams, gram)
+        if i == len(self.grams) or self.grams[i] != gram:
+            return None
+        return self.postings[self.gram_postings[i]:self.gram_postings[i + 1]]
+
+    def _candidates(self, text: str) -> set:
+        """n-gram posting 교집합 (가장 짧은 목록부터)"""
+        postings = []
+        for gram in query_grams(text):
+            posting = self._posting(gram)
+            if posting is None:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return candidates
+
+    def search(self, keyword: str, cancer_only: bool = False, lowest_only: bool = False,
+               exclude_header: bool = False) -> List[int]:
+        """
+        한글명 또는 영문명에 키워드(대소문자 무시)가 포함된 코드 번호
+
+        n-gram posting 교집합으로 후보를 줄인 뒤 실제 부분 문자열 포함 여부로 확정한다.
+        """
+        text = keyword.lower()
+        if not text:
+            # 빈 문자열은 모든 이름에 포함됨
+            candidates = set(range(len(self.codes)))
+        else:
+            candidates = self._candidates(text)
+
+        mask = (FLAG_CANCER if cancer_only else 0) | (FLAG_LOWEST if lowest_only else 0)
+        needle = text.encode('utf-8')
+        result = []
+        for i in sorted(candidates):
+            flag = self.flags[i]
+            if flag & mask != mask or (exclude_header and flag & FLAG_HEADER):
+                continue
+            if len(text) > 2 and needle not in self._haystack.raw(i):
+                continue
+            result.append(i)
+        return result
+
+    def match_counts(self, keywords: List[str], **filters) -> Dict[int, int]:
+        """
+        키워드별 검색 결과를 합쳐 코드 번호 → 일치한 키워드 수
+
+        Args:
+            keywords: 검색 키워드 목록
+            **filters: search()의 cancer_only / lowest_only / exclude_header
+        """
+        counts: Dict[int, int] = {}
+        for keyword in keywords:
+            for i in self.search(keyword, **filters):
+                counts[i] = counts.get(i, 0) + 1
+        return counts
@@ -0,0 +1,240 @@
+"""
+키워드 → KCD 코드 순위 엔진 (BM25)
+
+암종/바이오마커 매핑 스크립트가 키워드 부분 문자열 일치 개수(match_count / match_ratio)로
+후보를 정렬하던 것을 BM25 점수로 바꾼다.
+
+- 토큰화: 영문은 단어 단위, 한글은 음절 1-gram/2-gram
+  (띄어쓰기가 일정하지 않은 '유방의', '기관지 또는 폐의' 같은 이름에서도 '유방', '폐'가 토큰으로 잡힘)
+- 문서 = 코드 1개의 한글명 + 영문명, KCDIndex의 코드 중 대상 코드만 색인
+- 계층 보정: 하위 코드(C50.9)는 상위 코드(C50) 점수의 일부를, 상위 코드는 가장 높은 하위 코드 점수의 일부를 더함
+- 배치 질의: 여러 질의의 토큰 posting/IDF를 한 번만 조회
+
+사용 예:
+    ranker = KCDRanker(KCDIndex.load())
+    ranker.rank(['유방'], top_k=5, lowest_only=True)
+    ranker.rank_batch([['폐'], ['대장', '결장', '직장']], top_k=3, collapse_category=True)
+"""
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from shared.kcd_index import FLAG_CANCER, FLAG_HEADER, FLAG_LOWEST, KCDIndex
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+# 계층 보정 가중치
+PARENT_WEIGHT = 0.3   # 하위 코드 += 상위 코드 점수 × 가중치
+CHILD_WEIGHT = 0.2    # 상위 코드 += 최고 하위 코드 점수 × 가중치
+
+_WORD_RE = re.compile(r'[a-z0-9]+|[가-힣]+')
+
+
+def tokenize(text: str, query: bool = False) -> List[str]:
+    """
+    이름/검색어 토큰화
+
+    Args:
+        text: 원문
+        query: 검색어 여부 (한글 2글자 이상은 2-gram만, 1글자는 그 글자)
+    """
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if word.isascii():
+            tokens.append(word)
+            continue
+        bigrams = [word[i:i + 2] for i in range(len(word) - 1)]
+        if query:
+            tokens.extend(bigrams or [word])
+        else:
+            tokens.extend(word)
+            tokens.extend(bigrams)
+    return tokens
+
+
+def parent_code(code: str) -> Optional[str]:
+    """상위 코드 (C50.91 → C50.9, C50.9 → C50, C50 → None)"""
+    if '.' not in code:
+        return None
+    head, tail = code.split('.', 1)
+    if len(tail) > 1:
+        return f"{head}.{tail[:-1]}"
+    return head
+
+
+class KCDRanker:
+    """KCD 코드명 BM25 역색인"""
+
+    def __init__(self, index: KCDIndex, cancer_only: bool = True,
+                 parent_weight: float = PARENT_WEIGHT, child_weight: float = CHILD_WEIGHT):
+        """
+        Args:
+            index: KCD 인덱스
+            cancer_only: 암 코드만 색인 (매핑 스크립트 기본값)
+            parent_weight / child_weight: 계층 보정 가중치 (0이면 보정 없음)
+        """
+        self.index = index
+        self.parent_weight = parent_weight
+        self.child_weight = child_weight
+
+        # 범위 코드(C00-D48)는 색인하지 않음
+        self.docs = [i for i, code in enumerate(index.codes)
+                     if '-' not in code and (not cancer_only or index.flags[i] & FLAG_CANCER)]
+        slot_of = {doc: slot for slot, doc in enumerate(self.docs)}
+
+        self.postings: Dict[str, List[tuple]] = {}
+        self.doc_len = []
+        for slot, doc in enumerate(self.docs):
+            tokens = tokenize(index.names_kr[doc]) + tokenize(index.names_en[doc])
+            self.doc_len.append(len(tokens))
+            tf: Dict[str, int] = {}
+            for token in tokens:
+                tf[token] = tf.get(token, 0) + 1
+            for token, count in tf.items():
+                self.postings.setdefault(token, []).append((slot, count))
+
+        n = len(self.docs)
+        self.avg_len = sum(self.doc_len) / n if n else 0.0
+        self.idf = {token: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5))
+                    for token, p in self.postings.items()}
+
+        # 계층 (색인된 코드끼리만)
+        self.parent: List[Optional[int]] = []
+        for doc in self.docs:
+            parent = parent_code(index.codes[doc])
+            parent_doc = index.position(parent) if parent else None
+            self.parent.append(slot_of.get(parent_doc))
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def _term_scores(self, token: str) -> Dict[int, float]:
+        """토큰 1개의 문서별 BM25 기여도"""
+        idf = self.idf.get(token)
+        if idf is None:
+            return {}
+        scores = {}
+        for slot, tf in self.postings[token]:
+            norm = K1 * (1 - B + B * self.doc_len[slot] / self.avg_len)
+            scores[slot] = idf * tf * (K1 + 1) / (tf + norm)
+        return scores
+
+    def _score(self, keywords: Sequence[str], term_cache: Dict[str, Dict[int, float]]) -> tuple:
+        """
+        질의 1개 점수 (키워드 = 절, 키워드의 토큰이 모두 있는 문서만 그 키워드에 일치로 집계)
+
+        Returns:
+            (문서별 BM25 점수, 문서별 일치 키워드 수)
+        """
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for keyword in keywords:
+            tokens = tokenize(keyword, query=True)
+            if not tokens:
+                continue
+            hits: Dict[int, int] = {}
+            for token in tokens:
+                if token not in term_cache:
+                    term_cache[token] = self._term_scores(token)
+                for slot, score in term_cache[token].items():
+                    scores[slot] = scores.get(slot, 0.0) + score
+                    hits[slot] = hits.get(slot, 0) + 1
+            for slot, count in hits.items():
+                if count == len(tokens):
+                    matched[slot] = matched.get(slot, 0) + 1
+        return scores, matched
+
+    def _boost(self, scores: Dict[int, float]) -> Dict[int, float]:
+        """계층 보정 (자기 점수가 있는 문서만 대상, 순위만 조정)"""
+        best_child: Dict[int, float] = {}
+        for slot, score in scores.items():
+            parent = self.parent[slot]
+            if parent is not None and score > best_child.get(parent, 0.0):
+                best_child[parent] = score
+
+        boosted = {}
+        for slot, score in scores.items():
+            parent = self.parent[slot]
+            if parent is not None:
+                score += self.parent_weight * scores.get(parent, 0.0)
+            score += self.child_weight * best_child.get(slot, 0.0)
+            boosted[slot] = score
+        return boosted
+
+    def _result(self, slot: int, score: float, matched: int) -> Dict[str, Any]:
+        doc = self.docs[slot]
+        return {
+            'kcd_code': self.index.codes[doc],
+            'name_kr': self.index.names_kr[doc],
+            'name_en': self.index.names_en[doc],
+            'score': round(score, 4),
+            'match_count': matched,
+        }
+
+    def _collapse(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """3자리 분류 코드 단위로 묶기 (C50.0, C50.9 → C50, 최고 점수 유지)"""
+        collapsed = []
+        seen = set()
+        for result in results:
+            category = result['kcd_code'][:3]
+            if category in seen:
+                continue
+            seen.add(category)
+            entry = self.index.get(category)
+            if entry:
+                result = dict(result, kcd_code=category, name_kr=entry['name_kr'], name_en=entry['name_en'])
+            collapsed.append(result)
+        return collapsed
+
+    def rank(self, keywords: Sequence[str], top_k: Optional[int] = 10, **options) -> List[Dict[str, Any]]:
+        """
+        키워드 목록(질의 1개)으로 코드 순위
+
+        Args:
+            keywords: 검색 키워드 (예: ['대장', '결장', '직장'])
+            top_k: 반환 개수 (None이면 전체)
+            **options: rank_batch() 참고
+        """
+        return self.rank_batch([keywords], top_k=top_k, **options)[0]
+
+    def rank_batch(self, queries: Sequence[Sequence[str]], top_k: Optional[int] = 10,
+                   lowest_only: bool = False, exclude_header: bool = False,
+                   collapse_category: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        여러 질의를 한 번에 순위 계산 (토큰별 BM25 기여도는 질의 간 공유)
+
+        Args:
+            queries: 질의별 키워드 목록
+            top_k: 질의별 반환 개수 (None이면 전체)
+            lowest_only: 최하위 코드만
+            exclude_header: 표제어 제외
+            collapse_category: 3자리 분류 코드 단위로 묶기
+
+        Returns:
+            질의별 [{kcd_code, name_kr, name_en, score, match_count}, ...] (점수 높은 순, 동점은 코드 순)
+        """
+        term_cache: Dict[str, Dict[int, float]] = {}
+        all_results = []
+        for keywords in queries:
+            scores, matched = self._score(keywords, term_cache)
+            # 키워드 토큰 일부만 걸린 문서(일치 키워드 0개)는 순위/계층 보정 모두에서 제외
+            scores = {slot: score for slot, score in scores.items() if matched.get(slot, 0) > 0}
+            boosted = self._boost(scores)
+
+            ranked = []
+            for slot, score in boosted.items():
+                flag = self.index.flags[self.docs[slot]]
+                if lowest_only and not flag & FLAG_LOWEST:
+                    continue
+                if exclude_header and flag & FLAG_HEADER:
+                    continue
+                ranked.append((-score, self.index.codes[self.docs[slot]], slot))
+            ranked.sort()
+
+            results = [self._result(slot, -neg, matched[slot]) for neg, _, slot in ranked]
+            if collapse_category:
+                results = self._collapse(results)
+            all_results.append(results[:top_k] if top_k is not None else results)
+        return all_results
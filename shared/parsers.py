@@ -3,14 +3,20 @@
 
 Upstage Document Parse API를 사용하여
 HWP, PDF 등의 문서를 Markdown/HTML로 변환
+
+TriageParser는 텍스트 레이어가 있는 페이지를 로컬에서 추출하고
+이미지뿐인 페이지만 Upstage로 보낸다 (shared/text_triage.py)
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import requests
 import os
+import tempfile
 from dotenv import load_dotenv
 
+from shared import text_triage
+
 # .env 파일 로드
 load_dotenv()
 
@@ -240,6 +246,128 @@ class UpstageParser(BaseParser):
         }
 
 
+class TriageParser(BaseParser):
+    """
+    로컬 텍스트 우선 파서
+
+    - PDF: 페이지별로 born-digital / 스캔 판별 → 스캔 페이지 연속 구간만 잘라서 API 전송
+    - DOCX / HWP: python-docx / pyhwp로 로컬 추출, 텍스트가 거의 없으면 API 전송
+    - 그 외 형식: API 전송
+
+    반환 형식은 UpstageParser와 같다. pages는 전체 페이지 수,
+    usage.pages는 API로 보낸(과금) 페이지 수이다.
+    """
+
+    LOCAL_MODEL = 'local-text'
+
+    def __init__(self, api_parser: UpstageParser, min_chars: int = text_triage.MIN_TEXT_CHARS):
+        """
+        Args:
+            api_parser: 스캔 페이지를 보낼 Upstage 파서
+            min_chars: born-digital로 볼 페이지당 최소 글자 수
+        """
+        self.api_parser = api_parser
+        self.min_chars = min_chars
+
+    def supports(self, file_extension: str) -> bool:
+        return self.api_parser.supports(file_extension)
+
+    def parse(self, file_path: Path) -> Dict[str, Any]:
+        """파일 파싱 (로컬 추출 우선)"""
+        return self._parse(Path(file_path), force_ocr=False)
+
+    def parse_with_ocr(self, file_path: Path) -> Dict[str, Any]:
+        """스캔 페이지만 강제 OCR (Digitization API), 텍스트 레이어가 있는 페이지는 로컬 추출"""
+        return self._parse(Path(file_path), force_ocr=True)
+
+    def _call(self, file_path: Path, force_ocr: bool) -> Dict[str, Any]:
+        if force_ocr:
+            return self.api_parser.parse_with_ocr(file_path)
+        return self.api_parser.parse(file_path)
+
+    def _parse(self, file_path: Path, force_ocr: bool) -> Dict[str, Any]:
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        suffix = file_path.suffix.lower()
+        if suffix == '.pdf':
+            return self._parse_pdf(file_path, force_ocr)
+
+        text = None
+        if suffix == '.docx':
+            text = text_triage.extract_docx_text(file_path)
+        elif suffix == '.hwp':
+            text = text_triage.extract_hwp_text(file_path)
+
+        if text_triage.has_text_layer(text, self.min_chars):
+            return self._local_result(text, text_triage.text_to_html(text), pages=1,
+                                      triage={'local_pages': 1, 'api_pages': 0, 'runs': []})
+
+        result = self._call(file_path, force_ocr)
+        result['metadata']['triage'] = {'local_pages': 0, 'api_pages': result.get('pages', 0), 'runs': []}
+        return result
+
+    def _parse_pdf(self, file_path: Path, force_ocr: bool) -> Dict[str, Any]:
+        pages = text_triage.triage_pdf(file_path, self.min_chars)
+        runs = text_triage.page_runs([p['kind'] for p in pages])
+
+        # 전부 스캔 페이지면 원본 그대로 전송
+        if runs and all(run['kind'] == text_triage.SCANNED for run in runs):
+            result = self._call(file_path, force_ocr)
+            result['metadata']['triage'] = {'local_pages': 0, 'api_pages': len(pages), 'runs': runs}
+            return result
+
+        contents: List[str] = []
+        htmls: List[str] = []
+        api_pages = 0
+        models = {self.LOCAL_MODEL}
+        for run in runs:
+            if run['kind'] == text_triage.DIGITAL:
+                for page in pages[run['start'] - 1:run['end']]:
+                    if page['text'].strip():
+                        contents.append(page['text'])
+                        htmls.append(text_triage.text_to_html(page['text'], page['page']))
+                continue
+
+            result = self._parse_pages(file_path, run['start'], run['end'], force_ocr)
+            contents.append(result.get('content', ''))
+            htmls.append(result.get('html', ''))
+            api_pages += result.get('usage', {}).get('pages') or (run['end'] - run['start'] + 1)
+            models.add(result.get('model', 'unknown'))
+
+        triage = {'local_pages': len(pages) - sum(r['end'] - r['start'] + 1 for r in runs
+                                                  if r['kind'] == text_triage.SCANNED),
+                  'api_pages': api_pages, 'runs': runs}
+        result = self._local_result('\n\n'.join(contents), '\n'.join(htmls), len(pages), triage)
+        result['model'] = '+'.join(sorted(models))
+        result['usage'] = {'pages': api_pages}
+        return result
+
+    def _parse_pages(self, file_path: Path, start: int, end: int, force_ocr: bool) -> Dict[str, Any]:
+        """PDF 페이지 구간(1-based, end 포함)만 임시 PDF로 잘라 API 전송"""
+        from pypdf import PdfReader, PdfWriter
+
+        reader = PdfReader(file_path)
+        writer = PdfWriter()
+        for page_num in range(start - 1, end):
+            writer.add_page(reader.pages[page_num])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chunk_path = Path(tmp_dir) / f"{file_path.stem}_p{start:04d}-{end:04d}.pdf"
+            writer.write(chunk_path)
+            return self._call(chunk_path, force_ocr)
+
+    def _local_result(self, content: str, html: str, pages: int, triage: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "content": content,
+            "html": html,
+            "metadata": {"triage": triage},
+            "pages": pages,
+            "model": self.LOCAL_MODEL,
+            "usage": {"pages": 0}
+        }
+
+
 class ParserFactory:
     """
     파서 생성 팩토리
@@ -251,7 +379,7 @@ class ParserFactory:
         파서 인스턴스 생성
 
         Args:
-            parser_type: 파서 종류 ("upstage")
+            parser_type: 파서 종류 ("upstage" / "triage": 로컬 텍스트 우선, 스캔 페이지만 Upstage)
             api_key: API 키 (None이면 환경변수에서 로드)
 
         Returns:
@@ -260,7 +388,7 @@ class ParserFactory:
         Raises:
             ValueError: 알 수 없는 파서 타입 또는 API 키 없음
         """
-        if parser_type == "upstage":
+        if parser_type in ("upstage", "triage"):
             # API 키 확인
             if api_key is None:
                 api_key = os.getenv("UPSTAGE_API_KEY")
@@ -271,6 +399,8 @@ class ParserFactory:
                     "Set it in .env file or pass as argument."
                 )
 
+            if parser_type == "triage":
+                return TriageParser(UpstageParser(api_key))
             return UpstageParser(api_key)
 
         raise ValueError(f"Unknown parser type: {parser_type}")
@@ -0,0 +1,171 @@
+"""
+로컬 텍스트 레이어 판별 (유료 OCR 전 단계)
+
+대부분의 HIRA/MFDS 문서는 텍스트 레이어가 있는 born-digital 문서인데도
+파일 전체를 Upstage API로 보내고 있었다. 여기서는 페이지별로 텍스트 레이어를 확인해
+
+- born-digital 페이지: 로컬에서 바로 추출 (pdfplumber / python-docx / pyhwp hwp5txt)
+- 이미지뿐인(스캔) 페이지: 연속 구간 단위로 잘라 API로 전송
+
+하도록 판별/추출 함수를 제공한다. 실제 조합은 shared.parsers.TriageParser 참고.
+
+판별 기준 (classify_page):
+    - 공백 제외 글자 수 >= MIN_TEXT_CHARS              → digital
+    - (cid:NN) 등 깨진 글자 비율이 높음                 → scanned (텍스트 레이어가 있어도 읽을 수 없음)
+    - 글자가 적고 이미지가 페이지의 MIN_IMAGE_RATIO 이상 → scanned
+    - 글자도 이미지도 없음                              → blank
+    - 그 외 (표지/간지 등 짧은 텍스트 페이지)            → digital
+"""
+import html
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MIN_TEXT_CHARS = 30
+MIN_IMAGE_RATIO = 0.3
+MAX_GARBLED_RATIO = 0.3
+
+DIGITAL = 'digital'
+SCANNED = 'scanned'
+BLANK = 'blank'
+
+_CID_RE = re.compile(r'\(cid:\d+\)')
+
+# pyhwp 실행 파일 (PATH 우선, 없으면 hwp_extract_pyhwp.py와 같은 가상환경 경로)
+HWP5TXT_FALLBACK = Path(__file__).parent.parent / 'scraphub' / 'Scripts' / 'hwp5txt.exe'
+
+
+def classify_page(text: str, image_ratio: float = 0.0, min_chars: int = MIN_TEXT_CHARS) -> str:
+    """
+    페이지 1개 판별
+
+    Args:
+        text: 텍스트 레이어에서 추출한 문자열
+        image_ratio: 이미지가 덮는 페이지 면적 비율 (0~1)
+        min_chars: born-digital로 볼 최소 글자 수 (공백 제외)
+
+    Returns:
+        'digital' / 'scanned' / 'blank'
+    """
+    garbled = sum(len(m) for m in _CID_RE.findall(text))
+    compact = ''.join(text.split())
+    if compact and garbled / len(compact) > MAX_GARBLED_RATIO:
+        return SCANNED
+
+    if len(compact) >= min_chars:
+        return DIGITAL
+    if image_ratio >= MIN_IMAGE_RATIO:
+        return SCANNED
+    if not compact and image_ratio == 0:
+        return BLANK
+    return DIGITAL
+
+
+def page_runs(kinds: List[str]) -> List[Dict[str, Any]]:
+    """
+    페이지 판별 결과 → 연속 구간 (빈 페이지는 로컬 구간으로 취급)
+
+    Returns:
+        [{'kind': 'digital'|'scanned', 'start': 1, 'end': 3}, ...] (1-based, end 포함)
+    """
+    runs: List[Dict[str, Any]] = []
+    for page_num, kind in enumerate(kinds, 1):
+        kind = SCANNED if kind == SCANNED else DIGITAL
+        if runs and runs[-1]['kind'] == kind:
+            runs[-1]['end'] = page_num
+        else:
+            runs.append({'kind': kind, 'start': page_num, 'end': page_num})
+    return runs
+
+
+def image_coverage(page) -> float:
+    """pdfplumber 페이지에서 이미지가 덮는 면적 비율 (겹침은 무시하고 1로 상한)"""
+    area = float(page.width * page.height) or 1.0
+    covered = 0.0
+    for image in page.images:
+        width = max(0.0, min(image['x1'], page.width) - max(image['x0'], 0))
+        height = max(0.0, min(image['bottom'], page.height) - max(image['top'], 0))
+        covered += width * height
+    return min(1.0, covered / area)
+
+
+def triage_pdf(pdf_path: Path, min_chars: int = MIN_TEXT_CHARS) -> List[Dict[str, Any]]:
+    """
+    PDF 페이지별 판별 + 텍스트 추출 (pdfplumber)
+
+    Returns:
+        [{'page': 1, 'kind': 'digital', 'text': '...'}, ...]
+    """
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages, 1):
+            text = page.extract_text() or ''
+            pages.append({
+                'page': page_num,
+                'kind': classify_page(text, image_coverage(page), min_chars),
+                'text': text,
+            })
+            page.flush_cache()
+    return pages
+
+
+def extract_docx_text(docx_path: Path) -> str:
+    """DOCX 본문 텍스트 (본문 순서대로 문단 + 표는 셀을 ' | '로 연결, python-docx)"""
+    from docx import Document
+    from docx.oxml.ns import qn
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    document = Document(docx_path)
+    lines = []
+    # document.paragraphs / document.tables는 종류별로 따로 모으므로 본문 순서가 깨짐 → body 자식을 직접 순회
+    for child in document.element.body.iterchildren():
+        if child.tag == qn('w:p'):
+            text = Paragraph(child, document).text
+            if text.strip():
+                lines.append(text)
+        elif child.tag == qn('w:tbl'):
+            for row in Table(child, document).rows:
+                cells = [cell.text.strip() for cell in row.cells]
+                if any(cells):
+                    lines.append(' | '.join(cells))
+    return '\n'.join(lines)
+
+
+def extract_hwp_text(hwp_path: Path, timeout: int = 60) -> Optional[str]:
+    """HWP 본문 텍스트 (pyhwp hwp5txt, 실행 파일이 없거나 실패하면 None)"""
+    exe = shutil.which('hwp5txt') or (str(HWP5TXT_FALLBACK) if HWP5TXT_FALLBACK.exists() else None)
+    if not exe:
+        return None
+    try:
+        result = subprocess.run([exe, str(hwp_path)], capture_output=True, text=True,
+                                encoding='utf-8', timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def has_text_layer(text: Optional[str], min_chars: int = MIN_TEXT_CHARS) -> bool:
+    """
+    문서 전체 텍스트가 로컬 추출 결과로 쓸 만한지
+
+    classify_page는 짧은 텍스트도 digital로 보내므로(표지/간지용 폴백),
+    문서 단위에서는 공백 제외 글자 수가 min_chars 이상인지 따로 확인한다.
+    """
+    if not text or len(''.join(text.split())) < min_chars:
+        return False
+    return classify_page(text, 0.0, min_chars) == DIGITAL
+
+
+def text_to_html(text: str, page: Optional[int] = None) -> str:
+    """로컬 추출 텍스트 → 단순 HTML (줄 단위 <p>)"""
+    paragraphs = ''.join(f'<p>{html.escape(line)}</p>' for line in text.splitlines() if line.strip())
+    if page is None:
+        return paragraphs
+    return f'<section data-page="{page}">{paragraphs}</section>'
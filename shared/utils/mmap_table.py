@@ -0,0 +1,178 @@
+"""
+mmap 스냅샷 공용 유틸리티
+
+KCD 인덱스(shared/kcd_index.py), 약가 사전(shared/drug_dictionary.py),
+브랜드 해소기(shared/brand_resolver.py)가 같은 방식으로 저장하고 여는 파일을 다룬다.
+
+- PackedStrings: UTF-8 연결 바이트 + uint32 오프셋 배열 → 순번으로 문자열 조회 (bisect 가능한 시퀀스)
+- pack_strings: 문자열 목록 → (UTF-8 연결 바이트, 오프셋 배열)
+- MmapFiles: 파일명 → array 형식 표대로 디렉토리의 파일을 mmap으로 열고 한 번에 해제
+- SnapshotWriter: 파일마다 임시 파일(.tmp)에 쓴 뒤 os.replace로 교체 (meta.json은 호출 쪽에서 마지막에)
+
+사용 예:
+    FILES = {'keys.bin': None, 'key_offsets.bin': 'I', 'postings.bin': 'I'}
+
+    writer = SnapshotWriter(out_dir)
+    writer.write_files(FILES, data)
+    writer.write_json('meta.json', meta)
+
+    files = MmapFiles(out_dir, FILES)
+    keys = PackedStrings(files['keys.bin'], files['key_offsets.bin'])
+    keys.position('옵디보')
+    files.close()
+"""
+import json
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class PackedStrings(Sequence):
+    """
+    UTF-8 연결 바이트 + 오프셋 배열 → 순번으로 문자열 조회
+
+    문자열이 UTF-8 바이트 순(= str 코드 포인트 순)으로 정렬돼 있으면
+    bisect / position으로 이분 탐색할 수 있다. 슬라이스는 문자열 목록을 돌려준다.
+    """
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self.raw(i).decode('utf-8')
+
+    def raw(self, i: int) -> bytes:
+        """순번 → UTF-8 바이트 (디코딩 없이 비교할 때)"""
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+    def position(self, text: str) -> Optional[int]:
+        """정렬된 목록에서 문자열 순번 (없으면 None)"""
+        i = bisect_left(self, text)
+        if i < len(self) and self[i] == text:
+            return i
+        return None
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Sequence, list)) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+def pack_strings(strings: Iterable[str]) -> Tuple[bytes, array]:
+    """문자열 목록 → (UTF-8 연결 바이트, 오프셋 배열)"""
+    blob = bytearray()
+    offsets = array('I', [0])
+    for text in strings:
+        blob += text.encode('utf-8')
+        offsets.append(len(blob))
+    return bytes(blob), offsets
+
+
+def empty_files(files: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """파일 표 → 빈 값 (array 형식이면 빈 배열, None이면 b'')"""
+    return {name: array(fmt) if fmt else b'' for name, fmt in files.items()}
+
+
+class MmapFiles:
+    """
+    디렉토리의 파일들을 읽기 전용 mmap으로 열기
+
+    파일 표는 파일명 → array 형식('I', 'd' 등, None은 바이트 그대로)이고,
+    형식이 있으면 memoryview를 그 형식으로 cast해 돌려준다. 빈 파일은 mmap할 수 없으므로
+    빈 배열/바이트로 대신한다.
+    """
+
+    def __init__(self, directory: Path, files: Dict[str, Optional[str]]):
+        self.directory = Path(directory)
+        self.files = files
+        self.data: Dict[str, Any] = {}
+        self._mmaps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []
+
+        for name, fmt in files.items():
+            with open(self.directory / name, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self.data[name] = array(fmt) if fmt else b''
+                    continue
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mmaps.append(mapped)
+            view = memoryview(mapped)
+            if fmt:
+                base, view = view, view.cast(fmt)
+                self._views.append(base)
+            self._views.append(view)
+            self.data[name] = view
+
+    def __getitem__(self, name: str):
+        return self.data[name]
+
+    @property
+    def nbytes(self) -> int:
+        """디스크 크기 (바이트)"""
+        return sum((self.directory / name).stat().st_size for name in self.files)
+
+    def close(self) -> None:
+        """memoryview 해제 후 mmap 닫기 (이후 data는 빈 값)"""
+        self.data = empty_files(self.files)
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        for m in self._mmaps:
+            m.close()
+        self._mmaps = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SnapshotWriter:
+    """
+    스냅샷 파일 쓰기 (파일마다 임시 파일에 쓴 뒤 os.replace로 교체)
+
+    읽는 쪽은 meta.json을 기준으로 판단하므로 meta.json은 항상 마지막에 쓴다.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name: str, payload: bytes) -> None:
+        """파일 1개 원자적 교체"""
+        path = self.directory / name
+        tmp_path = path.with_name(name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def write_files(self, files: Dict[str, Optional[str]], data: Dict[str, Any]) -> None:
+        """파일 표 순서대로 저장 (형식이 있으면 그 형식의 배열 바이트, 없으면 바이트 그대로)"""
+        for name, fmt in files.items():
+            value = data[name]
+            if fmt is None:
+                payload = bytes(value)
+            elif isinstance(value, array) and value.typecode == fmt:
+                payload = value.tobytes()
+            else:
+                payload = array(fmt, value).tobytes()
+            self.write(name, payload)
+
+    def write_json(self, name: str, obj: Any, indent: Optional[int] = 2) -> None:
+        """JSON 파일 원자적 교체 (UTF-8, ensure_ascii=False)"""
+        self.write(name, json.dumps(obj, ensure_ascii=False, indent=indent).encode('utf-8'))
@@ -0,0 +1,71 @@
+"""
+호스트별 요청 간격 제한기
+
+여러 페이지/워커가 동시에 같은 사이트에 요청할 때
+호스트 단위로 최소 요청 간격과 동시 요청 수를 제한한다.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """
+    호스트별 비동기 요청 간격 제한기
+
+    사용 예:
+        limiter = HostRateLimiter(min_interval=0.5, max_concurrent=4)
+        async with limiter.slot(url):
+            await page.goto(url)
+    """
+
+    def __init__(self, min_interval: float = 1.0, max_concurrent: int = 2,
+                 per_host: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            min_interval: 같은 호스트에 대한 요청 시작 간 최소 간격 (초)
+            max_concurrent: 같은 호스트에 동시에 진행 가능한 요청 수
+            per_host: 호스트별 최소 간격 재정의 (예: {'www.hira.or.kr': 2.0})
+        """
+        self.min_interval = min_interval
+        self.max_concurrent = max_concurrent
+        self.per_host = per_host or {}
+
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._last_request: Dict[str, float] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URL에서 호스트 추출 (file:// 등 호스트가 없으면 빈 문자열)"""
+        return urlparse(url).netloc.lower()
+
+    def interval_for(self, host: str) -> float:
+        """호스트에 적용할 최소 간격"""
+        return self.per_host.get(host, self.min_interval)
+
+    async def wait(self, url: str) -> None:
+        """요청 간격이 확보될 때까지 대기 (동시 요청 수 제한 없이 간격만 적용)"""
+        host = self.host_of(url)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            interval = self.interval_for(host)
+            last = self._last_request.get(host)
+            if last is not None:
+                remaining = last + interval - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+            self._last_request[host] = time.monotonic()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """요청 한 건에 대한 슬롯 (동시 요청 수 + 요청 간격 모두 적용)"""
+        host = self.host_of(url)
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrent))
+
+        async with semaphore:
+            await self.wait(url)
+            yield
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+scripts/benchmark_matching.py 유닛 테스트
+
+- 작은 합성 코퍼스로 전체 벤치마크가 돌고 결과 JSON 형식이 맞음
+- 회귀 게이트: 처리량 감소/메모리 증가가 임계값을 넘을 때만 회귀
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('yaml')
+
+from scripts.benchmark_matching import compare_results, run_suite
+
+
+def test_run_suite_small():
+    result = run_suite(scale=0.01, repeat=1)
+    benchmarks = result['benchmarks']
+    for name in ['refine.process_all', 'refine.gate.phonetic', 'drug_candidates.extract', 'term_matcher.extract',
+                 'brand_index.build', 'brand_resolver.build', 'kcd.search']:
+        assert benchmarks[name]['items'] > 0, name
+        assert benchmarks[name]['seconds'] >= 0 and benchmarks[name]['peak_kb'] >= 0, name
+    assert result['meta']['scale'] == 0.01
+
+    only = run_suite(scale=0.01, repeat=1, only=['kcd'])
+    assert list(only['benchmarks']) == ['kcd.search']
+    assert only['benchmarks']['kcd.search']['items'] == benchmarks['kcd.search']['items']
+
+    # 그룹보다 긴 접두사도 선택됨
+    assert list(run_suite(scale=0.01, repeat=1, only=['kcd.search'])['benchmarks']) == ['kcd.search']
+    assert list(run_suite(scale=0.01, repeat=1, only=['refine.gate.phonetic'])['benchmarks']) == ['refine.gate.phonetic']
+    with pytest.raises(ValueError):
+        run_suite(scale=0.01, repeat=1, only=['kcd.serach'])
+
+
+def test_compare_results():
+    def result(throughput, peak_kb, items=100):
+        return {'meta': {'version': 1, 'scale': 1.0, 'seed': 0, 'corpus': 'synthetic', 'workers': 1},
+                'benchmarks': {'kcd.search': {'items': items, 'throughput': throughput, 'peak_kb': peak_kb}}}
+
+    baseline = result(1000.0, 100.0)
+    assert compare_results(baseline, result(950.0, 105.0), threshold=0.10) == []
+
+    regressions = compare_results(baseline, result(800.0, 150.0), threshold=0.10, memory_threshold=0.3)
+    assert [(r['metric'], r['change']) for r in regressions] == [('throughput', 0.2), ('peak_kb', 0.5)]
+
+    # 입력 크기가 다르거나 기준 벤치마크가 빠지면 비교 불가로 보고
+    assert [(r['metric'], r['current']) for r in compare_results(baseline, result(10.0, 1000.0, items=50))] \
+        == [('items', 50)]
+    missing = {'meta': dict(baseline['meta']), 'benchmarks': {}}
+    assert [(r['name'], r['metric']) for r in compare_results(baseline, missing)] == [('kcd.search', 'missing')]
+
+    # --only로 일부만 돌린 결과는 선택된 벤치마크만 확인
+    partial = {'meta': dict(baseline['meta'], only=['refine']), 'benchmarks': {}}
+    assert compare_results(baseline, partial) == []
+
+    # 입력 조건(코퍼스/배율 등)이 다르면 항목 수가 같아도 비교 거부
+    other = result(1000.0, 100.0)
+    other['meta']['corpus'] = 'data/parsed'
+    with pytest.raises(ValueError, match='corpus'):
+        compare_results(baseline, other)
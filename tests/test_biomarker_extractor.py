@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+shared/biomarker_extractor.py 유닛 테스트
+
+- 기존 키워드별 `in` 검사와 같은 바이오마커 (겹치는 키워드 포함)
+- 짧은 키워드(ALK, MET) 단어 경계
+- 일치 위치/프로세스 풀 일괄 처리
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.biomarker_extractor import BiomarkerKeywordExtractor, snippet
+
+KEYWORDS = {
+    'HER2': ['HER2', 'HER-2', 'ERBB2'],
+    'EGFR': ['EGFR'],
+    'VEGF': ['VEGF', 'VEGFR'],
+    'ALK': ['ALK'],
+    'MET': ['MET', 'c-MET'],
+    'CDK4/6': ['CDK4', 'CDK6', 'CDK4/6'],
+    'ER': ['에스트로겐 수용체', 'estrogen receptor'],
+}
+
+
+def old_extract(text):
+    """기존 extract_biomarkers_from_text 동작"""
+    upper = text.upper()
+    return [name for name, words in KEYWORDS.items() if any(word.upper() in upper for word in words)]
+
+
+def test_same_as_substring_search():
+    extractor = BiomarkerKeywordExtractor(KEYWORDS)
+    for text in ['HER2 양성 유방암', 'VEGFR 억제제', 'anti-her-2 항체', 'CDK4/6 억제제',
+                 'Estrogen Receptor 양성', '에스트로겐 수용체 길항제', 'c-MET 증폭', '']:
+        assert extractor.biomarkers(text) == old_extract(text), text
+
+
+def test_short_token_boundary():
+    extractor = BiomarkerKeywordExtractor(KEYWORDS)
+    assert extractor.biomarkers('ALK 양성 비소세포폐암') == ['ALK']
+    assert extractor.biomarkers('ALK양성') == ['ALK']
+    assert extractor.biomarkers('GALK1 결핍') == []
+    assert extractor.biomarkers('Methotrexate, metastatic') == []
+    assert extractor.biomarkers('MET exon 14') == ['MET']
+
+    # 뒤에 붙은 숫자(아형 번호)는 허용, 영문자만 거부
+    extractor = BiomarkerKeywordExtractor({'MEK': ['MEK'], 'ALK': ['ALK']})
+    assert extractor.biomarkers('MEK1/2 억제제') == ['MEK']
+    assert extractor.extract('MEK1 및 MEK2') == [('MEK', 0, 3), ('MEK', 7, 10)]
+    assert extractor.biomarkers('ALK1 결핍, GALK1') == ['ALK']
+    assert extractor.biomarkers('MEKK1 키나아제') == []
+
+
+def test_spans_and_batch():
+    extractor = BiomarkerKeywordExtractor(KEYWORDS)
+    text = 'VEGFR 및 HER2 표적'
+    spans = extractor.extract(text)
+    assert spans == [('VEGF', 0, 5), ('EGFR', 1, 5), ('HER2', 8, 12)]
+    assert snippet(text, 8, 12, width=2) == '및 HER2 표'
+
+    texts = ['ALK', None, 'cdk4/6'] * 5
+    expected = [extractor.extract(t) for t in texts]
+    assert expected[2] == [('CDK4/6', 0, 6)]
+    assert extractor.extract_batch(texts, workers=1) == expected
+    assert extractor.extract_batch(texts, workers=2, chunk_size=4) == expected
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+shared/biomarker_matcher.py 유닛 테스트
+
+- 색인 조회 결과가 기존 쌍별 비교(정확/부분 일치)와 같음
+- 복합 바이오마커 토큰 확장 (CDK4/6 → CDK4, CDK6)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.biomarker_matcher import BiomarkerTestIndex, expand_composite, normalize_biomarker_name
+
+TEST_NAMES = ['HER2', 'her-2 IHC', 'KRAS', 'BCR-ABL', 'ABL', 'PD-L1', 'CDK4', 'CDK6 amplification',
+              'EGFR', 'MET', None, 'ALK', 'ROS1', 'BRCA1', 'BRCA2', 'Ki-67']
+
+
+def pairwise(biomarker, test):
+    """기존 match_biomarker_to_test의 정확/부분 일치 규칙"""
+    b = normalize_biomarker_name(biomarker)
+    t = normalize_biomarker_name(test)
+    if b == t:
+        return 'exact_match'
+    if b and t and (b in t or t in b):
+        return 'partial_match'
+    return None
+
+
+def test_matches_pairwise_rules():
+    index = BiomarkerTestIndex(TEST_NAMES)
+    for biomarker in ['HER-2', 'KRAS', 'BCR-ABL', 'PD-L1', 'C-MET', 'BRCA', 'EGFR T790M', 'NTRK', 'A']:
+        expected = [(i, kind) for i, test in enumerate(TEST_NAMES) if (kind := pairwise(biomarker, test))]
+        assert [(i, kind) for i, kind, _ in index.match(biomarker)] == expected, biomarker
+
+
+def test_composite_expansion():
+    assert expand_composite('CDK4/6') == ['CDK4', 'CDK6']
+    assert expand_composite('BCR/ABL') == ['BCR', 'ABL']
+    assert expand_composite('BRCA1/2') == ['BRCA1', 'BRCA2']
+
+    index = BiomarkerTestIndex(TEST_NAMES)
+    matches = {TEST_NAMES[i]: (kind, confidence) for i, kind, confidence in index.match('CDK4/6')}
+    # 'CDK4'는 'CDK4/6'의 부분 문자열이라 부분 일치가 우선
+    assert matches == {'CDK4': ('partial_match', 0.85), 'CDK6 amplification': ('composite_match', 0.80)}
+
+    # 토큰 '6'만으로 Ki-67 같은 검사에 잘못 걸리지 않음
+    assert 'Ki-67' not in matches
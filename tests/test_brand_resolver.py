@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+shared/brand_resolver.py 유닛 테스트
+
+- 성분 레코드는 한 번만 저장, 브랜드/성분명 키 → 기존 brand_index.json 항목 형태
+- BK-tree 오타 조회 결과가 전수 편집 거리 비교와 같음
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.brand_resolver import BrandResolver, BrandResolverBuilder, edit_distance
+
+ATC_LEVELS = {'atc_level1': 'L', 'atc_level1_name': '항암제 및 면역조절제',
+              'atc_level2': 'L01', 'atc_level2_name': '항종양제',
+              'atc_level3': 'L01F', 'atc_level3_name': '단클론항체'}
+ENTRIES = [
+    dict(ATC_LEVELS, atc_code='L01FF02', brand_name_primary='키트루다', brand_names_clean=['키트루다', 'Keytruda'],
+         ingredient_ko='펨브롤리주맙', atc_name_en='pembrolizumab', ingredient_base_ko='펨브롤리주맙',
+         ingredient_base_en='pembrolizumab', manufacturers=['한국엠에스디']),
+    dict(ATC_LEVELS, atc_code='L01FF01', brand_name_primary='옵디보', brand_names_clean=['옵디보', 'Opdivo'],
+         ingredient_ko='니볼루맙', atc_name_en='nivolumab', ingredient_base_ko='니볼루맙',
+         ingredient_base_en='nivolumab', manufacturers=['한국오노약품공업']),
+    dict(ATC_LEVELS, atc_level3='L01E', atc_level3_name='단백질 키나제 억제제', atc_code='L01EF03',
+         brand_name_primary='버제니오', brand_names_clean=['버제니오'], ingredient_ko='아베마시클립',
+         atc_name_en='abemaciclib', ingredient_base_ko='아베마시클립', ingredient_base_en='abemaciclib'),
+]
+
+
+def build(tmp_path):
+    builder = BrandResolverBuilder()
+    for entry in ENTRIES:
+        builder.add(entry, [entry['brand_name_primary']])
+    meta = builder.save(tmp_path / 'resolver')
+    return meta, BrandResolver.open(tmp_path / 'resolver')
+
+
+def test_exact_lookup(tmp_path):
+    meta, resolver = build(tmp_path)
+    with resolver:
+        assert meta['records'] == 3
+        # ATC 단계 이름은 코드별 한 번만 저장
+        assert meta['atc_names'] == 4
+
+        entry = resolver.lookup('KEY truda')
+        assert entry['atc_code'] == 'L01FF02'
+        assert entry['match_type'] == 'brand' and entry['brand_display'] == '키트루다'
+        assert entry['atc_level3_name'] == '단클론항체'
+        assert entry['distance'] == 0
+
+        entry = resolver.lookup('니볼루맙')
+        assert entry['match_type'] == 'ingredient_ko' and entry['brand_display'] == '니볼루맙'
+        assert resolver.lookup('버제니오')['atc_level3_name'] == '단백질 키나제 억제제'
+        assert '옵디보' in resolver and '타그리소' not in resolver
+
+
+def test_fuzzy_lookup(tmp_path):
+    _, resolver = build(tmp_path)
+    with resolver:
+        assert resolver.lookup('버재니오')['atc_code'] == 'L01EF03'
+        assert resolver.lookup('keytrda')['distance'] == 1
+        assert resolver.lookup('keytrda', fuzzy=False) is None
+        assert resolver.lookup('전혀다른약') is None
+
+        keys = list(resolver.keys())
+        for query in ['opdvo', '키트루드', 'nivolumap', 'abc']:
+            expected = sorted(((k, d) for k in keys if (d := edit_distance(query, k)) <= 2),
+                              key=lambda item: (item[1], item[0]))
+            assert resolver.fuzzy(query, 2) == expected, query
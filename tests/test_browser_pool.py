@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+shared/browser_pool.py, shared/browser.py, shared/utils/rate_limiter.py 유닛 테스트
+
+- 호스트별 요청 간격 / 동시 요청 수 제한
+- 경량 프로파일 요청 차단 판정, 페이지 로드 시간 기록
+- 로컬 HTML 픽스처 대상 동시 수집 (Playwright 설치 시에만)
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.utils.rate_limiter import HostRateLimiter
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'ncc'
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    """같은 호스트 요청은 min_interval 간격으로, 다른 호스트는 독립적으로 시작"""
+    limiter = HostRateLimiter(min_interval=0.05, max_concurrent=10)
+    starts = {'a': [], 'b': []}
+
+    async def request(host: str):
+        async with limiter.slot(f'https://{host}.example.com/page'):
+            starts[host].append(time.monotonic())
+
+    async def main():
+        await asyncio.gather(*(request(host) for host in ['a', 'a', 'a', 'b', 'b']))
+
+    asyncio.run(main())
+
+    a = sorted(starts['a'])
+    assert all(later - earlier >= 0.045 for earlier, later in zip(a, a[1:])), a
+    # 다른 호스트는 a 호스트 대기열과 무관하게 바로 시작
+    assert min(starts['b']) - min(a) < 0.04
+
+
+def test_rate_limiter_caps_concurrency():
+    """같은 호스트 동시 요청 수는 max_concurrent 이하"""
+    limiter = HostRateLimiter(min_interval=0, max_concurrent=2)
+    in_flight = 0
+    peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        async with limiter.slot('https://www.cancer.go.kr/x'):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(8)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_browser_pool_local_fixtures():
+    """로컬 HTML 픽스처를 풀에서 동시에 수집, 완료 순서대로 콜백 호출"""
+    pytest.importorskip('playwright')
+    from shared.browser_pool import BrowserPool
+
+    urls = [(FIXTURE_DIR / name).as_uri() for name in ['cancer_view_1.html', 'cancer_view_2.html']] * 3
+    completed = []
+
+    async def worker(page, url):
+        await pool.goto(page, url)
+        return await page.inner_text('.cont_box h4#go')
+
+    async def main():
+        nonlocal pool
+        async with BrowserPool(num_contexts=2, pages_per_context=2,
+                               rate_limiter=HostRateLimiter(min_interval=0)) as pool:
+            return await pool.run(urls, worker, on_result=lambda url, result: completed.append(url))
+
+    pool = None
+    try:
+        results = asyncio.run(main())
+    except Exception as e:  # 브라우저 바이너리 미설치 등
+        pytest.skip(f'Chromium 실행 불가: {e}')
+
+    assert results == ['갑상선암이란', '위암이란'] * 3
+    assert sorted(completed) == sorted(urls)
+
+
+def test_lightweight_profile_blocking():
+    """이미지/폰트/분석 스크립트는 차단, 문서/스크립트는 통과"""
+    pytest.importorskip('playwright')
+    from shared.browser import PROFILES, should_block
+
+    profile = PROFILES['lightweight']
+    types, keywords = profile['blocked_resource_types'], profile['blocked_url_keywords']
+
+    assert should_block('https://www.hira.or.kr/logo.png', 'image', types, keywords)
+    assert should_block('https://www.googletagmanager.com/gtag/js?id=x', 'script', types, keywords)
+    assert not should_block('https://www.hira.or.kr/bbsDummy.do', 'document', types, keywords)
+    assert not should_block('https://www.hira.or.kr/js/common.js', 'script', types, keywords)
+
+
+def test_page_timings_summary(tmp_path):
+    """실패 건 포함 로드 시간 기록 및 JSON 저장"""
+    pytest.importorskip('playwright')
+    from shared.browser import PageTimings
+
+    timings = PageTimings()
+    for elapsed in [0.1, 0.2, 0.3]:
+        timings.record('https://example.com', elapsed)
+    with pytest.raises(RuntimeError):
+        with timings.measure('https://example.com/fail'):
+            raise RuntimeError('timeout')
+
+    summary = timings.summary()
+    assert summary['count'] == 4
+    assert summary['failed'] == 1
+    assert summary['max_ms'] == 300.0
+
+    timings.save(tmp_path / 'timings.json')
+    assert (tmp_path / 'timings.json').exists()
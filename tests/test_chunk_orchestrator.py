@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+shared/chunk_orchestrator.py 유닛 테스트
+
+- 큰 청크부터 배정, 결과는 계획 순서로 점진 병합
+- (원본 해시, 페이지 범위) 캐시: 범위가 바뀐 청크만 다시 파싱
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.chunk_orchestrator import ChunkOrchestrator, ChunkResultCache
+
+
+def make_parser(calls):
+    lock = threading.Lock()
+
+    def parse_chunk(chunk):
+        with lock:
+            calls.append((chunk['start'], chunk['end']))
+        if chunk['start'] == 99:
+            return {'error': 'boom', 'chunk': chunk}
+        return {
+            'content': {'html': f"<p>{chunk['start']}-{chunk['end']}</p>"},
+            'elements': [chunk['start']],
+            'chunk_metadata': {'chunk_info': chunk, 'api_pages': chunk['end'] - chunk['start'] + 1},
+        }
+
+    return parse_chunk
+
+
+def test_largest_first_and_ordered_merge(tmp_path):
+    plan = [{'start': 1, 'end': 10}, {'start': 11, 'end': 60}, {'start': 61, 'end': 80}]
+    calls = []
+    orchestrator = ChunkOrchestrator(make_parser(calls), workers=1, min_interval=0)
+    prepared = []
+    results = orchestrator.run(plan, prepare=lambda pending: prepared.extend(pending) or pending)
+
+    assert calls == [(11, 60), (61, 80), (1, 10)]
+    assert [item['index'] for item in prepared] == [1, 2, 3]
+    assert [r['elements'] for r in results] == [[1], [11], [61]]
+
+    merged = orchestrator.merger.merged('book.pdf', 'test_split')
+    assert merged['content'] == '<p>1-10</p>\n\n<hr>\n\n<p>11-60</p>\n\n<hr>\n\n<p>61-80</p>'
+    assert merged['elements'] == [1, 11, 61]
+    assert merged['total_pages'] == 80
+    assert merged['chunks_parsed'] == 3 and merged['chunks_failed'] == 0
+
+
+def test_cache_reuses_unchanged_ranges(tmp_path):
+    pdf_path = tmp_path / 'book.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 test')
+    cache_dir = tmp_path / 'chunk_cache'
+
+    calls = []
+    plan = [{'start': 1, 'end': 42}, {'start': 43, 'end': 90}, {'start': 99, 'end': 100}]
+    orchestrator = ChunkOrchestrator(make_parser(calls), ChunkResultCache(cache_dir, pdf_path), workers=2, min_interval=0)
+    orchestrator.run(plan, prepare=lambda pending: pending)
+    assert orchestrator.stats == {'cached': 0, 'parsed': 2, 'failed': 1}
+
+    # 목차 수정: 두 번째 청크 범위만 변경 → 그 청크와 실패했던 청크만 다시 파싱
+    calls.clear()
+    plan = [{'start': 1, 'end': 42}, {'start': 43, 'end': 95}, {'start': 99, 'end': 100}]
+    orchestrator = ChunkOrchestrator(make_parser(calls), ChunkResultCache(cache_dir, pdf_path), workers=2, min_interval=0)
+    orchestrator.run(plan, prepare=lambda pending: pending)
+    assert sorted(calls) == [(43, 95), (99, 100)]
+    assert orchestrator.stats == {'cached': 1, 'parsed': 1, 'failed': 1}
+    assert orchestrator.merger.merged('book.pdf', 'test_split')['chunks_failed'] == 1
+
+    # 원본 PDF가 바뀌면 캐시를 쓰지 않음
+    pdf_path.write_bytes(b'%PDF-1.4 changed')
+    assert ChunkResultCache(cache_dir, pdf_path).get(1, 42) is None
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+mfds/utils/docx_stream.py 유닛 테스트
+
+- 본문 요소를 원본 바이트 그대로 청크에 복사
+- 바이트 예산 초과 시 각조(제목 스타일) 경계에서 분할
+- 청크가 참조하는 이미지만 포함
+- 읽기 블록이 여러 개여도 모든 청크가 닫는 태그로 끝남, 빈 요소 태그(<w:p/>) 경계
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mfds.utils import docx_stream
+from mfds.utils.docx_stream import DOCUMENT_PART, DOCUMENT_RELS, DocxStreamSplitter
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+IMAGE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+STYLES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+
+
+def heading(text):
+    return f'<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+def para(text, image=None):
+    drawing = f'<w:r><w:drawing><a:blip xmlns:a="urn:a" r:embed="{image}"/></w:drawing></w:r>' if image else ''
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r>{drawing}</w:p>'
+
+
+def make_docx(path, body):
+    document = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<w:document xmlns:w="{W}" xmlns:r="{R}"><w:body>{body}'
+                f'<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr></w:body></w:document>')
+    rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{STYLES}" Target="styles.xml"/>'
+            f'<Relationship Id="rId2" Type="{IMAGE}" Target="media/image1.png"/>'
+            f'<Relationship Id="rId3" Type="{IMAGE}" Target="media/image2.png"/>'
+            '</Relationships>')
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr('[Content_Types].xml', '<Types/>')
+        z.writestr(DOCUMENT_PART, document)
+        z.writestr(DOCUMENT_RELS, rels)
+        z.writestr('word/styles.xml', '<w:styles/>')
+        z.writestr('word/media/image1.png', b'png1')
+        z.writestr('word/media/image2.png', b'png2')
+
+
+def chunk_bodies(chunks):
+    """청크별 document.xml 본문 (여는/닫는 태그 확인 후 제거)"""
+    bodies = []
+    for chunk in chunks:
+        with zipfile.ZipFile(chunk['path']) as z:
+            xml = z.read(DOCUMENT_PART)
+        assert xml.startswith(b'<?xml') and xml.endswith(b'</w:body></w:document>')
+        bodies.append(xml[xml.index(b'<w:body>') + 8:-len(b'</w:body></w:document>')])
+    return bodies
+
+
+def original_body(path):
+    xml = zipfile.ZipFile(path).read(DOCUMENT_PART)
+    return xml[xml.index(b'<w:body>') + 8:-len(b'</w:body></w:document>')]
+
+
+def test_split_keeps_monographs_and_references(tmp_path):
+    body = (heading('Aspirin') + para('가' * 200) + para('Assay', image='rId2')
+            + heading('Ibuprofen') + para('나' * 200)
+            + heading('Zinc Oxide') + para('Identification', image='rId3'))
+    source = tmp_path / 'monographs.docx'
+    make_docx(source, body)
+
+    splitter = DocxStreamSplitter(source, max_bytes=900)
+    chunks = splitter.split(tmp_path / 'out')
+
+    assert [c['first_heading'] for c in chunks] == ['Aspirin', 'Ibuprofen', 'Zinc Oxide']
+    assert splitter.stats['elements'] == 8
+
+    # 본문 바이트가 원본 그대로 이어짐
+    joined = b''
+    for chunk in chunks:
+        with zipfile.ZipFile(chunk['path']) as z:
+            xml = z.read(DOCUMENT_PART)
+            assert xml.startswith(b'<?xml') and xml.endswith(b'</w:body></w:document>')
+            joined += xml[xml.index(b'<w:body>') + 8:-len(b'</w:body></w:document>')]
+    original = zipfile.ZipFile(source).read(DOCUMENT_PART)
+    assert joined == original[original.index(b'<w:body>') + 8:-len(b'</w:body></w:document>')]
+
+    # 이미지는 참조하는 청크에만, 스타일은 모든 청크에
+    with zipfile.ZipFile(chunks[0]['path']) as z:
+        assert 'word/media/image1.png' in z.namelist()
+        assert 'word/media/image2.png' not in z.namelist()
+        assert b'rId3' not in z.read(DOCUMENT_RELS)
+        assert 'word/styles.xml' in z.namelist()
+    with zipfile.ZipFile(chunks[1]['path']) as z:
+        assert not any(n.startswith('word/media/') for n in z.namelist())
+
+
+def test_split_without_boundary_falls_back_to_budget(tmp_path):
+    source = tmp_path / 'general.docx'
+    make_docx(source, ''.join(para(f'{i}' * 100) for i in range(6)))
+
+    chunks = DocxStreamSplitter(source, max_bytes=300).split(tmp_path / 'out')
+
+    # 문단 1개씩, 본문 끝 sectPr는 마지막 청크에 포함
+    assert [c['elements'] for c in chunks] == [1, 1, 1, 1, 1, 2]
+    assert all(c['bytes'] <= 300 for c in chunks)
+
+
+def test_split_across_read_blocks(tmp_path, monkeypatch):
+    # </w:body>를 읽기 전에 앞 청크들을 내보내도 닫는 태그가 붙어야 함
+    monkeypatch.setattr(docx_stream, 'READ_BLOCK', 64)
+    source = tmp_path / 'large.docx'
+    make_docx(source, ''.join(heading(f'Monograph {i}') + para('다' * 100) for i in range(5)))
+
+    chunks = DocxStreamSplitter(source, max_bytes=500).split(tmp_path / 'out')
+
+    assert [c['first_heading'] for c in chunks] == [f'Monograph {i}' for i in range(5)]
+    assert b''.join(chunk_bodies(chunks)) == original_body(source)
+
+
+def test_split_self_closing_elements(tmp_path):
+    source = tmp_path / 'empty.docx'
+    make_docx(source, heading('Aspirin') + '<w:p/>' + '<w:bookmarkEnd w:id="0"/>' + para('라' * 50)
+              + heading('Ibuprofen') + '<w:p/>')
+
+    splitter = DocxStreamSplitter(source, max_bytes=400)
+    with zipfile.ZipFile(source) as z:
+        elements = [element for element, _ in splitter.iter_elements(z)]
+
+    assert elements[1:3] == [b'<w:p/>', b'<w:bookmarkEnd w:id="0"/>']
+    assert elements[-2] == b'<w:p/>'
+    assert elements[-1].startswith(b'<w:sectPr>')
+
+    chunks = splitter.split(tmp_path / 'out')
+    assert [c['first_heading'] for c in chunks] == ['Aspirin', 'Ibuprofen']
+    assert b''.join(chunk_bodies(chunks)) == original_body(source)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+shared/drug_dictionary.py 유닛 테스트
+
+- 제품은 한 번만 저장, 키(원본/정규화) → 제품 번호
+- 이분 탐색 조회 결과가 기존 drug_dictionary.json 항목 형태와 같음
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.drug_dictionary import DrugDictionary, DrugDictionaryBuilder, normalize_key, search_key_table
+
+OPDIVO_100 = {'product_code': '655501001', 'product_name': '옵디보주100mg(니볼루맙,유전자재조합)_(0.1g/10mL)',
+              'specification': '10', 'company': '한국오노약품공업(주)', 'ingredient_code': '622701BIJ',
+              'price': 1184460.0, 'route': '주사'}
+OPDIVO_20 = dict(OPDIVO_100, product_code='655501002', product_name='옵디보주20mg(니볼루맙,유전자재조합)_(20mg/2mL)',
+                 specification='2', price=259930.0)
+KYMRIAH = {'product_code': '699900010', 'product_name': 'Kymriah-주', 'specification': '1',
+           'company': '한국노바티스(주)', 'ingredient_code': '', 'price': 360039359.0, 'route': '주사'}
+
+
+def build(tmp_path):
+    builder = DrugDictionaryBuilder()
+    builder.add(OPDIVO_100, ['옵디보주100mg', '옵디보주', '옵디보', '니볼루맙'])
+    builder.add(OPDIVO_20, ['옵디보주20mg', '옵디보주', '옵디보', '니볼루맙'])
+    builder.add(KYMRIAH, ['Kymriah-주', 'Kymriah'])
+    meta = builder.save(tmp_path / 'dict')
+    return meta, DrugDictionary.open(tmp_path / 'dict')
+
+
+def test_build_and_lookup(tmp_path):
+    meta, drug_dict = build(tmp_path)
+    with drug_dict:
+        assert meta['products'] == 3
+        # 회사명/경로/성분코드는 한 번만 저장
+        assert meta['strings'] < 3 * 6
+
+        assert len(drug_dict) == len(list(drug_dict.keys()))
+        assert list(drug_dict.keys()) == sorted(drug_dict.keys(), key=lambda k: k.encode('utf-8'))
+
+        assert '옵디보' in drug_dict and '키트루다' not in drug_dict
+        assert [r['product_code'] for r in drug_dict.records('니볼루맙')] == ['655501001', '655501002']
+        assert drug_dict.records('옵디보주100mg') == [OPDIVO_100]
+
+        entry = drug_dict.get('Kymriah-주')
+        assert entry == {'records': [KYMRIAH], 'normalized_from': 'kymriah주', 'is_normalized': False}
+        assert drug_dict.get('kymriah')['is_normalized'] is True
+        assert drug_dict.get('없는키') is None
+
+        assert drug_dict.lookup('KYMRIAH 주') == [KYMRIAH]
+        assert [r['product_code'] for r in drug_dict.products()] == ['655501001', '655501002', '699900010']
+
+
+def test_normalize_key():
+    assert normalize_key('Kymriah-주 (CAR-T)') == 'kymriah주cart'
+    assert normalize_key('') == ''
+
+
+def test_search_key_table():
+    pd = pytest.importorskip('pandas')
+
+    names = pd.Series(['옵디보주100mg(니볼루맙,유전자재조합)_(0.1g/10mL)', None,
+                       '타이레놀서방정500mg(아세트아미노펜)', '(성분)약', 'Kymriah-주'])
+    table = search_key_table(names)
+
+    rows = {row: list(zip(group['key_kind'], group['key'])) for row, group in table.groupby('row')}
+    assert rows[0] == [('product', '옵디보주100mg'), ('without_dosage', '옵디보주'),
+                       ('without_form', '옵디보'), ('ingredient', '니볼루맙')]
+    # 목록 앞쪽 제형(정)이 서방정보다 먼저 일치하던 기존 동작 유지
+    assert rows[2][2] == ('without_form', '타이레놀서방')
+    assert 1 not in rows and 3 not in rows
+    assert rows[4] == [('product', 'Kymriah-주'), ('without_form', 'Kymriah-')]
+    assert table.loc[table['key'] == 'Kymriah-주', 'normalized'].tolist() == ['kymriah주']
+    assert table.loc[table['key'] == '니볼루맙', 'normalized'].isna().all()
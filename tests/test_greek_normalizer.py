@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+mfds/utils/greek_normalizer.py 유닛 테스트
+
+- 그리스 문자가 여러 개여도 모두 변환 (이전에는 마지막 문자만 반영)
+- 단위 기호 μ(μg 등)는 유지
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mfds.utils.greek_normalizer import GreekLetterNormalizer
+
+RULES = {
+    'greek_letters': {
+        'mappings': {'α': 'alpha', 'β': 'beta', 'γ': 'gamma', 'μ': 'mu'},
+        'mappings_ko': {'α': '알파', 'β': '베타', 'γ': '감마', 'μ': '뮤'},
+        'excluded_contexts': ['μg', 'μL', 'μm', 'μmol'],
+    }
+}
+
+
+@pytest.fixture
+def normalizer(tmp_path):
+    rules_path = tmp_path / 'rules.json'
+    rules_path.write_text(json.dumps(RULES, ensure_ascii=False), encoding='utf-8')
+    return GreekLetterNormalizer(str(rules_path))
+
+
+def test_multiple_greek_letters(normalizer):
+    result = normalizer.generate_synonyms('α,β-Dihydro-γ-lactone')
+    assert result['has_greek'] is True
+    assert result['synonyms_ascii'] == ['alpha,beta-Dihydro-gamma-lactone', 'alpha,betaDihydrogammalactone']
+    assert result['synonyms_ko'][0] == '알파,베타-Dihydro-감마-lactone'
+
+
+def test_unit_symbols_are_kept(normalizer):
+    assert normalizer.generate_synonyms('Test μg/mL')['has_greek'] is False
+    assert normalizer.to_ascii('μ-Opioid 10μg') == 'mu-Opioid 10μg'
+    assert normalizer.greek_chars('β-Carotene 5μmol') == {'β'}
+    # 목록에 없는 μ+영문자는 단위가 아님
+    assert normalizer.to_korean('μgamma') == '뮤gamma'
+
+
+def test_batch_and_cache(normalizer):
+    results = normalizer.generate_synonyms_batch(['α-Tocopherol', 'Dexamethasone', 'α-Tocopherol'])
+    assert [r['has_greek'] for r in results] == [True, False, True]
+    results[0]['synonyms_ascii'].append('changed')
+    assert normalizer.generate_synonyms('α-Tocopherol')['synonyms_ascii'] == ['alpha-Tocopherol', 'alphaTocopherol']
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+shared/hangul_phonetic.py 유닛 테스트
+
+- 음절 표 로마자 변환이 기존 음절별 자모 분해와 같음
+- 한글/영문 음성 키(자음 골격)가 음차 쌍에서 일치
+- 색인 조회로 한글 약제명 → 영문 성분명 후보
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.hangul_phonetic import (CHOSUNG_ROMAN, JONGSUNG_ROMAN, JUNGSUNG_ROMAN, PhoneticIndex, english_keys,
+                                    korean_key, romanize)
+
+PAIRS = [
+    ('paclitaxel', '파클리탁셀'), ('trastuzumab', '트라스투주맙'), ('imatinib', '이매티닙'),
+    ('gefitinib', '게피티닙'), ('gemcitabine', '젬시타빈'), ('carboplatin', '카보플라틴'),
+    ('cyclophosphamide', '사이클로포스파마이드'), ('fluorouracil', '플루오로우라실'), ('osimertinib', '오시머티닙'),
+]
+
+
+def romanize_by_syllable(text):
+    """기존 _romanize_korean (음절별 자모 분해)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if 0xAC00 <= code <= 0xD7A3:
+            code -= 0xAC00
+            result.append(CHOSUNG_ROMAN[code // 588] + JUNGSUNG_ROMAN[(code % 588) // 28] + JONGSUNG_ROMAN[code % 28])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def test_romanize_table():
+    text = ''.join(chr(code) for code in range(0xAC00, 0xD7A4, 7)) + ' abc-1'
+    assert romanize(text) == romanize_by_syllable(text)
+    assert romanize('파클리탁셀') == 'pakeulritagsel'
+
+
+def test_phonetic_keys():
+    for en, ko in PAIRS:
+        assert korean_key(ko) in english_keys(en), (en, ko)
+    # e/i/y 앞 g는 두 가지
+    assert english_keys('gefitinib') == ['KPTNP', 'SPTNP']
+    assert korean_key('바이알') not in english_keys('busulfan')
+
+
+def test_index_candidates():
+    index = PhoneticIndex([en for en, _ in PAIRS] + ['bortezomib', 'docetaxel'])
+    for en, ko in PAIRS:
+        assert en in [name for name, _ in index.candidates(ko)], ko
+    # 자음 1개 차이(보르테조밉의 ㄹ)도 후보
+    assert index.candidates('보르테조밉')[0][0] == 'bortezomib'
+    assert index.candidates('바이알') == []
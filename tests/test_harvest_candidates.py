@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+harvest_candidates.py 유닛 테스트
+
+- 합친 스캐너 결과가 패턴별 finditer(기존 방식)와 같음
+- 병렬 처리 결과가 순차 처리와 같음 (후보 순서, 괄호쌍 집계)
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('pandas')
+
+from scripts.harvest_candidates import EN_SUFFIXES, KO_SUFFIXES, CandidateScanner, DrugCandidateHarvester
+
+TEXT = ('트라스투주맙 및 파클리탁셀과카보플라틴 병용, Gefitinib (게피티닙) 또는 imatinib/이매티닙. '
+        '도세탁셀(docetaxel) 투여 후 XMAB, 맙, 카보플라틴carboplatin, irinotecan 이리노테칸, 급여 (benefit)')
+
+
+def reference_hits(text):
+    """기존 패턴별 finditer 결과 (단계, 패턴 번호, 시작, 끝, surface)"""
+    hits = set()
+    # 영문은 같은 단어가 여러 패턴(nib, tinib)에 걸리면 먼저 도는 패턴만
+    en_first = {}
+    for idx, suffix in enumerate(EN_SUFFIXES):
+        for match in re.finditer(rf'\w+{suffix}\b', text, re.IGNORECASE):
+            en_first.setdefault((match.start(), match.end(), match.group()), idx)
+    hits.update((0, idx, start, end, surface) for (start, end, surface), idx in en_first.items())
+    for idx, suffix in enumerate(KO_SUFFIXES):
+        for match in re.finditer(rf'[가-힣]+{suffix}', text):
+            hits.add((1, idx, match.start(), match.end(), match.group()))
+    return hits
+
+
+def test_fused_scanner_matches_per_pattern():
+    hits = {(phase, idx, start, end, surface)
+            for phase, idx, _, start, end, surface, _ in CandidateScanner().scan(TEXT) if phase < 2}
+    assert hits == reference_hits(TEXT)
+
+
+def test_parallel_equals_serial(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f'{i}.json'
+        content = TEXT[i * 7:] + ' 리툭시맙(rituximab) ' * i
+        path.write_text(json.dumps({'content': content, 'metadata': {'source_file': f'doc{i}.pdf'}},
+                                   ensure_ascii=False), encoding='utf-8')
+        paths.append(path)
+
+    serial = DrugCandidateHarvester()
+    for path in paths:
+        serial.extract_from_json(path)
+
+    parallel = DrugCandidateHarvester()
+    parallel.extract_from_jsons(paths, workers=2)
+
+    assert parallel.candidates == serial.candidates
+    assert parallel.pair_counts == serial.pair_counts
+    assert parallel.pair_counts[('rituximab', '리툭시맙')] >= 1
+    assert ('benefit', '급여') not in parallel.pair_counts
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+hira_cancer/attachment_downloader.py 유닛 테스트
+
+- 병렬 다운로드 SHA-256 중복 제거 (가짜 응답 객체 사용, 네트워크 없음)
+- 덮어쓴 첨부의 이전 해시/URL 정리
+- Content-Disposition 파일명 복원
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hira_cancer.attachment_downloader import AttachmentDownloader, filename_from_disposition
+from shared.utils.rate_limiter import HostRateLimiter
+
+# 테스트에서는 호스트 간격 대기 생략 (기본값은 DOWNLOAD_INTERVAL초/1건)
+NO_WAIT = HostRateLimiter(min_interval=0, max_concurrent=4)
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, filename: str):
+        self.status = 200
+        self.ok = True
+        self.headers = {
+            'content-type': 'application/octet-stream',
+            'content-disposition': f'attachment; filename="{filename}"',
+        }
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeContext:
+    """context.request.get(url)만 흉내내는 응답 테이블"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+        self.request = self
+
+    async def get(self, url, timeout=None):
+        self.requested.append(url)
+        await asyncio.sleep(0)
+        return self.responses[url]
+
+
+def test_downloader_dedupes_identical_files(tmp_path):
+    """다른 게시글에 같은 서식이 첨부되면 파일은 하나만 저장, 받은 URL은 다시 요청하지 않음"""
+    form = b'same-form' * 1000
+    responses = {
+        'https://hira/a1': FakeResponse(form, '%EC%84%9C%EC%8B%9D.hwp'),
+        'https://hira/a2': FakeResponse(form, 'form.hwp'),
+        'https://hira/b1': FakeResponse(b'other', 'other.pdf'),
+    }
+    posts = [
+        ({'board': 'announcement', 'number': '1'}, {'filename': '서식.hwp', 'download_url': 'https://hira/a1'}),
+        ({'board': 'faq', 'number': '7'}, {'filename': 'form.hwp', 'download_url': 'https://hira/a2'}),
+        ({'board': 'faq', 'number': '8'}, {'filename': 'other.pdf', 'download_url': 'https://hira/b1'}),
+    ]
+
+    async def run(context, jobs):
+        downloader = AttachmentDownloader(tmp_path, concurrency=2, rate_limiter=NO_WAIT)
+        downloader.bind(context)
+        for post, attachment in jobs:
+            downloader.enqueue(attachment, post)
+        return await downloader.drain()
+
+    context = FakeContext(responses)
+    stats = asyncio.run(run(context, posts))
+
+    assert stats == {'downloaded': 2, 'reused': 0, 'duplicates': 1, 'failed': 0}
+    saved = sorted(p.name for p in (tmp_path / 'attachments').rglob('*') if p.is_file() and p.suffix != '.json')
+    assert len(saved) == 2 and '1_서식.hwp' in saved
+    assert not list(tmp_path.rglob('*.part'))
+
+    first, second = posts[0][1], posts[1][1]
+    assert first['sha256'] == second['sha256']
+    assert second['duplicate_of'] == first['local_path']
+
+    # 다음 실행: 받은 URL은 네트워크 요청 없이 재사용
+    context = FakeContext(responses)
+    again = [({'board': 'faq', 'number': '9'}, {'filename': 'x.hwp', 'download_url': 'https://hira/a1'})]
+    stats = asyncio.run(run(context, again))
+    assert stats['reused'] == 1 and context.requested == []
+
+
+def test_downloader_overwrite_forgets_stale_hash(tmp_path):
+    """덮어쓴 파일의 이전 내용은 더 이상 중복 원본이 아님 (다시 받으면 새로 저장)"""
+    post = {'board': 'announcement', 'number': '1'}
+
+    async def run(responses, jobs, overwrite=False):
+        downloader = AttachmentDownloader(tmp_path, concurrency=1, overwrite=overwrite,
+                                          rate_limiter=NO_WAIT)
+        downloader.bind(FakeContext(responses))
+        for job_post, attachment in jobs:
+            downloader.enqueue(attachment, job_post)
+        return await downloader.drain()
+
+    asyncio.run(run({'https://hira/v1': FakeResponse(b'version-1', 'form.hwp')},
+                    [(post, {'filename': 'form.hwp', 'download_url': 'https://hira/v1'})]))
+    # 증분 수집: 같은 게시글의 첨부가 교체됨
+    asyncio.run(run({'https://hira/v2': FakeResponse(b'version-2', 'form.hwp')},
+                    [(post, {'filename': 'form.hwp', 'download_url': 'https://hira/v2'})], overwrite=True))
+    assert (tmp_path / 'attachments' / 'announcement' / '1_form.hwp').read_bytes() == b'version-2'
+
+    # 다른 게시글에 이전 내용이 올라오면 교체된 파일을 가리키지 않고 따로 저장
+    other = {'board': 'faq', 'number': '3'}
+    attachment = {'filename': 'old.hwp', 'download_url': 'https://hira/v1-copy'}
+    stats = asyncio.run(run({'https://hira/v1-copy': FakeResponse(b'version-1', 'old.hwp')}, [(other, attachment)]))
+    assert stats['downloaded'] == 1 and 'duplicate_of' not in attachment
+    assert Path(attachment['local_path']).read_bytes() == b'version-1'
+
+    # 이전 URL도 교체된 파일로 재사용되지 않음
+    again = {'filename': 'form.hwp', 'download_url': 'https://hira/v1'}
+    asyncio.run(run({'https://hira/v1': FakeResponse(b'version-1', 'form.hwp')},
+                    [({'board': 'faq', 'number': '4'}, again)]))
+    assert Path(again['local_path']).read_bytes() == b'version-1'
+
+
+def test_downloader_default_pacing_and_shared_limiter(tmp_path):
+    """제한기를 주지 않으면 HIRA 호스트 다운로드는 0.5초/1건, 주면 그대로 공유"""
+    downloader = AttachmentDownloader(tmp_path, concurrency=4)
+    assert (downloader.rate_limiter.min_interval, downloader.rate_limiter.max_concurrent) == (0.5, 1)
+
+    shared = HostRateLimiter(min_interval=0.5, max_concurrent=1)
+    assert AttachmentDownloader(tmp_path, rate_limiter=shared).rate_limiter is shared
+
+
+def test_filename_from_disposition():
+    assert filename_from_disposition("attachment; filename*=UTF-8''%EA%B3%B5%EA%B3%A0.pdf") == '공고.pdf'
+    assert filename_from_disposition('attachment; filename="%B0%F8%B0%ED.hwp"') == '공고.hwp'
+    assert filename_from_disposition(None) is None
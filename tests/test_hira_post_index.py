@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+hira_cancer/post_index.py 유닛 테스트
+
+- 게시글 신규/개정/변경없음 판정
+- 첨부파일 해시 기반 재다운로드 생략
+- 인덱스 저장/로드
+- 증분 중단 판정 (상단 고정 공지 제외)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hira_cancer.post_index import PostIndex, UnchangedStop, file_sha256, is_pinned_row, post_id
+
+
+def make_post(number='120', revision_date='2025-01-02', bbs_no='45648'):
+    return {
+        'board': 'announcement',
+        'number': number,
+        'title': '암환자에게 처방·투여하는 약제에 대한 공고',
+        'revision_date': revision_date,
+        'created_date': '2025-01-02',
+        'has_attachment': True,
+        'detail_url': f'https://www.hira.or.kr/bbsDummy.do?pgmid=HIRAA030023010000&brdScnBltNo=4&brdBltNo={bbs_no}',
+        'onclick': None,
+    }
+
+
+def test_post_status_and_stable_id(tmp_path):
+    """목록 번호가 밀려도 같은 글로 인식, 제·개정일이 바뀌면 개정으로 판정"""
+    index = PostIndex(tmp_path / 'post_index.json')
+    post = make_post()
+
+    assert post_id(post) == '45648'
+    assert index.status('announcement', post) == 'new'
+
+    index.update('announcement', post)
+    assert index.status('announcement', make_post(number='121')) == 'unchanged'
+    assert index.status('announcement', make_post(revision_date='2025-02-01')) == 'revised'
+    assert index.status('announcement', make_post(bbs_no='45700')) == 'new'
+
+
+def test_known_attachment_requires_matching_file(tmp_path):
+    """같은 다운로드 키 + 로컬 파일 해시 일치일 때만 기존 첨부로 인정"""
+    index = PostIndex(tmp_path / 'post_index.json')
+    local_path = tmp_path / '120_공고.hwp'
+    local_path.write_bytes(b'hwp-content')
+
+    attachment = {
+        'filename': '공고.hwp',
+        'download_url': 'https://www.hira.or.kr/bbsDownload.do?brdScnBltNo=4&brdBltNo=45648&type=6&atchSeq=49',
+        'local_path': str(local_path),
+        'sha256': file_sha256(local_path),
+    }
+    post = dict(make_post(), attachments=[attachment])
+    index.update('announcement', post)
+
+    assert index.known_attachment('announcement', post, attachment)['sha256'] == attachment['sha256']
+
+    # 교체된 첨부 (첨부 순번 변경)
+    replaced = dict(attachment, download_url=attachment['download_url'].replace('atchSeq=49', 'atchSeq=50'))
+    assert index.known_attachment('announcement', post, replaced) is None
+
+    # 로컬 파일이 바뀌면 다시 받아야 함
+    local_path.write_bytes(b'corrupted')
+    assert index.known_attachment('announcement', post, attachment) is None
+
+
+def test_index_roundtrip(tmp_path):
+    """저장 후 다시 읽어도 상태 유지"""
+    path = tmp_path / 'raw' / 'post_index.json'
+    index = PostIndex(path)
+    index.update('faq', make_post())
+    index.save()
+
+    reloaded = PostIndex(path)
+    assert len(reloaded) == 1
+    assert reloaded.status('faq', make_post()) == 'unchanged'
+    assert not path.with_suffix('.json.tmp').exists()
+
+
+def test_pinned_unchanged_row_does_not_stop_incremental(tmp_path):
+    index = PostIndex(tmp_path / 'post_index.json')
+    old = [make_post(number=str(n), bbs_no=str(45000 + n)) for n in (99, 98, 97, 96)]
+    for post in old:
+        index.update('announcement', post)
+
+    # 1페이지: 이미 본 고정 공지가 맨 위, 그 아래 새 글, 그 다음 기존 글
+    pinned = dict(old[0], pinned=is_pinned_row('notice', '99'))
+    rows = [pinned, make_post(number='100', bbs_no='45100')] + old[1:]
+
+    stop = UnchangedStop(run=3)
+    seen = []
+    for post in rows:
+        post['status'] = index.status('announcement', post)
+        seen.append(post['number'])
+        if stop.feed(post):
+            break
+
+    assert pinned['status'] == 'unchanged'
+    assert rows[1]['status'] == 'new'
+    assert seen == ['99', '100', '98', '97', '96']
+    assert stop.reached
+
+
+def test_unchanged_run_resets_and_spans_pages():
+    stop = UnchangedStop(run=2)
+    assert not stop.feed({'status': 'unchanged'})
+    assert not stop.feed({'status': 'revised'})
+    assert not stop.feed({'status': 'unchanged'})
+    # 다음 페이지 첫 행에서 연속 2건 도달
+    assert stop.feed({'status': 'unchanged'})
+
+
+def test_is_pinned_row():
+    assert is_pinned_row('notice', '12')
+    assert is_pinned_row(None, '공지')
+    assert is_pinned_row('', '12', has_icon=True)
+    assert not is_pinned_row(None, '12')
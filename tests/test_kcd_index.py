@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+shared/kcd_index.py / shared/kcd_ranker.py 유닛 테스트
+
+- 접두사/범위 조회, 암 코드 비트맵
+- n-gram 역색인 검색이 기존 선형 탐색(소문자 부분 문자열)과 같은 결과를 내는지
+- 저장 → mmap으로 다시 열기, 원본이 바뀌면 재빌드 (정규화 Parquet이 있으면 그 표에서 빌드)
+- BM25 순위: 계층 보정, 배치 질의, 분류 코드 묶기
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.kcd_index import KCDIndex, is_cancer_code
+from shared.kcd_ranker import KCDRanker, parent_code, tokenize
+
+
+RECORDS = [
+    {'code': 'C00-D48', 'name_kr': '신생물', 'name_en': 'Neoplasms', 'is_header': True, 'is_lowest': False},
+    {'code': 'C50', 'name_kr': '유방의 악성 신생물', 'name_en': 'Malignant neoplasm of breast', 'is_header': True, 'is_lowest': False},
+    {'code': 'C50.0', 'name_kr': '유두 및 유륜의 악성 신생물', 'name_en': 'Nipple and areola', 'is_header': False, 'is_lowest': True},
+    {'code': 'C50.9', 'name_kr': '상세불명의 유방의 악성 신생물', 'name_en': 'Breast, unspecified', 'is_header': False, 'is_lowest': True},
+    {'code': 'C34.9', 'name_kr': '상세불명의 기관지 또는 폐의 악성 신생물', 'name_en': 'Bronchus or lung, unspecified', 'is_header': False, 'is_lowest': True},
+    {'code': 'D48.9', 'name_kr': '행동양식 불명 또는 미상의 신생물', 'name_en': 'Neoplasm of uncertain behaviour', 'is_header': False, 'is_lowest': True},
+    {'code': 'D50.0', 'name_kr': '만성 실혈에 의한 철결핍빈혈', 'name_en': 'Iron deficiency anaemia secondary to blood loss', 'is_header': False, 'is_lowest': True},
+    {'code': 'J18.9', 'name_kr': '상세불명의 폐렴', 'name_en': 'Pneumonia, unspecified', 'is_header': False, 'is_lowest': True},
+]
+
+
+def linear_search(keyword, cancer_only=False, lowest_only=False):
+    keyword = keyword.lower()
+    return sorted(
+        r['code'] for r in RECORDS
+        if (keyword in r['name_kr'].lower() or keyword in r['name_en'].lower())
+        and (not cancer_only or is_cancer_code(r['code']))
+        and (not lowest_only or r['is_lowest'])
+    )
+
+
+def test_prefix_range_and_cancer_bitmap():
+    index = KCDIndex.from_records(RECORDS)
+
+    assert index.prefix('C50') == ['C50', 'C50.0', 'C50.9']
+    assert index.range('C00', 'D48') == ['C34.9', 'C50', 'C50.0', 'C50.9', 'D48.9']
+    assert index.cancer_codes(lowest_only=True) == ['C34.9', 'C50.0', 'C50.9', 'D48.9']
+    assert index.is_cancer('D48.9') and not index.is_cancer('D50.0')
+    assert not index.is_cancer('C00-D48')
+    assert index.get('C50')['is_header'] is True
+
+
+def test_search_matches_linear_scan():
+    index = KCDIndex.from_records(RECORDS)
+
+    for keyword in ['폐', '유방', '악성 신생물', 'BREAST', 'neo', 'x', '상세불명의 폐렴', '없는말']:
+        for filters in [{}, {'cancer_only': True, 'lowest_only': True}]:
+            found = [index.codes[i] for i in index.search(keyword, **filters)]
+            assert found == linear_search(keyword, **filters), (keyword, filters)
+
+    counts = index.match_counts(['유방', 'breast'], cancer_only=True, lowest_only=True)
+    assert {index.codes[i]: n for i, n in counts.items()} == {'C50.9': 2}
+
+
+def test_load_builds_and_reopens_with_mmap(tmp_path):
+    source = tmp_path / 'kcd9_full.json'
+    source.write_text(json.dumps({'codes': RECORDS}, ensure_ascii=False), encoding='utf-8')
+    index_dir = tmp_path / 'kcd9_index'
+
+    with KCDIndex.load(source, index_dir) as index:
+        assert len(index) == len(RECORDS)
+    meta = json.loads((index_dir / 'meta.json').read_text(encoding='utf-8'))
+
+    with KCDIndex.load(source, index_dir) as index:
+        assert [index.codes[i] for i in index.search('폐', cancer_only=True)] == ['C34.9']
+
+    # 원본 변경 → 재빌드
+    source.write_text(json.dumps({'codes': RECORDS[:2]}, ensure_ascii=False), encoding='utf-8')
+    os.utime(source, ns=(meta['source_mtime_ns'] + 10**9, meta['source_mtime_ns'] + 10**9))
+    with KCDIndex.load(source, index_dir) as index:
+        assert index.codes == ['C00-D48', 'C50']
+
+
+
+def test_load_builds_from_normalized_parquet(tmp_path):
+    """kcd9_full.parquet이 있으면 JSON 대신 그 표의 필요한 컬럼으로 빌드"""
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    source = tmp_path / 'kcd9_full.json'
+    source.write_text(json.dumps({'codes': RECORDS[:2]}, ensure_ascii=False), encoding='utf-8')
+    frame = pd.DataFrame(RECORDS).assign(classification='', symbol='', note='')
+    frame.to_parquet(tmp_path / 'kcd9_full.parquet', index=False)
+
+    with KCDIndex.load(source, tmp_path / 'kcd9_index') as index:
+        assert len(index) == len(RECORDS)
+        assert [index.codes[i] for i in index.search('폐', cancer_only=True, lowest_only=True)] == ['C34.9']
+
+def test_open_maps_binary_tables(tmp_path):
+    """열 때는 meta.json만 읽고 코드/이름/n-gram 표는 mmap 그대로 조회"""
+    index_dir = tmp_path / 'kcd9_index'
+    KCDIndex.from_records(RECORDS).save(index_dir)
+    assert sorted(p.name for p in index_dir.glob('*.json')) == ['meta.json']
+
+    with KCDIndex.open(index_dir) as index:
+        assert isinstance(index.codes.blob, memoryview) and isinstance(index.postings, memoryview)
+        assert index.position('C50.9') == 4 and index.position('C51') is None
+        assert index.get('C34.9')['name_kr'] == '상세불명의 기관지 또는 폐의 악성 신생물'
+        assert [index.codes[i] for i in index.search('breast')] == ['C50', 'C50.9']
+
+    meta = json.loads((index_dir / 'meta.json').read_text(encoding='utf-8'))
+    (index_dir / 'meta.json').write_text(json.dumps(dict(meta, version=1)), encoding='utf-8')
+    with pytest.raises(ValueError):
+        KCDIndex.open(index_dir)
+
+
+def test_tokenize_and_parent_code():
+    assert tokenize('유방의 암', query=True) == ['유방', '방의', '암']
+    assert tokenize('폐', query=True) == ['폐']
+    assert tokenize('Large B-cell', query=True) == ['large', 'b', 'cell']
+    assert '폐' in tokenize('기관지 또는 폐의')
+    assert parent_code('C50.91') == 'C50.9'
+    assert parent_code('C50.9') == 'C50'
+    assert parent_code('C50') is None
+
+
+def test_bm25_rank_batch():
+    ranker = KCDRanker(KCDIndex.from_records(RECORDS), cancer_only=True)
+    assert len(ranker) == 5  # 범위 코드, 비암 코드 제외
+
+    breast, lung, missing = ranker.rank_batch([['유방'], ['폐', 'lung'], ['췌장']], top_k=5, lowest_only=True)
+
+    # C50.9는 이름 + 상위 코드(C50) 보정, C50.0은 '유방'이 없어 제외
+    assert [m['kcd_code'] for m in breast] == ['C50.9']
+    assert breast[0]['match_count'] == 1 and breast[0]['score'] > 0
+    assert [m['kcd_code'] for m in lung] == ['C34.9']
+    assert lung[0]['match_count'] == 2
+    assert missing == []
+
+    # 하위 코드가 상위 코드 점수를 일부 물려받아 앞섬
+    assert [m['kcd_code'] for m in ranker.rank(['유방'], top_k=None)] == ['C50.9', 'C50']
+
+    # 분류 코드가 있으면 분류 코드로 묶고, 없으면 원래 코드 유지
+    # ('신생물' 토큰만 걸리는 D48.9는 키워드 일치가 없어 제외)
+    collapsed = ranker.rank(['악성 신생물'], top_k=None, lowest_only=True, collapse_category=True)
+    assert [m['kcd_code'] for m in collapsed] == ['C50', 'C34.9']
+    assert collapsed[0]['name_kr'] == '유방의 악성 신생물'
+
+
+def test_bm25_drops_partial_keyword_hits():
+    """키워드 2-gram 일부만 걸린 코드는 결과에서 제외 ('간세포'의 '세포'만 있는 기저세포 코드)"""
+    records = RECORDS + [
+        {'code': 'C22.0', 'name_kr': '간세포암종', 'name_en': 'Liver cell carcinoma', 'is_header': False, 'is_lowest': True},
+        {'code': 'C44.1', 'name_kr': '눈꺼풀의 피부의 기저세포 악성 신생물', 'name_en': 'Skin of eyelid',
+         'is_header': False, 'is_lowest': True},
+        {'code': 'C53.9', 'name_kr': '상세불명의 자궁경부의 악성 신생물', 'name_en': 'Cervix uteri, unspecified',
+         'is_header': False, 'is_lowest': True},
+        {'code': 'C54.1', 'name_kr': '자궁내막의 악성 신생물', 'name_en': 'Endometrium', 'is_header': False, 'is_lowest': True},
+    ]
+    ranker = KCDRanker(KCDIndex.from_records(records), cancer_only=True)
+
+    liver, cervix = ranker.rank_batch([['간세포', '간암'], ['자궁경부', '자궁목']], top_k=None)
+    assert [m['kcd_code'] for m in liver] == ['C22.0']
+    assert [m['kcd_code'] for m in cervix] == ['C53.9']
+    assert all(m['match_count'] > 0 for m in liver + cervix)
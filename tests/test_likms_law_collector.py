@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+likms/config, likms/scrapers/law_collector.py 유닛 테스트
+
+- 컬렉션 설정 로드 / 중복 제거
+- 법령별 상태 저장 후 재실행 시 완료 건 건너뛰기
+- 검색 결과 캐시 저장/로드
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from likms.config import get_collection, get_laws, list_collections
+from likms.scrapers.law_collector import CollectionStatus, LawCollector, SearchCache, law_url, safe_name
+
+
+def test_collections_config():
+    """기존 scourt_*.py 스크립트의 법령 목록이 모두 설정으로 옮겨졌는지"""
+    keys = list_collections()
+    assert {'medical', 'medical_aid', 'nhis', 'pharmacy'} <= set(keys)
+
+    nhis = get_collection('nhis')
+    assert len(nhis['laws']) == 4
+    assert all(law['jisCntntsSrno'] and law['search_keyword'] for law in nhis['laws'])
+
+    laws = get_laws(['medical', 'medical'])
+    assert [law['name'] for law in laws] == ['의료법', '의료법 시행령', '의료법 시행규칙']
+    assert laws[0]['collection'] == 'medical'
+    assert '%EC%9D%98%EB%A3%8C%EB%B2%95' in law_url(laws[0]['jisCntntsSrno'], laws[0]['search_keyword'])
+
+
+def test_status_skips_done_laws(tmp_path):
+    """완료 기록 + 저장 파일이 있는 법령만 건너뛰고, 실패 건은 다시 수집 대상"""
+    output_dir = tmp_path / 'laws'
+    collector = LawCollector(output_dir=output_dir, status_path=tmp_path / 'status.json',
+                             search_cache_path=tmp_path / 'cache.json')
+    laws = get_laws(['medical'])
+
+    collector.status.record(laws[0], {'status': 'done', 'attempts': 1, 'chars': 10})
+    collector.status.record(laws[1], {'status': 'failed', 'attempts': 2, 'error': 'timeout'})
+    collector.status.save()
+    (output_dir / f"{safe_name(laws[0]['name'])}.json").write_text('{}', encoding='utf-8')
+
+    reloaded = LawCollector(output_dir=output_dir, status_path=tmp_path / 'status.json',
+                            search_cache_path=tmp_path / 'cache.json')
+    assert [law['name'] for law in reloaded.pending(laws)] == ['의료법 시행령', '의료법 시행규칙']
+    assert len(reloaded.pending(laws, force=True)) == 3
+    assert reloaded.status.summary() == {'done': 1, 'failed': 1}
+
+    reloaded.status.record(laws[1], {'status': 'failed', 'attempts': 1, 'error': 'timeout'})
+    assert reloaded.status.get(laws[1]['name'])['attempts'] == 3
+
+
+def test_search_cache_roundtrip(tmp_path):
+    cache = SearchCache(tmp_path / 'cache.json')
+    law = {'name': '의료법 시행령', 'search_keyword': '의료법'}
+    url = 'https://portal.scourt.go.kr/pgp/main.on?w2xPath=PGP1021M04&jisCntntsSrno=123&c=900'
+
+    assert cache.lookup(law) is None
+    cache.store(law, url)
+    cache.save()
+
+    entry = SearchCache(tmp_path / 'cache.json').lookup(law)
+    assert entry['url'] == url
+    assert entry['jisCntntsSrno'] == '123'
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+shared/utils/mmap_table.py 유닛 테스트
+
+- 문자열 표 저장 → mmap으로 열어 이분 탐색
+- 빈 파일은 빈 배열/바이트로 대체
+- meta.json 외 임시 파일이 남지 않음
+"""
+
+import sys
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.utils.mmap_table import MmapFiles, PackedStrings, SnapshotWriter, pack_strings
+
+FILES = {'keys.bin': None, 'key_offsets.bin': 'I', 'prices.bin': 'd', 'postings.bin': 'I'}
+
+
+def test_roundtrip_and_position(tmp_path):
+    keys = sorted(['키트루다', 'keytruda', '옵디보', 'C50.9', ''])
+    data = {'prices.bin': array('d', [1.5, 2.25]), 'postings.bin': []}
+    data['keys.bin'], data['key_offsets.bin'] = pack_strings(keys)
+
+    writer = SnapshotWriter(tmp_path / 'snap')
+    writer.write_files(FILES, data)
+    writer.write_json('meta.json', {'keys': len(keys)})
+    assert not list((tmp_path / 'snap').glob('*.tmp'))
+
+    with MmapFiles(tmp_path / 'snap', FILES) as files:
+        packed = PackedStrings(files['keys.bin'], files['key_offsets.bin'])
+        assert list(packed) == keys
+        assert packed[-1] == keys[-1]
+        assert packed[1:3] == keys[1:3]
+        assert packed.position('옵디보') == keys.index('옵디보')
+        assert packed.position('') == 0
+        assert packed.position('옵디') is None
+        assert list(files['prices.bin']) == [1.5, 2.25]
+        # 빈 파일은 mmap 대신 빈 배열
+        assert len(files['postings.bin']) == 0
+        assert files.nbytes == sum((tmp_path / 'snap' / name).stat().st_size for name in FILES)
+
+    assert files.data['keys.bin'] == b''
+    assert len(files.data['key_offsets.bin']) == 0
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+mfds/utils/monograph_index.py 유닛 테스트
+
+- 마크다운 제목 / 분자식 줄 기준 각조 분할, HTML content는 <h1>/<h2> 제목 기준
+- 한글명·영문명·그리스 문자 표기 변형으로 조회, 각조 본문만 반환
+- 원본 JSON이 바뀌면 재빌드
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mfds.utils.monograph_index import MonographIndex, name_keys, segment_monographs, volume_text
+
+HEADED = """General Notices
+
+# Aspirin
+아스피린
+Aspirin contains not less than 99.5%.
+
+# α-Tocopherol
+알파토코페롤
+Identification: 1 μg
+
+## Zinc Oxide
+산화아연
+Assay ...
+"""
+
+PLAIN = """Preface text
+
+Ibuprofen
+이부프로펜
+C13H18O2 : 206.28
+Ibuprofen contains ...
+
+β-Carotene
+C40H56 : 536.87
+Store in light-resistant containers.
+"""
+
+
+HTML = ('<p>General Notices</p>'
+        '<h1 id="0">Aspirin</h1><p>아스피린</p><p>Aspirin contains &lt;0.1% salicylic acid.</p>'
+        '<h2><span>α-Tocopherol</span></h2><p>알파토코페롤<br>Identification: 1 μg</p>'
+        '<table><tr><td>Assay</td><td>99.0%</td></tr></table>')
+
+
+def write_volume(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'content': content, 'html': '', 'pages': 1}, f, ensure_ascii=False)
+
+
+def test_name_keys_greek_variants():
+    assert name_keys('α-Tocopherol') == ['αtocopherol', 'alphatocopherol', '알파tocopherol']
+    assert name_keys('Zinc Oxide') == ['zincoxide']
+
+
+def test_segment_by_formula_lines():
+    segments = segment_monographs(PLAIN)
+    assert [title for _, _, title in segments] == ['Ibuprofen', 'β-Carotene']
+    assert PLAIN[segments[0][0]:segments[0][1]].startswith('Ibuprofen\n이부프로펜')
+
+
+def test_segment_html_content():
+    text = volume_text({'content': HTML, 'html': HTML})
+    assert not any(tag in text for tag in ('<p>', '<h1', '<br>', '<td>', '<span>'))
+    segments = segment_monographs(text)
+    assert [title for _, _, title in segments] == ['Aspirin', 'α-Tocopherol']
+    aspirin = text[segments[0][0]:segments[0][1]]
+    assert aspirin.startswith('# Aspirin\n') and '아스피린\n' in aspirin and '<0.1%' in aspirin
+    tocopherol = text[segments[1][0]:segments[1][1]]
+    assert '알파토코페롤\nIdentification: 1 μg' in tocopherol and 'Assay 99.0%' in tocopherol
+
+    # content가 없으면 html 필드 사용
+    assert volume_text({'content': '', 'html': HTML}) == text
+
+
+def test_lookup_and_rebuild(tmp_path):
+    write_volume(tmp_path / 'en_monographs.json', HEADED)
+    write_volume(tmp_path / 'en_plain.json', PLAIN)
+    write_volume(tmp_path / 'parse_summary.json', '# Ignored')
+    index_dir = tmp_path / 'monograph_index'
+
+    with MonographIndex.load(tmp_path, index_dir) as index:
+        assert index.titles == ['Aspirin', 'α-Tocopherol', 'Zinc Oxide', 'Ibuprofen', 'β-Carotene']
+
+        hit, = index.lookup('alpha-tocopherol')
+        assert hit['title'] == 'α-Tocopherol' and hit['volume'] == 'en_monographs'
+        assert hit['text'].startswith('# α-Tocopherol') and '1 μg' in hit['text']
+        assert 'Zinc' not in hit['text']
+
+        assert [h['title'] for h in index.lookup('알파-토코페롤')] == ['α-Tocopherol']
+        assert [h['title'] for h in index.lookup('산화 아연')] == ['Zinc Oxide']
+        assert [h['title'] for h in index.lookup('beta-carotene')] == ['β-Carotene']
+        assert index.lookup('이부프로펜')[0]['text'].endswith('Ibuprofen contains ...\n\n')
+        assert index.lookup('Paracetamol') == []
+
+    # 원본 변경 → 재빌드
+    write_volume(tmp_path / 'en_plain.json', '# Paracetamol\n파라세타몰\n')
+    stat = (tmp_path / 'en_plain.json').stat()
+    os.utime(tmp_path / 'en_plain.json', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with MonographIndex.load(tmp_path, index_dir) as index:
+        assert [h['title'] for h in index.lookup('파라세타몰')] == ['Paracetamol']
+        assert index.lookup('Ibuprofen') == []
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+normalize_kcd9_masterfile.py 유닛 테스트
+
+- 컬럼 단위 정제 결과가 기존 행 단위 변환과 같은 레코드를 만드는지
+- 한 번의 순회로 전체/최하위/코드 맵/대분류 뷰 생성
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from normalize_kcd9_masterfile import build_views, clean_masterfile
+
+
+def make_raw_frame():
+    nan = float('nan')
+    rows = [
+        [1, '대', 'A00-B99', nan, nan, '특정 감염성 및 기생충성 질환', 'Certain infectious diseases', 0, 0, 0, 0, nan, nan, nan],
+        [1, '소', 'A00', nan, '포함', ' 콜레라 ', 'Cholera', 0, 0, 0, 0, nan, nan, nan],
+        [nan, '세', 'A00.0', '+', nan, '고전적 콜레라', nan, 1, nan, 0, 1, 2.0, '명칭 수정', nan],
+        [nan, '세', 'B01.9', nan, nan, '합병증이 없는 수두', 'Varicella', 1, 1, 0, 0, nan, nan, nan],
+    ]
+    return pd.DataFrame(rows, columns=[f'col{i}' for i in range(14)])
+
+
+def test_clean_and_build_views():
+    df = clean_masterfile(make_raw_frame())
+    views = build_views(df)
+
+    records = views['records']
+    assert [r['code'] for r in records] == ['A00-B99', 'A00', 'A00.0', 'B01.9']
+    assert records[1]['name_kr'] == '콜레라'
+    assert records[1]['note'] == '포함'
+    assert records[2] == {
+        'code': 'A00.0', 'name_kr': '고전적 콜레라', 'name_en': '', 'is_header': False,
+        'classification': '세', 'symbol': '+', 'note': '', 'is_lowest': True,
+        'is_domestic': False, 'is_oriental': False, 'is_additional': True,
+        'revision': {'no': '2.0', 'note': '명칭 수정'},
+    }
+    assert 'revision' not in records[3]
+
+    assert [r['code'] for r in views['usable']] == ['A00.0', 'B01.9']
+    assert views['usable'][1]['is_domestic'] is True
+    assert views['code_map']['A00'] == {'name_kr': '콜레라', 'name_en': 'Cholera',
+                                        'is_lowest': False, 'is_header': True}
+    assert views['chapters'] == [{'code_range': 'A00-B99', 'name_kr': '특정 감염성 및 기생충성 질환',
+                                  'total_codes': 3}]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+hira/parse_suga_procedures.py 유닛 테스트
+
+- 페이지 구간 분할 (마지막 자투리 구간, 구간 크기 > 페이지 수)
+- 워커 여러 개일 때도 페이지 순서대로 결과 병합
+- 실패한 구간의 페이지별 에러가 self.errors에 모임
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('pdfplumber')
+
+
+class FakePage:
+    """EDI 코드 1개짜리 표가 있는 페이지 (fail이면 표 추출 실패)"""
+
+    def __init__(self, page_num, fail=False, delay=0.0):
+        self.page_num = page_num
+        self.fail = fail
+        self.delay = delay
+
+    def extract_tables(self):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f'broken page {self.page_num}')
+        return [[
+            ['분류번호', '코드', '분류', '점수'],
+            [f'가-{self.page_num}', f'AA{self.page_num:03d}', f'행위 {self.page_num}', '1,000'],
+        ]]
+
+    def flush_cache(self):
+        pass
+
+
+class FakePdf:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def suga(tmp_path, monkeypatch):
+    # 모듈 import 시 data/hira/parsed를 만들므로 임시 디렉토리에서 import
+    monkeypatch.chdir(tmp_path)
+    from hira import parse_suga_procedures
+    return parse_suga_procedures
+
+
+def use_fake_pdf(monkeypatch, module, pages):
+    monkeypatch.setattr(module, 'pdfplumber', SimpleNamespace(open=lambda path: FakePdf(pages)))
+    # 가짜 PDF가 워커에 보이도록 프로세스 대신 스레드 풀 사용 (결과 순서 규칙은 동일)
+    monkeypatch.setattr(module, 'ProcessPoolExecutor', ThreadPoolExecutor)
+
+
+@pytest.mark.parametrize('pages, shard_size, expected', [
+    (120, 50, [(0, 50), (50, 100), (100, 120)]),
+    (100, 50, [(0, 50), (50, 100)]),
+    (7, 50, [(0, 7)]),
+    (1, 1, [(0, 1)]),
+    (0, 50, []),
+])
+def test_page_shards(suga, pages, shard_size, expected):
+    shards = suga.page_shards(pages, shard_size)
+    assert shards == expected
+    # 구간이 빈틈 없이 전체 페이지를 덮음
+    assert [p for start, end in shards for p in range(start, end)] == list(range(pages))
+
+
+def test_parse_shard_collects_pages(suga, monkeypatch):
+    use_fake_pdf(monkeypatch, suga, [FakePage(n) for n in range(10)])
+
+    result = suga._parse_shard(('ebook.pdf', 3, 6))
+
+    assert (result['start'], result['end']) == (3, 6)
+    assert [p['edi_code'] for p in result['procedures']] == ['AA003', 'AA004', 'AA005']
+    assert [p['page'] for p in result['procedures']] == [4, 5, 6]
+    assert result['pages_with_tables'] == 3
+    assert result['errors'] == []
+
+
+def test_iter_shards_keeps_page_order_with_workers(suga, monkeypatch):
+    # 앞 구간을 느리게 해서 뒤 구간이 먼저 끝나도록 함
+    pages = [FakePage(n, delay=0.05 if n < 4 else 0.0) for n in range(10)]
+    use_fake_pdf(monkeypatch, suga, pages)
+
+    parser = suga.SUGAProcedureParser()
+    shards = suga.page_shards(10, 4)
+    results = list(parser.iter_shards(shards, workers=3))
+
+    assert [(r['start'], r['end']) for r in results] == [(0, 4), (4, 8), (8, 10)]
+    codes = [p['edi_code'] for r in results for p in r['procedures']]
+    assert codes == [f'AA{n:03d}' for n in range(10)]
+
+
+def test_parse_pdf_merges_shard_errors(suga, monkeypatch):
+    failing = {5, 6, 9}
+    pages = [FakePage(n, fail=n in failing, delay=0.02 if n < 3 else 0.0) for n in range(12)]
+    use_fake_pdf(monkeypatch, suga, pages)
+
+    parser = suga.SUGAProcedureParser()
+    parser.parse_pdf(workers=4, shard_size=3)
+
+    assert [e['page'] for e in parser.errors] == [6, 7, 10]
+    assert all(e['type'] == 'page_parsing_error' for e in parser.errors)
+    assert parser.stats['parsing_errors'] == 3
+    assert parser.stats['pages_with_tables'] == 9
+    assert parser.stats['total_pages'] == 12
+    assert [p['page'] for p in parser.procedures] == [n + 1 for n in range(12) if n not in failing]
@@ -9,6 +9,7 @@ refine_drug_anchors.py 유닛 테스트
 4. FOLFOX → regimen.yaml
 5. HER2 → biomarker.yaml
 6. NSCLC → disease_alias.yaml
+7. 병렬 처리(맵 + 충돌 해소 리듀스) 결과 = 순차 처리 결과
 """
 
 import sys
@@ -19,6 +20,7 @@ from pathlib import Path
 # 상위 디렉토리의 scripts 모듈 임포트
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import scripts.refine_drug_anchors as refine_module
 from scripts.refine_drug_anchors import DrugAnchorRefiner, DrugEntry
 
 # 테스트용 필터 설정
@@ -241,6 +243,43 @@ def test_case_6_nsclc_disease():
     Path(filter_path).unlink()
 
 
+def test_case_7_parallel_equals_serial():
+    """테스트 7: 병렬 처리 = 순차 처리 (결정, reason_codes, 통계)"""
+    print("\n[테스트 7] parallel == serial")
+
+    import yaml
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
+        yaml.dump(TEST_FILTERS, f, allow_unicode=True)
+        filter_path = f.name
+
+    pairs = [('paclitaxel', '파클리탁셀'), ('busulfan', '바이알'), ('prednisolone', '아비라테론'),
+             ('FOLFOX', '폴폭스'), ('HER2', 'HER2'), ('NSCLC', '비소세포폐암'), ('docetaxel', '도세탁셀'),
+             ('docetaxel', '파클리탁셀'), ('imatinib', '이매티닙'), ('imatinib', '이매티닙')]
+
+    def run(workers):
+        refiner = DrugAnchorRefiner(filter_path)
+        entries = [DrugEntry(en=en, ko=ko, count=i, source='test') for i, (en, ko) in enumerate(pairs * 3)]
+        refiner.process_all(entries, workers=workers)
+        buckets = [refiner.active_drugs, refiner.pending_drugs, refiner.dropped_drugs,
+                   refiner.regimens, refiner.biomarkers, refiner.diseases]
+        return [[(e.en, e.ko, e.count, e.decision, e.reason_codes) for e in bucket] for bucket in buckets], refiner.stats
+
+    original = refine_module.ENTRIES_PER_TASK
+    refine_module.ENTRIES_PER_TASK = 4
+    try:
+        serial = run(1)
+        parallel = run(2)
+    finally:
+        refine_module.ENTRIES_PER_TASK = original
+
+    assert parallel == serial, "Parallel result differs from serial"
+    assert serial[1].reason_code_counts['ALIAS_CONFLICT'] == 3, serial[1].reason_code_counts
+
+    print(f"[PASS] {serial[1].active} active, {serial[1].pending} pending")
+
+    Path(filter_path).unlink()
+
+
 def run_all_tests():
     """모든 테스트 실행"""
     print("=" * 70)
@@ -253,7 +292,8 @@ def run_all_tests():
         test_case_3_prednisolone_pending,
         test_case_4_folfox_regimen,
         test_case_5_her2_biomarker,
-        test_case_6_nsclc_disease
+        test_case_6_nsclc_disease,
+        test_case_7_parallel_equals_serial
     ]
 
     passed = 0
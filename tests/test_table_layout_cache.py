@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+hira/table_parser/layout_cache.py 유닛 테스트
+
+- 캐시된 페이지는 PDF를 다시 열지 않고 읽음
+- 페이지별 추가 결과(Camelot 등) 저장/로드
+- PDF 내용이 바뀌면 다른 캐시 디렉토리 사용
+- 캐시 버전이 바뀌면 한 번만 비우고 새 meta 저장
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hira.table_parser.layout_cache import LayoutCache
+
+
+def make_record(page_num):
+    return {
+        'page': page_num,
+        'width': 595.3,
+        'height': 841.9,
+        'text': f'표 {page_num}-1 요양급여 기준',
+        'words': [[72.0, 90.5, 110.2, 101.0, '표']],
+        'lines': [[72.0, 120.0, 520.0, 120.0]],
+        'rects': [],
+        'tables': [{'bbox': [72.0, 120.0, 520.0, 300.0], 'rows': [['구분', '코드'], ['약제', 'AA001']]}],
+        'extras': {},
+    }
+
+
+def test_cached_pages_skip_pdf(tmp_path):
+    """캐시에 있는 페이지는 pdfplumber 없이 읽힘"""
+    pdf_path = tmp_path / 'ebook.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 dummy')
+    cache_dir = tmp_path / 'cache'
+
+    cache = LayoutCache(pdf_path, cache_dir)
+    cache.meta['page_count'] = 2
+    for page_num in (1, 2):
+        cache._write(make_record(page_num))
+    cache._save_meta()
+
+    reloaded = LayoutCache(pdf_path, cache_dir)
+    pages = list(reloaded.pages())
+    assert [page.page_num for page in pages] == [1, 2]
+    assert reloaded.stats == {'hits': 2, 'misses': 0}
+    assert reloaded._pdf is None
+
+    table = pages[0].find_tables()[0]
+    assert table.bbox == (72.0, 120.0, 520.0, 300.0)
+    assert table.extract()[1] == ['약제', 'AA001']
+    assert pages[1].extract_text().startswith('표 2-1')
+
+    reloaded.set_extra(2, 'camelot_lattice', [{'rows': [['a']], 'bbox': None}])
+    assert LayoutCache(pdf_path, cache_dir).page(2).extra('camelot_lattice') == [{'rows': [['a']], 'bbox': None}]
+
+
+def test_changed_pdf_uses_new_cache(tmp_path):
+    pdf_path = tmp_path / 'ebook.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 v1')
+    first = LayoutCache(pdf_path, tmp_path / 'cache')
+
+    pdf_path.write_bytes(b'%PDF-1.4 v2')
+    second = LayoutCache(pdf_path, tmp_path / 'cache')
+
+    assert first.sha256 != second.sha256
+    assert first.dir != second.dir
+
+
+def test_version_mismatch_rewrites_meta(tmp_path, monkeypatch):
+    """이전 버전 캐시는 한 번만 비우고, 새로 쓴 페이지는 다음에 열 때 남아 있음"""
+    import hira.table_parser.layout_cache as layout_cache
+
+    pdf_path = tmp_path / 'ebook.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 dummy')
+    cache_dir = tmp_path / 'cache'
+    old = LayoutCache(pdf_path, cache_dir)
+    old._write(make_record(1))
+
+    monkeypatch.setattr(layout_cache, 'CACHE_VERSION', layout_cache.CACHE_VERSION + 1)
+    upgraded = LayoutCache(pdf_path, cache_dir)
+    assert not upgraded._page_path(1).exists()
+    assert json.loads(upgraded.meta_path.read_text(encoding='utf-8'))['version'] == layout_cache.CACHE_VERSION
+    upgraded._write(make_record(1))
+
+    reopened = LayoutCache(pdf_path, cache_dir)
+    assert reopened._page_path(1).exists()
+    assert reopened.page(1).page_num == 1 and reopened.stats == {'hits': 1, 'misses': 0}
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+hira/table_parser/cross_page_merger.py 유닛 테스트
+
+- 스트리밍 병합 결과가 일괄 병합과 같고, 표가 끝나는 즉시 JSONL에 기록
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hira.table_parser.layout_cache import LayoutCache
+from hira.table_parser.cross_page_merger import (
+    TableSegment,
+    iter_merged_tables,
+    merge_cross_page_tables,
+    write_merged_tables_jsonl,
+)
+
+
+def make_record(page_num):
+    return {
+        'page': page_num,
+        'width': 595.3,
+        'height': 841.9,
+        'text': f'표 {page_num}-1 요양급여 기준',
+        'words': [[72.0, 90.5, 110.2, 101.0, '표']],
+        'lines': [[72.0, 120.0, 520.0, 120.0]],
+        'rects': [],
+        'tables': [{'bbox': [72.0, 120.0, 520.0, 300.0], 'rows': [['구분', '코드'], ['약제', 'AA001']]}],
+        'extras': {},
+    }
+
+
+def make_segment(page_num, rows, bbox=(72.0, 100.0, 520.0, 700.0)):
+    return TableSegment(page_num=page_num, table_idx=0, bbox=bbox,
+                        data=[['구분', '코드']] + rows, has_header=True)
+
+
+def test_streaming_merge_emits_tables_early():
+    """연속이 끊기는 즉시 앞 표를 내보내고, 반복 헤더는 한 번만 남김"""
+    segments = [
+        make_segment(1, [['약제', 'AA001']]),
+        make_segment(2, [['약제', 'AA002']]),
+        make_segment(4, [['행위', 'BB001']]),
+    ]
+    consumed = []
+
+    def source():
+        for segment in segments:
+            consumed.append(segment.page_num)
+            yield segment
+
+    merged = iter_merged_tables(source())
+    first = next(merged)
+    # 4페이지 조각을 읽은 시점에 1-2페이지 표가 완성됨
+    assert consumed == [1, 2, 4]
+    assert first.pages == [1, 2]
+    assert first.rows == [['구분', '코드'], ['약제', 'AA001'], ['약제', 'AA002']]
+    assert first.row_count == 3
+
+    rest = list(merged)
+    assert [t.pages for t in rest] == [[4]]
+    assert [t.pages for t in merge_cross_page_tables(segments)] == [[1, 2], [4]]
+
+
+def test_write_merged_tables_jsonl(tmp_path):
+    pdf_path = tmp_path / 'ebook.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 dummy')
+    cache = LayoutCache(pdf_path, tmp_path / 'cache')
+    cache.meta['page_count'] = 2
+    for page_num in (1, 2):
+        cache._write(make_record(page_num))
+
+    stats = write_merged_tables_jsonl(pdf_path, tmp_path / 'merged.jsonl', cache=cache)
+
+    lines = (tmp_path / 'merged.jsonl').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == stats['merged_tables'] == 1
+    table = json.loads(lines[0])
+    assert table['pages'] == [1, 2]
+    assert table['num_rows'] == 2
+    assert stats['multi_page_tables'] == 1
+    assert stats['total_rows_before'] == 4 and stats['total_rows_after'] == 3
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+shared/text_triage.py 유닛 테스트 (오프라인)
+
+- 페이지 판별: born-digital / 스캔 / 빈 페이지
+- 연속 구간 묶기 (스캔 구간만 API 전송 대상)
+- DOCX 로컬 추출 (python-docx 설치 시)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.text_triage import (BLANK, DIGITAL, SCANNED, classify_page, has_text_layer,
+                                page_runs, text_to_html)
+
+
+def test_classify_page():
+    body = '제1조(목적) 이 고시는 요양급여의 적용기준 및 방법에 관한 세부사항을 정함을 목적으로 한다.'
+    assert classify_page(body, image_ratio=0.0) == DIGITAL
+    # 본문이 있으면 배경 이미지가 있어도 로컬 추출
+    assert classify_page(body, image_ratio=1.0) == DIGITAL
+    assert classify_page('', image_ratio=0.95) == SCANNED
+    assert classify_page('- 3 -', image_ratio=0.9) == SCANNED
+    assert classify_page('(cid:12)(cid:34)(cid:56) ' * 10, image_ratio=0.0) == SCANNED
+    assert classify_page('', image_ratio=0.0) == BLANK
+    assert classify_page('부 록', image_ratio=0.0) == DIGITAL
+
+
+def test_page_runs():
+    kinds = [DIGITAL, BLANK, SCANNED, SCANNED, DIGITAL, SCANNED]
+    assert page_runs(kinds) == [
+        {'kind': DIGITAL, 'start': 1, 'end': 2},
+        {'kind': SCANNED, 'start': 3, 'end': 4},
+        {'kind': DIGITAL, 'start': 5, 'end': 5},
+        {'kind': SCANNED, 'start': 6, 'end': 6},
+    ]
+    assert page_runs([]) == []
+
+
+def test_text_helpers():
+    assert not has_text_layer(None)
+    assert not has_text_layer('  \n ')
+    # 짧은 텍스트(이미지 PDF의 쪽 번호 등)는 문서 전체 결과로 쓰지 않음
+    assert not has_text_layer('- 3 -')
+    assert not has_text_layer('가' * 29)
+    assert has_text_layer('가' * 40)
+    assert text_to_html('a < b\n\nc', page=2) == '<section data-page="2"><p>a &lt; b</p><p>c</p></section>'
+
+
+def test_extract_docx_text(tmp_path):
+    docx = pytest.importorskip('docx')
+    from shared.text_triage import extract_docx_text
+
+    document = docx.Document()
+    document.add_paragraph('대한민국약전 통칙')
+    table = document.add_table(rows=1, cols=2)
+    table.rows[0].cells[0].text = '성분'
+    table.rows[0].cells[1].text = '함량'
+    document.add_paragraph('표 아래 문단')
+    path = tmp_path / 'sample.docx'
+    document.save(path)
+
+    # 표는 본문에 나온 위치 그대로
+    assert extract_docx_text(path) == '대한민국약전 통칙\n성분 | 함량\n표 아래 문단'